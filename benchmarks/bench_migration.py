@@ -0,0 +1,212 @@
+"""
+End-to-end latency harness for RLManager.generate_new_save_files.
+
+Runs the real launch -> detect -> shutdown -> copy flow against fake_game.py,
+which stands in for the Rocket League executable, and reports the latency of
+every phase over many runs (Linux and macOS, the stand-in is a shell script).
+
+    python benchmarks/bench_migration.py --runs 20
+    python benchmarks/bench_migration.py --runs 20 --partial-pause 0.3 --jitter 0.2
+    python benchmarks/bench_migration.py --mode replace_existing --ignore-sigterm
+
+Per run, "detect_after_first_write" is the time between the stand-in's first
+(possibly partial) write and the detection. "written_before_detection" counts
+the files the game had finished when it was closed, and "complete" tells whether
+the copied backup has every file at its full size (get_backup mode only).
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import statistics
+import stat
+import sys
+import time
+
+from bench_rlmanager import isolated_home
+
+FAKE_GAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_game.py")
+
+# Progress texts of generate_new_save_files that start each phase
+PHASES = [
+    ("launch", "Starting Rocket League..."),
+    ("detect", "Waiting for new save files..."),
+    ("shutdown", "Closing Rocket League..."),
+    ("copy", "Copying save files..."),
+]
+
+
+def make_game_exe(folder: str) -> str:
+    os.makedirs(folder, exist_ok=True)
+    exe = os.path.join(folder, "RocketLeague")
+    with open(exe, "w") as f:
+        f.write(f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_GAME}"\n')
+    os.chmod(exe, os.stat(exe).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return exe
+
+
+def read_events(path: str) -> list:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def distribution(values: list) -> dict:
+    values = sorted(values)
+    if not values:
+        return {}
+
+    def percentile(p):
+        return values[min(len(values) - 1, round(p / 100 * (len(values) - 1)))]
+
+    return {
+        "min_ms": round(values[0], 1),
+        "p50_ms": round(percentile(50), 1),
+        "p90_ms": round(percentile(90), 1),
+        "p99_ms": round(percentile(99), 1),
+        "max_ms": round(values[-1], 1),
+        "mean_ms": round(statistics.fmean(values), 1),
+    }
+
+
+def run_once(rl_manager, args, workdir: str, run: int) -> dict:
+    import psutil
+
+    save_folder = os.path.join(workdir, f"run{run}", "DBE_Production")
+    os.makedirs(save_folder)
+    events_path = os.path.join(workdir, f"run{run}", "events.jsonl")
+    config_path = os.path.join(workdir, f"run{run}", "game.json")
+    base = f"{random.getrandbits(128):032x}"
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "save_folder": save_folder,
+            "base": base,
+            "files": args.files,
+            "size": args.size,
+            "start_delay": args.start_delay,
+            "file_interval": args.file_interval,
+            "jitter": args.jitter,
+            "partial_pause": args.partial_pause,
+            "ignore_sigterm": args.ignore_sigterm,
+            "events": events_path,
+        }, f)
+    os.environ["RL_FAKE_GAME_CONFIG"] = config_path
+    rl_manager.save_path_steam = save_folder
+
+    marks = []
+    start = time.perf_counter()
+    ok = rl_manager.generate_new_save_files(
+        args.mode, platform="steam", progress=lambda text: marks.append((text, time.perf_counter(), time.time())))
+    end = time.perf_counter()
+
+    at = {text: (perf, wall) for text, perf, wall in marks}
+    phases = {}
+    for i, (phase, text) in enumerate(PHASES):
+        if text not in at:
+            continue
+        following = next((at[t][0] for _, t in PHASES[i + 1:] if t in at), end)
+        phases[phase] = (following - at[text][0]) * 1000
+    phases["total"] = (end - start) * 1000
+
+    events = read_events(events_path)
+    writes = [e for e in events if e["event"] == "write"]
+    first_write = next((e for e in events if e["event"] in ("partial_write", "write")), None)
+    detected_at = at.get(PHASES[2][1], (None, None))[1]
+    if first_write and detected_at:
+        phases["detect_after_first_write"] = (detected_at - first_write["time"]) * 1000
+
+    complete = None
+    if args.mode == "get_backup":
+        backup = [f for f in os.listdir(rl_manager.backup_path) if f.startswith(base)]
+        complete = len(backup) == args.files and all(
+            os.path.getsize(os.path.join(rl_manager.backup_path, f)) == args.size for f in backup)
+
+    pids = [e["pid"] for e in events if e["event"] == "started"]
+    return {
+        "ok": ok,
+        "phases": phases,
+        "complete": complete,
+        "written_before_detection": sum(1 for e in writes if detected_at and e["time"] <= detected_at),
+        "leftover_processes": sum(1 for pid in pids if psutil.pid_exists(pid)
+                                  and psutil.Process(pid).status() != psutil.STATUS_ZOMBIE),
+        "detection": rl_manager.last_save_detection,
+    }
+
+
+def prime_backup(rl_manager, workdir: str, args):
+    """replace_existing needs a backup to copy from; back up a donor account first."""
+    donor_folder = os.path.join(workdir, "donor", "DBE_Production")
+    os.makedirs(donor_folder)
+    donor = f"{random.getrandbits(128):032x}"
+    for n in range(args.files):
+        with open(os.path.join(donor_folder, f"{donor}_{n}.save"), "wb") as f:
+            f.write(os.urandom(args.size))
+    rl_manager.save_path_steam = donor_folder
+    rl_manager.backup_save_files_for_new_ones(donor, "steam")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--mode", choices=["get_backup", "replace_existing"], default="get_backup")
+    parser.add_argument("--files", type=int, default=4, help="save files the fake game writes")
+    parser.add_argument("--size", type=int, default=64 * 1024, help="bytes per save file")
+    parser.add_argument("--start-delay", type=float, default=0.5, help="seconds before the first write")
+    parser.add_argument("--file-interval", type=float, default=0.05, help="seconds between two files")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay per file, in seconds")
+    parser.add_argument("--partial-pause", type=float, default=0.0,
+                        help="write each file in two halves with this pause in between")
+    parser.add_argument("--settle-window", type=float, help="override RLManager.settle_window, in seconds")
+    parser.add_argument("--ignore-sigterm", action="store_true", help="the fake game only exits when killed")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    if sys.platform == "win32":
+        parser.error("the fake game is a shell script, run the harness on Linux or macOS")
+
+    with isolated_home("rl-e2e-") as workdir:
+        from util import RLManager
+
+        with contextlib.redirect_stdout(sys.stderr):
+            rl_manager = RLManager()
+            rl_manager.rocket_league_path_steam = make_game_exe(os.path.join(workdir, "game"))
+            if args.settle_window is not None:
+                rl_manager.settle_window = args.settle_window
+            if args.mode == "replace_existing":
+                prime_backup(rl_manager, workdir, args)
+
+            runs = []
+            for run in range(args.runs):
+                runs.append(run_once(rl_manager, args, workdir, run))
+                print(f"run {run + 1}/{args.runs}: {runs[-1]['phases']['total']:.0f} ms", file=sys.stderr)
+
+    phase_names = [name for name, _ in PHASES] + ["detect_after_first_write", "total"]
+    report = {
+        "config": vars(args),
+        "runs": len(runs),
+        "failed": sum(1 for r in runs if not r["ok"]),
+        "incomplete": sum(1 for r in runs if r["complete"] is False),
+        "leftover_processes": sum(r["leftover_processes"] for r in runs),
+        "phases": {name: distribution([r["phases"][name] for r in runs if name in r["phases"]])
+                   for name in phase_names},
+        "detection_backends": sorted({r["detection"]["backend"] for r in runs if r["detection"]}),
+        "per_run": runs,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    print(f"{'phase':26} {'min':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for name, dist in report["phases"].items():
+        if dist:
+            print(f"{name:26} " + " ".join(f"{dist[k]:>8.1f}" for k in ("min_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms")))
+    print(f"failed: {report['failed']}  incomplete copies: {report['incomplete']}  "
+          f"leftover processes: {report['leftover_processes']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Micro-benchmarks for the RLManager hot paths on synthetic save and drive trees.
+
+    python benchmarks/bench_rlmanager.py
+    python benchmarks/bench_rlmanager.py --sizes small medium --repeat 10
+    python benchmarks/bench_rlmanager.py --compare benchmarks/baselines/baseline.json
+
+Everything runs in a temporary home directory, so the real config, backups and
+snapshots are not touched. Results are written as a JSON baseline (by default to
+benchmarks/baselines/, which is not tracked); --compare prints the change against
+an older baseline.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# name -> (account bases, save files per base, drive tree directories)
+SIZES = {
+    "small": (20, 5, 1_000),
+    "medium": (200, 10, 10_000),
+    "large": (1_000, 10, 50_000),
+}
+SAVE_SIZE = 16 * 1024
+
+
+@contextlib.contextmanager
+def isolated_home(prefix: str = "rl-bench-"):
+    """
+    Yields a temporary working directory that is also the home directory, so the
+    config and ~/.RLAccountMigrator of a benchmark run never touch the real ones.
+    Must be entered before util is imported.
+    """
+    workdir = tempfile.mkdtemp(prefix=prefix)
+    home = os.path.join(workdir, "home")
+    os.makedirs(home)
+    for var in ("HOME", "USERPROFILE", "XDG_CONFIG_HOME"):
+        os.environ[var] = home if var != "XDG_CONFIG_HOME" else os.path.join(home, ".config")
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+
+    from PySide6.QtCore import QSettings
+    settings = QSettings("RLAccountMigrator", "Config")
+    # On Windows QSettings lives in the registry, not in the home directory.
+    saved_settings = {key: settings.value(key) for key in settings.allKeys()}
+    try:
+        yield workdir
+    finally:
+        settings.clear()
+        for key, value in saved_settings.items():
+            settings.setValue(key, value)
+        settings.sync()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def make_save_tree(folder: str, bases: int, files_per_base: int, rng: random.Random) -> list:
+    """Writes bases * files_per_base <hex>_N.save files. Returns the bases, the newest one first."""
+    os.makedirs(folder, exist_ok=True)
+    names = [f"{rng.getrandbits(128):032x}" for _ in range(bases)]
+    now = time.time()
+    for i, base in enumerate(names):
+        # Only the first base has saves from today, all others are older.
+        mtime = now if i == 0 else now - 86400 * (2 + i % 30)
+        for n in range(files_per_base):
+            path = os.path.join(folder, f"{base}_{n}.save")
+            with open(path, "wb") as f:
+                f.write(rng.randbytes(SAVE_SIZE))
+            os.utime(path, (mtime - n, mtime - n))
+    return names
+
+
+def make_drive_tree(root: str, directories: int, rng: random.Random):
+    """A deep tree of filler directories with the exe and save folders at the far end."""
+    created = 0
+    level = [root]
+    while created < directories:
+        next_level = []
+        for parent in level:
+            for _ in range(rng.randint(2, 6)):
+                path = os.path.join(parent, f"dir{created:06d}")
+                os.makedirs(path)
+                with open(os.path.join(path, "file.txt"), "w") as f:
+                    f.write("x")
+                next_level.append(path)
+                created += 1
+                if created >= directories:
+                    break
+            if created >= directories:
+                break
+        level = next_level
+
+    deepest = level[-1]
+    targets = [
+        os.path.join(deepest, "Steam", "steamapps", "common", "rocketleague", "Binaries", "Win64"),
+        os.path.join(deepest, "Epic Games", "rocketleague", "Binaries", "Win64"),
+    ]
+    for folder in targets:
+        os.makedirs(folder)
+        open(os.path.join(folder, "RocketLeague.exe"), "w").close()
+    for name in ("SaveData", "SaveDataEpic"):
+        os.makedirs(os.path.join(deepest, "TAGame", name, "DBE_Production"))
+
+
+def rewrite_saves(folder: str, base: str, files_per_base: int, rng: random.Random):
+    """Gives every save file of base new content, so no run finds it already backed up or restored."""
+    for n in range(files_per_base):
+        with open(os.path.join(folder, f"{base}_{n}.save"), "wb") as f:
+            f.write(rng.randbytes(SAVE_SIZE))
+
+
+def measure(fn, repeat: int, setup=None) -> dict:
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(times), 3),
+        "median_ms": round(statistics.median(times), 3),
+        "mean_ms": round(statistics.fmean(times), 3),
+        "max_ms": round(max(times), 3),
+        "runs": repeat,
+    }
+
+
+def run_size(name: str, repeat: int, workdir: str) -> dict:
+    from util import RLManager
+
+    bases, files_per_base, directories = SIZES[name]
+    rng = random.Random(name)
+    save_folder = os.path.join(workdir, name, "DBE_Production")
+    drive_root = os.path.join(workdir, name, "drive")
+    print(f"[{name}] creating {bases * files_per_base} saves and {directories} directories...", file=sys.stderr)
+    base_names = make_save_tree(save_folder, bases, files_per_base, rng)
+    make_drive_tree(drive_root, directories, rng)
+
+    rl_manager = RLManager()
+    rl_manager.save_path_steam = save_folder
+    current, target = base_names[0], base_names[1]
+
+    def full_drive_scan():
+        from collections import defaultdict
+        rl_manager._full_drive_scan(defaultdict(list), roots=[drive_root])
+        # Keep the configured save folder, the scan points it at the fake drive.
+        rl_manager.save_path_steam = save_folder
+
+    results = {
+        "files": bases * files_per_base,
+        "directories": directories,
+        "latest_saves": measure(lambda: rl_manager.latest_saves("steam"), repeat),
+        "check_path_contains_save_files": measure(
+            lambda: rl_manager.check_path_contains_save_files("steam"), repeat,
+            setup=lambda: rl_manager._save_indexes.clear()),
+        "_full_drive_scan": measure(full_drive_scan, max(1, repeat // 2)),
+        # New content every run, otherwise the snapshot store dedups and stores nothing.
+        "backup_save_files_for_new_ones": measure(
+            lambda: rl_manager.backup_save_files_for_new_ones(current, "steam"), repeat,
+            setup=lambda: rewrite_saves(save_folder, current, files_per_base, rng)),
+    }
+    # The target differs from the backup before every run, so each one restores all files.
+    copied = []
+
+    def replace():
+        rl_manager.replace_save_files_with_backup(target, "steam")
+        copied.append(rl_manager.last_transfer["copied"])
+
+    results["replace_save_files_with_backup"] = measure(
+        replace, repeat, setup=lambda: rewrite_saves(save_folder, target, files_per_base, rng))
+    results["replace_save_files_with_backup"]["copied_min"] = min(copied)
+    return results
+
+
+def compare(current: dict, baseline: dict):
+    print(f"{'size':8} {'operation':34} {'baseline':>10} {'now':>10} {'change':>8}")
+    for size, ops in current["results"].items():
+        for op, timing in ops.items():
+            if not isinstance(timing, dict):
+                continue
+            old = baseline.get("results", {}).get(size, {}).get(op)
+            if not old:
+                continue
+            change = (timing["median_ms"] / old["median_ms"] - 1) * 100 if old["median_ms"] else 0.0
+            print(f"{size:8} {op:34} {old['median_ms']:>9.2f}ms {timing['median_ms']:>8.2f}ms {change:>+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="baseline file to write (default: benchmarks/baselines/<timestamp>.json)")
+    parser.add_argument("--compare", help="baseline file to compare the results with")
+    args = parser.parse_args()
+
+    with isolated_home() as workdir:
+        # RLManager prints progress, keep stdout for the results.
+        with contextlib.redirect_stdout(sys.stderr):
+            results = {size: run_size(size, args.repeat, workdir) for size in args.sizes}
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    output = args.output or os.path.join(BASELINE_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Baseline written to {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Stand-in for the Rocket League executable, used by bench_migration.py.
+
+Reads its schedule from the JSON file named by RL_FAKE_GAME_CONFIG, writes the
+save files of a new account base into the save folder and then idles until it
+is terminated. Every write is logged with a wall clock timestamp to the events
+file, so the harness can relate detection times to the actual writes.
+
+Config keys:
+    save_folder     folder to write <base>_N.save files into
+    base            account base, 32 hex characters
+    files           number of save files
+    size            bytes per save file
+    start_delay     seconds before the first file is written
+    file_interval   seconds between two files
+    jitter          random extra delay per file, in seconds
+    partial_pause   if > 0, write the first half of each file, pause this long, then the rest
+    ignore_sigterm  keep running on SIGTERM, so only a kill ends the process
+    events          path of the JSON lines event log
+"""
+import json
+import os
+import random
+import signal
+import sys
+import time
+
+
+def log(events_path: str, event: str, **data):
+    with open(events_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"event": event, "time": time.time(), **data}) + "\n")
+
+
+def main():
+    with open(os.environ["RL_FAKE_GAME_CONFIG"], "r", encoding="utf-8") as f:
+        config = json.load(f)
+    events = config["events"]
+
+    if config.get("ignore_sigterm"):
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    else:
+        signal.signal(signal.SIGTERM, lambda *_: (log(events, "terminated"), sys.exit(0)))
+
+    log(events, "started", pid=os.getpid())
+    time.sleep(config.get("start_delay", 0))
+
+    rng = random.Random()
+    half = config["size"] // 2
+    for n in range(config["files"]):
+        path = os.path.join(config["save_folder"], f"{config['base']}_{n}.save")
+        data = rng.randbytes(config["size"])
+        with open(path, "wb") as f:
+            if config.get("partial_pause", 0) > 0:
+                f.write(data[:half])
+                f.flush()
+                log(events, "partial_write", file=os.path.basename(path))
+                time.sleep(config["partial_pause"])
+            f.write(data[half:] if config.get("partial_pause", 0) > 0 else data)
+        log(events, "write", file=os.path.basename(path), size=len(data))
+        time.sleep(config.get("file_interval", 0) + rng.uniform(0, config.get("jitter", 0)))
+
+    log(events, "idle")
+    while True:
+        time.sleep(1)
+
+
+if __name__ == "__main__":
+    main()
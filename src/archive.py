@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zipfile
+from integrity import CHUNK_SIZE, is_manifest
+from save_index import SAVE_RE
+
+# Member holding the archive's metadata and the sha256 of every file
+INDEX_NAME = "index.json"
+COMPRESS_LEVEL = 6
+ARCHIVE_FORMAT = 1
+
+
+def archive_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "archives")
+
+
+def create_archive(path: str, files: dict, meta: dict | None = None) -> dict:
+    """
+    Writes a backup set into one compressed archive and returns its index.
+
+    files maps archive names to a source path or the content as bytes. Every file is
+    streamed through the compressor in CHUNK_SIZE pieces and compressed on its own
+    (a zip file), so memory use doesn't grow with the archive and any file can later
+    be read without decompressing the others.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    entries = {}
+    tmp_path = path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as zf:
+        for name, source in files.items():
+            h = hashlib.sha256()
+            size = 0
+            with zf.open(name, "w", force_zip64=True) as dst:
+                if isinstance(source, bytes):
+                    h.update(source)
+                    dst.write(source)
+                    size = len(source)
+                else:
+                    with open(source, "rb") as src:
+                        while chunk := src.read(CHUNK_SIZE):
+                            h.update(chunk)
+                            dst.write(chunk)
+                            size += len(chunk)
+            entries[name] = {"hash": h.hexdigest(), "size": size}
+
+        index = {"format": ARCHIVE_FORMAT, "created": time.time(), **(meta or {}), "files": entries}
+        zf.writestr(INDEX_NAME, json.dumps(index, indent=2))
+    os.replace(tmp_path, path)
+
+    index["archive_size"] = os.path.getsize(path)
+    return index
+
+
+def export_folder(folder: str, path: str, meta: dict | None = None) -> dict:
+    files = {f: os.path.join(folder, f) for f in sorted(os.listdir(folder))
+             if f.endswith(".save") and not is_manifest(f)}
+    return create_archive(path, files, meta)
+
+
+def export_snapshot(store, snapshot_id: str, path: str) -> dict:
+    manifest = store.get(snapshot_id)
+    if manifest is None:
+        raise FileNotFoundError(f"Snapshot {snapshot_id} does not exist")
+    files = {}
+    for name, info in manifest["files"].items():
+        # Full blobs are streamed from disk, deltas only exist once rebuilt.
+        files[name] = store.read_blob(info["hash"]) if store.is_delta(info["hash"]) else store.blob_path(info["hash"])
+    meta = {key: manifest.get(key) for key in ("account", "platform")}
+    meta["snapshot"] = snapshot_id
+    return create_archive(path, files, meta)
+
+
+def read_index(path: str) -> dict:
+    with zipfile.ZipFile(path) as zf:
+        try:
+            index = json.loads(zf.read(INDEX_NAME))
+        except KeyError:
+            raise ValueError(f"{path} is not a backup archive (no {INDEX_NAME})")
+    if index.get("format") != ARCHIVE_FORMAT:
+        raise ValueError(f"{path} has unsupported archive format {index.get('format')}")
+    return index
+
+
+def _check_save_name(name: str, path: str):
+    """Archives come from other machines, only plain save file names may be written."""
+    if os.path.basename(name) != name or "/" in name or "\\" in name or not SAVE_RE.fullmatch(name):
+        raise ValueError(f"{path} contains an invalid file name: {name!r}")
+
+
+def extract(path: str, target_dir: str, names=None, rename_base: str | None = None) -> list:
+    """
+    Streams files of an archive into target_dir and returns the written paths.
+
+    names limits it to some files. rename_base swaps the account base in file names,
+    like SnapshotStore.restore. Each file is checked against its hash while it is
+    written to a temporary file and only then moved into place.
+    """
+    index = read_index(path)
+    account = index.get("account")
+    # All names are checked before the first file is written.
+    targets = {}
+    real_dir = os.path.realpath(target_dir)
+    for name in (names if names is not None else index["files"]):
+        if name not in index["files"]:
+            raise KeyError(f"{name} is not in {path}")
+        _check_save_name(name, path)
+        target_name = name
+        if rename_base and account and name.startswith(account):
+            target_name = rename_base + name[len(account):]
+            _check_save_name(target_name, path)
+        target = os.path.join(target_dir, target_name)
+        if os.path.dirname(os.path.realpath(target)) != real_dir:
+            raise ValueError(f"{path}: {name!r} would be written outside {target_dir}")
+        targets[name] = target
+
+    os.makedirs(target_dir, exist_ok=True)
+    written = []
+    with zipfile.ZipFile(path) as zf:
+        for name, target in targets.items():
+            info = index["files"][name]
+            h = hashlib.sha256()
+            fd, tmp_path = tempfile.mkstemp(dir=target_dir, suffix=".tmp")
+            try:
+                with zf.open(name) as src, os.fdopen(fd, "wb") as dst:
+                    while chunk := src.read(CHUNK_SIZE):
+                        h.update(chunk)
+                        dst.write(chunk)
+                if h.hexdigest() != info["hash"]:
+                    raise OSError(f"{name} in {path} is corrupt (checksum mismatch)")
+                os.replace(tmp_path, target)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            written.append(target)
+    return written
+
+
+def import_archive(store, path: str) -> dict:
+    """Adds the files of an archive to the snapshot store and returns the snapshot."""
+    index = read_index(path)
+    with tempfile.TemporaryDirectory() as tmp:
+        files = extract(path, tmp)
+        return store.create(files, account=index.get("account"), platform=index.get("platform"), source="archive")
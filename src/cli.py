@@ -0,0 +1,298 @@
+import argparse
+import contextlib
+import json
+import signal
+import sys
+import threading
+from util import RLManager, MigrationCancelled
+from savefile import inspect_save, diff_saves
+from tracing import tracer
+from migration_queue import MigrationQueue, queue_path
+from archive import read_index, import_archive
+from transfer import summarize_plan
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2  # used by argparse for invalid arguments
+EXIT_NOT_CONFIGURED = 3
+EXIT_ERROR = 4
+EXIT_CANCELLED = 5
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="RLAccountMigrator",
+        description="Headless Rocket League save migration. Prints one JSON object per run.",
+    )
+    parser.add_argument("--output", help="also write the JSON result to this file")
+    parser.add_argument("--quiet", action="store_true", help="don't print progress to stderr")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("locate", help="find Rocket League exe and save folders and store them in the config")
+
+    backup = sub.add_parser("backup", help="copy today's newest saves of the current account into the backup folder")
+    backup.add_argument("--platform", choices=["steam", "epic"], required=True)
+
+    generate = sub.add_parser("generate", help="launch Rocket League and back up or replace the new account's saves")
+    generate.add_argument("--platform", choices=["steam", "epic"], required=True)
+    generate.add_argument("--mode", choices=["get_backup", "replace_existing"], required=True)
+    generate.add_argument("--base", help="target account save base; skips the game launch if its saves already exist")
+    generate.add_argument("--settle", type=float, metavar="SECONDS",
+                          help="how long new save files must stay unchanged before the game is closed")
+
+    restore_plan = sub.add_parser("restore-plan", help="show which files replacing an account's saves would touch")
+    restore_plan.add_argument("--platform", choices=["steam", "epic"], required=True)
+    restore_plan.add_argument("--base", required=True, help="account save base")
+
+    accounts = sub.add_parser("accounts", help="list known account save bases that still have save files")
+    accounts.add_argument("--platform", choices=["steam", "epic"], required=True)
+
+    snapshots = sub.add_parser("snapshots", help="list stored backup snapshots")
+    snapshots.add_argument("--account", help="only snapshots of this account base")
+
+    use_snapshot = sub.add_parser("use-snapshot", help="make a stored snapshot the active backup")
+    use_snapshot.add_argument("snapshot_id")
+
+    queue = sub.add_parser("queue", help="migrate the backup to many accounts in a row, resumable after a crash")
+    queue_sub = queue.add_subparsers(dest="queue_command", required=True)
+    queue_add = queue_sub.add_parser("add", help="add target accounts to the queue")
+    queue_add.add_argument("--platform", choices=["steam", "epic"], required=True)
+    queue_add.add_argument("--base", nargs="+", default=[], help="known account save bases")
+    queue_add.add_argument("--logged-in", type=int, default=0, metavar="N",
+                           help="add N entries that migrate whichever account is logged in when they run")
+    queue_add.add_argument("--snapshot", help="backup snapshot to migrate (default: the active backup)")
+    queue_sub.add_parser("list", help="show the queue and its throughput")
+    queue_run = queue_sub.add_parser("run", help="run the pending entries")
+    queue_run.add_argument("--limit", type=int, help="stop after this many entries")
+    queue_run.add_argument("--pause", action="store_true",
+                           help="wait for Enter before every entry that starts the game, to log in the next account")
+    queue_sub.add_parser("retry", help="put failed entries back into the queue")
+    queue_clear = queue_sub.add_parser("clear", help="remove finished entries")
+    queue_clear.add_argument("--all", action="store_true", help="remove pending entries too")
+
+    export = sub.add_parser("export", help="write the active backup or a snapshot into a compressed archive")
+    export.add_argument("path", nargs="?", help="archive file (default: ~/.RLAccountMigrator/archives)")
+    export.add_argument("--snapshot", help="export this snapshot instead of the active backup")
+
+    show_archive = sub.add_parser("archive", help="list the files of a backup archive")
+    show_archive.add_argument("path")
+
+    restore_archive = sub.add_parser("restore-archive", help="extract a backup archive into the save folder")
+    restore_archive.add_argument("path")
+    restore_archive.add_argument("--platform", choices=["steam", "epic"], required=True)
+    restore_archive.add_argument("--base", help="account save base to rename the files to")
+    restore_archive.add_argument("--file", nargs="+", dest="files", help="only extract these files")
+
+    import_parser = sub.add_parser("import-archive", help="add a backup archive to the snapshots")
+    import_parser.add_argument("path")
+
+    sub.add_parser("verify", help="check the backup folder and all snapshots against their checksums")
+
+    inspect = sub.add_parser("inspect", help="show the settings stored in a .save file, grouped by section")
+    inspect.add_argument("path")
+
+    diff = sub.add_parser("diff", help="list the settings that differ between two .save files")
+    diff.add_argument("path_a")
+    diff.add_argument("path_b")
+
+    return parser
+
+
+def cmd_locate(rl_manager: RLManager, args, progress, cancel_event):
+    locations = rl_manager.get_rocket_league_locations(progress=progress, cancel_event=cancel_event)
+    result = {"locations": locations, "status": rl_manager.check_all_paths_set()["text"]}
+    return (EXIT_OK if locations else EXIT_FAILED), result
+
+
+def cmd_backup(rl_manager: RLManager, args, progress, cancel_event):
+    err = rl_manager.check_folder_paths_set(platform=args.platform)
+    if err:
+        return EXIT_NOT_CONFIGURED, {"error": err}
+
+    saved = rl_manager.duplicate_save(platform=args.platform)
+    if isinstance(saved, str):
+        return EXIT_FAILED, {"error": saved}
+    if not saved:
+        return EXIT_FAILED, {"error": "No saves from today found to back up."}
+    return EXIT_OK, {"files": saved}
+
+
+def cmd_generate(rl_manager: RLManager, args, progress, cancel_event):
+    err = rl_manager.check_folder_paths_set(platform=args.platform)
+    if not err and args.mode == "replace_existing":
+        err = rl_manager.check_backup_folder_empty() or rl_manager.check_backup_integrity()
+    if err:
+        return EXIT_NOT_CONFIGURED, {"error": err}
+
+    if args.settle is not None:
+        rl_manager.settle_window = args.settle
+    ok = rl_manager.generate_new_save_files(mode=args.mode, platform=args.platform,
+                                            progress=progress, cancel_event=cancel_event, base_name=args.base)
+    if not ok:
+        return EXIT_FAILED, {"error": "No new save files found or Rocket League exe missing."}
+    result = {"transfer": rl_manager.last_transfer} if args.mode == "replace_existing" else {}
+    if args.base:
+        return EXIT_OK, result | {"base": args.base, "launched": False}
+    return EXIT_OK, result | {"launched": True, "detection": rl_manager.last_save_detection}
+
+
+def cmd_restore_plan(rl_manager: RLManager, args, progress, cancel_event):
+    err = (rl_manager.check_folder_paths_set(platform=args.platform)
+           or rl_manager.check_backup_folder_empty() or rl_manager.check_backup_integrity())
+    if err:
+        return EXIT_NOT_CONFIGURED, {"error": err}
+    return EXIT_OK, {"plan": summarize_plan(rl_manager.plan_replace(args.base, platform=args.platform))}
+
+
+def cmd_accounts(rl_manager: RLManager, args, progress, cancel_event):
+    return EXIT_OK, {"accounts": rl_manager.known_accounts(platform=args.platform)}
+
+
+def cmd_snapshots(rl_manager: RLManager, args, progress, cancel_event):
+    snapshots = [
+        {key: m.get(key) for key in ("id", "created", "account", "platform", "source")} | {"files": sorted(m["files"])}
+        for m in rl_manager.snapshots.list(account=args.account)
+    ]
+    return EXIT_OK, {"snapshots": snapshots, "storage": rl_manager.snapshots.usage()}
+
+
+def cmd_use_snapshot(rl_manager: RLManager, args, progress, cancel_event):
+    if rl_manager.snapshots.get(args.snapshot_id) is None:
+        return EXIT_FAILED, {"error": f"Snapshot {args.snapshot_id} does not exist."}
+    return EXIT_OK, {"files": rl_manager.use_snapshot(args.snapshot_id)}
+
+
+def cmd_queue(rl_manager: RLManager, args, progress, cancel_event):
+    queue = MigrationQueue(queue_path())
+    if args.queue_command == "add":
+        if args.snapshot and rl_manager.snapshots.get(args.snapshot) is None:
+            return EXIT_FAILED, {"error": f"Snapshot {args.snapshot} does not exist."}
+        bases = args.base + [None] * args.logged_in
+        added = [queue.add(args.platform, base=base, snapshot=args.snapshot) for base in bases]
+        return EXIT_OK, {"added": [item["id"] for item in added], "stats": queue.stats()}
+    if args.queue_command == "run":
+        def before_launch(item):
+            progress(f"Log in the next {item['platform']} account for entry {item['id']} and press Enter.")
+            # No migration is running yet, Ctrl+C has to interrupt the blocking read.
+            previous = signal.signal(signal.SIGINT, signal.default_int_handler)
+            try:
+                sys.stdin.readline()
+            finally:
+                signal.signal(signal.SIGINT, previous)
+        stats = queue.run(rl_manager, progress=progress, cancel_event=cancel_event, limit=args.limit,
+                          before_launch=before_launch if args.pause else None)
+        return (EXIT_FAILED if stats["failed"] else EXIT_OK), {"stats": stats, "items": queue.items()}
+    if args.queue_command == "retry":
+        return EXIT_OK, {"retried": queue.retry(), "stats": queue.stats()}
+    if args.queue_command == "clear":
+        return EXIT_OK, {"removed": queue.clear(finished_only=not args.all), "stats": queue.stats()}
+    return EXIT_OK, {"items": queue.items(), "stats": queue.stats()}
+
+
+def cmd_export(rl_manager: RLManager, args, progress, cancel_event):
+    if args.snapshot and rl_manager.snapshots.get(args.snapshot) is None:
+        return EXIT_FAILED, {"error": f"Snapshot {args.snapshot} does not exist."}
+    return EXIT_OK, rl_manager.export_backup(args.path, snapshot_id=args.snapshot)
+
+
+def cmd_archive(rl_manager: RLManager, args, progress, cancel_event):
+    return EXIT_OK, read_index(args.path)
+
+
+def cmd_restore_archive(rl_manager: RLManager, args, progress, cancel_event):
+    err = rl_manager.check_folder_paths_set(platform=args.platform)
+    if err:
+        return EXIT_NOT_CONFIGURED, {"error": err}
+    return EXIT_OK, {"files": rl_manager.restore_archive(args.path, platform=args.platform,
+                                                         base_name=args.base, names=args.files)}
+
+
+def cmd_import_archive(rl_manager: RLManager, args, progress, cancel_event):
+    snapshot = import_archive(rl_manager.snapshots, args.path)
+    return EXIT_OK, {"snapshot": snapshot["id"], "files": sorted(snapshot["files"])}
+
+
+def cmd_verify(rl_manager: RLManager, args, progress, cancel_event):
+    report = rl_manager.verify_backups()
+    broken = (report["backup_folder"]["corrupt"] or report["backup_folder"]["missing"]
+              or report["snapshots"]["corrupt"] or report["snapshots"]["missing"])
+    return (EXIT_FAILED if broken else EXIT_OK), report
+
+
+def cmd_inspect(rl_manager: RLManager, args, progress, cancel_event):
+    return EXIT_OK, {"sections": inspect_save(args.path)}
+
+
+def cmd_diff(rl_manager: RLManager, args, progress, cancel_event):
+    changes = diff_saves(args.path_a, args.path_b)
+    return EXIT_OK, {"changes": changes, "identical": not changes or changes.get("changed_blocks") == []}
+
+
+COMMANDS = {
+    "locate": cmd_locate,
+    "backup": cmd_backup,
+    "generate": cmd_generate,
+    "restore-plan": cmd_restore_plan,
+    "accounts": cmd_accounts,
+    "snapshots": cmd_snapshots,
+    "use-snapshot": cmd_use_snapshot,
+    "queue": cmd_queue,
+    "export": cmd_export,
+    "archive": cmd_archive,
+    "restore-archive": cmd_restore_archive,
+    "import-archive": cmd_import_archive,
+    "verify": cmd_verify,
+    "inspect": cmd_inspect,
+    "diff": cmd_diff,
+}
+
+
+def run_cli(argv) -> int:
+    args = build_parser().parse_args(argv)
+
+    def progress(text: str):
+        if not args.quiet and sys.stderr:
+            print(text, file=sys.stderr, flush=True)
+
+    # In migrations Ctrl+C cancels cleanly, which also closes the game. A second Ctrl+C,
+    # or any in the other commands, interrupts right away.
+    cancel_event = threading.Event()
+
+    def on_sigint(signum, frame):
+        if cancel_event.is_set():
+            signal.default_int_handler(signum, frame)
+        cancel_event.set()
+
+    if args.command == "generate" or (args.command == "queue" and args.queue_command == "run"):
+        signal.signal(signal.SIGINT, on_sigint)
+
+    result = {"command": args.command}
+    try:
+        # stdout only carries the JSON result, diagnostics go to stderr.
+        with contextlib.redirect_stdout(None if args.quiet else sys.stderr):
+            code, payload = COMMANDS[args.command](RLManager(), args, progress, cancel_event)
+        result.update(payload)
+    except (MigrationCancelled, KeyboardInterrupt):
+        code = EXIT_CANCELLED
+        result["error"] = "Cancelled."
+    except ValueError as e:
+        code = EXIT_FAILED
+        result["error"] = str(e)
+    except TimeoutError as e:
+        code = EXIT_CANCELLED
+        result["error"] = str(e) or "Timed out."
+    except Exception as e:
+        code = EXIT_ERROR
+        result["error"] = str(e)
+    if tracer.last_run:
+        result["trace"] = tracer.last_run["path"]
+    result["ok"] = code == EXIT_OK
+    result["exit_code"] = code
+
+    output = json.dumps(result, indent=2)
+    if sys.stdout:
+        print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    return code
@@ -0,0 +1,151 @@
+import os
+import threading
+from contextlib import contextmanager
+from settle import SETTLE_WINDOW
+from scanner import LOW_PRIORITY_DEPTH
+
+
+def _path_or_empty(kind: str):
+    def validate(value: str):
+        if not value:
+            return None
+        exists = os.path.isfile(value) if kind == "file" else os.path.isdir(value)
+        if not exists:
+            return f"{value} is not an existing {kind}"
+        return None
+    return validate
+
+
+def _in_range(low: float, high: float):
+    def validate(value: float):
+        if not low <= value <= high:
+            return f"must be between {low} and {high}"
+        return None
+    return validate
+
+
+# name -> (type, default, validator returning an error text or None)
+FIELDS = {
+    "save_path_epic": (str, "", _path_or_empty("folder")),
+    "save_path_steam": (str, "", _path_or_empty("folder")),
+    "rocket_league_path_epic": (str, "", _path_or_empty("file")),
+    "rocket_league_path_steam": (str, "", _path_or_empty("file")),
+    "backup_path": (str, "", _path_or_empty("folder")),
+    "settle_window": (float, SETTLE_WINDOW, _in_range(0.05, 30.0)),
+    # Full drive scan: extra directory names to skip (comma separated), depth limit (0 = none)
+    # and how deep trees like Windows or ProgramData are searched
+    "scan_excluded": (str, "", None),
+    "scan_max_depth": (int, 0, _in_range(0, 64)),
+    "scan_low_priority_depth": (int, LOW_PRIORITY_DEPTH, _in_range(0, 64)),
+}
+
+
+class ConfigStore:
+    """
+    Typed, validated in-memory view of the QSettings config.
+
+    All values are read once. Changes made inside transaction() are visible to
+    reads right away but only validated and written to the settings backend, in
+    one go, when the outermost transaction ends. Listeners then get the changes as
+    {name: (old, new)}. If the block raises, nothing is written.
+    """
+
+    def __init__(self, settings, fields=FIELDS):
+        self.settings = settings
+        self.fields = fields
+        self._lock = threading.RLock()
+        self._values = {name: self._load(name) for name in fields}
+        self._pending = {}
+        self._depth = 0
+        self._listeners = []
+        self.writes = 0
+
+    def _load(self, name: str):
+        type_, default, validate = self.fields[name]
+        raw = self.settings.value(name, default)
+        try:
+            value = type_(raw) if raw is not None else default
+        except (TypeError, ValueError):
+            return default
+        # Paths may be temporarily missing (unplugged drive) and are kept, other
+        # invalid values fall back to the default.
+        if type_ is not str and validate and validate(value):
+            return default
+        return value
+
+    def get(self, name: str):
+        with self._lock:
+            return self._pending.get(name, self._values[name])
+
+    def set(self, name: str, value):
+        if name not in self.fields:
+            raise KeyError(name)
+        value = self.fields[name][0](value)
+        with self.transaction():
+            with self._lock:
+                self._pending[name] = value
+
+    def validate(self, name: str, value) -> str | None:
+        validate = self.fields[name][2]
+        err = validate(value) if validate else None
+        return f"{name}: {err}" if err else None
+
+    def subscribe(self, listener):
+        """listener(changes) is called after every commit that changed something."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pending.clear()
+            raise
+        with self._lock:
+            self._depth -= 1
+            if self._depth > 0:
+                return
+            pending, self._pending = self._pending, {}
+        self._commit(pending)
+
+    def _commit(self, pending: dict):
+        changes = {name: (self._values[name], value) for name, value in pending.items()
+                   if value != self._values[name]}
+        if not changes:
+            return
+        errors = [err for name, (_, new) in changes.items() if (err := self.validate(name, new))]
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        for name, (_, new) in changes.items():
+            self._values[name] = new
+            self.settings.setValue(name, new)
+        self.settings.sync()
+        self.writes += 1
+
+        for listener in list(self._listeners):
+            listener(changes)
+
+
+class ConfigField:
+    """Exposes a config field as an attribute of the owner's config store."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.config.get(self.name)
+
+    def __set__(self, obj, value):
+        obj.config.set(self.name, value)
@@ -0,0 +1,102 @@
+import struct
+
+MAGIC = b"RLDELTA1"
+BLOCK_SIZE = 256
+_MOD = 1 << 16
+_HEADER = struct.Struct("<64sHI")  # base sha256 (hex), chain depth, target size
+_COPY = struct.Struct("<II")  # base offset, length
+_INSERT = struct.Struct("<I")  # length, followed by the data
+HEADER_SIZE = len(MAGIC) + _HEADER.size
+
+
+def _weak(block) -> tuple[int, int]:
+    a = b = 0
+    size = len(block)
+    for k, x in enumerate(block):
+        a += x
+        b += (size - k) * x
+    return a % _MOD, b % _MOD
+
+
+def encode(base: bytes, target: bytes, base_digest: str, depth: int, block_size: int = BLOCK_SIZE) -> bytes:
+    """
+    Encodes target as a delta against base, rsync style: base is indexed by a rolling
+    checksum of its aligned blocks, target is scanned byte by byte and every block found
+    in base becomes a copy instruction, extended as far as both files stay equal.
+    """
+    base_view, target_view = memoryview(base), memoryview(target)
+    index = {}
+    for offset in range(0, len(base) - block_size + 1, block_size):
+        index.setdefault(_weak(base_view[offset:offset + block_size]), []).append(offset)
+
+    out = [MAGIC, _HEADER.pack(base_digest.encode("ascii"), depth, len(target))]
+    literal_start = 0
+    i = 0
+    n = len(target)
+    a, b = _weak(target_view[:block_size]) if n >= block_size else (0, 0)
+
+    while i + block_size <= n:
+        match = None
+        for offset in index.get((a, b), ()):
+            if base_view[offset:offset + block_size] == target_view[i:i + block_size]:
+                match = offset
+                break
+
+        if match is None:
+            if i + block_size < n:
+                out_byte, in_byte = target[i], target[i + block_size]
+                a = (a - out_byte + in_byte) % _MOD
+                b = (b - block_size * out_byte + a) % _MOD
+            i += 1
+            continue
+
+        if literal_start < i:
+            out.append(b"I" + _INSERT.pack(i - literal_start) + target_view[literal_start:i].tobytes())
+        length = block_size
+        # Extend block-wise first, then byte-wise, as long as both sides agree.
+        while (i + length + block_size <= n and match + length + block_size <= len(base)
+               and base_view[match + length:match + length + block_size]
+               == target_view[i + length:i + length + block_size]):
+            length += block_size
+        while i + length < n and match + length < len(base) and base[match + length] == target[i + length]:
+            length += 1
+        out.append(b"C" + _COPY.pack(match, length))
+        i += length
+        literal_start = i
+        if i + block_size <= n:
+            a, b = _weak(target_view[i:i + block_size])
+
+    if literal_start < n:
+        out.append(b"I" + _INSERT.pack(n - literal_start) + target_view[literal_start:].tobytes())
+    return b"".join(out)
+
+
+def read_header(data: bytes) -> tuple[str, int, int]:
+    """Returns (base digest, chain depth, target size) of a delta."""
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a delta")
+    digest, depth, size = _HEADER.unpack_from(data, len(MAGIC))
+    return digest.decode("ascii"), depth, size
+
+
+def apply(base: bytes, data: bytes) -> bytes:
+    _, _, size = read_header(data)
+    out = bytearray()
+    pos = HEADER_SIZE
+    while pos < len(data):
+        op = data[pos:pos + 1]
+        pos += 1
+        if op == b"C":
+            offset, length = _COPY.unpack_from(data, pos)
+            pos += _COPY.size
+            out += base[offset:offset + length]
+        elif op == b"I":
+            (length,) = _INSERT.unpack_from(data, pos)
+            pos += _INSERT.size
+            out += data[pos:pos + length]
+            pos += length
+        else:
+            raise ValueError(f"Corrupt delta at byte {pos - 1}")
+    if len(out) != size:
+        raise ValueError("Delta produced the wrong size")
+    return bytes(out)
@@ -3,14 +3,15 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QGridLayout,
     QPushButton, QTabWidget, QLabel, QFileDialog, QMessageBox, QApplication,
-    QScrollArea, QFrame 
+    QScrollArea, QFrame, QComboBox
 )
 from util import RLManager
-import sys
-import os
-from pathlib import Path
-import shutil
-import tempfile
+from jobs import Job, JobRunner
+from tracing import tracer
+from setup_state import SetupState, PLATFORMS
+import resources_rc  # noqa: F401 - registers the embedded :/icons resources
+
+APP_ICON = ":/icons/app.png"
 
 # --- Helper Functions ---
 def show_error(parent, message):
@@ -21,6 +22,13 @@ def show_error(parent, message):
     msg.setStandardButtons(QMessageBox.StandardButton.Ok)
     msg.exec()
 
+def job_already_running(parent, job_runner: JobRunner) -> bool:
+    """Shows an error if another job is still running, tabs must not start a second one."""
+    if job_runner.is_busy():
+        show_error(parent, "Another task is still running. Wait for it to finish or cancel it first.")
+        return True
+    return False
+
 def elide_path(path: str, max_len: int = 60) -> str:
     """Shorten long paths for display but keep full path in tooltip."""
     if not path:
@@ -68,14 +76,35 @@ def card_frame_widget(title, description, notice_text=None):
 
 # --- Base Tab Class ---
 class RequiresSetupTab(QWidget):
-    def __init__(self, rl_manager: RLManager):
+    """Tab showing parts of the setup state, repainted by on_setup_changed when they change."""
+    def __init__(self, rl_manager: RLManager, setup_state: SetupState):
         super().__init__()
         self.rl_manager = rl_manager
+        self.setup_state = setup_state
+        setup_state.changed.connect(self.on_setup_changed)
+
+    def on_setup_changed(self, state: dict, keys: set):
+        pass
+
+class LazyTab(QWidget):
+    """Placeholder that builds the real tab widget the first time it is entered."""
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+        self.content = None
+        self.content_layout = QVBoxLayout(self)
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+
+    def ensure_built(self) -> QWidget:
+        if self.content is None:
+            self.content = self.factory()
+            self.content_layout.addWidget(self.content)
+        return self.content
 
     def on_enter(self):
-        """Called when the tab becomes active."""
-        if hasattr(self, "check_for_set_up"):
-            self.check_for_set_up()
+        content = self.ensure_built()
+        if hasattr(content, "on_enter"):
+            content.on_enter()
 
 # --- Main Window ---
 class RLMainWindow(QMainWindow):
@@ -87,12 +116,16 @@ class RLMainWindow(QMainWindow):
 
         self.setIcons()
 
+        self.job_runner = JobRunner(self)
+        self.setup_state = SetupState(rl_manager, parent=self)
+
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        self.home_tab = HomeTab(self.navigate_to_tab, self.rl_manager)
-        self.setup_tab = DebugTab(self.rl_manager)
-        self.migrate_tab = MigrateSettingsTab(self.rl_manager)
+        # Only the home tab is visible at startup, the others are built on first visit.
+        self.home_tab = HomeTab(self.navigate_to_tab, self.rl_manager, self.job_runner, self.setup_state)
+        self.setup_tab = LazyTab(lambda: DebugTab(self.rl_manager, self.setup_state))
+        self.migrate_tab = LazyTab(lambda: MigrateSettingsTab(self.rl_manager, self.job_runner, self.setup_state))
 
         self.tabs.addTab(self.home_tab, "Home")
         self.tabs.addTab(self.migrate_tab, "Migrate Settings")
@@ -100,50 +133,26 @@ class RLMainWindow(QMainWindow):
 
         self.tabs.currentChanged.connect(self.on_tab_changed)
     
-    def get_resource_path(self) -> str:
-        relative_icon_path = Path("assets") / "icons" / "app.png"
-
-        if sys.platform == "win32":
-            relative_icon_path = Path("assets") / "icons" / "app.ico"            
-        elif sys.platform.startswith("linux"):
-            relative_icon_path = Path("assets") / "icons" / "app.png"
-        elif sys.platform == "darwin": # macOS 
-            relative_icon_path = Path("assets") / "icons" / "app.icns"
-
-        path = os.path.join(*relative_icon_path.parts)
-
-        relative_path = Path(path)
-
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-            source_path = Path(sys._MEIPASS) / relative_path
-            target_dir = Path(tempfile.gettempdir()) / "RLAccountMigrator_Resources"
-            target_dir.mkdir(exist_ok=True)
-            target_path = target_dir / relative_path
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            if not target_path.exists() or target_path.stat().st_mtime < source_path.stat().st_mtime:
-                try:
-                    shutil.copy2(source_path, target_path) 
-                except Exception as e:
-                    print(f"ERROR copying resource: {e}")
-                    return str(source_path)
-                               
-            return str(target_path).replace("\\", "/") 
-        else:
-            return str(Path(os.path.abspath(".")) / relative_path).replace("\\", "/")
-
     def setIcons(self):
-        icon_path_str = self.get_resource_path()        
-        
-        icon = QIcon(icon_path_str)
+        icon = QIcon(APP_ICON)
 
         if icon.isNull():
-             print("ERROR: QIcon could NOT load file from the final path.")
-        
+            tracer.event("app_icon_missing", resource=APP_ICON)
+
         if not icon.isNull():
             self.setWindowIcon(icon)
             QApplication.instance().setWindowIcon(icon)
 
+    def closeEvent(self, event):
+        # Running jobs close Rocket League on cancel, give them the chance to do so.
+        self.job_runner.cancel_all()
+        self.job_runner.pool.waitForDone(15000)
+        self.setup_state.close()
+        super().closeEvent(event)
+
     def on_tab_changed(self, index: int):
+        # Folders may have changed outside the app; repaints only happen if the state differs.
+        self.setup_state.invalidate()
         widget = self.tabs.widget(index)
         if hasattr(widget, "on_enter"):
             widget.on_enter()
@@ -153,8 +162,13 @@ class RLMainWindow(QMainWindow):
 
 # --- Home Tab ---
 class HomeTab(QWidget):
-    def __init__(self, navigate_callback, rl_manager: RLManager):
+    def __init__(self, navigate_callback, rl_manager: RLManager, job_runner: JobRunner, setup_state: SetupState):
         super().__init__()
+        self.rl_manager = rl_manager
+        self.job_runner = job_runner
+        self.setup_state = setup_state
+        self.job = None
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(18, 18, 18, 18)
         layout.setSpacing(18)
@@ -176,9 +190,10 @@ class HomeTab(QWidget):
         btn_setup.setToolTip("Sets up needed paths for steam and epic")
         btn_setup.setFixedWidth(180)
         
-        stats_dic = rl_manager.check_all_paths_set()
+        stats_dic = setup_state.state["summary"]
         self.setup_step_label = QLabel(stats_dic["text"], alignment=Qt.AlignmentFlag.AlignCenter)
         self.setup_step_label.setStyleSheet(f"color: {stats_dic["color"]};")
+        setup_state.changed.connect(self.on_setup_changed)
 
         get_save_grid = QGridLayout()
         get_save_grid.setHorizontalSpacing(12)
@@ -202,6 +217,13 @@ class HomeTab(QWidget):
         get_save_grid.addWidget(get_save_epic, 1, 0)
         get_save_grid.addWidget(get_save_steam_label, 0, 1)
         get_save_grid.addWidget(get_save_steam, 1, 1)
+        # Disabled while any job of the shared runner is active
+        self.start_buttons = [btn_setup, get_save_epic, get_save_steam]
+        job_runner.busy_changed.connect(self.on_runner_busy)
+
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.setFixedWidth(160)
+        self.btn_cancel.hide()
 
         migrate_step_label = QLabel("Step 3\nNow you are ready to copy your settings to steam or epic.")
         migrate_step_label.setStyleSheet("font-size: 16px; font-weight: 600; color: #e0e0f0;")
@@ -221,27 +243,83 @@ class HomeTab(QWidget):
         layout.addWidget(self.setup_step_label)
         layout.addWidget(get_save_step_label, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addLayout(get_save_grid)
+        layout.addWidget(self.btn_cancel, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addLayout(migrate_box)
 
-        btn_setup.clicked.connect(lambda: self.run_auto_config(rl_manager))
+        btn_setup.clicked.connect(self.run_auto_config)
         btn_migrate.clicked.connect(lambda: navigate_callback(1))
-        get_save_epic.clicked.connect(lambda: rl_manager.generate_new_save_files("get_backup", "epic"))
-        get_save_steam.clicked.connect(lambda: rl_manager.generate_new_save_files("get_backup", "steam"))
+        get_save_epic.clicked.connect(lambda: self.run_get_backup("epic"))
+        get_save_steam.clicked.connect(lambda: self.run_get_backup("steam"))
+        self.btn_cancel.clicked.connect(self.cancel_job)
 
-    def run_auto_config(self, rl_manager: RLManager):
-        
+    def on_setup_changed(self, state: dict, keys: set):
+        # While a job runs the label shows its progress.
+        if "summary" in keys and self.job is None:
+            self.log_status(**state["summary"])
+
+    def on_runner_busy(self, busy: bool):
+        for btn in self.start_buttons:
+            btn.setEnabled(not busy)
+
+    def run_auto_config(self):
+        if job_already_running(self, self.job_runner):
+            return
         self.log_status(text="Starting auto config", color="#f0c36b")
-        try:
-            ok = rl_manager.get_rocket_league_locations()
-            if bool(ok):
-                self.log_status(text="Settings configured successfully!", color="#86d07f")
-                QMessageBox.information(self, "Done", "Settings configured successfully.")
-            else:
-                self.log_status(text="Couldn't configured settings.\nVisit Manual Setup", color="#d97777")
-                QMessageBox.information(self, "Info", "Couldn't configured settings.\nVisit Manual Setup")
-        except Exception as e:
-            self.log_status(text="Error occurred.", color="#d97777")
-            show_error(self, str(e))
+        # A full drive scan takes a while, it runs as a job like the save generation.
+        job = Job(self.rl_manager.get_rocket_league_locations)
+        job.signals.progress.connect(lambda text: self.log_status(text=text, color="#f0c36b"))
+        job.signals.finished.connect(self.on_auto_config_finished)
+        job.signals.failed.connect(self.on_job_failed)
+        job.signals.cancelled.connect(self.on_job_cancelled)
+        self.set_running(job)
+        self.job_runner.start(job)
+
+    def on_auto_config_finished(self, ok):
+        self.set_running(None)
+        if bool(ok):
+            self.log_status(text="Settings configured successfully!", color="#86d07f")
+            QMessageBox.information(self, "Done", "Settings configured successfully.")
+        else:
+            self.log_status(text="Couldn't configured settings.\nVisit Manual Setup", color="#d97777")
+            QMessageBox.information(self, "Info", "Couldn't configured settings.\nVisit Manual Setup")
+
+    def run_get_backup(self, platform: str = "steam" or "epic"):
+        if job_already_running(self, self.job_runner):
+            return
+        self.log_status(text="Starting Rocket League and waiting for new save files...", color="#f0c36b")
+        job = Job(self.rl_manager.generate_new_save_files, mode="get_backup", platform=platform)
+        job.signals.progress.connect(lambda text: self.log_status(text=text, color="#f0c36b"))
+        job.signals.finished.connect(self.on_get_backup_finished)
+        job.signals.failed.connect(self.on_job_failed)
+        job.signals.cancelled.connect(self.on_job_cancelled)
+        self.set_running(job)
+        self.job_runner.start(job)
+
+    def set_running(self, job: Job | None):
+        self.job = job
+        self.btn_cancel.setVisible(job is not None)
+
+    def cancel_job(self):
+        if self.job:
+            self.log_status(text="Cancelling...", color="#f0c36b")
+            self.job.cancel()
+
+    def on_get_backup_finished(self, ok):
+        self.set_running(None)
+        self.setup_state.invalidate()
+        if ok:
+            self.log_status(text="Settings saved successfully!", color="#86d07f")
+        else:
+            self.log_status(text="No saves found to back up.", color="#d97777")
+
+    def on_job_failed(self, error: str):
+        self.set_running(None)
+        self.log_status(text="Error occurred.", color="#d97777")
+        show_error(self, error)
+
+    def on_job_cancelled(self):
+        self.set_running(None)
+        self.log_status(text="Cancelled.", color="#d0d0d8")
 
     def log_status(self, text: str = "", color: str = "#d0d0d8"):
         self.setup_step_label.setText(text)
@@ -250,8 +328,12 @@ class HomeTab(QWidget):
 
 # --- Migrate Settings Tab ---
 class MigrateSettingsTab(RequiresSetupTab):
-    def __init__(self, rl_manager: RLManager):
-        super().__init__(rl_manager)
+    def __init__(self, rl_manager: RLManager, job_runner: JobRunner, setup_state: SetupState):
+        super().__init__(rl_manager, setup_state)
+        self.job_runner = job_runner
+        self.job = None
+        # Platform state currently on screen
+        self.shown = {}
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -278,9 +360,13 @@ class MigrateSettingsTab(RequiresSetupTab):
         self.status_label_epic = QLabel("Epic status: -", alignment=Qt.AlignmentFlag.AlignCenter)
         self.status_label_epic.setStyleSheet("color: #d0d0d8;")
 
+        self.account_combo_epic = QComboBox()
+        self.account_combo_epic.setToolTip("Known accounts with existing saves are migrated without starting Rocket League")
+
         migrate_grid.addWidget(migrate_header_epic, 0, 0)
-        migrate_grid.addWidget(self.btn_migrate_epic, 1, 0)
-        migrate_grid.addWidget(self.status_label_epic, 2, 0)
+        migrate_grid.addWidget(self.account_combo_epic, 1, 0)
+        migrate_grid.addWidget(self.btn_migrate_epic, 2, 0)
+        migrate_grid.addWidget(self.status_label_epic, 3, 0)
 
         migrate_header_steam = QLabel("Steam", alignment=Qt.AlignmentFlag.AlignCenter)
         self.btn_migrate_steam = QPushButton("Migrate to current steam account")
@@ -288,39 +374,69 @@ class MigrateSettingsTab(RequiresSetupTab):
         self.status_label_steam = QLabel("Steam status: -", alignment=Qt.AlignmentFlag.AlignCenter)
         self.status_label_steam.setStyleSheet("color: #d0d0d8;")
 
+        self.account_combo_steam = QComboBox()
+        self.account_combo_steam.setToolTip("Known accounts with existing saves are migrated without starting Rocket League")
+
         migrate_grid.addWidget(migrate_header_steam, 0, 1)
-        migrate_grid.addWidget(self.btn_migrate_steam, 1, 1)
-        migrate_grid.addWidget(self.status_label_steam, 2, 1)
+        migrate_grid.addWidget(self.account_combo_steam, 1, 1)
+        migrate_grid.addWidget(self.btn_migrate_steam, 2, 1)
+        migrate_grid.addWidget(self.status_label_steam, 3, 1)
 
         migrate_grid.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         main.addLayout(migrate_grid)
 
+        self.btn_cancel = QPushButton("Cancel migration")
+        self.btn_cancel.hide()
+        main.addWidget(self.btn_cancel, alignment=Qt.AlignmentFlag.AlignCenter)
+
         outer = QVBoxLayout(self)
         outer.addWidget(scroll)
 
         self.btn_migrate_epic.clicked.connect(lambda: self.run_migration(platform="epic"))
         self.btn_migrate_steam.clicked.connect(lambda: self.run_migration(platform="steam"))
-        self.check_for_set_up()
-
-    def check_for_set_up(self):
-        ready_epic = bool(self.rl_manager.save_path_epic and self.rl_manager.rocket_league_path_epic)
-        ready_steam = bool(self.rl_manager.save_path_steam and self.rl_manager.rocket_league_path_steam)
-        self.btn_migrate_steam.setEnabled(ready_steam)
-        self.btn_migrate_epic.setEnabled(ready_epic)
-        if not ready_epic:
-            self.status_label_epic.setText("Status: \nPlease repeat get config at home tab\n or \nvisit Manual Setup tab.")
-            self.status_label_epic.setStyleSheet("color: #f0b36b;")
-        elif ready_epic:
-            self.status_label_epic.setText("Status: Ready")
-            self.status_label_epic.setStyleSheet("color: #86d07f;")
-
-        if not ready_steam:
-            self.status_label_steam.setText("Status: \nPlease repeat get config at home tab\n or \nvisit Manual Setup tab.")
-            self.status_label_steam.setStyleSheet("color: #f0b36b;")
-        elif ready_steam:
-            self.status_label_steam.setText("Status: Ready")
-            self.status_label_steam.setStyleSheet("color: #86d07f;")
+        self.btn_cancel.clicked.connect(self.cancel_migration)
+        job_runner.busy_changed.connect(self.on_runner_busy)
+        self.show_state()
+
+    def on_setup_changed(self, state: dict, keys: set):
+        # Painted when the job ends, its progress stays visible until then.
+        if self.job is not None:
+            return
+        for platform in keys & set(PLATFORMS):
+            self.show_platform(platform, state[platform])
+
+    def on_runner_busy(self, busy: bool):
+        # Own jobs repaint when they end, jobs of other tabs only toggle the buttons.
+        if self.job is None:
+            self.show_state()
+
+    def show_state(self):
+        for platform in PLATFORMS:
+            self.show_platform(platform, self.setup_state.state[platform])
+
+    def show_platform(self, platform: str, info: dict):
+        shown = self.shown.get(platform, {})
+        button = self.btn_migrate_steam if platform == "steam" else self.btn_migrate_epic
+        button.setEnabled(info["ready"] and not self.job_runner.is_busy())
+        if info["accounts"] != shown.get("accounts"):
+            combo = self.account_combo_steam if platform == "steam" else self.account_combo_epic
+            self.fill_account_combo(combo, info["accounts"])
+        if info["ready"] != shown.get("ready"):
+            if info["ready"]:
+                self.log_status(platform=platform, text="Status: Ready", color="#86d07f")
+            else:
+                self.log_status(platform=platform, text="Status: \nPlease repeat get config at home tab\n or \nvisit Manual Setup tab.", color="#f0b36b")
+        self.shown[platform] = info
+
+    def fill_account_combo(self, combo: QComboBox, accounts: list):
+        selected = combo.currentData()
+        combo.clear()
+        combo.addItem("Logged in account (starts Rocket League)", None)
+        for base in accounts:
+            combo.addItem(f"Known account {elide_path(base, 20)}", base)
+        index = combo.findData(selected)
+        combo.setCurrentIndex(max(index, 0))
 
     def log_status(self, platform: str = "steam" or "epic", text: str = "", color: str = "#d0d0d8"):
         if platform == "steam":
@@ -329,10 +445,10 @@ class MigrateSettingsTab(RequiresSetupTab):
         elif platform == "epic":
             self.status_label_epic.setText(text)
             self.status_label_epic.setStyleSheet(f"color: {color};") 
-        
-        QApplication.processEvents()
 
     def run_migration(self, platform: str = "steam" or "epic"):
+        if job_already_running(self, self.job_runner):
+            return
         err = self.rl_manager.check_folder_paths_set(platform=platform)
         err2 = self.rl_manager.check_backup_folder_empty()
         if err:
@@ -341,23 +457,61 @@ class MigrateSettingsTab(RequiresSetupTab):
         if err2:
             show_error(self, err2)
             return
-        self.log_status(platform=platform, text="Starting Rocket League and waiting for new save files...", color="#f0c36b")
-        try:
-            ok = self.rl_manager.generate_new_save_files(mode="replace_existing", platform=platform)
-            if ok:
-                self.log_status(platform=platform, text="Settings migrated successfully!", color="#86d07f")
-                QMessageBox.information(self, "Done", "Settings migrated successfully.")
-            else:
-                self.log_status(platform=platform, text="No saves found to migrate.", color="#d97777")
-                QMessageBox.information(self, "Info", "No saves found to migrate.")
-        except Exception as e:
-            self.log_status(platform=platform, text="Error occurred.", color="#d97777")
-            show_error(self, str(e))
+        err3 = self.rl_manager.check_backup_integrity()
+        if err3:
+            show_error(self, err3)
+            return
+        combo = self.account_combo_steam if platform == "steam" else self.account_combo_epic
+        base_name = combo.currentData()
+        if base_name is None:
+            self.log_status(platform=platform, text="Starting Rocket League and waiting for new save files...", color="#f0c36b")
+        job = Job(self.rl_manager.generate_new_save_files, mode="replace_existing", platform=platform, base_name=base_name)
+        job.signals.progress.connect(lambda text: self.log_status(platform=platform, text=text, color="#f0c36b"))
+        job.signals.finished.connect(lambda ok: self.on_migration_finished(platform, ok))
+        job.signals.failed.connect(lambda err: self.on_migration_failed(platform, err))
+        job.signals.cancelled.connect(lambda: self.on_migration_cancelled(platform))
+        self.set_running(job)
+        self.job_runner.start(job)
+
+    def set_running(self, job: Job | None):
+        self.job = job
+        self.btn_cancel.setVisible(job is not None)
+        if job is not None:
+            self.btn_migrate_epic.setEnabled(False)
+            self.btn_migrate_steam.setEnabled(False)
+
+    def cancel_migration(self):
+        if self.job:
+            self.job.cancel()
+
+    def on_migration_finished(self, platform: str, ok):
+        self.set_running(None)
+        self.show_state()
+        self.setup_state.invalidate()
+        if ok:
+            self.log_status(platform=platform, text="Settings migrated successfully!", color="#86d07f")
+            QMessageBox.information(self, "Done", "Settings migrated successfully.")
+        else:
+            self.log_status(platform=platform, text="No saves found to migrate.", color="#d97777")
+            QMessageBox.information(self, "Info", "No saves found to migrate.")
+
+    def on_migration_failed(self, platform: str, error: str):
+        self.set_running(None)
+        self.show_state()
+        self.setup_state.invalidate()
+        self.log_status(platform=platform, text="Error occurred.", color="#d97777")
+        show_error(self, error)
+
+    def on_migration_cancelled(self, platform: str):
+        self.set_running(None)
+        self.show_state()
+        self.setup_state.invalidate()
+        self.log_status(platform=platform, text="Migration cancelled.", color="#d0d0d8")
 
 # --- Setup Tab ---
 class DebugTab(RequiresSetupTab):
-    def __init__(self, rl_manager: RLManager):
-        super().__init__(rl_manager)
+    def __init__(self, rl_manager: RLManager, setup_state: SetupState):
+        super().__init__(rl_manager, setup_state)
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -430,6 +584,20 @@ class DebugTab(RequiresSetupTab):
 
         main.addLayout(btn_grid)
 
+        timings_card = card_frame_widget(
+            "Timings",
+            "Phase breakdown of the last migration, backup or scan."
+        )
+        self.timings_label = QLabel(tracer.breakdown())
+        self.timings_label.setStyleSheet("color: #cfcfdd; font-family: monospace; font-size: 12px;")
+        self.timings_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.timings_label.setWordWrap(True)
+        timings_card.layout().addWidget(self.timings_label)
+        self.btn_export_trace = QPushButton("Export trace")
+        self.btn_export_trace.clicked.connect(self.export_trace)
+        timings_card.layout().addWidget(self.btn_export_trace)
+        main.addWidget(timings_card)
+
         outer = QVBoxLayout(self)
         outer.addWidget(scroll)
 
@@ -438,11 +606,17 @@ class DebugTab(RequiresSetupTab):
         self.btn_choose_exe_epic.clicked.connect(lambda: self.choose_path("rocket_league_epic"))
         self.btn_choose_exe_steam.clicked.connect(lambda: self.choose_path("rocket_league_steam"))
   
-        self.check_for_set_up()
-        
-    
-    def check_for_set_up(self):
-        self.update_all_labels_and_status()
+        self.on_setup_changed(setup_state.state, set(setup_state.state))
+        self.on_enter()
+
+    def on_enter(self):
+        self.timings_label.setText(tracer.breakdown())
+        self.btn_export_trace.setEnabled(tracer.last_run is not None)
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export trace", "trace.json", "Chrome trace (*.json)")
+        if path:
+            tracer.export(tracer.last_run, path)
 
     def _style_status(self, state: str, label: str = "epic" or "steam"):
         color_map = {
@@ -461,93 +635,59 @@ class DebugTab(RequiresSetupTab):
                 f"background: {bg}; color: {fg}; border-radius: 8px; padding: 8px; font-weight: 600;"
             )
 
-    def update_all_labels_and_status(self):
-        self.save_label_epic.setText(f"Epic DBE_Production folder: {elide_path(self.rl_manager.save_path_epic)}")
-        self.save_label_epic.setToolTip(self.rl_manager.save_path_epic or "")
-        self.save_label_steam.setText(f"Steam DBE_Production folder: {elide_path(self.rl_manager.save_path_steam)}")
-        self.save_label_steam.setToolTip(self.rl_manager.save_path_steam or "")
-        self.exe_label_epic.setText(f"Epic Rocket League exe: {elide_path(self.rl_manager.rocket_league_path_epic)}")
-        self.exe_label_epic.setToolTip(self.rl_manager.rocket_league_path_epic or "")
-        self.exe_label_steam.setText(f"Steam Rocket League exe: {elide_path(self.rl_manager.rocket_league_path_steam)}")
-        self.exe_label_steam.setToolTip(self.rl_manager.rocket_league_path_steam or "")
-
-        save_set_epic = bool(self.rl_manager.save_path_epic)
-        exe_set_epic = bool(self.rl_manager.rocket_league_path_epic)
-        save_set_steam = bool(self.rl_manager.save_path_steam)
-        exe_set_steam = bool(self.rl_manager.rocket_league_path_steam)
-
-        if not (save_set_steam or exe_set_steam):
-            self.status_label_steam.setText("Steam status: Please configure save & exe path.")
-            self._style_status("incomplete", "steam")
-        elif not save_set_steam and exe_set_steam:
-            self.status_label_steam.setText("Steam status: DBE_Production folder missing.")
-            self._style_status("warning", "steam")
-        elif save_set_steam and not exe_set_steam:
-            self.status_label_steam.setText("Steam status: Rocket League exe missing.")
-            self._style_status("warning", "steam")
-        else:
-            self.status_label_steam.setText("Steam status: Ready")
-            self._style_status("ready", "steam")
-
-        if not (save_set_epic or exe_set_epic):
-            self.status_label_epic.setText("Epic status: Please configure save & exe path.")
-            self._style_status("incomplete", "epic")
-        elif not save_set_epic and exe_set_epic:
-            self.status_label_epic.setText("Epic status: DBE_Production folder missing.")
-            self._style_status("warning", "epic")
-        elif save_set_epic and not exe_set_epic:
-            self.status_label_epic.setText("Epic status: Rocket League exe missing.")
-            self._style_status("warning", "epic")
+    def on_setup_changed(self, state: dict, keys: set):
+        if "backup" in keys:
+            self.backup_label.setText(f"Backup file locations: {elide_path(state['backup'])}")
+            self.backup_label.setToolTip(state["backup"] or "")
+        for platform in keys & set(PLATFORMS):
+            self.show_platform(platform, state[platform])
+
+    def show_platform(self, platform: str, info: dict):
+        name = platform.capitalize()
+        save_label = self.save_label_steam if platform == "steam" else self.save_label_epic
+        exe_label = self.exe_label_steam if platform == "steam" else self.exe_label_epic
+        status_label = self.status_label_steam if platform == "steam" else self.status_label_epic
+        save_label.setText(f"{name} DBE_Production folder: {elide_path(info['save'])}")
+        save_label.setToolTip(info["save"] or "")
+        exe_label.setText(f"{name} Rocket League exe: {elide_path(info['exe'])}")
+        exe_label.setToolTip(info["exe"] or "")
+
+        if not (info["save"] or info["exe"]):
+            status_label.setText(f"{name} status: Please configure save & exe path.")
+            self._style_status("incomplete", platform)
+        elif not info["save"]:
+            status_label.setText(f"{name} status: DBE_Production folder missing.")
+            self._style_status("warning", platform)
+        elif not info["exe"]:
+            status_label.setText(f"{name} status: Rocket League exe missing.")
+            self._style_status("warning", platform)
+        elif not info["save_exists"]:
+            status_label.setText(f"{name} status: DBE_Production folder not found.")
+            self._style_status("error", platform)
+        elif not info["exe_exists"]:
+            status_label.setText(f"{name} status: Rocket League exe not found.")
+            self._style_status("error", platform)
         else:
-            self.status_label_epic.setText("Epic status: Ready")
-            self._style_status("ready", "epic")
-
-        win = self.window()
-        if hasattr(win, "tabs"):
-            for i in range(win.tabs.count()):
-                w = win.tabs.widget(i)
-                if hasattr(w, "check_for_set_up"):
-                    try:
-                        w.check_for_set_up()
-                    except Exception:
-                        pass
+            status_label.setText(f"{name} status: Ready")
+            self._style_status("ready", platform)
 
     def choose_path(self, folder_type: str):
-        settings = self.rl_manager.settings
-        if folder_type == "rocket_league_epic" or folder_type == "rocket_league_steam":
-            path, _ = QFileDialog.getOpenFileName(self, "Select Rocket League exe", "", "Executables (*.exe)")
-            if path:
-                if folder_type == "rocket_league_epic":
-                    self.rl_manager.rocket_league_path_epic = path
-                    settings.setValue("rocket_league_path_epic", path)
-                elif folder_type == "rocket_league_steam":
-                    self.rl_manager.rocket_league_path_steam = path
-                    settings.setValue("rocket_league_path_steam", path)
-        else:
-            folder = QFileDialog.getExistingDirectory(self, f"Choose {folder_type} folder")
-            if folder:
-                if folder_type == "save_epic" or folder_type == "save_steam":
-                    if folder_type == "save_epic":
-                        self.rl_manager.save_path_epic = folder
-                        err = self.rl_manager.check_folders_identical(platform="epic")
-                        err2 = self.rl_manager.check_path_contains_save_files(platform="epic")
-                        if err:
-                            self.rl_manager.save_path_epic = ""
-                            show_error(self, err)
-                        elif err2:
-                            self.rl_manager.save_path_epic = ""
-                            show_error(self, err2)
-                        settings.setValue("save_path_epic", self.rl_manager.save_path_epic)
-                    elif folder_type == "save_steam":
-                        self.rl_manager.save_path_steam = folder
-                        err = self.rl_manager.check_folders_identical(platform="steam")
-                        err2 = self.rl_manager.check_path_contains_save_files(platform="steam")
+        rl_manager = self.rl_manager
+        try:
+            if folder_type == "rocket_league_epic" or folder_type == "rocket_league_steam":
+                path, _ = QFileDialog.getOpenFileName(self, "Select Rocket League exe", "", "Executables (*.exe)")
+                if path:
+                    setattr(rl_manager, folder_type.replace("rocket_league", "rocket_league_path"), path)
+            else:
+                folder = QFileDialog.getExistingDirectory(self, f"Choose {folder_type} folder")
+                if folder and folder_type in ("save_epic", "save_steam"):
+                    platform = folder_type.removeprefix("save_")
+                    # Checked before the commit, an invalid folder is never persisted.
+                    with rl_manager.config.transaction():
+                        setattr(rl_manager, f"save_path_{platform}", folder)
+                        err = (rl_manager.check_folders_identical(platform=platform)
+                               or rl_manager.check_path_contains_save_files(platform=platform))
                         if err:
-                            self.rl_manager.save_path_steam = ""
-                            show_error(self, err)
-                        elif err2:
-                            self.rl_manager.save_path_steam = ""
-                            show_error(self, err2)
-                        settings.setValue("save_path_steam", self.rl_manager.save_path_steam)
-
-        self.update_all_labels_and_status()
\ No newline at end of file
+                            raise ValueError(err)
+        except ValueError as e:
+            show_error(self, str(e))
\ No newline at end of file
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+MANIFEST_NAME = ".checksums.json"
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def copy_with_hash(src: str, dst: str) -> tuple[str, int]:
+    """Copies src to dst like shutil.copy2 and hashes the data in the same pass."""
+    h = hashlib.sha256()
+    size = 0
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        while chunk := fsrc.read(CHUNK_SIZE):
+            h.update(chunk)
+            fdst.write(chunk)
+            size += len(chunk)
+    shutil.copystat(src, dst)
+    return h.hexdigest(), size
+
+
+def is_manifest(name: str) -> bool:
+    return name == MANIFEST_NAME or name == MANIFEST_NAME + ".tmp"
+
+
+def load_manifest(folder: str) -> dict | None:
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write_manifest(folder: str, hashes: dict) -> dict:
+    """Writes the checksum manifest for already known file hashes (name -> sha256)."""
+    files = {}
+    for name, digest in hashes.items():
+        st = os.stat(os.path.join(folder, name))
+        files[name] = {"hash": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    manifest = {"algorithm": "sha256", "files": files}
+    _save(folder, manifest)
+    return manifest
+
+
+def _save(folder: str, manifest: dict):
+    tmp_path = os.path.join(folder, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(folder, MANIFEST_NAME))
+
+
+def verify_folder(folder: str, max_workers: int = 4) -> dict:
+    """
+    Checks a folder against its checksum manifest.
+
+    Files whose size and mtime still match the manifest are trusted without
+    reading them; only changed files are re-hashed, in parallel. Returns lists
+    of ok, corrupt, missing and untracked file names.
+    """
+    report = {"ok": [], "corrupt": [], "missing": [], "untracked": [], "rehashed": 0, "has_manifest": False}
+    manifest = load_manifest(folder)
+    if manifest is None:
+        return report
+    report["has_manifest"] = True
+
+    to_hash = []
+    for name, info in manifest["files"].items():
+        try:
+            st = os.stat(os.path.join(folder, name))
+        except OSError:
+            report["missing"].append(name)
+            continue
+        if st.st_size != info["size"]:
+            report["corrupt"].append(name)
+        elif st.st_mtime_ns == info["mtime_ns"]:
+            report["ok"].append(name)
+        else:
+            to_hash.append((name, st))
+
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            digests = pool.map(lambda item: hash_file(os.path.join(folder, item[0])), to_hash)
+            for (name, st), digest in zip(to_hash, digests):
+                if digest == manifest["files"][name]["hash"]:
+                    report["ok"].append(name)
+                    # Touched but intact, don't read it again next time.
+                    manifest["files"][name]["mtime_ns"] = st.st_mtime_ns
+                else:
+                    report["corrupt"].append(name)
+        report["rehashed"] = len(to_hash)
+        _save(folder, manifest)
+
+    tracked = set(manifest["files"])
+    report["untracked"] = sorted(n for n in os.listdir(folder) if n not in tracked and not is_manifest(n))
+    return report
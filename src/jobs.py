@@ -0,0 +1,86 @@
+import threading
+import time
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from util import MigrationCancelled
+from tracing import tracer
+
+
+class JobSignals(QObject):
+    progress = Signal(str)
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class Job(QRunnable):
+    """
+    Runs fn(*args, progress=..., cancel_event=..., **kwargs) on a worker thread.
+
+    Results, errors and progress texts are delivered through Qt signals, so slots
+    connected from the GUI run on the main thread.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = JobSignals()
+        self.cancel_event = threading.Event()
+        self.created = time.perf_counter()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        name = getattr(self.fn, "__name__", "job")
+        queued_ms = (time.perf_counter() - self.created) * 1000
+        try:
+            with tracer.run(f"job {name}", queued_ms=round(queued_ms, 1)):
+                result = self.fn(*self.args, progress=self.signals.progress.emit, cancel_event=self.cancel_event, **self.kwargs)
+        except MigrationCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class JobRunner(QObject):
+    """
+    Starts jobs on the global QThreadPool and keeps them alive until they are done.
+
+    All tabs share one runner and only start a job while it is idle, two jobs would
+    launch the game and work on the same save folder. busy_changed(bool) is emitted
+    when the first job starts and when the last one ended.
+    """
+
+    busy_changed = Signal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool.globalInstance()
+        self.active = set()
+
+    def start(self, job: Job) -> Job:
+        self.active.add(job)
+        for signal in (job.signals.finished, job.signals.failed, job.signals.cancelled):
+            signal.connect(lambda *_, job=job: self._job_done(job))
+        if len(self.active) == 1:
+            self.busy_changed.emit(True)
+        self.pool.start(job)
+        return job
+
+    def _job_done(self, job: Job):
+        if job in self.active:
+            self.active.discard(job)
+            if not self.active:
+                self.busy_changed.emit(False)
+
+    def cancel_all(self):
+        for job in list(self.active):
+            job.cancel()
+
+    def is_busy(self) -> bool:
+        return bool(self.active)
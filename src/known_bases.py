@@ -0,0 +1,33 @@
+import json
+import os
+import time
+
+
+class KnownBases:
+    """Persistent record of the account save bases seen per platform."""
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.data = {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def record(self, platform: str, base: str):
+        now = time.time()
+        entry = self.data.setdefault(platform, {}).setdefault(base, {"first_seen": now})
+        entry["last_seen"] = now
+        self.save()
+
+    def bases(self, platform: str) -> list:
+        """Known bases of a platform, most recently seen first."""
+        entries = self.data.get(platform, {})
+        return sorted(entries, key=lambda b: entries[b]["last_seen"], reverse=True)
@@ -0,0 +1,236 @@
+import glob
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+STEAM_APP_ID = "252950"
+EPIC_APP_NAME = "Sugar"  # Rocket League's app name in Epic manifests
+GAME_TITLE = "rocket league"
+
+EXE_RELATIVE = Path("Binaries") / "Win64" / "RocketLeague.exe"
+TAGAME_RELATIVE = Path("My Games") / "Rocket League" / "TAGame"
+
+_VDF_TOKEN = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}])|//[^\n]*')
+
+
+def parse_vdf(text: str) -> dict:
+    """Parses Valve's KeyValues text format (libraryfolders.vdf, *.acf). Keys are lowercased."""
+    root = {}
+    stack = [root]
+    key = None
+    for match in _VDF_TOKEN.finditer(text):
+        string, brace = match.groups()
+        if string is not None:
+            string = string.replace("\\\\", "\\").replace('\\"', '"')
+            if key is None:
+                key = string.lower()
+            else:
+                stack[-1][key] = string
+                key = None
+        elif brace == "{":
+            child = {}
+            stack[-1][key] = child
+            stack.append(child)
+            key = None
+        elif brace == "}" and len(stack) > 1:
+            stack.pop()
+    return root
+
+
+def _read_vdf(path: Path) -> dict:
+    try:
+        return parse_vdf(path.read_text(encoding="utf-8", errors="replace"))
+    except OSError:
+        return {}
+
+
+def _read_json(path: Path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _registry_value(key_path: str, name: str, hive: str = "HKEY_CURRENT_USER") -> str | None:
+    if sys.platform != "win32":
+        return None
+    import winreg
+    try:
+        with winreg.OpenKey(getattr(winreg, hive), key_path) as key:
+            value, _ = winreg.QueryValueEx(key, name)
+            return os.path.expandvars(value)
+    except OSError:
+        return None
+
+
+def windows_documents() -> list:
+    """The Documents folder, also when it was moved (e.g. into OneDrive)."""
+    folders = []
+    shell = _registry_value(r"Software\Microsoft\Windows\CurrentVersion\Explorer\User Shell Folders", "Personal")
+    if shell:
+        folders.append(Path(shell))
+    folders.append(Path.home() / "Documents")
+    return folders
+
+
+def _save_folder(documents: Path, platform: str) -> Path:
+    return documents / TAGAME_RELATIVE / ("SaveDataEpic" if platform == "epic" else "SaveData") / "DBE_Production"
+
+
+def _prefix_documents(prefix: Path) -> list:
+    """Documents folders of all users inside a Wine/Proton prefix."""
+    return [Path(p) for p in glob.glob(str(prefix / "drive_c" / "users" / "*" / "Documents"))]
+
+
+# --- Steam ---
+def steam_roots() -> list:
+    home = Path.home()
+    if sys.platform == "win32":
+        roots = [_registry_value(r"Software\Valve\Steam", "SteamPath"),
+                 os.path.join(os.getenv("ProgramFiles(x86)", r"C:\Program Files (x86)"), "Steam")]
+    elif sys.platform == "darwin":
+        roots = [home / "Library" / "Application Support" / "Steam"]
+    else:
+        roots = [
+            home / ".steam" / "steam",
+            home / ".local" / "share" / "Steam",
+            home / ".var" / "app" / "com.valvesoftware.Steam" / ".local" / "share" / "Steam",  # Flatpak
+            home / "snap" / "steam" / "common" / ".local" / "share" / "Steam",
+        ]
+    result = []
+    for root in roots:
+        if root and os.path.isdir(root):
+            resolved = Path(root).resolve()
+            if resolved not in result:
+                result.append(resolved)
+    return result
+
+
+def steam_libraries(root: Path) -> list:
+    libraries = [root]
+    for vdf_path in (root / "steamapps" / "libraryfolders.vdf", root / "config" / "libraryfolders.vdf"):
+        folders = _read_vdf(vdf_path).get("libraryfolders", {})
+        for entry in folders.values():
+            # New format: {"path": ...}, old format: "1" "D:\\SteamLibrary"
+            path = entry.get("path") if isinstance(entry, dict) else entry
+            if path and os.path.isdir(path) and Path(path).resolve() not in libraries:
+                libraries.append(Path(path).resolve())
+    return libraries
+
+
+def find_steam() -> dict:
+    found = {}
+    for root in steam_roots():
+        for library in steam_libraries(root):
+            manifest = _read_vdf(library / "steamapps" / f"appmanifest_{STEAM_APP_ID}.acf").get("appstate")
+            if not manifest:
+                continue
+            exe = library / "steamapps" / "common" / manifest.get("installdir", "rocketleague") / EXE_RELATIVE
+            if exe.is_file():
+                found.setdefault("Steam_exe", str(exe))
+
+            # Proton keeps the Windows Documents folder inside the game's prefix.
+            prefix = library / "steamapps" / "compatdata" / STEAM_APP_ID / "pfx"
+            for documents in _prefix_documents(prefix):
+                folder = _save_folder(documents, "steam")
+                if folder.is_dir():
+                    found.setdefault("Steam_folder", str(folder))
+    return found
+
+
+# --- Epic ---
+def _is_rocket_league(app_name: str | None, title: str | None) -> bool:
+    return app_name == EPIC_APP_NAME or GAME_TITLE in (title or "").lower()
+
+
+def _epic_launcher_installs() -> list:
+    """(install location, executable) from the Epic Games Launcher manifests."""
+    if sys.platform == "win32":
+        data = Path(os.getenv("ProgramData", r"C:\ProgramData")) / "Epic"
+        manifest_dir = data / "EpicGamesLauncher" / "Data" / "Manifests"
+    elif sys.platform == "darwin":
+        data = None
+        manifest_dir = Path.home() / "Library" / "Application Support" / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
+    else:
+        return []
+
+    installs = []
+    for item in glob.glob(str(manifest_dir / "*.item")):
+        manifest = _read_json(Path(item)) or {}
+        if _is_rocket_league(manifest.get("AppName"), manifest.get("DisplayName")) and manifest.get("InstallLocation"):
+            installs.append((Path(manifest["InstallLocation"]), manifest.get("LaunchExecutable") or str(EXE_RELATIVE)))
+
+    if data is not None:
+        installed = _read_json(data / "UnrealEngineLauncher" / "LauncherInstalled.dat") or {}
+        for entry in installed.get("InstallationList", []):
+            if entry.get("AppName") == EPIC_APP_NAME and entry.get("InstallLocation"):
+                installs.append((Path(entry["InstallLocation"]), str(EXE_RELATIVE)))
+    return installs
+
+
+def _heroic_installs() -> list:
+    """(install location, executable, wine prefix) from Heroic / legendary on Linux."""
+    home = Path.home()
+    config_dirs = [
+        home / ".config" / "heroic",
+        home / ".var" / "app" / "com.heroicgameslauncher.hgl" / "config" / "heroic",  # Flatpak
+    ]
+    installed_files = [c / "legendaryConfig" / "legendary" / "installed.json" for c in config_dirs]
+    installed_files.append(home / ".config" / "legendary" / "installed.json")
+
+    installs = []
+    for installed_file in installed_files:
+        installed = _read_json(installed_file) or {}
+        for app_name, entry in installed.items():
+            if not isinstance(entry, dict) or not _is_rocket_league(app_name, entry.get("title")):
+                continue
+            prefixes = []
+            for config_dir in config_dirs:
+                game_config = (_read_json(config_dir / "GamesConfig" / f"{app_name}.json") or {}).get(app_name, {})
+                if game_config.get("winePrefix"):
+                    prefixes.append(Path(game_config["winePrefix"]))
+            prefixes += [Path(p) for p in glob.glob(str(home / "Games" / "Heroic" / "Prefixes" / "*"))]
+            installs.append((Path(entry.get("install_path", "")), entry.get("executable") or str(EXE_RELATIVE), prefixes))
+    return installs
+
+
+def find_epic() -> dict:
+    found = {}
+    for location, executable in _epic_launcher_installs():
+        exe = location / executable
+        if exe.is_file():
+            found.setdefault("Epic_exe", str(exe))
+
+    if sys.platform.startswith("linux"):
+        for location, executable, prefixes in _heroic_installs():
+            exe = location / executable
+            if exe.is_file():
+                found.setdefault("Epic_exe", str(exe))
+            for prefix in prefixes:
+                for documents in _prefix_documents(prefix):
+                    folder = _save_folder(documents, "epic")
+                    if folder.is_dir():
+                        found.setdefault("Epic_folder", str(folder))
+    return found
+
+
+def discover_locations() -> dict:
+    """
+    Slot -> path of the Rocket League exe and save folders, resolved from the Steam
+    and Epic launcher manifests instead of scanning drives. Only a few small files
+    are read; slots that can't be resolved are left out.
+    """
+    found = {}
+    found.update(find_steam())
+    found.update(find_epic())
+
+    if sys.platform == "win32":
+        for documents in windows_documents():
+            for slot, platform in (("Steam_folder", "steam"), ("Epic_folder", "epic")):
+                folder = _save_folder(documents, platform)
+                if folder.is_dir():
+                    found.setdefault(slot, str(folder))
+    return found
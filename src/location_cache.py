@@ -0,0 +1,153 @@
+import json
+import os
+import stat
+from scanner import DriveScanner
+
+CACHE_VERSION = 1
+# How many ancestor directories are remembered per candidate. Their mtimes tell us
+# which subtree changed when a cached path disappears.
+PARENT_DEPTH = 4
+
+
+def _fingerprint(st: os.stat_result) -> list:
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def _is_expected_type(slot: str, is_dir: bool) -> bool:
+    return is_dir if slot.endswith("_folder") else not is_dir
+
+
+class LocationCache:
+    """
+    Persistent record of every Rocket League exe / DBE_Production candidate ever found.
+
+    Each candidate keeps a stat fingerprint and the mtimes of its nearest parent
+    directories. Validation costs a couple of stat calls per entry. A candidate
+    that vanished only triggers a scan of the nearest ancestor whose mtime changed,
+    not a full drive scan.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.entries = {}
+        self.stale = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            data = {}
+        if data.get("version") != CACHE_VERSION:
+            data = {}
+        self.entries = data.get("slots", {})
+        self.stale = data.get("stale", {})
+        self.validate()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "slots": self.entries, "stale": self.stale}, f, indent=2)
+        os.replace(tmp_path, self.cache_path)
+
+    def validate(self):
+        """Stat every cached candidate and move the ones that vanished to the stale list."""
+        changed = False
+        for slot, candidates in self.entries.items():
+            valid = []
+            for entry in candidates:
+                try:
+                    st = os.stat(entry["path"])
+                except OSError:
+                    self.stale.setdefault(slot, []).append(entry)
+                    changed = True
+                    continue
+                if not _is_expected_type(slot, stat.S_ISDIR(st.st_mode)):
+                    self.stale.setdefault(slot, []).append(entry)
+                    changed = True
+                    continue
+                if entry["fingerprint"] != _fingerprint(st):
+                    entry["fingerprint"] = _fingerprint(st)
+                    changed = True
+                valid.append(entry)
+            self.entries[slot] = valid
+        if changed:
+            self.save()
+
+    def lookup(self, slots) -> dict:
+        """Returns slot -> path for every requested slot with a still valid candidate."""
+        # Re-stat first, paths may have vanished since the cache was loaded.
+        self.validate()
+        found = {}
+        for slot in slots:
+            if self.entries.get(slot):
+                found[slot] = self.entries[slot][0]["path"]
+        return found
+
+    def rescan_stale(self, slots, **scanner_options) -> dict:
+        """
+        Re-scans only the changed subtrees of stale candidates for the requested slots.
+        scanner_options are passed on to DriveScanner (denylist, depth limits).
+        """
+        roots = set()
+        for slot in slots:
+            for entry in self.stale.get(slot, []):
+                root = self._changed_ancestor(entry)
+                if root:
+                    roots.add(root)
+        # Stale entries are resolved by this scan or cannot be resolved without a full one.
+        for slot in slots:
+            self.stale.pop(slot, None)
+        if not roots:
+            self.save()
+            return {}
+
+        scanner = DriveScanner(roots, slots=slots, **scanner_options)
+        found = scanner.scan()
+        self.update(scanner.candidates)
+        return found
+
+    def update(self, candidates: dict):
+        for slot, paths in candidates.items():
+            known = {e["path"] for e in self.entries.get(slot, [])}
+            for path in paths:
+                if path in known:
+                    continue
+                entry = self._make_entry(path)
+                if entry:
+                    self.entries.setdefault(slot, []).append(entry)
+                    known.add(path)
+        self.save()
+
+    def _make_entry(self, path: str) -> dict | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        parents = {}
+        parent = os.path.dirname(path)
+        for _ in range(PARENT_DEPTH):
+            try:
+                parents[parent] = os.stat(parent).st_mtime_ns
+            except OSError:
+                break
+            next_parent = os.path.dirname(parent)
+            if next_parent == parent:
+                break
+            parent = next_parent
+        return {"path": path, "fingerprint": _fingerprint(st), "parents": parents}
+
+    def _changed_ancestor(self, entry: dict) -> str | None:
+        # Parents are stored nearest first. The farthest one that still exists but whose
+        # mtime moved bounds the subtree in which the candidate was removed or renamed.
+        changed = None
+        for parent, mtime_ns in entry.get("parents", {}).items():
+            try:
+                current = os.stat(parent).st_mtime_ns
+            except OSError:
+                continue
+            if current != mtime_ns:
+                changed = parent
+        return changed
@@ -1,8 +1,7 @@
+import time
+STARTED_AT = time.perf_counter()
+
 import sys
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QPalette, QColor
-from gui import RLMainWindow
-from util import RLManager
 
 style = """
 /* --- Main Window --- */
@@ -143,6 +142,22 @@ QScrollArea {
 
 
 def main():
+    # Any command line arguments select the headless mode, which never loads widget code.
+    if len(sys.argv) > 1:
+        from cli import run_cli
+        sys.exit(run_cli(sys.argv[1:]))
+    run_gui()
+
+def run_gui():
+    from startup import StartupTimer
+    startup_timer = StartupTimer(start=STARTED_AT)
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QPalette, QColor
+    from gui import RLMainWindow
+    from util import RLManager
+    startup_timer.mark("imports")
+
     rl_manager = RLManager()
     app = QApplication(sys.argv)
     
@@ -167,6 +182,8 @@ def main():
     app.setStyleSheet(style)
 
     window = RLMainWindow(rl_manager)
+    startup_timer.mark("window")
+    startup_timer.watch_first_paint(window)
     window.show()
     sys.exit(app.exec())
 
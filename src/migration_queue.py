@@ -0,0 +1,175 @@
+import json
+import os
+import time
+from integrity import load_manifest
+from util import MigrationCancelled
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def queue_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "migration_queue.json")
+
+
+class MigrationQueue:
+    """
+    Persistent list of target accounts the backup is migrated to, one after another.
+
+    An entry is a platform plus either a known account base (migrated without
+    starting the game) or none, which migrates the account logged in when the entry
+    runs. Such an entry fails before any file is copied if the game created no new
+    account saves, i.e. the previous account is still logged in. Every state change
+    is written to disk right away.
+
+    Entries still marked running when the queue is loaded were interrupted by a crash
+    or reboot and run again. Once the game has created an entry's save files, its
+    account base is stored, so the rerun only copies files and skips the launch.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.data = {"next_id": 1, "items": []}
+
+        interrupted = [item for item in self.data["items"] if item["status"] == RUNNING]
+        for item in interrupted:
+            item["status"] = PENDING
+            item["interrupted"] = item.get("interrupted", 0) + 1
+        if interrupted:
+            self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def add(self, platform: str, base: str | None = None, snapshot: str | None = None) -> dict:
+        """snapshot selects the backup to migrate; None uses the backup folder as it is."""
+        item = {
+            "id": self.data["next_id"],
+            "platform": platform,
+            "base": base,
+            "snapshot": snapshot,
+            "status": PENDING,
+            "attempts": 0,
+            "added": time.time(),
+            "started": None,
+            "finished": None,
+            "phase": None,
+            "error": None,
+        }
+        self.data["next_id"] += 1
+        self.data["items"].append(item)
+        self.save()
+        return item
+
+    def items(self, status: str | None = None) -> list:
+        return [item for item in self.data["items"] if status is None or item["status"] == status]
+
+    def retry(self) -> int:
+        """Puts failed entries back into the queue."""
+        failed = self.items(FAILED)
+        for item in failed:
+            item.update(status=PENDING, error=None)
+        if failed:
+            self.save()
+        return len(failed)
+
+    def clear(self, finished_only: bool = True) -> int:
+        keep = [item for item in self.data["items"] if finished_only and item["status"] in (PENDING, RUNNING)]
+        removed = len(self.data["items"]) - len(keep)
+        self.data["items"] = keep
+        self.save()
+        return removed
+
+    def stats(self) -> dict:
+        """Entry counts and throughput, measured over the time entries were actually running."""
+        counts = {status: len(self.items(status)) for status in (PENDING, RUNNING, DONE, FAILED)}
+        busy = sum(item["finished"] - item["started"] for item in self.data["items"]
+                   if item["status"] in (DONE, FAILED) and item["started"] and item["finished"])
+        counts["busy_seconds"] = round(busy, 1)
+        counts["accounts_per_hour"] = round(counts[DONE] * 3600 / busy, 1) if busy else None
+        return counts
+
+    def run(self, rl_manager, progress=None, cancel_event=None, limit: int | None = None,
+            before_launch=None) -> dict:
+        """
+        Runs pending entries in order until the queue is empty, limit entries ran or
+        cancel_event is set. A failed entry is recorded and the queue goes on.
+        before_launch(item) is called before an entry that starts the game, e.g. to let
+        the operator log in the next account. Returns stats().
+        """
+        report = progress or (lambda text: None)
+        ran = 0
+        while limit is None or ran < limit:
+            if cancel_event is not None and cancel_event.is_set():
+                raise MigrationCancelled()
+            item = next(iter(self.items(PENDING)), None)
+            if item is None:
+                break
+            if not item["base"] and before_launch is not None:
+                before_launch(item)
+            self._run_item(rl_manager, item, report, cancel_event)
+            ran += 1
+            stats = self.stats()
+            report(f"{stats[DONE]} done, {stats[PENDING]} pending, "
+                   f"{stats['accounts_per_hour'] or 0:.1f} accounts/hour")
+        return self.stats()
+
+    def _use_snapshot(self, rl_manager, snapshot_id: str):
+        snapshot = rl_manager.snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise ValueError(f"Snapshot {snapshot_id} does not exist.")
+        active = (load_manifest(rl_manager.backup_path) or {}).get("files", {})
+        wanted = {name: f["hash"] for name, f in snapshot["files"].items()}
+        if {name: f.get("hash") for name, f in active.items()} != wanted:
+            rl_manager.use_snapshot(snapshot_id)
+
+    def _run_item(self, rl_manager, item: dict, report, cancel_event):
+        label = f"[{item['id']}] {item['platform']} {item['base'] or 'logged in account'}"
+        item.update(status=RUNNING, started=time.time(), finished=None, phase=None, error=None)
+        item["attempts"] += 1
+        self.save()
+
+        def checkpoint(text: str):
+            report(f"{label}: {text}")
+            item["phase"] = text
+            # Set by the save detection, a rerun of this entry then skips the game launch.
+            detection = rl_manager.last_save_detection
+            if not item["base"] and detection and detection.get("base"):
+                item["base"] = detection["base"]
+            self.save()
+
+        try:
+            if item["snapshot"]:
+                self._use_snapshot(rl_manager, item["snapshot"])
+            err = (rl_manager.check_folder_paths_set(platform=item["platform"])
+                   or rl_manager.check_backup_folder_empty() or rl_manager.check_backup_integrity())
+            if err:
+                raise ValueError(err)
+            rl_manager.last_save_detection = None
+            ok = rl_manager.generate_new_save_files(mode="replace_existing", platform=item["platform"],
+                                                    progress=checkpoint, cancel_event=cancel_event,
+                                                    base_name=item["base"], require_new_base=True)
+        except MigrationCancelled:
+            item.update(status=PENDING, started=None)
+            self.save()
+            raise
+        except Exception as e:
+            item.update(status=FAILED, error=str(e))
+        else:
+            if not ok:
+                item.update(status=FAILED, error="No new save files found or Rocket League exe missing.")
+            else:
+                item["status"] = DONE
+        item["finished"] = time.time()
+        self.save()
+        report(f"{label}: {item['status']}")
@@ -0,0 +1,98 @@
+import subprocess
+import time
+import psutil
+
+GAME_PROCESS_NAME = "RocketLeague"
+# Minimum time between two walks of the process table for launcher hand-offs, in seconds
+ADOPT_INTERVAL = 1.0
+
+
+def find_running_game() -> list:
+    return [p for p in psutil.process_iter(["name", "create_time"])
+            if p.info["name"] and GAME_PROCESS_NAME in p.info["name"]]
+
+
+class GameProcess:
+    """
+    Launches Rocket League and keeps track of the processes that belong to that launch.
+
+    Besides the spawned process and its children, game processes that appeared after
+    the launch are adopted too, because Steam and Epic may relaunch the exe through
+    their launcher, which hands the game over to a process we did not spawn.
+    """
+
+    def __init__(self, exe_path: str):
+        self.exe_path = exe_path
+        self.launched_at = None
+        self.tracked = {}
+        self._adopted_at = None
+
+    def launch(self):
+        self.launched_at = time.time()
+        popen = subprocess.Popen([self.exe_path])
+        try:
+            self._track(psutil.Process(popen.pid))
+        except psutil.NoSuchProcess:
+            pass
+
+    def _track(self, proc: psutil.Process):
+        self.tracked.setdefault(proc.pid, proc)
+
+    def refresh(self, adopt: bool = False) -> list:
+        """
+        Adds children and launcher hand-offs to the tracked set and returns the live
+        processes. Hand-offs need a walk of the whole process table, which is done at
+        most every ADOPT_INTERVAL seconds unless adopt is set.
+        """
+        for proc in list(self.tracked.values()):
+            try:
+                for child in proc.children(recursive=True):
+                    self._track(child)
+            except psutil.NoSuchProcess:
+                pass
+
+        now = time.monotonic()
+        due = self._adopted_at is None or now - self._adopted_at >= ADOPT_INTERVAL
+        if self.launched_at is not None and (adopt or due):
+            self._adopted_at = now
+            # create_time has a coarse resolution on some systems, allow a small margin.
+            for proc in find_running_game():
+                if proc.info["create_time"] >= self.launched_at - 1:
+                    self._track(proc)
+
+        alive = []
+        for pid, proc in list(self.tracked.items()):
+            if proc.is_running():
+                alive.append(proc)
+            else:
+                del self.tracked[pid]
+        return alive
+
+    def shutdown(self, timeout: float = 10) -> dict:
+        """
+        Terminates every tracked process at once and waits for all of them under one
+        deadline; whatever is left afterwards gets killed.
+        """
+        procs = self.refresh(adopt=True)
+        deadline = time.monotonic() + timeout
+
+        for proc in procs:
+            try:
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                pass
+        gone, alive = psutil.wait_procs(procs, timeout=max(0.0, deadline - time.monotonic()))
+
+        killed = []
+        for proc in alive:
+            try:
+                proc.kill()
+                killed.append(proc)
+            except psutil.NoSuchProcess:
+                pass
+        if killed:
+            psutil.wait_procs(killed, timeout=max(1.0, deadline - time.monotonic()))
+
+        self.tracked.clear()
+        self.launched_at = None
+        return {"terminated": len(gone), "killed": len(killed)}
@@ -0,0 +1,3537 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\xda\x9c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x06\
+bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
+\x80\x00IDATx\xda\xec\xfdw\xb8%Gu/\
+\x0c\xff\xaa\xbaw<9\xcd\x9c\xc99(\x8e\x02\x0a \
+\x09\x09D\x10\x02\x03\x22\x19\x1c16\xf7\xbe~m_\
+\xdb\xd76\xd7\x01'0N\xd8\xc6\xf15\xb6\xe1^\xc3\
+\xb5A$\x9b\x9c\x14\x11\x92\x10\xcaY3\x9a\x1c\xcf\xcc\
+\xc9i\xe7\xdd\xb5\xbe?\xba\xabjUu\xef#\xc19\
+\x18}\xcf3\xa5gt\xf6\xee]]a\xd5\xca\xb5j\
+\x15p\xb6\x9c-g\xcb\xd9r\xb6\x9c-g\xcb\xd9r\
+\xb6\x9c-g\xcb\xd9r\xb6\x9c-g\xcb\xd9r\xb6\x9c\
+-g\xcb\xd9r\xb6\x9c-g\xcb\xd9r\xb6\x9c-g\
+\xcb\xd9r\xb6\x9c-g\xcb\xd9r\xb6\x9c-g\xcb\xd9\
+r\xb6\x9c-g\xcb\xd9r\xb6\x9c-g\xcb\xd9r\xb6\
+\x9c-g\xcb\xd9r\xb6\x9c-g\xcb\xd9r\xb6\x9c-\
+g\xcb\xd9r\xb6\x9c-g\xcb\xd9r\xb6\x9c-g\xcb\
+\xd9r\xb6\x9c-g\xcb\xd9r\xb6\x9c-g\xcb\x0f\xbf\
+\x88\x1f\xf6\x00\xbe\xdfr\xe5\xcf~\x08\x97\xac.\xca\xaf\
+V\xcaa\xdf\xae\x8b\x06\xc6\x16\x1a\x85\xa1\xee|n[\
+7\xb6\xd4\x9b\xad\x5cD\x00E\x0a\x11\x00\x80 \x84\x00\
+(\x99\xb1B\xfc]\x90\x01\x00A\x80\x04 \x04\x81H\
+\x00 \x80\x04$\x08 @\xc5_A \x08\x12\x10B\
+\x80\x00\xc8\xf8e(D\x10 \x90\x08\x00\x02\xa4\x00 \
+\x04\x14%\x15\x10\xf7\x1f\xb7\x0f(\x22H!@D\x10\
+ \x08\x19\x8f\x84\xa2xL$%@\x0a\xa0d\xec\x90\
+f\x0cq\xcf`cGROBA@\x10 \x84\x02\
+\x04\x01J\xc4]\xc7\x7f\x92\xfeD\xfc\x98\x92\xf9\x13y\
+\xd0\x95 \xa1 \x00\x08\x08SG@\x80\x128\xaa\xa4\
+g\xa2\xb8\x1e%mK!!@P\x04H\xc40N\
+@\x18\x83\x9e\x10\xc3]\x08\x08\x22\xa8\x18\x82\xa0dN\
+R\x0f\x87\x00!\x93Y\x0a\x82\x8a\x14\x84\x00\x04$D\
+\x02m\x01@\x8a\x18\x0a\x11\x9f\x83H\x00\x95\x8c\x89 \
+\x91\x80\x17J\xc5\x8dK\x09\x08R Jf(`q\
+D)\x08\x19\xb7\xd7V\x02A Q\x08%\x82P\xb6\
+\xf6OG\x87\xe7\xab\xcd\xd6\xba\xe1\x9e\x88&\x8fL]\
+\x17\x1cn\xfd\xcdo\xffH\xf4\xb5[\x9e\xc6\x8d\xaf}\
+\xd3\x0f\x9b,\xbe\xe7\xf2\xff\x17\x0c\xe0\x17\xfe\xe4\x9f\xf1\
+\x0f\xaf\x7f7.\xfc\xfa=\xf9Z\xef\xba\xb5\xdd\xaar\
+n\x1dr\x0fAn%\x19n\x10\xb9\xfc\x86\x88\xa8;\
+\x0cE\x90\x17b\x88\x88\x82xaI\xe3\x81AbM\
+\x8f\xc2\xcc\x9c\x81@\xc4\xa8\xacQI\x18\xe2M\x90R\
+\xc02\x87\xa4\xbaH\xd0_%\x84\x9c\xb0\x84\xa4}K\
+\xa2\x86\xd5\x90n\xcf2%b\x03\x12\xbaK\xc1\xc6k\
+\x1e\xe8:\xba=\x9fpcF\xa6{\x15l.\xa6\x19\
+\xdd\x96\xb0\xcc\xc0\xbe\x99\x10r\x0a21\xa3\xd2\xf4H\
+\xc4xF\xc2D\x89\xbdha\x9e0\x0d\x06\xc7\xecb\
+g\xa4\x01m\x9a\xd7kB\x06(\xe6\xff\x82\xfd\xae\x92\
+\x01\x09]-\xe9\x92\x92\xf9\xc6\xa0\x16 R\xc9\x8f1\
+\xa3\x02\x91n\xd6\xe0D\xc2\xb3\x00\x8a\x19\x99\x10\x09C\
+\x87\x88\xea\x11M\x81T$\x81V\xd4\xac\x1f\xc9!\x9a\
+h(\xf1D\xb1\xb9\xf8d\x18\x94\xf7\xcd\xceM\x1e\xf9\
+\xfa\xf9\x8f5nU;\xf0\xcb?\xfe\xc2g\x08/X\
+\x06\xf0\xd9o|\x19o\xf9\xbdKq\xc5M\x0f\xe6'\
+\xc3\xd1\xcd\xe8\xea}i!\x147\x88|\xf9ER`\
+\x14R\x14H\x08H\x12\xa0D\x1eI!2\xd1L/\
+\xbe\xc6\x5c\xe2\xc4\xe6\x01\xc3}\x9f\x11?#\x15\x80K\
+T\xddN\x161\xbaD\x14?T\xd0\x04\xc8+\x12,\
+2{\xdd\xc7HL\xc2}h\xda \xd6\x83%ya\
+\x88\x88\x9c&\xb3\xd8\x86f\x04Z\x00\xa64\x02!\x9c\
+gv\xce|\x8e\x94V$:\xc1\xd4\xe70\x1dx\x83\
+i\x9b,#\xe7ss\x98\xa5\x99G\xa7YrZO\
+\xd73\x0cF\xb0\xf1\x11\xfc\x0f\xf1[\x09c\xa1\x84\xb9\
+\x11\x14\x89(jG$\xce\xa0\xd5x\xbc\xd5j\xdf\x95\
+kWn\xeb\x13\xed\xa7\x8f\x8d\x9e[\xfd\x91\xa7\xfe\x13\
+\x1f\xf9\x8b\xff\x07/\xc4\x12\xfc\xb0\x07\xe0\x97\xff\xf77\
+\xff\x1a\x0f|\xfbk8\xfd\xf5\xa9\x91\x9e\x8b\xdb7\xd6\
+\xbbF\x7f/\xec\xea}o\xa1Xz{\x98\xcf\x9f\x17\
+\x04\xb2_H\x19\x0aFC\x89,\x88\x89\x92Kw\x97\
+\x02\xed#\xc1\x88\xd9\x91\x18\xe4HP-u\x8d\x1a\xec\
+\x10\x9b\xfb7\xab\x08\x07\xd1=\xd4c4%:\xb4C\
+\x1d\x89=\x1b\xc1\xc1\xcc\x1c\x8f7d\x17-5\x13s\
+\xc8\x88\xf7\xcc\xba\xac\x1b\x0fp\xfa\xff\x0e\x5c3\xe1\xc1\
+\xc7\xff\xdc\xb2\xc7Hs!\xcc\x1bB\x9bR\x1d&\xe7\
+\xac\xab\x03*\xf2F\x9b\x01;o\xbe\xce#g-\x13\
+\xad\x22\xd1\xfa$\x84\x10R\x04\x81\x14\xbd2\xcc\xed\x08\
+\xc2\xdc\xf5*,\xbc\xb5.\xc2+{k\xd3\xf9\xe3a\
+\xd7\xc9\x89[?^\xbd\xae>\x88#\xf7|\xfd9\xe7\
+\xfd_Y^0\x1a@\xf7\xdb\xdf\x8b\xad\xafx'\xa8\
+25\xdc\x0c{n\x0a\x8a\xc5\x9f\x13ax\xb1\x08\xc2\
+\x9c\xd4\xaad\xc7\xb7]U\x97\xab\xb5>\xb1dJe\
+\xa3(&R\xc2\xd5\xd6S\x00\xe3\x84\x99%\xe1\xb4$\
+\xf6\xc9\xc1JW\xed\x7fH$\x19\x97\xf4\x09g\xe8@\
+\xe2\x9a\x83e\xfej\x95\xe7\x0c\xaeg~e\xfe\x10\xcf\
+\xc0p\xebg\xb5m\xe7.\x12\xb3 \x0dI\xfd!{\
+\xb5\xb8T\xd7/r\x8d\xa2\xb3\x1ef\xa1\xed\xd6wk\
+h8r\x09O~\xe7\xbe]\xe4<O\xd9\x10\x9d&\
+\x10\x7fUv\xbdm\x1d\x0bW\xa5\xa2v\xbb\xd5x\xb8\
+Y\xab}\xa4X_\xfc\xfc\xfe\xca+&~w\xd5G\
+\xf1\xfe\xff\xf5sx!\x94\x17\x04\x03X\xf5\xa7\x0f\xa2\
+\xbf~&\x17\x8dlxe\x90\xef\xfa\x8d0\x97\xbb:\
+\x08d\xc8\x87\xe8\xac\x9b\xf9\x22\xc0\xc5\xac%;\x17\xb1\
+\x1d\x13\xd4Q%\xdd\xdf\x96\x22+G\x5c\xf3\x0f\x0e\xf5\
+\xa4\xd9\x10\xf1Q\xf8\x8d{\xaa\xf5\xf7\x5c\xdc\xee\xbc\xc9\
+X\x02\x15\x99D\x96\xa8\xbd\xdcG\x82\xacaR\x07\xc2\
+\x81iC,\xc11\x1d\xb5[$\xfe\x00\xaf_wi\
+\xd8\x13\x1f\xf4l\x8e\xae\xfb6M\xd3f\xde| >\
+\xb0<k\x8bk6\xd6\x9cH\xfa\xcb\x10\x0c\x9c\x91\xf1\
+\xd6\xf9\xbb\x94\xf4\xd3\x8e\xa26Z\xadG\xf2\xed\xc6\xdf\
+\xcd5\x9b\x9f\x15\x85\x9e\xda\xf1\xf7\xec\xf9\xfe\xd7~\x85\
+\x8a\xfcav~\xed\x9f}\x05 \xc2hw\xb8;\x18\
+\xdd\xf6\x0f\x85\xae\xfeO\xe6\x0b\xc5\xeb\x02\x19\x84V\xe9\
+3`\xcc\xb6\xcd\xb4\xf3\x89\xc8\xa9k\x10\xcf\xf7j\xb1\
+\xfa\xceo\xc8\xc0on\xf7\x82\xd1\x97\xee\x80(Y`\
+r\xdb3\xed\xc7\xcfH\x11H\x11|;\x9a;%\xdd\
+\x8e\xbc\x91\x90\xf6f{u\x04\x1bP\xd2\xb9\x81B\xaa\
+/\xeb\xbc#\xe3TC\xb2\xbd\x91\x8cU\xb1\xe7\xb6r\
+\x1a&l\xfe>\xe3H-\x11,\x11\xe8\x1d\x0f\x08\xbb\
+\xbb@\xdeZ:\xf3d\xcb\xc6}\x0cV\x93b\x8c\x9e\
+\x1c\xc1\xec\xc0X\x8f\xd9\xc2\xc1\xb5\xf3\x89\xc8Y/x\
+\xc4\x0f\x0f$\xb6}r\xe6\xac\xe7\xca\xa5\xaaH\x9c\x17\
+a\x10\x84a\xb1tY\xb3\xd8\xf3Oa\xbe\xf8aQ\
+\x9b\xd9\x05\x22l\xfa\xa5\x8f\xe1\x87Y~h\x1a\xc0\xd6\
+\x0f\xdc\x89Rc6l\x0do{]X\xea\xfa\xe3 \
+\x9f;G\x08\x09\x8d\xc6\xc6\x8bntdO-\xf3\xbc\
+\xec\xcf9\x15-M\x92\xf7\xe3\xd7\x99\x88\xe0\xce\x1fO\
+bv\xb2\xbc\x0d\x02{R\xd4h\xf9\xe0\xc8\xea:\xaf\
+\xac\xba\xef\x0e\xd2z\x1b\xc8m\xd3Y\xb0\xb4\xf7LK\
+(\xe6,_B\xfda\x83\xce\x9a\xa8_\x92\x86\xad3\
+\xd2\xce\x87\x0f \xe5\xa7t\xe6\xc3\xd6.5\x85\xa5\xd6\
+\xaf\xc3\xdaw\xb4\x8f2\xe0CV\x13s\xf7e\xfc\x1d\
+\x06\x0bH\xbevB\xb06\xfcI2\xbf\x06g]\xc2\
+\x81\xbb;D\xa5\x14\xda\xad\xe6>jT\xfeH\xcc\x8d\
+}\xeax\xab\xd4j\xfc\xd5\x8d\xf8a\x94\x1f\x0a\x03\xb8\
+\xe4\xef\x1e\x82h7{+\x85\xfe_\x15\x85\xf2\xaf\x84\
+a\xd0\xbf\xb4\xf7H#\xe0\xf3p\xde\xe8EJL\x03\
+\xae\xae\xf9\xb8\xe3~f\x1ea\xfe\x22\xef\x83\x18\xd1z\
+x\x90\xda\x09`\xef\xb8\x962#l\x13\x07`\x8d\x16\
+\xdf\xab@\x19|\xc22\x9a\x8c\x81\xf8\xdb\x0bK\xf8C\
+\x9cjY\xc4\x93\xb2~D\x8a1\x19vF\x1d\xfa|\
+^\x04\x9b\xf1(e\x1bx8\xd0I\xef\xcf\xf8h\x18\
+nGS\x8f:\x8c\x8fW\xc9\xd6K8#p\xadA\
+\xff\xbb\xed\x98\x99\x05\x0bQ\xa3\xf6Oj~\xea\x03G\
+\xa6\xc2\xd9\xef\xfed\x19W\x5c\xf5b\xfcW\x96\xff\xd2\
+]\x80\x8f\x7f\xe9[\xf8\xcf]\xef\xc1@o~x1\
+(\x7f _,\xfd\xcf \x0c\xca|W[\x07ep\
+\xd8\x9a\x8fL\xb2\xfa\xc5\xe0\x0a\xd3\x0c|\x5c\xe2\x12\xdb\
+A\x02rp\x8c\xd5\xfe^\xf8\xa3@\xb6\xd3\xcf\xaf\xa6\
+\x19T\x96\xe3\x8d<^#<;\xd6NH3\x10;\
+J\xfd\xc9s>\xfa\x1a\x81\xdf\x16X\x7f\xacqN\xf4\
+v\x86\x0c\x9e\xcc&\xce&\x8e\xe7 *\xeaH\x8dK\
+\xea\x03\x8e\x03\x91\x00&\x9e;\xd6'\xde\x97\xdf\x7f\x0a\
+\x08\xcc\xb7\x03>I\xbf\x016N?\x06\xc17ct\
+[\x1e>\x07B\x14D\x10^\x9e/\x16\xcf\xdd\xd0G\
+\x0f~s\xb2gfdd\x14\xa7\x1f\xbb\x13\xffU\xe5\
+\xbf\x8c\x01\xfc\xe9Go\xc7G\x16\x86qNO{[\
+3W\xfahP(\xbeMJ\x19\x18ik\x08\xb7\xa3\
+\xb8\x80\x83\xe0\x1e\x8e\xc3[;\x01\x97\x84}\xdf\x9d\xab\
++\xc7?\x08nD:\x1c\xc5\xef\xcco\x8b7E\xec\
+\xbd\xa5\x8aH}\x14\xec\x1d\xd7\xe1\x94\xa6^\xed\xc97\
+\xac.\x09|JI\xce\xa5\xc0\x09_2\xba\xb6\x8c\x8e\
+K\x10\xe9\x97\x5cF\x95\xddpj\x9a\xe6\x07\x97[\xb3\
+j\x5cM'\xf64=\x06+,\xac}\xcf\x99\xb8p\
+\x9c\xc3\xd9\xec\x5cd\xad\x91\xe8\xdc\xa7E\x0f\xf2\x9e\xb3\
+\xc0%\x1f\x7f\xfc9{`\x91BH\x04\xe1\xeeJD\
+\xe7O\x9f>uOm\xf4\xbc\x99u]#\x98|\xf6\
+n\xfcW\x94\xff2\x060\xf1\xda\xdfDID[g\
+E\xd7\xbf\x90\x0c_)D\x07\x0a1P\x8e%\xaa\xf5\
+d\x0b8\x8eA\xce\x03:x\xd2u\x17\xda+\xcb}\
+\xb3\x9d\x11\xd4\x16-`L\xaf)\xb6\x9e%Z\xc5s\
+4\xec\xc8Q\x7f\xc0\x19\xfd\xb8]f\xf5\xb6\xa40\xeb\
+\xd0\x96&\x18\xe1\xd2\xbc\xf3%\xdd67f\x9e\xaf\x0f\
+\x81\xd9\x11\xbe\xda\x95\x82e\x16WI\xf4\x12o\xee)\
+3@\xf8\xa6Iz\x05(5\x06o\x9cL\x8204\
+t\x81\xe6\xb5\xdf\x09\xfe\xb6\x7f\xffGr\xd6Q\xcb\x17\
+\x19\x04[\x10\x16\xceoW\x17\xefY\xd8r\xe5\xcc\x15\
+\x1b\x07q\xe4\xd1o\xe3\x07]\xfeK\x18\xc0\xd0\x1f=\
+\x80\xc9\xe9\xf9^\xd93\xf0A\x99/\xbcAH\xe1\xfa\
+~2\x0c;C\xbc\xe6'\x91\xc9\x91\x9f\xcbt\xf3\xeb\
+g\x17w\xa5]\x12\xf6\xd5@]?]\xb3\xb3\xf2\xea\
+\x88\xf3\xecW\xc8k\xba\xc3\x04\xd3\xad\xa7\x19\x111\xa7\
+\xa3\xee6v\xa3\xd8\xba>\xebJ\x9b\xd4\xd4\xe9\x17\x0f\
+\x0c\xe4\xf82R\x86\x97\xd5\x93\xd9\x882\xc0\xc1^%\
+\xef\xbb`\x1d\x0a\xdevV;\xec_\xac\x18=O\xfb\
+\xde\xd9\x92\xf5\xb8\xa2\xb7\x1b\x94e\xf9\x08=6\xb2\xda\
+C\x96\xd0p\x96\xd7\xe3\xba2\x97\xdb\x22\xc2\xdc\xf9\xab\
+\xd4\xf4\xdd\xb3\xbd[f&\xef\xfc8~\xd0\xe5\x07\xce\
+\x00\xae\xfc\xdbG1\x92\xa3\x1e\xd9\xdb\xff\xa7a\xa1\xf8\
+N)\x84\xddz|.ai~\xf6\x90\x90;\xe2:\
+\xd9\xb6\x9d\xda\xe4H\x96\xd1S\xba!\xfd\xdc\xbeh\x10\
+\x14\xee8\xb2\xd4F\xfe.\x119>\x0a\xd7\xb2p\xe3\
+\xf2\x9f\x9f\xff\x81;\x9a<\xe2gB7kv\xd6\xe7\
+ ,\x8f\xcbt\x06.\xa1\xe6{-\x1b\x0d\xed9\xcc\
+k\x9f\xb035q\xe7]\x8f\x09\xa7\xdaw\xa1\xa0\xe1\
+\x9c\xd6\x09\xb2a\xe07\x9b\xae\xe3\xbdO\x16\xf2Y(\
+,8^\x80\xe1E'G)`\xb61\x83 \xd8R\
+\xa7\xdc\xd0\xec\xd4\xccm]\xd7\xbe\xabQ\xbd\xe7\x07\xcb\
+\x04~\xa0\x0c\xe0\xb2\x0f\xde\x8b\xe2\xbe\xef\xc8\xf1\xd5;\
+\x7f1W.\xbd'\x90\x22t\xa5@\x96G\x0e\x8e#\
+E,aKg\xcb\xed4\xa30\x91\xae\xec\xcdT\xbb\
+\x19\xf4n\xfb\xcfP\xdb\xe0\xfa\xb1\xe2\xbfZ\x8ahG\
+\x9af\x08l.\x14\xd7\x8cO\x15\x22\x8b\x17d8\x0e\
+\xd9\xa0:\xd4\x11L\x829\xb4l<vf\x84\xc8F\
+\xf5l1\xe9j\xe3\x9d\xd5\x13\xc1\x18a\x16\x0f\x10\x1d\
+\xbe\xf8\xf6\xbe_\xcd:\xf0D\x07\x0a\xe5\xf3\xb4\x8b\xb3\
+\x94)`'\xe6\x92\xaf`AM|W#[\xa7\xf3\
+`\x97\xa1(\xf2\x1d\x137\x00J8\xefp9&\x84\
+\x80\x90\xf2\xbcB.\xcc\xf7\x9dy\xec\xce\xf25\xefT\
+\xb3\xf7}\x16?\xa8\xf2\x03c\x00?\xf6\x8f\xdf\xc47\
+h;\x0a#\xc3\xaf\x14\xc5\xee\xbf\x0a\x83\xa0\x87AO\
+\x83\xcd!`\x9f/\x8aL\xea\xe8\x5c\xd2\xee\x1eO\xa2\
+\x8a\x0c$_Bcp\x97\xd8U\xab\xf5\xef\xbe\x12\xc2\
+\xad\x99\xb4\xc9\xd2Y\xe7\xf0\x87\xe1\xef8\xba#w\xd4\
+\x10G\x17\x15\xc8j\xb0\x93\x8f\xe29tc\xad%\xa4\
+F\x9ce\xd3\xa7\xc7\x17\xfbm(\x13\xecNmr\xfd\
+5\x1aV\xd4i|l\xaf~\xc9\xb3\x0b\x0c\x98<\xfc\
+\xd9\xc1\xbbd\x1e\xbe\xd9\xc1\xdbq\xcf\x04,\xc1\x04\xad\
+z\x90m\x06\x18\xe6\xe4A\x94\xfb\x5c@\x10BJ%\
+\x82\x0b\xda]\x83Gk\xab\xcf}|\xf5\x8b^\x8d\x99\
+\xbb\xfe\x1d?\x88\x12\xfe@Z\x05\xf0xc\x18\x17\xb5\
+\x8folv\x0f}@\x84\xc1\x88\x0fT\xee=1.\
+:a\x11_\x03\xc3,\x82\x07t\xcd \xf8\xc2\xd9\x00\
+\x22\x98\xc5v(\x8a:\x10+[$;\x22\xcd\x90\xd2\
+\x18\xe1n \xb0\xf1xj\xaa\xaf\xf1\x19&\xe2\xdb\x94\
+\xc6\xa3O\x99\xef\xfbv#e\x11\x7fFH\xaa\xf0\xc7\
+\xa1\xeb\x097\xb4\xd5i\xe7{P\x99]\x82\x12\xcez\
+\xe96\x9f\xcb\x22\xd3sJ\x0d\xdeq8\xf2\xae)\xd5\
+v\xaa\xe8z\xfa\xc8&\xdcs\x0b<z\x8b\x92\xf5\x10\
+\x19\xf3&^\x9d\x8dI\xf0&\x9cf}F\x9c\xad\x95\
+i\xbf\x84p\xab8\xc6H\x98\x0b{\xda\xd4\xfd;\xe1\
+\xe4\xb1\x07k\xb9\xc1\xbd\xf8\x01\x95\x1fH(\xf0\xb9\x7f\
+v\x07r\x13O\x06\xcdR\xcf\xaf\xca\x5c\xfeE2\x01\
+\x8e\x0eA\xd5a\xa7Zb\x1b5\xd9\xc7x\xb2\xff\xe2\
+0La\xc25\xb3\xe3\x05\xc8\xbe\x03\xaf\x0d\xef1_\
+\x14\x83W\x94H+\x82;\x16\xf3O\xb8\x11\xb8\xac\xd5\
+x\xc7B\xa5\x86 RsJ#.y1\xc9\x86\xaf\
+d\x0c\x9a\xfc\xb9!\xbb\x1e\x9bR\x1a&\x10.\xd19\
+4\xed\x11\x8a\x81\x87\x0e{M\xbd`~\xd7H\xedl\
+\xa5\x9b\x0fdBn\xf9\x0fD*Y[r\xfa&\x7f\
+\xb2\x94\x9aDz\xe2l\xc2\xc6o\xe40\x0d3\xfbd\
+&dq\xcb5\xda5\x9f\xe4\x0b\x97\x01s\x17A\xf9\
+\x10)\x05|\x86TZy2\x8eY@\x8bAA0\
+\xe1\xd9A\x98\xdb\x9d+\x16~sxn\x7f\xe9\xc2\xf7\
+~\x11?\x88\xb2\xe2\x0c\xe0\xd7\xff\xe8/0\x9d_\x8d\
+\xca\xd0y/\x8d\xc2\xe2O\x00\xae$w\xf0\x87AL\
+\x98,<<>\xde\xa5B\xe3i\x05\x0c#\xd1\xbf\x91\
+#\x8d\xb54\xb4HG\x9c\x13\xb3\xefz\x1c\xfc\xad\x98\
+-\xd9\xb1\x10\xf8x\xe1\xbcg$oB\xfc\x8c[A\
+8HM\xe9\xf7\xe1\xe1\x90\xdf\x97c\x80S\x1a\xf9x\
+\x5c>\xeb\xd7\xf9\x07\x0e#\xf7\xec\x82\xfb\x0f\x8c@\xd3\
+c501]\xb3\xb5\xe2\x8b\xeb\xbd\xea3w\xcdD\
+L\xdc\xbd\x16\x81>\xb1\x9b\xe0\x9a\x0e\x9c\xcd\xd4\xb3\xf5\
+\xdd\xd1\x90S\xc7\xc4S\x90;\x1eCu\xc4\xea\xdaQ\
+\xa6\xfb\x81\xcf\xb0\x85i\xcb\xe0\x16\xdc\xa3J\xecUw\
+\x0a\x8e\xf4aLP\xd87\x83B\xf1G[\xc3\x9b\xde\
+\xfa\xb8Z\x87\x9f\xfa\xbb\x95?J\xbc\xe2\x0c\xe0\x8b\xea\
+\x22\xf4L\x1d,\x8bB\xf9W\xc3 \x18N\x11\x9b\xab\
+\xcf3\x1e@\xce\xc2\xa6\x0e\xb3\xb0u0\xed$\x5c\xda\
+.\xae+\xb1RL[\xb7k\xda\xf3\x11\xcfJ:\xf3\
+\xa2\xa3b\x13\xfb\x98H\x0c\x868\xc8\x5cdO\x05\xe1\
+\xcd\xc1\xdd\xe2\xea\xd4N\x8c\x0fL\xe5w\x0e\xaf\xb0w\
+\xb8\xa0\xf1@N|\x9c\xdeXx?\x96\x85\x92!\x04\
+-\xdd\xb4T\xb4Dm\x99*\x87\x1f\xb4\xf3\xd3hk\
+^IIQ\xf6\x99\x5c\x9f\x83\x86!9\xeb\xe5\xae\x1b\
+\xa7\xe5\x0e\x0a\x0a,K \xa3a\xd9q[W\xad\x1f\
+\xb8\x9dV:||p$\x9a\x85\x033\x17R\xb6\x84\
+\xaf\x96\x99\xaf\xe9\xb5\x94APl\xc9\xd2\xff{\xae\x1c\
+\x1fyp\xe2y:\xc3\xbe\x87\xb2\xa2\x0c\xe0m\xff\xe3\
+/Q\xef_\x8bv\xff\xba\xebE\x98\xbf>\x93\xd2\x99\
+1d\xa5\x82Gt\xec\xb3\xf1\xa43\x0dMd\xd5e\
+\x0a\xaaQE\xcd\x02P\xfa\xb4\x18\x03\xba\xd0\xea\x1e\xd3\
+\xd75\x97\xd7\x8e,\xfbN\xc6\x82\xf3A9\x8b\x99\xf5\
+\x9eFrJ!\x82\xe9\xd3S\xc3\x1d\xc4g}\x08\x7f\
+\x0c\xc9w\xe3\x95p\x86\x1a\x030\x8d\xd4\x9e\x0a\x02\x17\
+v\xbe47D\xc2\xc7\xe0rf\xd3\x9f\xb3\x03b\xea\
+y\xdaJFaB\xd1\xc1\x81N\xe8\x9f\xda\x9c\xf0\xfa\
+\xea\x94I\xc2\x15\x00i\xeeM\xde@\x1cf\xab%?\
+\x13&\xb6\xbe\xd5\xa8\xc8\x9f#\xd7p}\x5c\xf7\x06`\
+\x98H\x98\x7f\xd1b\xd8u\xd3\xc9\xd2f\xbc\xf4\xbd7\
+c%\xcb\x8a2\x80GV\xbf\x08\xf9\xc9#\xe5\xa0X\
+zw e9\xa5\xbeqi\xaf\xbcg\x8e\xb4\x85\x83\
+\x8c\x1cx\x96 \x04[\x94D\x1b\xc80\x9cS4\x08\
+\xa4\x08JK:\x8dH\x1c\xa1\xec\xc2\xc2m\x88\xec\xbb\
+\x06\xa7\x99\xd4\xb4&\x89;\x1e\xfd5\xc5G\xb8\x96\x93\
+\xe6\x0dl\xdcnS\xa9\x1d\xb1\x04\xbe\xce\xb97&y\
+\xc8#\xc0L\x1f\x81\xcfo\xc8e\xae\x8e\xc8\xed\xe0\x8c\
+\xd3\xc8o\x1c\x91\x99\xaa<\xa5\xfau\x99\x04\xe0\x00&\
+\x8b\x05hE,\xc3tI\xf39>\xdf%\xc6\xe3K\
+l\xadmz\xba\x89`\xbf9L\x94\xb8\x83\x95\x01x\
+\xa9P\x06Om!6\x06)e\x10\xe6\xcb\xef\xdaT\
+?42\x9b\x1b\xc2J\x96\x15e\x00\xaa\xd8\x83pp\
+\xcd\xcb\xc30w\xbd\xe1`\x8e\xad\xea~M\xabP\x96\
+\x18\xd3\x08\xe0/P\x06\x08\x1d\x9b\x9c\xfb\x08\xdc\xbe\x9c\
+\x9d1Nx\xe0{\xb6N\xc3\xd9\x13f\xae`\xb3\xed\
+\xe3\x10\xacJ!\x1e\x97\x12\x06>L\xba\x08C8>\
+!0\x89\xcf\x10\xd38\xd0\x98\xc6\xe2\xc0\xc2c\xa4|\
+g\xc0\x85\x0c\x833\x98\xe6\x04^)\x83\x91\xa5`\xc2\
+\xd7F\x80R\xc0\xf4\xbf2f\x04\x9f\x99\xa4\xb5\x1b\xe2\
+\xb3\xd1L7E\xf4\x1d\xd6\xcbu\xfb\xba\x84\xee\xd2\x1f\
+,6\xa4\x83\x0e\x1c_C\x06.\x8a\xd4s\xe1\x02\xdc\
+\x81\xa7\xfd\x81\xfb\x10|x\xca\x5c\xee\x92E\x94\xae\x9d\
+V\x05\xfc\xebW\xef\xc7J\x95\x15c\x00W|d\x1f\
+\xb6E\xa7C\x15\xe6\xdf,\xa4,[\xc4\x84AR\x87\
+k:\x88l\x17\xc1\xda\xf4\xcc\x95\xec\x13\xb2\x87\xc5K\
+\xa9\x87\x8e\x14\xd3m\xf9[\x85\xc9\x17\xe1\xbf\xc8\xd4\xbd\
+\x94\xb7\xce\x0c\x8b\x99\x10\xe4\xb6\xcb=\xd1\x22\x81\x81\xe8\
+\xa8\x8a'\xc5;\x0f\xc0a\xc7#l\xecn\x88\xa9\x94\
+\x8cG\xd9:\x5cm\xb5O\x1cb\x17\x89\x8a,4\xa3\
+\x02k?\xf9\x9b\x0d\xdf\x0c\x95\xc5cXF\x13Ji\
+v\xfe\xda\xdbW]\x06\x9a\xe691\x91(\xeb\x7f\xe0\
+\xc25%\xe5y\x9f\x19\x00w\xf6\x175\xd9\xf3\xa8=\
+\x97\x89\x1a\x9f\x06\xc3i\xb3\x8f\x95\xa1\xad\xf9\xda\x86a\
+\x07\xbama\xdfK\xb1I\xf6@\x00\x08\xa4\xc8!\xcc\
+\xfdh\xdf\xc4\xb1\xdc\x1f}\xa7\x89\x95*+\x16\x07P\
+]\xac\xa1\x99_\xbdM\x06\xb9W\x18\xa4\xf4bN\xac\
+z\x8a\x0c\x22t\xcf\xc4\x1b\xf5\xd1\x0f\xce`\x86\xa9\xe1\
+\xe7\xcc\xa5\xcb\x13=p`\xa6\xfd\x06\x1e\xa6y\xed\x98\
+\xe7\xc2\x7f\x87\xe5\xf1\xe3\x0b+\xdc~\xe2\xb1S\xaa?\
+>/'\xfc\xdc(<\xd6\xc6V\xa6\xad\xe4~\x81$\
+W\x7f\xca\x12\xd0\x99\x86A\xce\xde\xbe\x10d\x93\xa4\x0a\
+\x81\xf41db}'\x8c\xc9w\x82\xfa\xc9XR0\
+\xf4`\xe64\xed\xa9U\xa9\xa6l\x0c\x81`\x04\xa1\xd3\
+\x8cY\xdf\x0bK\x1b\xce\xd6\x93\x0c\x84\xe0\x10\x8b\xaf\xcd\
+\xb8\x12\x9d\x7f\xd6k\xe2\xad\x85 \x83G\xfc\xb4\xa4\xdb\
+\x99\x1b\xb8\xe4\xfcJ\xe9\xe8Ab03oghT\
+V\x0bHo\x8f\x07\xf9\xd2K\xbb\xd6\xae;?\x88\xda\
+\x8f`\x85\xca\x8a1\x80z\x90G\x1e\xcd\xab\xa5\x10\xeb\
+RF3\x97\xe8\xb0\x88\xee\x22\xad{\x98\x02\x00\xcb\xeb\
+a\xddI1>\x0a\x86\x9cY\xc5\x7f\xce\xddQ\x09\x9b\
+\xa0t\xec\xbd\x01\xbbp\xb0\x09v\xc1\xb9]\xed\xa2<\
+S\xcaY\x10H<V\xbe\xd7K\x88/\xa7P\xa6?\
+\x82$B@\x0a9)P\x08$\xf2\xa1\x80\x08\x02H\
+I(\x06\x84r\xa0P\x90\x84\x9c\x00BA\x08\x85\x84\
+\x94\x00 \xa1\x0f\xf8\xa8\x04n\x11\x11\x9a\x044H\xa0\
+\x11\x094[\x02-\x92h+@E\x0a\x8d(B3\
+\x22D\x0aP\xc9E\x22\xdaM\xa6g(\x85Kl\xc4\
+\x98[JJ\x19\xf0Zbu\xd7\x1d\x1dx\x04\xd3\x84\
+\xec\xa6\xb8\xa3\x81\xd8%\xf0\x94rg\xff\xdc!y\xdb\
+\xba3^\x1d\xf8\xc4Ur\xb7MG1T\x1a\xff\x5c\
+<\xce\x8c-\xf0:e\xac\x01)\xc6\x09x\x9c\xc6g\
+ |K\x91R\xafB\x06\xab\xe6\xa8p\xdd\x94(>\
+\xf2\xaf\xff\xf6u\xbc\xf3'n\xc0r\xcb\x8a0\x80W\
+\xfc\xd5]x\xd5?\x5c'\xfe\xe5\xe7o}q d\
+\x92\xd8K\xb8\xc4\xe3\xa5\xdc\xcaZ,gA|\x18r\
+$\xe0\xda'\xab$43!\xbf%\x9f\xe33\x86\xe2\
+\x80?\xf9\xa6\x88'\x15r\x10\x9cg\xf01\x8c\xcc\x10\
+\x88\x80\x22\x01\x05\xad\x02\xc6\x01O\xa1\x14\xc8\x05\x02\xe5\
+\x1c\xd0\x97\x17\x18,\x02\x03\x05`\xa4\xab\x80\xa1\xa2\xc0\
+`Qb\xa8\x14\xa0'/\xd0\x93\x0f\xd1U\x0c\x91\x0b\
+s\x90\x81@N\x0a\xe4\x03BN\xc6w\xe2\x04\x82\xe2\
+\x1bw\xe0L)\x19O|\x91\x85\x02\x10\x11\xd0T@\
+;\x02\xda\x8a\x10)B\xab\xd5\xc6|\xbd\x85\xc5F\x0b\
+\xd560\xd3\x00\xe6\x1a\x0a\xb3\xf5\x16\xa6+mL\xd7\
+#L6%\xa6j@\xbd\xad\xd0hFh\x91FE\
+i4\x89\xf8l\x85\xabau\xf8b\xe1\xebo)\xc0\
+\x93\xd4V,B\x90`D/\xd2\x07\xf5|i\x9f\xf5\
+#\xf7\xfdk-(5F.P2\x9c\x99\xdc|\xe1\
+\xe35\xf8M\xa9\x16\xf9&\x04\xdf}\xe0\xda\xaa\x13I\
+\xc8\x1b\xe0v\xa4W!\x8e\x0f\x90h\x11\xaezq\xf4\
+\xe4\xdf\x7frjk\x0b+PV\x84\x01\xcc\x92\xc4'\
+\x7f\xf6s\xabe\x90{\xb1\xebT`\x93H\xb1\xe8d\
+\x01\x84`V)\xcb\xa4k^\xd5\xde~\xb8\xcc@#\
+\x01K\xe0@\x10V57+!\x1c\xc0\x0a\xe2\x0bi\
+\x844\xccS\xe2\xfb\xe1|\xaci_\x83\xd2>\x0e\x15\
+W\xcaI\x85\x9eP`\xa8(\xb0\xa6LX\xd7[\xc0\
+hO\x88\xf5=!FJ!\x86\xbbB\xf4\x16\x02t\
+\x15B\xe4\xa5@\x18\xd8+\xab\xfc\xc5\x16\x8c\x81\xba\xcc\
+0\xcb\xdbA\x99\xcf\x8d$2\xef\xe5\xbdw,\x22G\
+DhG\x84j[a\xb1\xd1\xc6\x5c=\xc2D\xa5\x85\
+\xb1\xc5\x08'\x17Z89\xdf\xc0\xe9J\x84\xd3U\x81\
+\x85\x86B-Rh\x93\x84\xd4\xf1\xfe\x09c\xf0\x99\x81\
+YWb\xcb\x22R\xbc\x00V\xd5\xf0\x18\x83w\x9c\x97\
+H\x9b\x0c\x19\xea\xb7\xb3\xee\x94\x06\x89\xcf\xa84.t\
+\xdaa\xc8\x92\xf2\x8e4G6^'\xe6\x9d6g\x9c\
+<\x03\xc6\x8d\xe3iH\xa6-a\x1e\xb8\x02J@B\
+A\x85\xf9K\x8f\xd0\x9aur\xb6z\x04+PV\x84\
+\x01\x10)\x04R\xec\x10Rn\xb4\x9c\xd4\xaa\xdbvN\
+if\xe0\x07\x09\x19\x18\x18m\xcb\xaa\xea\xdc>u\x14\
+,\x83X\xe4\x10\xab\x8e\xaa\x22\xe2\xc4\xcb\x91+\x9b9\
+q\xf5\xd2r\xee8B3R\x04\x81\x08\xa5@b\xa0\
+\x08l\xe8\x026\xf6\xe7\xb1\xa5\xbf\x80-\xfd\x12kz\
+\x0a\x18*\xe7\xd0[\x90(\x042\xb9t#\xee=k\
+3AY\x9d\x97\x9d%\xf0e\x07\xb2\xf1\xd3\xaf\xe3\xaf\
+\x8b\xfe\x8dO\xd9\xfc\x15\xce7)$\xf2!!\x1f\x06\
+\xe8/\xe6\xb0\xa1\x0f\x06\x8b\x89\x14\x22\x05\xd4\xda\x84\xd9\
+z\x13\xe3\x8b-\x1c\x9di\xe1\xe0l\x0bGf\x9b8\
+6\xa70QW\xa84\xdah*\x01\x08\xcd\x18\x92u\
+\x13\xe4\x80\xdb0\x7fmcsm\xd1'\xaa\x94\x09N\
+ d\x10\xacq4\xba{mv\x0b\x94\xcf\x96CN\
+\xb06\x19<\xb5\xa4\xe6\xed;\xdc+\xcb\x04\xb0\xf8\x93\
+\xda\xbe\xf6\xda\xf6\xdfII\x9bT\xb3\xb1\xb0\x91R\x8e\
+\xb6\x9a\xd1\x8e\x88\xe8\x08V\xa0\xac\x08\x03\x18\xc3\x00z\
+\x82h\x97$tY\x9b\x8a\xdb\xf1\xda\xf3D\xc8Z;\
+_\x17\xd2\xbb\x00\xcc\xe2\xce\xac\xa9\xa1#\x18\x12Y\xe9\
+\xe1J\x13\xe2\x9c\xc0\xbcK)K\xc5x\xc9\x08h'\
+\x92!/\x14z\x0b\x12\xeb\xca\x84\xed\x03y\xec\x1e\xce\
+c{\x7f\x1e\xeb\xfb\xf3\x18*\xe7P\xca\x05\xfa\xee8\
+\x86\xb0\x89f\xc3\x09\x1c\xf0uQ\xc6\xf8]\x1f\xc9\x92\
+\xf4\xfe\x1c\x85\x0b\x9d,(\xfb#p\xfc\x16\x0c\xe6v\
+\x07A@J\x81\xee<\xd0S(aC_\x19\x97\xae\
+\x8b\x7foE\x0as\xcd6&+m\x1c\x99i`\xdf\
+T\x13\xcf\x8e\xd7pp\x9e0U%TZ\x0a-!\
+\x11 \xf6-\xf8k\xedkd\x969t\x10\xae\x8cP\
+\xdc\xfbM2<2\x9e6\xa8q FG\xcf\x89\xe7\
+\x08\x9cL\xdf\xaf7\x00o.\x9a\x81{\xbe\x056%\
+\xeb\xbb\xc8\xb4s\xed\x98\xdd\xdc\x10p\xf9\xa2\x10\xc5\x85\
+\xb0\xe7\xbcf\xae|\xcb2P\xc4\x94e3\x80_\xfe\
+\xd4}\xf8\xdb\x99\xcd(\xd6\x0eo-$W\xdc\xa6\x1c\
+\x1b\x80\xd9\x06\x8b\x9f\xa4u3.!\xec.\x820\xf0\
+q\xb2\xf6:\x12\xcd\xd58\x9c\x16\x1d\x7f\x14e\xf3 \
+\xb2\xe8\xaf\x14\xa0H!/\x08\xfdE\x89-=\x02\x17\
+\x8e\x14p\xc1\xea\x02\xb6\x0f\x95\xb0\xaa;\x87\xee0&\
+\x06\x08\xe90r\xa5,\xd59R\x96)\x19\xdag\xe0\
+\x9cb\x84\x87(f\x80\x8c\x18\xb5\xc3\x92\xb5\x95\xc9 \
+\x12\x98e\x11?\x97dn[L\xc4r\x85\x88X\x8e\
+Ds\xe7b\xecl\xb4N\xce\xd8G1T\x0a0R\
+.\xe2\x9c\x91.\xbc\x86\x08ME\x98\xa9+\x9c\x9e\xad\
+\xe3\x99\xc9*\x9e<S\xc7\xde\xa96\x8e\xce+,4\
+\x22\xb4!\x11H\x81@\xfa$\x9e\xec\xfe\x08wH\x8e\
+ifh\x8c\xc0/j\xcd\x9e,8?7\xff7L\
+G\xb8\x04\xacM\x15SS\xb0\x8e\x99i\x1e\x0b8\xad\
+\xdd0\x89\xef\xec\xa0\x90{1\xad\xe7\x83\xe0|'\xfd\
+=~\xe6l\x892\xdb\xa2\x10\x88\xf3N\xcc_,~\
+\xf2C_\xa5\x7f\xfb\xd5\xe5\xa5\x13_6\x03x\xf4\xd0\
+4\xde:\xfe\x0f\xe1\x13\x9b_}.\x04\xf9&\x9bA\
+J\xe3\xfcX\x129\xdd\x85\xb3P\xd7\x17\x80r\xaf\xb1\
+\x17\x14\x92\x22\x0br:\xe3\x9eY\x91 \x0f!v\x96\
+IR\xe8\xca\x01[z%\xf6\xac.\xe2\xe2\xd1\x02v\
+\x0f\x150\xda[@W.t\x92D\x10%\x9bO\x04\
+\xc6P\x12\xc2\xf3\x87\xcf\xbf\xfb\xb6~\x06\xder?\x99\
+\xf5\x03d!x\x07\x11\x9f\x98\x19\x9d\xa4?3\xca\x5c\
+m\x80\x11\x95U\xdb\xed\xc0\xf9\xed?\x22\xd5h\xdc\xb2\
+b*x($Vw\x05X\xdd\x95\xc3\x9eu]\x88\
+\x14a\xb1\x19\xe1\xe4\x5c\x03O\x9e\xa9\xe1\xe1SU<\
+9\xd1\xc2\x89EB\xadM \x11\xfbB\x04\xbf\xae=\
+\xcb\xfc\xe6\x1aU\x167\xd4\x8c\x9eq\x10\xf7\xf6c\xdf\
+\xc7\xb0\x84j\x9e\xb6=\xbc\xfe\xac\xff\xc4\x11\xe6\x5c\xfb\
+\xf0\x97,s=\x18S\xe1\xfe\x9eT\x13\x22\xe1\xc5\x02\
+\x80Z\x7f\xce\xf8_\x84\xa1\xac/\xdb\x11\xb8l\x06p\
+\xbcBxr\xa6[\xf4\xadG\xa1\x98s\xd7\xc6\x99}\
+\x06\x90\xb4\x877S\x1f \x8bp\x86\xd4\x05Y5\xce\
+\xac\x117\x0f|\xf5\xcb\xfejb.(\xf6\x88\x07D\
+\x18*\x09\x9c?\x1c\xe0\xf2ue\x5c\xb4\xba\x80-\x83\
+\x05\xf4\x15s\xf1\x9d\xf3L\x95W\x06\x99`\xaf\xb7\xe2\
+\x12\xd4\xf5.d\xe8\x7f\x1eL\x1cl\xd0\xf9\x11\xd3\xd2\
+\xd0\x8c\xc0\x03\x90q+p\xef\xb7\xf0\xdfr;\xb60\
+\xec\xecl\xd4`wUW_\xb3\xe2s\x10z\x15\x99\
+&\x91hS\xa4\xd70\xf6\x05\xf4\x16$\xfaV\xe7q\
+\xee\xean\xbc\xf9|\xc2L\xad\x89CS\x0d<x\xb2\
+\x8a\x07OV\xb1w\xba\x8d\x99\x06\xa1E\x02\x81\x14\x19\
+\x11j\x9e\x97\x9ex\x0auO\x14x\xa0t\x18uF\
+\xbb\xfe\xfau\xd4\xae\xb8C:Qk\x19\x18\x98)\xc5\
+\x1bI\x84\x0e\x17Z\xc9;Z\xab\xe58\x0e\xd6^6\
+\x17\x14\x90\xb9\xc2\xc6\xe2\xee+\x06\x8b\xb9\xe0\x0c\x96Y\
+\x96\xcd\x00vn\x18Ec\xcd\xf0\xe0\xe9(\xb71F\
+ J\xa4\xa30\xf8\xe0\xd3\x82\xfdl\xb9\xa8\x06ZF\
+<\x9e\xbbP\xc6\x86\xcb\xb2\x11\xd3\xb6\xac@\xechk\
++B\x08\x855]\x02{V\xe5q\xe5\xfa2.\x1d\
+-b}_\x01\xc5\x5c\x00N\xe8\x8a\xf9 |\xa4\xe0\
+j:q\xaf\x96c\xca\x09K \x9aP\xf5\x14\xad7\
+\x92IU\xb2\xf5\x12\x80\x11)(E\x88\x08\xb1\x87\x9e\
+\x80\x96\x12\x88(\xde\xc3\xd7\xb6\xa4V\xc9M\xb0O\xf2\
+'\x1f\x02\xa1\x00r\x02\x08\x84\x80\x14\x02R\x82\xed\x85\
+3\xe9\x98\xa9Is\xd3\xc0\xd7\xa4`8*1\xc7e\
+\x0a\x99\x19<x\x88\xab\x10\x02\x83\xe5\x02\x86\xbb\xf2\xb8\
+lC\x0fj\xad\x08'\xe6\xeax\xf8T\x0d\xf7\x1c\xab\
+\xe0\xb1\xf1&&+\xca0\x03\x93\x0f\xda5\x95\x19\xda\
+$\xed\xfb\xd7\xf9\xea\xbe}\x1fCj\xbe\xe4\x0eW\xfb\
+?\x18\x9c\xb2\xccL\x83u\x19\xca\x82\xabQ%\xc6\xaa\
+O\x00Y\xca 3\x7f\xfcqj!\xd6V\xa2\xfb\xc4\
+\xe4LAR\x1b\xcb-\xcbf\x00\xa7g\x16\xd1\x22Y\
+h\x97{\xbaC;s\x16\x0f\xc2\x17\xc0\x93\x94\x8c+\
+r\xdb\xce\x07\x8b\x1b;A\x80\xd2\x88\xe7qM\xc0\x91\
+\xce\xad\x88\x10\x100R&\x5c\xbc:\x87\x97m*\xe3\
+\xe2u\xddX\xdb\x93G.\x90\xc9\xd8\xb4j\x9f,\x98\
+c{3\xc7\x8d\xa3\x023\xa9\xcd\x07\xc7\xa5@\xa2\xce\
+\xc6\x84\x19w\xa0 \xd0\x8a\x08M\x15{\xcck-\x85\
+\xf9\x86\xc2L\xa5\x89\x85\x96\xc2L=\xb6\x9d\x17[\x0a\
+\x95\xa6\xc2b=B\xb5\xad\xd0lG\xa8G\x0a\xf5\x08\
+hQ\x80\xb6b\xe6H\x02_\x09\xeds \x04\x12(\
+\xe6\x04\x0a\x22B\x1e\x84| Q\xce\x07\xe8)\xe6\xd0\
+S\x90\xe8\x0a\x05\xfa\x8a\x01\xfaK\x12\x03y\x81\x81r\
+\x88\x9eB\x88r^\xa2;\x1f\x22\x17\x08\xe4\x82\xd8\x93\
+o\x18\x92fzzM\xb4\x807\x7f\x85\xf1\x15\xb8W\
+\xa0\xc1Y'\x8e\xe8J\xc5\xd0,\x86!v\x0cwc\
+\xe7p7\xdet\xde N\xcd7\xf1\xc8\xc9E\xdcu\
+d\x11\x0f\x9en\xe1L%\x02\x09\x81P\xf3\xd3\x0c:\
+\x8fQ)k\x7f -v2\xe9\xd8[twYU\
+'\xda\xe7\xd3qT@\xe1U\xe2\xc1`\xe6\xff\x5c\x1b\
+\xe6J!\x8b-q\x94IC[\x22(\xe7\x82\x9cj\
+GXnY6\x03\x98Y\xac\xa1-B\x14K\x14\xab\
+\xe8d\xe7\x15/\x169\x88\xe0{7\xf91w\x0b \
+O\xde\x92\xcd\xfffM07\x04H\x7f\x8f\x08\x80\x8a\
+\xd0\x97\x03.\x5c\x1d\xe2\xfa\xcd\xdd\xb8rC\x19\xeb\xfa\
+\x8a\xc8\x871\x99\xc4A:\xc2\xeb\xcd\x12\xb9of\xa6\
+\x12\x88z!\xbe\xd2\xb8\x8d\xe31\xb4\xa2\x08\x8b\xcd\x08\
+\xb3\xb56\xc6\x17\x9b8S\x89pr\xbe\x8d\xf1J\x1b\
+\x13\x0bM\xcc4\x09S5B\xa5M\xa8G\x84zK\
+\xc5\x0eH\x08\xb4Y$\x1d%\xb2O\x08$\xc4\x08\x08\
+\xa1\xa0\x1d\x97\xc2\x84\x00\xebqi_K\xccl\x84\x86\
+\x07E\x88\xc3\x88\xdb,\x80'V\xa1s\x82\x90\x0f\x05\
+\x8a\xa1@wNb\xa4\x08\x0c\x14\x05V\xf7\xe6\xb1\xba\
++\x87\x8d\xbd\x01F{r\x18\xea*\xa0\xaf\x14\xa2\x9c\
+\x93\x08\x83\xc0\xf1y\x10\xc85\x1d\xc8\x8e\xdfhR\x82\
+3\x0d2\xf6,\xdfrUD\x08e\x80M\x03%l\
+\x1e,\xe1\xb5\xe7\x0c\xe1\xe4\x5c\x1d\xdf9\xb6\x88;\x0e\
+/\xe2\xd13M\xcc\xd4\x09RJ\x04L\x93\x02\x97\xfe\
+\xcc\xcb\xefo\xc7eZf\x5c\x12\xb3\x90p\xb3\xa4\x06\
+\x11\xd2\x1c\x80\xf4\xfb^\xdb\xfc\xf7l\xbb0\xad9:\
+\x01l\x1c.^\x1c\x01\x04P\x0a0\xb4{miK\
+\xb3\x9d;x\x02\xcb+\xcbf\x00\x95f\x1b\x91\x10\xc8\
+i)\xaa\xbd\xa9\xfa\xa2\x06\xa3N\x93A\x1a\xee\xbe\xd3\
+[~\xa9\xe5\xe1X\x03\xdf\xe1gmo\x0d\xa8\xb6\x22\
+\x84BaW\x7f\x88\x97m\xea\xc6\xcb\xb6ta\xe7p\
+\x11\xe5|.\xf1\x1bp&\x93\xb6\xf2x\x0e}n\xb6\
+\xd85\xb0?h\xc9\xae\x94B\xb5\x19a\xba\xd2\xc6\xc9\
+\xf9\x06\x0e\xcf\xb6pd\xb6\x85\xa3\xb3\x0d\x9c\xaa$D\
+\xdel\xa3\x19\x11\x14d\x12\xb9\xceR\x97\x0a\xcd\x5c\x02\
+\x08\x09H\x10r\xc6T\x10\xce\xfc\x00a\xb0\xcd\xd7J\
+\xd8HM\xda\xf10\x91`q\xc4\xb0\x84\x95Jn\x8c\
+A\x04\xa0\xda&T\xda\xc0TM\xe1\xc8|\x9c\xda\x8c\
+P\x85$B(\x08\xa5P\xa0\xab \xb1\xba,\xb1\xb6\
+[bS\x7f\x11[\x07\xf3\xd8\xd4\x9f\xc7ho\x01\xfd\
+\xa5\x10\xc5P\x9a1s-\xce\xa0\x04\xf9\x04\x01F\xa0\
+\x5cc\xd0NE \x94\x12[\x06\xbb\xb0e\xa8\x8c\x9b\
+\xce\x1f\xc4\x81\xc9\x1a\xee<\xb4\x80;\x0eU\xb0\x7f\xa6\
+\x85z;1m\xb2\xae'_\x22J\xcf\xc7$\x83\x1b\
+\x9c\xa1d\x1a\xae>\xb8\xdds\x13\xc645\xd2\x9cR\
+\xf5\x0dQP\xc6s\xf3\x8a\xc7\xb8\xbc\x03#\x04\x0a\xda\
+*\xcaEJa\xb9e\xd9\x0c@'\xd2p|R\xd0\
+\xce\x11\xeb\x80J9b\x1cE\x80\xd2\x003\xd8\xc2t\
+!S\x1b\x80\x88Cn#E\xe8\x09\x09\x97\xae\xcd\xe1\
+\xc6\x1d\xdd\xb8zc\x0f\x86\xbbr\x10\x22\xb6\xe9U\xba\
+;w\xfc\xfe\x87\x84\xd09\xcb\x91I\xb8^\xb3\x1da\
+\xaa\x16\xe1\xe4L\x05\xcfN5\xf1\xccd\x03\x07\xa6[\
+8\xb9H\x98m(4\x15\xa1\xadb\xa9-\x05%\x9e\
+m\x99\x10wB\x8c\x0c\xd1\x1c\x09\xea\xe3\x8a\x0f\x0f\x06\
+\x83\xa5Q[\xfbJ\xd2suL1f\xaeH\xc1\x09\
+\xc02\x11\xbd*U\x05T\xaa\xc0\xe9\x8a\xc2cg\x14\
+\x08\xf3\x08\x84B9\x14\xe8/\x06\xd8\xd4+\xb1}\xa8\
+\x88\xdd#y\xec\x18.a\xb4\xaf\x88\x81B\x80\x5c \
+\x92H\xcf\x0e\xfe,\x0e\x0e~^\x82m\xefi\xb5\xbe\
+\x18\x86\xb8`M\x0f\xce_\xd3\x85\x1f\xbf\xb8\x85\xc7N\
+U\xf0\xf5g\xe7q\xcf\xb1:\xc6kq])\x99\xcb\
+\x85\xc8\xf4m\xfa\xe2v\xbd\xb0B\x87\xb8\xfe\xed\xe1\x19\
+?\xb9\x97\xf6\xdc\xa73\x17\x1b-\x82\xeb\x10\xbe\x16\x90\
+v^\xb9\xa1\xe7\xb0\xeb\xa1S\xda;\xe4\xa0\x08\xedv\
+\x1b\xed\x17\x82\x09\x10\xdbKZ\xc2\xb8v\x22\xdf\x92\xe1\
+\x08\xad\x03&\xdc\x0b\xbb\x5c\x95<{\x93/~\x16Q\
+,}G\x8a\xc0\xcb\xb6\x16\xf0\xfa\xdd}\xb8`M7\
+\xca9i\x90\xc7\x98\x0d\xcfQ\xfc\x05\xd4\x92\x99\x88\xd0\
+\x8c\x14&*M\x1c\x9cl\xe0\x89\xf1:\x9e\x1a\xaf\xe1\
+\xc0\x8c\xc2T\xb5\x8dJ\x1bh#\xde\xbe\x0a\xa0\xa5\xb9\
+D>\xd0+\xea\x9a/:\xe4\xd9\x82!\xed\x8drl\
+fJ3O\xe7\xb6\x0fOb\xf1\xa6\xbcK\xc83\xf2\
+\xea\x11\xab\x07Fp\xc2\x1d\x1e\x83\x8eL\xba\x8f\x13\xc9\
+\xc7\x1f\xaa\x11PYT8\xbe@\xb8\xebd\x059\xb1\
+\x80\xee\x9c\xc0H\x97\xc0\xf6\x81\x10\xe7\xad*\xe1\x82\xd5\
+%l\x19*b\xb8+\x8f|\xa2\xb7+>\x1f\xd6\x8b\
+\x11\x90\x09\x03r\xa5\xaaf\x0c\x12\x03\xa5\x02^\xb6\xbd\
+\x80k\xb6\xf6\xe3\xf0d\x0d\xb7\xed\x9f\xc3W\xf6/b\
+\xffL\x1bm% \x99}\xe08%9\x04LL\xbe\
+U\xb5Sj<\xa7B3\xbe\xf4\xba\xa5\xdcV\xdc6\
+\xf0\xb0\x8bC\xd9i.\xd5\xb2\xa7%8\x9d\x11\xa2\x88\
+\xb0\x02\x0a\xc0\xf2\x19\x80\xa46Hq/\x9d\xcby\xfd\
+\xa0 \xdf\x93dUn\x7f\x9b\x07\x89i\xcfl\xc4d\
+\x156\xf5\x08\xdc\xb0\xad\x0b7\xee\xec\xc1\xf6\xa12B\
+\x19\x13\xfeR*~F\xd3\xe6\x8bL\xd8\xac\x22\xc2l\
+\xbd\x8d#\xd3u<4V\xc3\xc3'\xab\xd87\x1da\
+\xbc\x1a\xa1\x11\xc5\xc8()fxR\xba\x91\xf5\xc9d\
+\x93&5\x81\xb1\xa5\xa6\xecqdK\xf6\xe4\x1b\xa7K\
+\xaeb9\x88\x86\xd4\xcb\x8e\xf6\xc0\x88(=NK \
+\x9a\xe6\xb87\x8a\xdb\xe8\xc4\xdfe!xR\xc4\x11~\
+\x89\xe1\x87\xc5\xb6\xc0\xfc,\xf0\xect\x13_?\xd8D\
+)\x9c\xc3HYb\xf7P\x1e\x17\xaf-a\xcfh\x01\
+[\x87\xbb\xd0_\x0a\x11\x08\x98x\x0cc\xf19>\x0d\
+w?G\x83C;m\xa5\x90\xd8>R\xc6\xf6\x912\
+\xde|a\x13w\x1d\x9e\xc3\x97\xf6.\xe2\xa1\xd3\x0d\xd4\
+\xda@ \xb3m\xf7\xec\xc3C\xd9\x86a|\x02U\x8b\
+gw=\xd3qH\x1e3w\xd6$S\xc5\x8b\xeb:\
+\x1a\x8f\xfb\xa3\x03w\xbdZ\x04D\xa4\xf0\xc20\x01\x84\
+L\x9c\x16\x88\x8fQ\xfa\xf6\x0d\xd3\x00\xf4v\x97\x8d\xff\
+f\xc1\x19\xdc\x08s\x10^$\x1ec\xc2\x9a\x12\xe1\x1d\
+\xe7\xf7\xe0\xb5\xbb\xfa\xb0\xae\xaf\x08!d\xe2\x09\x7f.\
+\x92\xcf\x80\xbc\xd0\xda\x94\xc2\xd8B\x13O\x9e\xa9\xe3;\
+\xc7\xabx\xf4t\x0dG\x17\x08\x8b\xadx\x0b.H\x90\
+<\x08\x92\x1e\x94\x1f\x8b\xee\x86\x97P\xa7\xfeRa\xc8\
+ZC\xb2s\xb5\xadZ\xc4\xe3ZU\xea6\x1a\xadN\
+f\xf8\x03\xdc\xe3\xb4L\xba\xf2\xa5\xf1\xfe\x82t\xf8o\
+\xe2\x05W\x8a\xb5\xcbU\xbb\x14\xabr\xda\x0c\x04A\x06\
+\xb1)\xd4$\xe0\xf8\x02\xe1\xd8|\x1d\xb7\x1c\xae\xa2\x94\
+\x13\xd8\xd8\x1b`\xcfh\x01\x97o\xe8\xc6\x9e\xd12F\
+{\xf3(\x84\xa1\x1d\x83i\xd8S\xbb3@\xab\xf5\xc7\
+\xe1\xee\x02\xde|\xe1*\xdc\xb0k\x10\x0f\x9c\x98\xc7\xff\
+}h\x1a\xf7\x1co\xc2x\x0b\xbd\x08C\xb3b\x1e/\
+p\x03\x89,C\xd7\xa6\x80\xe3\xac\xe6\xdb \x82\xaf\x13\
+\xc7g\xbbN\x82\xf5\xe3\xaeM\x8c9\xfc6f\x97\xaf\
+p\x1f@\xa6\xb4\xf8\xbe\xcb\xb2\x19\x80R\x0a\x94x\xa6\
+\xf5\xa293\xd54\xcc\xc2\x80\x89M\x8aD\xc2a\xd9\
+:\xb8\x071\xe2\xad\xae\x0d\xdd\xc0\x1f\xbf|\x15.\xdb\
+\xd0\x8b\xd8n\x83q\x84=\x1fy\xafCL\xb5\xf3\xee\
+\xf4B\x1b\x8f\x8eUp\xf7\xd1x\xab\xe9\xe4\xa2B3\
+\x8a\xb7\xd3\x02\x91\xd8\xec\x9c\x99ek\xd1\xc8T0\x1d\
+w\xb85^\xdc\xe3\xc5\xfe\xd6\x91\x8ePL\x1c\x8e,\
+\xd8\xc1:\xfc\xf4\x96\xa9H\x8b\x1fO\xaa\x1b\xb5Y\xd8\
+\x93x\x9a_\xb8f\x15\xcc:\x11`\xcc\x0c\xeb\xaf\xea\
+pL6\xa5U\xe8ip\x95:Fji2\xb2J\
+4\xda\xc0\xbe)\x85g&*\xf8\xccS\x8bX\xdd\x15\
+b\xcf\xea\x1c\xae\xdeT\xc6\xa5\xeb{\xb1a\xa0\x88B\
+\x98ht>l\xcd\x94\xb9\xb3X\x9b\x93\xf1\x1cK\xf9\
+\x10\xd7m\x1b\xc0\xc5\xeb\xba\xf1\x97\xdf:\x85O=]\
+5L\x96\xe3]J\xfff\x9d\xf8\x17|\xf8\x8e\xe1\xf4\
+\xab\x1es\x14<\x22\x93k\xc7\xd6w\x103\x93\x04\x7f\
+\x85\xd5j\xdc\x9d\x11\xc0S#L\xdf\x02p\xe8\xe6\xfb\
+-\xcbf\x00\x14\x11\x94\xe4x\xe1\xebF\x19\xaa\x8f\x13\
+>\xa5\x95\x7f\xcb\x169\x12\x03@N(\xbc\xfb\xe2\x01\
+\x5c\xb6\xa1\xd78Wl$\x5c\xd6\x22r\x88\x11\xe2\xeb\
+H\x15\xa6\xaaM<:V\xc5\xed\x87+x\xe0T\x03\
+'\x17\x09-\x15\x9f\xb1\x17\x00B\xa9\x91\x9fR\xebk\
+\x90\x0d\xbe$\xce\xea3\xe3Z++\x1a`$\xbc\x9e\
+\xb0g\x22\x185P\x13\xbf7C\xbe\xbd\xe5\xbb\x02\x5c\
+\x88[\xe2\x88\x7f`~\x05\x8f\xd0S\x8d\xb0\xd6\x0d\xeb\
+\xd1\x08j\x18F\x22\xb1\xb4\x22\x028g\xf9\xf5X9\
+\xb3\x04b\xa7\xa3\x08$@\x843\x15\x85\xaf\x1el\xe0\
+\x9b\x07\xab\x18*M\xe3\xc2\xd1\x02\xae\xdb\xd2\x83\xcb7\
+vcC\x7f\x11\xb9@\xda8\x0d\x12\xe9q9\x93\x16\
+\x09\x83\x07\xfa\x8ay\xfc\xd2Uk\xf1\xe4\xf8\x11<1\
+\xdeF \x9f\x03S\xf88\xb9\xc6o$\xbf\xe7\xc3\xf1\
+t|\xcd~\xads\x91\xad!3\xb6\x1c\xe2\x07\xbc\xc3\
+P\xfcL\x00K\xa7\xc6\xb40\x91\xf8$\x14\x00\xb5|\
+\xfa_\x01\x06\x00\x858:~\xa9\xf4\xcb\x96\x1b\xda;\
+\xda\x8d\x88\x01'w\x1f!\x15\x80\xb5e\x89\xab6u\
+\xc3\xa8R\x9aIt\xb88\xd4\xec\xa0\x0b\xa0\xde\x8a\xf0\
+\xecd\x15\xb7\x1dZ\xc4\x1dGk84\xdbF=\x12\
+\xb1\x94\x17\x02\xa1P\x99\x0b\xeaj\xbe\xde\xed\xae\xbe]\
+\x0c\x8b+\x19J:C\x1cO\xfb\x01s\xc4\xf9m\x19\
+'\xa97\xc7\x94M\x9e\xd0E\xe6\xc5v\xfe`\x18\xc2\
+*\xcbtyx\xb3Uz\x5c\x86l\xb30\xfb\x8d\x02\
+<\x1ca)\x22\xe1E\xb0\xf6s\x02\x00\x05\x98\xac\x01\
+\xb7\x1el\xe0\xf6Cu\xac\xee\x9a\xc4\x15\xeb\xcbx\xd5\
+\x8e\x1e\x5c\xb2\xbe\x07C]y\xed\x00\xb7}'>\x03\
+7)(%;@\x84\x91\xee<^\xb1\xb5\x1b\x8f\x9f\
+\x9e\x06%\x8ej\xbeZz-4\xe8L\xf0\x0f\x91\x91\
+\xd4\xd9\xe7\x06|P{\xa9\xeb\xb5\xc2C\xfc5\xab\x19\
+p\x0d0-(\xbc\xf5\xf5M;Xg\xfbJ\x94\xe5\
+;\x01e\xb2\x0fK\xc2\x10\x8b\x99\x9d\xbb\xd7g\xa7\xc5\
+q\x84?O[?\x88\x08XS\x16\x18,\xe7\x1d\xeb\
+(\xe5\xd42\x8121\xd4\xa7\xaaM\xdc}d\x01_\
+\xdb?\x8f\x87O\xb70\xd3PI8l|\x82Ms\
+aW\xf0\xb1\xd5!G\x00X\x0e\xcf:\x17\xec7\x97\
+\xf8\xbd1\xba\x01\xe3\x88\xb7M\x85\xd54\x04\x97f\xdc\
+\x1c\xe2)\xb2:\x10\xb8&2\x0dv\xd7|\x05\xd7\x5c\
+\x5c\xbbV/\x91p\xa4hJ\xbd\xf5\xf7\xa8Y\xe4\x8b\
+kS[\xcd\xc7\xd1\x9c\xb2\xc4.\xeb\x84\xaf\x81\x10\x02\
+a\x10\xcf\xf5L\x15\xf8\xcf\xbd\x15|m\x7f\x05[\x07\
+&p\xfd\xb6\x1e\xbcrG/\xb6\x8ft1\x13\xc1\x1b\
+\x9f\xb1\xc7u\xf3\x02;\x06s\x08R8Cl}Y\
+P\x98\x0b8\xcf\x81\xed\x17\xae\x1d15\xdfh\x8f\x9e\
+v\xc5\xb49\x8f\x0cR0ZJS\xd1\xcd\x09!;\
+\x0a\xdc\xef\xa5\xac\x88\x13P\x1a\xeeJv\xf4\x06Y\xf8\
+\x95\xd4\xee\xb4\xd2\xcf\xb9*d\x17\xb2?/\x90\x97,\
+q\xa4\xbf\x0c\x89m\x1f)\x85c\xd35\xdcz`\x0e\
+_\xdd_\xc1\xde\x99\x08m%\x10J \x97\x04\xc3\x18\
+\x95N\x13\x82\xb1\xef\xbc\xcd3\xae\x11\x0am\xbby\xc3\
+\x04#Z_\xbdg\xe9\xb9Sg\xcf\x1d\xb5\xcf\xaa\xf4\
+\xee\x01\x1f\xc0\xe5\x07\x1d\x16\x9b#\xa9\xc8BZ\x81,\
+)\xec0'\x8b\xa1pNg\x91\x85/e\xf4g\x8c\
+\x18a\x89\xc7\xf5\xe6\xf8\x14\xc0\xbf\xa5\xd7\x91;B\x05\
+\x00!\xe3@\xa5\xbdS\x0a{'f\xf0\xc9\xc7\xe6\xf0\
+\xe2\x0dE\xbc\xfe\x9c>\x5c\xba\xb1\x0f}\xc5\x10$\x04\
+S\x9b\xd30\xe8-\x84\xc8\x05@\x93\x96\x22*\x17>\
+\x99\xfb\xfbp\xb7\xab\xf5@\xc9\xd3\x1a}&\x22\xb2\xc1\
+\x9f^N\xcf\xef\xa0\x1fYw\x9a7F)\xb2\xafM\
+\xfb\x1e\xcb\x0a\x98\x00qbI=b_-w\x12.\
+\x80\xbcI\xd9\x0f\x1a\xd1|\x17\x95P\x0a\x03\xa5\x22d\
+ `I\x89\xb7\x1d\xc7\xd6?s\xa6\x82\xcf\xef\x9d\xc7\
+\x9dG\xaa8\xb5\x18w\x12\xc8\x98\xf8\x1d\xd9\xc9\xc6c\
+\xed\xb1\xb8?\xcb\x90\xc8a[ \xe6\x0c\xcbp:\x1a\
+\x95\x9dIw.e\xd2\xaa\xb3\x99\x9e\xf3\x15\x0cI\xb9\
+IA\xdc\x0c\x11\x80\xef\x1d\xd7-\x08\xb6\x15j\xe1\xd9\
+\x89q\xe8\x0e\x8d\xde\xcb\xe0\xe32d7Z\x93\xfd\x94\
+,f\xb6\x12\xc7&C\x8a\xfd\xe8\xa9\xbd\xc4\xd0@\xcf\
+\x981\x5c\xa2\xc4\x91\x1fH\xcc4\x08_z\xb6\x86\xdb\
+\x0eUq\xce\xf0\x04^\x7fN\x1f^\xb1s\x10\xabz\
+\x0a\x80\x900\xbb\x18l =\xa5\x00\x05)\xd1h\xeb\
+\x10a\xc6\xe6\xb99\xc9P\x03^\xf8:8\xce2\xe1\
+ \x12\xb8\x11\xe3\x92|g\x81\x87#s\xb9\xe8\x22@\
+\x86!i\xde\xd7\x5c\xc6\xad\xa1q\x9f^\x08\x0c \xce\
+\x07\xc7t=\x0f\x1b,>\x90Quaq\xc7 \x8a\
+m\xc2] E@W!\x0e\xb8Q\xce\xe2jUH\
+\xe0\xfec\xf3\xf8\xf5o\x8ca\xaa\x11 \x08\x84\xdd\xff\
+MTc~XE\xaf\xb4\xd0\x83\x002\x08\xdaU\xc3\
+S\x0b\xc0\x1ck\x8e\x1d'\xecw?\x07*gz\xe4\
+tj\x09\xce\xe0\x97H3\x0e\xc3\x18\x8c\xc9\x91^|\
+\xeb_\xe1\xe3\xcer\x17:/93\xb7z;\xafc\
+\xd7\xc9\x03\x94\xdf\x18\xc8\xd99t\x09\x0d\x1e,Y\xe3\
+\x89\xf3P\x03\xc8\xf5\xa8\x10#\xc2P\x02\xcdH\xe0\xe1\
+\xb16\x1e\x1e\x9b\xc4=G\x16\xf1\x97o\xd8\x82R.\
+\xe7\x9c\x07\xd0}\x95r\x129\xe9gj&_qr\
+g\xef\x13VG\xb08\xaa\xa0S\x95\xcf\x8d\xf8\xb7N\
+\xaa\xa4\xf7\xdd\xc6\x92d\xd4\xd1\xbb\x1eX~Y\x01\x13\
+ \x0d\x14C@\x19b\xcf\x86\x08s\xe4\xf62\xb8\xea\
+\xc9\x0b\x82\x14\x84\xae\x9c\xddf \xbfOA86\xd7\
+\xc6lC '\xb3\xfa\x84E`n\xe0:vX\x9a\
+\xc8]V\xc3\x16\x91\xdb\xac\xce\xa2\xc4O\x88\xed\xf5\xd9\
+w\xb5\xcd\xcf\x1as\x9c\x9f\xda~\xe6\xcde\xa7\xc5J\
+zq\xc6\x94\x96\xbe\xac\x1b\xb7\xa6\x9d\xb1O\x00L\x04\
+\xba\xac\x82\x9b\x08\xbe\x8d\x9f>j\xeb\xe2\xb6\xcb`]\
+f\xe6\xf7\x92F~\xae=\x0a\x8fy\x06\x81@\xa4\x80\
+#s\x11\xaa-\x85R\x0eF\xc8X0\xc7\xfe\x9e\x5c\
+\xc0$\xb6\xeb<J\xf1$\x9e+1\x8dJV\x83\xd5\
+\x8eS\x8e\x1f.\x94\xf5Q.W+H-G\xaa\x0b\
+\x0e3\xb6\xa0\x1c\x5cB@\xd8\xdc\xd0\xcb*\xcb\xbf\x19\
+H\x07\xdck\xe2\x04_\x00o\xaeF\xe3L\x82\x5c\x12\
+\xc3\x97\x0c\xd1k\xd9\xc6&M\x0a\xa5|\x00g\xe5<\
+\xea\x9c\xad\xab\xc4;L\x1d`\x1b\xb7i\xa3\xda\xc8\xaa\
+\xec\x1d\x04\x9e\x80G\xfc\x8e\x96LF\xdd\xb4\xf7\x14\xea\
+\xca\x89*H\x8c\xd0\xfc\xad\xb1\xe4\x7f\xb1\x86\x93\x9c\xa0\
+$\xc5gnF \xb2\xe6\xed\x0c\xd6W\xdf\xdd\x8a<\
+\x92/\x15r\xcb\xbb\xca X\xb7\x0f=h\xab\xfd;\
+\xa7\xed\x88KP\xdb\x96K\xcc\xe6\xb2l\xd7\xac\xc9X\
+\x07/%?\xf3s\xbasm\xb4\x08\xed\xb6>f\x95\
+F\xb8@r\xc1\xa0a\xcd\xc6\xc7\xfb%\x83)l\xca\
+\xaeY!<\xe9\xedv\xd7A\x9b\xca\x5c7\xb7\xdfT\
+%\x86\x80|,\x06\x16+!\xfe\xb1\x02\x1a@\x9b\x08\
+\x91\x01\xac\x05\x149\x80\x12\x9e\x14H\x08B!9.\
+\xecn\x8f\x18\x09(\x04\x02\x00]y\xa6\x92\xa7\xce\xeb\
+\x13j\xadv\x02\x15\xe9\xa9\x9a\xde\xaeA\xca!\xa3\x7f\
+\xd3\x09<)\xd5\x8fy\xa2%v&\xe0\xd3\x84\xa7\xbf\
+\x0a\x91\xf0\xc86AJ\x82\x94\xf1\xb6W(\x01\x19\x00\
+\x81\x94\x08@P$\xd1\x22\x81zK\xa1\xdd\x8e\x10!\
+\x0e7\x0eDr\xa0F1\x84\xf3v\x0b\xb2\xc6\xc2w\
+5\xb8\xe5d\x93R\xb2l\x8a\xc4]\xa0\xbayr\xa7\
+\xe4\x10\xa4W7\xa9\xc0\xbd\xe1\xc4\xedeO\x90\xf1\xa1\
+v\xb0\x08\x5c\x8d\x8b/\x1e\xdb\xee\x94\x00Z\x8a\xd0V\
+J\xbbF`\x0e\x01%\xe3\x08C\x89\x9c\xd4\xdb\xcf<\
+=\x87\x1fp\x93\xd1\x7fF@NJ\xeb\x02\x5c]-\
+\x15\x1b\x90\x8c\xdda\xcap\xb6\x1c\xe3\xacL\xc2\xf9M\
+3\x05^\xd7j\x9eK0\x96\xef\xb1,\xff0\x10Q\
+\xe24\xe1N4\x9f\xd2\xf4\xac\xb8\xcdl\x89/\x1b;\
+\xe2\xaf\x12@Y\x87\xe1r\x87\x8d\xe1\xc0\x02\xf5v\x94\
+\x1c\xb5\xb5\xed\xf0\xe5\xd2=\x93\x03yV]\xa4\xc7\x92\
+>\xc3\xe0\xb6g>i\x95\x8d\xf1\x06\xcb\xfbc\x9b\xb8\
+;'\xf0\x8e\x8b\xfb\xb0}\xb8\x80\xee\x9c@9\x94\xe8\
+\xcaK\x14\xf3!\xc2 \xce\x98\xab\x004Z\x11fj\
+-\x1c\x9fm\xe1\xa93u|\xf7D\x15\x87\xe6U\x92\
+b\xdb\x19\x02\x5cc\xdb\x99\xb4;n\x8eQ<t\x9c\
+X*/~-\xba7\xeb,\xa3\x00Y\xcf\xb2\xa4\x18\
+\x97\x5c\x99\xed.\xd5v\xba+_\x8d'\x10Z\x11\xa1\
+\xa5\xb4\xdc\x16\x96\xc9%%\x10\x88\xb7}\xc9}N\x1e\
+@\xf5\xf0MNDod\x9dh\xcd2\xa8t(\xb7\
+E{\xd7\x97\xe3;\xf5\x8d\x89\x90!\xf5M]\xceX\
+\x8d\xc6\xfc\x028\x0b\x10\x8fM\xc0\x91\x8e\x19'\xa1\x1c\
+\x82bi\xa4:#\x83v\xa4\x09\x84\xa9\xd3]\xae\xd4\
+\xae7\xd3\xd2Y\xb7bO\x9e\xa59\xb4]!K<\
+\x8e\xa9\x05\x07=\x1cD\xb4mj\x84\xe4\xd2\xcf\xda\xcc\
+-\xa5\xf0\xe2\x0de\xfc\xca\xd5\xa3\x08\x03s(\x98\xc1\
+Ew\xe8^U\xa6\x14\xe1\xf4B\x03\xff\xfc\xddq|\
+\xe2\xf1yv\xd6\xd5\xf5\x5c\xebqY\xdf\x8b\xcb\xcc\x5c\
+I\xe6C\x9b\xccrqB7\xa1\xa9\xb6q\xc79\x9b\
+\x12\x83\x82\x7f#CH\xa9LN\xfag\x06/\x97Q\
+g\xb9\xd0\x18\xe1{K)\xf4\x91\xf0(\xb1\xc93\xe8\
+!\x902\x8e-\x80\xb7\x87D.Q\x22\xd5\xebs\x10\
+?1\xcd\xd6s&;6\xbf\xa3\x8c\xdaCS\x8e\xbf\
+\xc2\xd7>2\x1c\xc4|LB \xde\x06\x5c\x01/\xc0\
+\xf2}\x00Dqf\x1aG\xcf\xec\x045\x06<\xa3\xe2\
+p\x84\xd2\x98\xe7n\xc3\x04\x062\x9e$\x11\x00\x14\xd0\
+h)\x0d\xf6T\xb7\x04\x8a\xaf\xc6\x8abi\x11)h\
+\xae\xe5\x8c\x85\x93\x08\x07\xbf\xfdD\x9e\x91\xab\xc7\x19\xab\
+o\xae=\xcc\x91H\xa0\xd1&LV\xdbh\xb4\x15Z\
+Q\x84H\xc5\xf9\xfet\x9e<\xfb\xae\x02H\x81(\x0e\
+\x97]\xdbW\xc4[.\xe8GWN\xa4lU\xd7\xd1\
+j\xb5\x16\xc7\xc6\xed\xa4_\xbb\xfa|z\xb6z\x0d\xc8\
+EdN4\xb6?^\xc7\x85\x01)\x82\x1d\x90\xa7-\
+,\xb19\xce\xd7\xc2\x89aJ\x0d\x9d\xd0\x8e\x14Z\x86\
+\x92cs\xc9^\xc6\x12G{Jm\x8a\x18|\xb3[\
+\xbf\x0c\x9b\xd8\xd0\xf48\xf8\xdah\x98\xf8\x0eR\x8b\x1e\
+\xe9\xb91\x06\xe7\x98\x06\xec(\xb2\x1dz\x16\xe2%\xcc\
+\xc4\x1dO\x0cg\x05\xf1B\xd0\x00b\xb6\xab\xd3T\xf1\
+m\x0b_Ly\xaf91\x03\xd6P4r\x86\xec\xae\
+]\x90yI#\x12%\x88\xd0L\x9c@f\x1b.y\
+\x99\x08(\x06\x02\xaf\xdfU\xc2\xe6\x81\x02N\xcc7p\
+\xdf\xf1:\x0e\xcf\xb5\xd1\xa6\xd8\xbf \x12\xf5P\x07\x19\
+9\xe32\xe3w\xf52\xf7\x98\xac\x97\xce\xc4\xd3$B\
+)p\xf7\xb1\x06\xde\xf9\xd9#XS\x16(\x86\x12a\
+ p\xe3\xce~\xdcp\xce \x04\x04j\xad6\x9e9\
+\xb3\x88\xa7\xc6\x1b8\xbd\xd0B\xa5\xa9\x10J\xa0\x9c\x93\
+80\xddB\xb5\x1dg\xc95=r\xf50\xe9,%\
+\xdb\xd3\x9c\xd0\xd5v\x1c\xaf\x7f\x16C\xb0p\xd4s\xcf\
+b\x1f\x16.\xf6Zs\x07\x97\xb5\xed\xedm\x9d\xfa\xef\
+\x02\x94\xe1+p\xc7k\xb5>\xf6*\x11T\xc4j\xfb\
+\x81Q\xa0\x98\xa9zk\xe3\x10\xa9\xa3\x05\x12\x9c\x9f\xbd\
+6M\x90\x18\xf1Q\xda\xd3\x9b\x96Q\x91\x03c\x8b\x9b\
+\xd904j>\xf3q\xb8\xbb\x0c\xc4\xdcP\x229\x82\
+\xbf|\x0d`\xd9\x0c \x82D\x94\xc8h\x1f\x09\xdd\xbc\
+\xf6\x22\xfdG\xebs,\x1d\x8a\x8f<1\xe2\xb8\x8e\xbf\
+\x18\x98\x16H\x912\xabm\x91\x99\xe2\xec<\xaf\xd8\x9c\
+\xc7\xef\xbeb\x1d\x0aa\x00E\xc0\xc4B\x1d\xf7\x1e]\
+\xc4m\x07\xe6\xf1\xc8\x99\x16\xa6\xaaQ\x92\xd8\xc3n\xab\
+\xf8V\x82\x96\x0a\xdas\x0d\x8a3\xeeI\xc4G\x85s\
+2V5\xcd\xfb\x221\x8b(\xf6\x8d\x90\x00\x8e\xcc(\
+\x1c\x9a\x8a\x7f\x0f\xa0p\xfd\xb6>\x08\x01,6\xda\xf8\
+\xc0m\xc7\xf1\x95\xfd\x15T\xdb\xd6\x9c\x8a\xb9\xbb\x8cM\
+ \x99\x9dL$eG\xa66\x0e\xad\x9amT\xd5\xac\
+IrB\x87\xfb\xba\xfe}I\x85\xce\x88@\xeed\xcb\
+\x18\x83\x10\xb0\x01S\xda\xd1\xda\xd9\x07\xe4h1|m\
+\xe1\xbeb\x15\x10.N-\xde\xe9<\x12\x9c\xc3\x98\xf3\
+\x0f\x9etv`,X\xbb\x22\x03\x97;\x98,f\xe6\
+\x5c\xfd\xd7C\x80\xc7\x00\x85\xfdA\xe7K\x14^/\xe0\
+\x90uvd\x96Z\x95\xe7W\x96\xcd\x00\x02)\x01\x93\
+\x13\xc0\xb7\x099Q\x1b\xf6\x95\x01l8\x88\xcd\xdbP\
+\x14\x1f7r\x00f\x95(@\x80-\xb0\x0f]Bw\
+N\x22\x94\x12*\xe1\x96\xabz\x8a\xb8\xe9\x82\x22n<\
+g\x00'f\x1bx\xe4d\x05\xf7\x1eY\xc4#\xa7\x9b\
+\x18\xaf\xb4\xd1P1?\xcf\x07@>\x10\xc8\x87\x01\xba\
+B\xa0\xaf \xd1\x9b\x07\xfaK9\x0cw\x85\xe8/\x85\
+\x18*\x87\x18,\x87\xe8\xce\x09\x14s\x81MTIz\
+w4\x86\x80\x22BD\x89\x14$\x85B\x18\xe0\xdc5\
+\xdd\x00$\x1e:1\x83/\xec]4\xb7\xe5\xd8S`\
+\xb1\xcd\xafH\xa1\x15\xc5'\x22\xe3\x9b\x7f\xa5\x937?\
+\x15\x8c\xc2\x0d\xd7\x0c\xa6\xea\xab\xd0Z\xcd26r\xe6\
+V\x16o\xcf\xb5\xa3y5\x93\xab\xd0\xbc\xdeABq\
+\xc2\xea\x88\xc3\x9c\xa1\xb98ay\xbcMi\x96n>\
+~7R\x84(r\xd8\x91\xa3\xe6\xfb]:F\x88\xb9\
+\x1dI3s\xad!j]\xd7\x9a\x16V\xa2\xb90v\
+\x1d~<\x07\x22\xc1\x7f\xcd\x9e\x0c\xcc\xf2J\xf0\xf8\x9a\
+\xc4\xe4}!0\x80\xd8N\xf3\x8c \xe7@Fz*\
+0?q\x1b)iO\xb0TI\xc9\x1f\xc5\x1fp\xd9\
+\x92t+\xbc\xbe\xb5\xb6+A\xb8\xefD\x0dGg\xea\
+\xd8:XN\xae\xed\x8es\x05\xe6\x82\x00[\x86\xca\xd8\
+6\x5c\xc6\x1b\xce\x1f\xc2\x99\xf9\x06\x9e>]\xc1\xe9\x1a\
+\xa1\xaf 0\x90\x0f\xd0W\x0a\xd0]\x0aP\x0a%\xba\
+\xf2!\x0a\xb98\x1bm\x90\x1c*\xb2n\xdb\xcc\xc9\x22\
+\x8d\xdd\xf1\x80\x15\x11\x16\x1a\x84G\x8e\xcd\xe2_\xee\x9f\
+F\x83\x02\x84\x22\xb6\x99#B\x22\xfb\x15J\x12\xe8\xef\
+\xca\xe1\x82a\x89Wl\xefAK\x01_|f\x1e\xf7\
+\x9fj\x82\xa4p\xbb\xe8h\xd6k\xd1\x82\xd4\xe6\x8c!\
+x\xa3\x01\xa7\x93Q\xba\xb6iGC\xd5\xd4w\x1ey\
+\x08j\x09\xde\xae\xa5\xeb\x9c[J:\x08\xef]K<\
+\x92\x0f\x92Iv!\x04\x94R\xc9\x85\xae.\xb3tu\
+\x04O\xb8{\xb6\x88a\xcaFkIe*H\xc3_\
+\xa4\x7f\xce\xf2\x11Y\x15\xc1\x9a\x13\xfc\x0d~\x0c\x9b\xd3\
+Il\xfe.\xbf,\xdf\x04P\x04\x9d\x9a\xd0\x09w\xf1\
+UU\xc1\xd5~\xef\xaf];\x0fZ\xb1\xa7\xb3\x11Y\
+\x04\x16\x0c0\x9a\xcfH\xd8m \x1e{-\x05pr\
+\x91\xf0\xad\x83\xf3\xd8:T\xb6L\x060\xc8\xac\x00\x04\
+\x22\xc0\xba\xfe2\xd6\x0f\x94Y\xe7Zo\xf1\xb4\x98\xc4\
+\xd5\xdc\x8eb\xe7b#\x8aPk*4\xdb\x0a\xf5\x88\
+PmD\xa86\xdbh\xb6\xe3;\xf2\xea\x11\xa1\xd6$\
+TZ\x11*\xcd6\xea\x8d\x16N/\xb4ph\xa6\x89\
+\xa3\xb3\x84\xc5\x96@!\x94(\xe6$z\x0b\x02k\xbb\
+$\xb6\x0f\x15\xb0s\xb8\x88m\x839\xac\x1b\xec\xc6\xaa\
+\xee8\xeb.\x00\xbc|\xfb\x00~\xfbk\xc7p\xcb\xa1\
+*B)\xe3x0\xc9\xe7\x05\xb8\xa8-\xec\xd6\x98\x87\
+l\x0e.2\xbf\x89\x09\xd62k\xe1\x9b\x16nq~\
+M[ l]\xd3\x04.\xbc\x97:*\x10|\x17\x80\
+\xd5\x97\xc9y\x0fw@\x96P\x22\x8ac\x05\x00\x9da\
+\x09\xb0~\x1b\xde\x1a\x99W\x91\xf9\x8b6\x0527\xb9\
+R\x93\xe7\x0a)\xb9\xb4\xeb\x88\x0c\xfd\x1e\x9f\x9d\x80\x96\
+\xf7VK\xe0\x0c\xca$\xa8^\xbe\x0b`\x05\x8e\x03C\
+\x81(J\x1b\xce\xde\xc2\xd90R\xd1\x11\x97\x0c\xe7v\
+\x96\x18\xa8\xb7\x13QO|\xd6\xf6t\xa0\x94\xd2\xd8x\
+\x96P5\xa8\x81\xdb\x0f\xce\xe3\xad{\x86\xd0\x95\xcf\xb9\
+\xb9J\x8c\x83\x8fy\xcf\x85\xbd\x85FK\xb4\xf9Z\x13\
+\x8f\x9d\x9a\xc7\x5c\x138S\x890Sibb\xa1\x89\
+\xa9\xc5&\xa6\x9b\x02s\x0d\x81z\xa4\xd0V\x0a\xed\x88\
+\xd0j+D$\x11\x11%1\x06\x02\xed\xb6\xc2[\xce\
+\xed\xc6+\xb6u\xe3\x825\x02m\x02\xda\x89\xf4\xea\x0e\
+\x05\x86{\xf2\x18.\xe7\xd0W\xca\xa1\x94\xb7\xb7\x0dk\
+DR\xc9\xc0Gz\x0ax\xef\xf5\xeb\xb0sd\x0a\xcf\
+\x9c\xa9\xe2\xe8l\x84\xc9Z\x84\xc5\x16@B\x22\x14Y\
+0\xce^\x1b\xbe[\x10k\xf8\xe4.\x99\x06\x13{\xce\
+@\xe6m\xff\xe9\x0f\x8c\xb3{\xda\x89\xebSd\xf1\xf9\
+\x06\x91\xb9$\xb4R?[/\x88\x99\xbdDb\x86\x9a\
+5\xe3k\x1b\xaf\x85\xbeA/\xdb\xd9\xe9\x12\xb96e\
+\x04u@S\xca\x82&\x0b\xe6\xd1<7\x01\x96\xb3{\
+\xe3\xf5\x9c\xd6\x08\x5cgh\x87\x11&\x0f\xf9\xce\xdb\xf7\
+_V(\x10\x08\x09\x81\xb3\x15\xf0U \xd2\x99c,\
+\x82\x98\x1bV\x9d\xc5qo\x95!\xa5Pk*\x86D\
+\xb6}]/\x1f\xa4\x99\x8af\x05\x12\xc0\x13\x13m<\
+p|\x01/\xdb>h\xfar<\xfd&yd|\xdd\
+\xf5\xfe\xf1*\x8e\xce\xd6\xb0c\xa8\x8c\xed\xab\xba\xb1\xd8\
+h\xe3\x8fn;\x83\xc3\xf3:\xfd\x89\xcd\xf4k\xb2\xe5\
+\x82;\xb5\x84\xc1\x22A@S\x11\xb6\xf6\x87\xf8\xa5\xab\
+\xd7b\xc3@\x97\xe9+[\x1a\xc7\x8c\xd2\xe6{\xb4\xbe\
+\x0e\xed[\xd88\xd8\x85_\xbf\xae\x84F[a\xb6\xda\
+\xc2\x89\xd9:\x1e\x19\xab\xe1\x9e\xc3\x0bx\xecL\x03\xf3\
+\xcdx\xfe\xb2\x93\xa8\xf2Tig\xb9\xd2\x96\x96\x13\xab\
+\xc0\x89RK&\x87]3\x9bXx\xdd\xf0>\xb2C\
+\x9c-\xca\xf3HF\xcfnq\x98O(%\x02}T\
+\x84\x5c& \x84@\xa4\xe2t\xed\xee\xcbnw\xe6W\
+\xed\x0fa\xbb#\xd6L\xb2TIf\xad]Ac\xc7\
+m{\xf3u'{<\x9c\xe9\x96\xa9\x13\x99\x0c\xe8l\
+\xbe\xdc9\x18\x08\x01%^\x10\x0c@Z\xdb0\x8b\xc1\
+\xfa^\x7f\xe7\xc7D\xedt\x1bL\x00\x15\x13\x10A\xa0\
+\xd1V\xcc\xd1$\x0c \x81\x98v\xe3\xb3\x02\xbe\xcdj\
+YM\xa5%\xf0\xbe\xdb\xc7q`\xa2\x86sW\x970\
+\xd2\x95G!\x973\xb8Uo\xb60\xbeP\xc7\xd1\xb9\
+6\x1e=U\xc1\xdd\xc7\x1a\x98Zl\xe1\x9a\xcdE\xfc\
+\xfd\x9b\xb6a]\x7f\x11\xaf\xda\xd9\x8b\x0f?8\x87\x9c\
+\x94\xaeY\xe0K/cr\x13\xda\x0a(\x0a\x85k7\
+\x17\xf1\xb3\x97\x0dc]_\x11J)\x07 J)\x84\
+\x81L.\xd3d``\x8e5Cb&\x8dW<\xb3\
+|\x18`u\xaf\xc4h_\x11/\xda\xd4\x87\x1f\xbfx\
+\x18\xcf\x9c\xa9\xe0+{gq\xdb\x81\x05\x9cX\x88\xdb\
+\x09\xb8\x0a\xdf)\x8c\xd8\x93\x9c~\xfa-\xff\x96\x1d\x9e\
+\xfa\xcdoQx\xdd8j\xbb\xa3\x0a[\xed\x8b\xe3\x89\
+#\x8d\x99\x8c\xd5bYkgD@.\xa08m\x98\
+7\x0d]\xdaD\x88\xf4\xfe=O\xca\xe88\x8d\xc9\x1d\
+\x8b\xbb\x04I\x95\x0c=\xc4\xf0e&\xa3\xd96\xb2\x96\
+\x8dB\xe3\xab\xf0\x83w\x8c:\xc4\x01\x95\xc8SW\xa8\
+\x99\xa4\xa4I[\xa4T\x9c\xb4u\x99e\xf9IA\x91\
+\x5c\x97-(\xc5\xee\xccW\xdf.\x15\x0cI:h\x0c\
+\x1a+\x14\x80\x9a\xbe\x0c/e1\x02\x90\x02\xa5\x9c4\
+j;[\x1eC\xa0\x12\x84\x13\x0b\x11\xfe\xfc\x9e\x19\x14\
+\x82\x19t\xe5d\xac6&1\x00\xcdH\xa1\xdah\xa3\
+\x99l\xc1\x05\x02\x08r9<2\xd6\xc2\x13'\x16p\
+\xe5\xd6A\xbc\xf9\xc2!|\xe5\xd9\x05\x9cXP\xc6\xe9\
+d=\xb9\x22\x81\x04\x00\x12h+B1\x10\xb8b}\
+\x1e?\xb6g\x00\xd7l\xebGW>4R]\x08\xa0\
+\xdal\xe3\x13\x0f\x8f\xe3\xf1\xd3\x15\xbcfg?^\xb2\
+\xb5\x1f}\xa50!p\xbb\xf8\x06\xb5\xcc}\xf4:\xc1\
+\xa8&L{*\xad\x94\xcb\xe3\xd2\x0d9\x5c\xb4\xbe\x0f\
+?yI\x0d_yj\x0a\xff\xf1\xf4<\x8e\xceE\x80\
+\x10\x89\xa4\xcc \xda\x14\xe3f\x92Gkdf<d\
+\xe6`mx8Z\x01\xd8\x98-\xf2\xa7y\x8f\x1b.\
+\xcb\x04\x9f7\x1c\xd7\xac\xb3v2\x00\x14C\x89\x9c\xd6\
+\x00\x85\xb5\x9f5P\xaa\x8dx\x17\xc5\xbdS\x81\x9c\xfe\
+\xa15S\xf24XB\xca\xce\xe6\xca\x90\xfe\xcc\xf1<\
+\x15mh\x0d\x9dtTdZm\xb5OS\xb0\xe2\x0c\
+3\xdeUR+\x90\x14p\x05n\x06b\x11cF\x8d\
+I_\x17\x9d\x120\xbc\x0d\xce\xec8T\x93\xef\xcd\xc8\
+\xf3O3\xedYPLl6\xa2\x8f\xf9Q\x19\x0b\x0f\
+\x10s\xd5&\x094\x1bH\x14y\xdb\xafD\xa2J2\
+=r\xa1\x05|\xf5\xd99\x5c\xb6\xb9\x0f[\x06Kx\
+\xdby}\xf8\xab\xefLg,Z\xc2\xac\x08(\x06\x84\
+Wl*\xe1\xcd\xe7\x0f\xe0\xf2\x8d=\xe8.\xe6\xe2\xed\
+\xbb\x84\xf8\xa5\x00f\xebm\xfc\xf9\xed\xc7\xf1\x99\xa7\x17\
+\x10\x91\xc0\xad\x87N\xe3\x82U\xd3x\xd3y}\xb8~\
+\xe7\x00F\xba\x0b\xd6'\xe1xPa\x91R\xd8\xdd\x0e\
+\x22M\x8a\xf6\xb8\xf5\x96\xe12~\xe1\xa5%\xbc\xe1\x82\
+\x1a\xbe\xf0\xe4\x14>\xfd\xc4\x1c\x8e/D\x08\x92x\x07\
+\xe1\x8d\xdfq2\x813 w\xb1xn\xc7\x94kP\
+\x13z\xd2\x03\xb7]]>\xef\xbe\xcfw/\xd3\x85\x05\
+9sG%b\x07_W\x8eP\x0c\x03\xd66\xc0\xcf\
+6T\xea\xad\xf8\x06\x1d\x0aX\x1c=3%9rf\
+\x99\x07)\xcd\xc7\xadN\x9c\xfa\x0d\xde\xdb\x13\x05\xd6\xe9\
+\x98\xd1\xbe\xe3\xe4L7\xae\x0fi\x19\x94\xf4hf%\
+\xbc\x80\xcb?\x0b@\x0a\xc4\x83\xb0\x13q\xe188\x1c\
+\xc7\x1b\x9f9S\xf7y\x03\xe4\xfe^oF\xd9\xac8\
+\x81DwA\xc6\xe1\x9e\x9e\x82\xe5: u\xf7d<\
+\xa9\x8e\xbd\x98\xf4\xcb\x1d\x91R\x0a|\xebp\x05'f\
+k\xd84\xd8\x85\x9b.\x1c\xc6\x97\xf7\xcea\xdf\x8cJ\
+\x98\x85enD\xf1\xa9\xc5\xf7\x5c=\x847_0\x8c\
+B.\xb4W\x93%}H\x01L\xd5\x9a\xf8\xa3[O\
+\xe2\x8b{\x17\x11H\x89\x9c\x88\x11\xf9\xa1\xb1&\x1e;\
+=\x81O>:\x8b7\x9d\xdf\x87W\xef\x1e\xc4\xea\x9e\
+B\x0a7\x8c\xa4JDJ\x0a=\x13\xf8*\x15Op\
+\xfd`\x17~\xe1\x9a2^{\xee\x10n~t\x1c\xff\
+\xf1\xd4<&+\x840Hr\xca\x19\x06C&}8\
+\xf7\x91d\xe1\xa8\xe1N\xc2\x9e\x22\xb4\xe1\xad|q\xb2\
+\x10\xc6W\x99\xd1\x81\xfa\xb5h\xd6\x8e1\x81\xf4h\xe2\
+\x9b\x8es\x01g6\x8cR\x04\xb0\xd8Th+rv\
+\x22\xbcckK\x16=_\xe7\xd2\x12\x87\x03\x18\xec1\
+,\xcf\xfe\xcd\x80\x04u\xf8\x9c\xf1\xdd\x10\x7f\xaaNr\
+9\x8dX\xbe\x09\xb0\xfc\xb3\x00\x82\xc3<\xc3\xb1\xc3\x10\
+\x89\xbb\xfc\x8c\x0df\x08.y\x8d#\x90\x00HJ\xcc\
+\xd5\xdb\xc6vN\xc7\xa4\x09\x0c\x96\x82$f\xceG\x10\
+\x1frd\xfb6\xea;\xa3P\xc7N%H\x10N-\
+(|\xeb\xe0<@\x84\xd1\xde<\xde\xbeg\x00BE\
+h*\x81\xb6\x82\x89\xe9WDX\xdf+\xf0\xeas\x06\
+\x0d\xf1\xf3\xa6\xa5\x14\x98\xa8\xb4\xf0\x87\xdf8\x81/<\
+\xbd\x10g-\x22+a\xc2D\xb2>=\xd1\xc2\x1f\xdd\
+9\x89\x9f\xf9\xd4!\xfc\xeb}\xa70\xbe\xd8`\xb6\xab\
+\x03H;f\x13\xa0\xce51\x0d\xcf\xf8\xf3\x96\xe12\
+\xfe\xd7\xcb7\xe2\xa3o\xdd\x847\x9cSF(\x94\xb9\
+\xac\x94\x88\xd2[[\xc4\xd6\x88\xf7\xe5\x98\xd1.\xdc\xd2\
++\x03X\x9f\x85;\x1e[\x89\xcc\x92\x08$\x1a\xa5\x83\
+K\xbc\x0fbK\x14\xe3QoA\xd8\xd3\x92\x196\xc4\
+|\xc3\xe6\x8a\x807\xde\xe7\x83-\xa9\xda\x94\xfd\x86\x7f\
+0\x87\xfc\xaa\x5c\x05\xd6\x83\x15\xd6\xa7\xe5\xe3\xa6\xd5\xa5\
+\xbd5\x01\xdb\x9e]\x82\xcf>\xdf\x12,\xb7\x81\xf2\xe5\
+o\x83\x12A_\xb1\xbb\xef]a \xfbR\x15<\xdd\
+\xc51\x052\x8a\xff\x5c\x11\xb0\xb6D\xb8\xf1\xdc!H\
+\x19\xc4\x80f\xde7!\x80S3\x15|\xed\xd9E\x9b\
+\x12\xca\xd7\x97x\xc3\x94\xf5Y\x18\xd5\xd0\xc2:\x96\x82\
+\x11\x09T\x9bm\xbcrW\x1f\xf2A\x80\xad\x83E\xac\
+\xef\x090\x5c\x22\x94\xc2\xc4^W\x0aQ\xa40]U\
+\x18\x9f\xafc\xb4'\xc0@9g\xb6\xf2\xa4\x00&+\
+M\xfc\xc17O\xe0\xeb\x07*\x08\x92\x9c\xf8N\xfc\x0a\
+\x03\x97\x000Y\x8bp\xf7\xd1*\xee9<\x87\x9c\x88\
+\xb0e\xa8\x18\xdb\xba\x8c<\xa4\x04\x84P\x10\x82\x9c\xed\
+\xb5\x88\x08\x8a\x14\x9aQ\x84Z\xb3\x8d\xb9Z\x0b\xd3\x95\
+&fj-\x8c\xf6\x14q\xc39C(\x87\x11\x1e<\
+^A\x8b\xa5\xf4\xd6\x04\xebH\x7f\xb6\xf7\x97\x92\x80\x19\
+\x22\x8e\xe3\xb7\xbd\xcdX<\x07\xb2f\xcaJg\x89\xb2\
+\xa4uD\xc0\x95\x1b\xcbx\xf9\xce\xc1\x8c_\xe3\x1b\xaa\
+\xef>8\x87o\x1d\xaa\x98\x0b^S\x8d'\xdd\xa7\xfd\
+!\xdc\xce\xcc\x18\xa7\x83\xc8\xdc\xbf\xa0\x7fN3\x994\
+Ss2O\x9a*|\x17#k\xcc\x02\xa4zQ\xb9\
+Y)u\xe0\xe8\xb7n\xc6r\xca\x0aD\x02\xc6\xc9\x89\
+\x84\x91f\xbe\xf7\x82\xf3Q\xed\xa2IO\x8c\xfc\xfa\x02\
+\x10\x14o\xb3U\xa3\xd8\xa3\x9e\x0b\xc8\xf4\xc9\xad\x86\x9e\
+b\x0ea M\xe6W\xe7\x04W\x8as\xbb\x9fS\x1a\
+\x87\xe7\x94\x94\x12xr\xbc\x85'O.\xe2\xaa\xad\x03\
+\xe8)\xe4\xf0\x8eKV\xe3m\xa4Pk)\xcc\xd6\xe2\
+\x98\x80\x93sM\x1c\x9fk\xe1\xe4l\x13\x9f~p\x0c\
+o\xb9p\x10{6\x8d\x00 \xcc\xd4\xdax\xff\xad'\
+\xf0\xf5\xfd\x15s\xf9\x88]L\xb8\xdc^k\x1f\x09b\
+=3\x19\xe1\xbd\xb7\x8c\x83 \xf1\xa3\x17\x8f\x18_\xc2\
+\xc3\xc7fp`\xba\x81\x85\x86B\xa5\xd1F#\x02j\
+m\xc2|\xb5\x89J#B\xad\x1d\xdftTo\x0b,\
+4\x09\x95V|n~S\x9f\xc0\xef\xbc|=~\xf6\
+\xca\xb5(H\x89\x0f\xde5\x81j$\x92\x03W.\x11\
+\xc6\xda\xa6HT`\x1e*\x9c\x05S\x82\xdd\xd1\xe1D\
+\x92\xbc\x0f.%\xb9\x17\x18\x99\xfd\xb2\x9aV\x12k\xff\
+\x07\xebs\xa0T\x80\x94\x02\xfa\x163?\x5c\x7f\xa6\x16\
+!\x02\x10X>f`\xec\x5c\x09\x0f\x96\x1f\xc1m\x22\
+u\xf8\xca\x89\x87H*\xe8\xc3@>mp\x9d5\x95\
+\xcf_\xe3\x1b\xe7p\x1c'R\xfe\x07a\x92\x9e\xe8\xff\
+\x96[\x96\x1f\x08\x14\x8a8,Up\xce\x9f| w\
+\xf8\x04\xbb\x82\xae\xf5\xca=\x5c\xee\x13\x09`\xb6)Q\
+k)\x94r\xa1K\xa0I_\xfd\xe5\x1cJ9\x89f\
+\x93<\x80f3\x1a\x01\x11\x07\xe9\x10!'c\xf5[\
+\x00h+\x85\x96\x02\xda\x14\x07\x17\x85B@\x0a\x85z\
+\x9bpd\xae\x89\xab\x041\xaf\xbbD9\x1f\x87\x08\xaf\
+\xef/\xe3\xe2\x0d0\x88\xdel\xdb\xed\x9af\xd4\xc6\xdf\
+\xdeu\x02_\xd9\xb7\x18\x13?\xc8 \x9fQ{ul\
+\xb9\xb7\xe0\x00!\x14@S\x09\xdc\xb2o\x16o8\x7f\
+\x10\xf9 \x84\x10\x84{\x8e\xcc\xe3CwOA&\xdb\
+\x92d\x0e3Y\xf2\xb1\xa7\xd4,\xdc'+\x11~\xed\
+\x8bG\xf1G7n\xc0O\x5c>\x8a@\x0a\xfc\xd9\x9d\
+\xa7Qi\x0b\x03\x07\xd3{\x86\xa3\xcc%p\x8f\x22\x9d\
+\xfd<M\x8d\x89\xaf\x80\xa9\xb6~:\xeb\xb4\xaa\x0b\xf3\
+\x1e\xf9\x14m^\x88\xf3E\x0ew\xdbtq\xce\xdd\x09\
+\xc9Z\xcc\xd5#\x96\xdd\xc9\xda\xec~\xbfY\x1a\xa9\x93\
+\xb2\x8c\x99X\x9c\x91p\x9cr\x85\x1c\x80\x8cy\xc2\xa9\
+\xab}`\xc9s\xd20\xb7\x0b\xc1\x99\x07gMB\x04\
+\xf1I\xd6e\x96\xe5o\x03&\xf6\xaf;S\x8d\x18\x1d\
+\x14~\xa3\xfe\xfa,@0\x00X\xe4Y\xa8+T\x9b\
+-\x0cu\xe5\xdc\xad\x94\x04A\xba\x0aq\xa8\xecl#\
+\x8a\x8f\xcd\x92\x0b`\xb7\x87\xf8\xdd=\xab\x02\xbcl[\
+/v\x8f\xe4\xd1S\x08! PmE8\xbd\xd0\xc2\
+\xde\x89\x06\x1e\x1b\xab\xe2\xe0t|\x0d\xb8@L\xd4|\
+\xb9\xf5G\xd7\xec\x8c\x9f\xe7\x02k\x9e\xcc\xd6\xdax\xe0\
+X%9\xc8\xe3K\x15NUd\xda\xe3\xc9mI\x00\
+\xa1 <>V\xc7\xb1\xe9\x1av\xae\xea\x01 p\xed\
+\x8e~\xfc\xebC\xb3Xh!\xb9$\x22\xbd\x04\xf1\xd6\
+\xa4p\xfc0R\x068\xba@x\xcfW\x8e\xe3}\xaf\
+\x22\xbc\xe3E\xab\x11J\x81?\xbb\xe34\x16Z:&\
+\xcaw.Z\x98;h\xee\x1d\xd6\xe7\x8e0_;H\
+\xa1\x04\xe7\x15\xec\xbbs\x1bq\xd6^\xbdy_ $\
+\x85\xd1.O|\xb2\xa5hE\x84\x89\xb9\x867\x87\x8c\
+A\xf0mA\xaf\x1a\xf9|\x87\x8f-\xa9\xe8\x9a\x0f\x9d\
+\x8e\xf3\x08\xf6\xcd\xd5\x00\xedS\xc1\x18\xa7gVd.\
+\xc7\x0b@\x03P*\x8e\x8e#\x16\x9a\xc8\x01\xc4xo\
+\xf2\x029\xdb1\xd91\x97npH\xb5\x15a\xbe\xde\
+v\x16F{\xc2\x09\x84R.@o\x81pj\xd1K\
+\xcfD\xf6\x858$7\xf6\x1a\xff\xb7\xcb\xfa\xf1\xa3\x17\
+\x8f`\xb0\x1c\x22-\x03b\xcd`\xae\xde\xc6\x13\xa7\x16\
+\xf0\xe9G\xa7q\xeb\xa1\x1a\xbe\xfc\xf4,^{N?\
+F\xba\x8b\xe0\xb4\x9b2_]!\x84\xe1\xee\x12\xfe\xf2\
+G6\xe1\x13\x0f\x8f\xe3k\x07*\x98\xac\xc1\xdcU\xc0\
+\x9b\xe1\x08e\xdb\x8f1P\x08`\xaa\xa6p\xdf\xd1\x05\
+\xec\x5c\xdd\x0d\x22\x81]\xab\xbaq\xf1\xda\x02n?\xd2\
+D\xce1\xb1]\xc6k\xe0\xcf\xc0\x1c\x08`l\x81\xf0\
+\x9b_=\x8e\xf76\xdbx\xcb\xc5\xab\x90\x93\xc0\x1f\xdd\
+6\x86\xf9V\xec\xb3\xc8bT\xc4\xda\xcfB='\x15\
+:\xf7*\x1ax\xd8vb>cM\xc2t\xc6\x1e\xb0\
+K=32,\x03(\x87\x12C]y\xc0dK\x10\
+l\x94\x02\xcdHa\xa6\xd6L\xfc\x126\xfe\x9f[\x1f\
+\xf1\x8eGj1,\xe5'\x80K\xe5\x88\xf4'\xb7d\
+q\xb5$\x9e\xb9\xd8Y{\xc1\xda\xf3\xe3\xb19\x93%\
+\x82\x82J\x0b\xde\xef\xa3,{\x17\xc0pe\x12)P\
+d1-\x9d\xac%\x0b1\xf5\x14=G)jM\x85\
+\xa9\xc5\x16\x8c#\xca\xf14\x01\xe5\xbc\xc0PQ \xa2\
+\xac\xbe\x13\x84 \xa0\x1d)\x5c\xb8*\xc0O]\xb6\x1a\
+\x03\xa5\x1c\x14\xc5\xb6\xa3J\xbc\xf9J\xc5W\x8d\x13\x09\
+\xf4\x15s\xb8f\xdb >\xf8#\x9b\xf1W7\x8e\xa2\
+\xd6l\xe3\xaf\xbfu\x0a\x8dV\x94\xa8\xed\x1aA\x04\xdc\
+\x99\x0a\x8b\xb9\x88%\xea\xee5\xbd\xf8\xbd\x1b\xb6\xe0#\
+o\xde\x84\x1f\xbf\xa0\x1b\x03\xf9\xf8\x16##e\xfds\
+\x14\x86\xe8\xb4\x18\x8a\xb7\xc1\xee88\x1f\x87E\x03(\
+\xe6\x02\xdcx\xce r\xc2\xa48\xb2*\xb7\xbf\x10\xa9\
+1\xc6\x97\xa6L\xd5\x81\xdf\xff\xe6\x18\xfe\xe3\xb1q\xbc\
+a\xcf*\xfc\xde+\xd7\xa2\xaf \xbc\x0c\xcb\xa9\xc6\xec\
+\xff3\xf0\xcf\x90\x09\xdbE\xd0>m\x01?\x12\xce[\
+y\x0f\x19\xf8A%n\xf3\x12b\xad\xb3\x94\x0f0\xd8\
+]2D\xe5\xb2A\xc2b\x930Q\x8f\xb7\x88ML\
+\x05y\xf4\x06\x96!\xda\x8c\xc9_\xcf\xc4\xee6q.\
+ZB\xb3i\xba\xd6\x85O\xb7\xf1\x18\x13\xbc!\xf6\x92\
+\x9b\x80F\x9b\x18\x99\xc6\xb13fII&\xaee\x96\
+\x15\xd8\x06\x94\x10\x22\xb6\xc3\xd2\xb2\xd4\xab\xaa\xc1\xe7;\
+\x8f\xc8[:\xf3=n\xa9\xad\x08\x13\x956\x9c\xd5\xd3\
+\xbf\x92@>\x080\xda[plKc\x00\x90}'\
+\x94\xc0#\xa7\x1b\xf8\xda\xd3\x93vt\xc2\xf3\xb6&\xc4\
+B\x143\x86|\x18\xe25\xe7\x8d\xe0\xc3o\xd9\x8az\
++\xc2g\x1e=\x03\x95\xa4\xf0\xf6z\xb2\x0bm\xa4W\
+\xdc\x96R\x04)%\xf6\xac\xef\xc7\xef\xdf\xb0\x19\x1fy\
+\xcbf\xbc\xfd\x82\x1e\xf4\xe6\xe34eJ#\x97')\
+9\xe4\x02)\xf0\xc4\xe9\x16\xf6OV\x93M\x0e\x81\x97\
+n\x1f\xc0\xee\x91\x1ct\xa0\xa4\x93-\xc7L\x9d!\xad\
+\x83\x95\x84@\x08\xcc7\x80\x0f\xdcv\x06\x9fyx\x1c\
+?r\xc1\x08\xde\xfb\xf25\xe8\x09c\x0f\xbb1q\xb2\
+\xd6\x92\xab\xecY\x15LW|%\xad\x1d\xee\x08[t\
+n\x83|03>\xd7[\x04\xba\x8a9\xc6\x8c\x5c\xc2\
+\xad\xd4\x9a\xa86T\x867]\xfb#4\xb1\x0b\x03\x13\
+\x033b\x9dy\x84\x8e\xa4N\x96fn4&bN\
+\xba\xb42\xe4\xe1\xb0[\xcf\xd7\xaf\xd2\x824\x1e\xb3X\
+\x01\xf2]\xbe\x06\xa0(\xd9\xbb\xe5\xf9\xd62\x16\x94\x01\
+\xcf\x00P\x07\xe5\x80\x98\x93\xc3\xbe\xa8\x03U\x14$N\
+\xcc6\x11g\xc2\xf5\x01\x11#\xf2hO\x9e\xf5\xcd8\
+\xacY\x98\xf8{\xb5%\xf0\xe7w\x8d\xe3\xd6g\xa7\xa1\
+#\xc8}\x1b\xde/J\x01\x1b\x07\xcb\xf8\xfdWo\x86\
+\x88Z84>\xef\xee\x0c\xa5\x96\xca\x22\xbdfJ\x02\
+\xf1\x8d\xb5\x81\x94\xb8p]/\xfe\xe0\x86M\xf8\xc8\x9b\
+7\xe2\xad\xe7u\xa1//\x10\xa9\xe4\xcag\xca\x1e\x85\
+\x000]S\xf8\xd6\xfe\x19h\xa95\xd2\x15\xe2\xa6s\
+\xfb\xe0^\xbd\x95 \x1eY8:6+\x93\xaa\xa0\xd8\
+\x91\xb6\xd8$\xfc\xf1\xed\xa7\xf1\x89\x07O\xe3G.\x18\
+\xc4o]?\x8ar@h'v\x980\xd2\x8e\x1c\x86\
+\xc0\xd9-q\xa2bK\xc0u\x0f'\xfb\xadi\xcfr\
+\x03\x91-\xee\xecx\xd9\xe3H\x11\xd6tI\xf4\x16\xad\
+\x82\xef4\x22\x80\xf1\xb9*\x16k-\xd6\x84+@L\
+\x17l\x1c\x82\x09\x04\xcdT\xedP2o44\x9f\x8d\
+R\xea1Z\xb3\x0e\xa9\xfe\xdd(\x94,\xc9\xc9#B\
+\xed]\x16d\xe9g\x99e\xd9\x0c\x80\x94\x82RJ\xdf\
+\x0d\xe2\xa8\x86\xda\xd6rU'\x17u\x84\x01\x82p\xf5\
+(&%\x14\x80\xb1\xf9F\xec\xb9g\x901<X\x00\
+\xeb{\x83\xe4\xf4[Z}\xd2\x9f\x05\x92h\xbc:\xf0\
+\x87\xb7\x9e\xc6\x03\xc7\xe6\xe2\xb8~\xb3\xe8\x9dE\x99R\
+@o)\x877_\xba\x1e}\xa5B\x87\x1d,\xc6\xc2\
+\xcc\x02\x097\xfbk\x92\x90$\x10\x01.^\xdf\x8f\x0f\
+\xbcv+>\xfa\xd6-x\xdby\xdd\xe8\x0e\x09\xed\xc8\
+J!\x9b\xe4\xd3R\xd3\x9d\x07\x171[m&\xfd\xc4\
+\x81G\xdb\x06BD|\x01\xb8\xeal\xd4[_\xf5\xb6\
+*\xb3\x14@\xb5\x0d\xfc\xe3w\xc6\xf1\xf0\xb19\xbc\xf5\
+\xe2Ux\xff\xab\xd7a{\x7f\x80\xa8\xad\x10\x91G\x5c\
+\x1e\x88T2\xa7\x88\xab\xc2\xba\xa2'9\xf9\xfbZ\x8e\
+\x19\xdf\x91\xc1\x15\xfd\xae\x0fd\xcb\xd4\x89\x08\xeb\x07J\
+(\x04A* )\x9e\xaa\xc2\xc9\xf9\x16\xeaQ\x92V\
+N\xef\xb0\xf0e6\xb0\xb5\x9e}w\x0cf\x0a\xd0\xac\
+\xd0^\xf0j5\x19\xb3A\xe0L2\x03V)\xd4b\
+\x90r\xd6\x8e\xc1\xcd\xc7\xc9$aND\x0a\xd1\x0a\xa4\
+\x04Y6\x03HR\x82\xc2\xe1\x8e\xc6\x11\x97AP\xfe\
+WoO\x5c\x7f\xf1\xd5\xa0\xb1\xb9\xbaM\xfei\xbc\xa3\
+\xd6\xe8\xd8\xd0\x97G!\xf0\x80\xca\x80\xcb\xe5a\x00`\
+lA\xe1\xfd\xb7\x8c\xe1\xc8T\x15\xe9\xdd\x94l&@\
+\x04\x14\xc2\x00\xc3\xbd%6O\xe7\x83-\xc6\x04\xe0\xc8\
+\xef\xbatcF q\xd1\x86>\xbc\xffu[\xf0\xe1\
+7m\xc2\x8d;J(\x04\x0a\x91\x82\x13\xcf@ \x04\
+\x82\xf0\xecd\x03O\x8d-B\x87\x13\xac\xe9+\xe1m\
+\x17\x0e\x80\x94B+\x8a\xb71#\xc3G\xd3\x22\xc5\x85\
+\xab0\x88/(\xc2\xcf^6\x84\xf3\xd7\xc6\xbb\x0co\
+\xdc3\x82\x8f\xbec;~\xe6E}\xe8\x0e\xe3\xe0\x22\
+\x0dDE@K)D\xed\x08\x92\x14\xbas\x02CE\
+`\xa8\x08t\xe7\x80\x10\x11\x94\x8a\xe2l\xcc<$R\
+\xdb%\x80+\xcd\xcc\x18Y\xb6\x5c\x0etb\xb0L\xa4\
+\x8a\x04a\xe3`\xde\xb9\xcc\xd8\xd6\x8fY\xcb\xd1\x99&\
+\x14d\x87\xedL\xb2\xc3\x11vh\xbe\xab\x8f\xdb\xe7~\
+\xc2Q@\xb0\xad\xbbl\x1cr~\xf1y0Y\xe6\xe1\
+rn\xeb\xac\xf4\x85\x98cZ\xac@Y~\x1c@\x10\
+\xc7\xcc\xa7\xf6q3h\x82\xc8\x95\xcf\x19\x17f\x99\x8f\
+\xfa\xaalJ\x8eP\x9e\xaeJ,6\x22\x14s\xdc\xe6\
+\xb3\x0b1\xdaWDO1\xc4T5J\xdb|lK\
+G/p \x80''[\xf8\x93\xdbO\xe0\xcf^\xb7\
+\x09\xfd\xc5\x82\xa3\x97\xf8\x8b\xe1N\xc4\x1frF]v\
+T6\xdd\x86\xdb\x9eR\xb1ip\xe5\xd6\x01\xecY\xdf\
+\x83{\x0f\xcd\xe2c\x0fL\xe0\xbe\x13u\xb4\x15\xd8)\
+>`\xb1E\xf8\xf6\xc1\x05\xbcd\xcb\xa0A\x917\xed\
+Y\x85j#\xc2\xd8B\x03\xf3\xb5\x08\x87g#\x1c\x9e\
+m\xa1\x1e\x09\x04\x04hnA\x143\xeb\xb8w\x05A\
+\xb13IJ\x81\xd5]\x01^\xb2\xa5\x0f]\xc5|\xec\
+\x14%`\xe3@\x19\xbf}\xc3V\xbct\xfb4>t\
+\xe7)<:\xd6\x82\x14\xc0\xaan\x89K\xd6t\xe1\xe2\
+\xf5]\xd86\x5c\xc4\xaa\x9e\x02\xba\x0a\xb1,\xa94\x22\
+L-6qd\xba\x89'\xc7\x16\xf1\xe8\xa9:\x8e\xce\
+\xb4\xd0\xa2\xf8\xb0U\x8a\xc0\xc1\x89\x006f@\xe3\x90\
+V\x10\xc8\x12\x04A \x08\x80\xad\x83\xf1\xad\xc0N\xec\
+G\x02_\xa5\x08\xc7\xa7jP\x00\xc2\xd4\x8d\xd5I\xaf\
+\x026\x05\x9d\x19\x83e\xb9\xd9\x06\xa1\xa7\xa5t\xac\xc5\
+\xf18\xbb\xaec\xfe\x18j\xa0lZ2\xaf'\xaeT\
+\x19\xa4\x02\x8f\xbe\x9f\xb2\x02\x97\x83J\xe7\xd6_\x0d:\
+\x7f\x17(5)\x10\xbb>J\xd8\x85\x16\xdeKD\x90\
+B`\xaa\x16a\xaa\xda\xc2pO1\xade\x11a\xa0\
+\x9c\xc3HYb\xa2\xa2\xcc\xc1\xa0\xd4Xu\xd3\xc9\xfb\
+\x81\x04n=X\xc5\x87\xef\x1d\xc3\xaf]\xb7\x01\xa1\x94\
+\xac\xdb\xa5M\x02w\xdb\x8a\xedk\xf2\xf7L\x08\xaco\
+\xf2\xf8\xe3\x8ba@D(\xe4B\x5c\xbf{\x18\x97m\
+\xea\xc5-{\xa7\xf1\xb1\x07\xc6\xf1\xf4D\x1b$\x02\xb3\
+\xed\xd9\x95\x97\x89\xd4\x8e_\x1d\xec\xca\xe3\x97_\xb61\
+I>\x0a\xcc\xd5\x9ax\xe8\xf8\x02\xbe\xf4\xd44\x1e\x1b\
+k\xa2\xad\xe2\xa4)}\x05\x85\x81\x020P.\xa0\xbf\
+;\x8f\xde\xbc\xc0p9\xc4\xea\x9e\x1c6\xf4\x97\xb0}\
+u\x17\x14\x9b\xae\xa28c\xd1u;\x87\xb0}\xa4\x8c\
+\x7f\xbe\xe7$F\xbar\xb8\xf1\xbcAl\x18,#\x1f\
+\xca\x14\x9c\xadW;\xbe\x8ba\xb2\xd2\xc0\x03G\xe7\xf1\
+\xc5\xc7\xa7p\xcf\xd1**-a\x12x\xf8K\xad\x17\
+\xc7\xa1\x19d\x08N\x02z\x0b!\xd6\x0f\x16M%\xeb\
+\x94\x84\xc9\xb6||\xae\xe5\xa8\xb8\xc4\x17?\xa9\xec\xaf\
+\xae\xaf!q\x82\xcc\x94\xf3\x19\xcc\x07\x89\xa9`\x02u\
+\x1cm\xd5\xc7\x1fr\xfb\xf5M(\xd8\x08C3\xfe\xc4\
+w#:\xe0\xe6\xf7R\x96\x9f\x10D1\x0e\xceT5\
+\x17\x1c\x16\x0e\xe9\xc2\xd8\x1b\x17\xa0\x80\xf5\xa6\x83\xb0\xd0\
+\x88pj\xb6\x8e\xdd\xab{l@\x0d\xdbW\xee\xca\x07\
+\xd8\xd0\x13\xe0\xc9\x89v\xfaf\x1b\xd3S<\x02\x93\xee\
+\x8b\xe2g\x1f\x7fx\x16;\x87\x8bx\xd3\x9eU \xc5\
+\xf5\x92\xec\xa5O\x83\x9d\xbc\x1f\xb8\xfd\x97 (7\x07\
+R\x1a\x81{!\x95R@O1\x8f7_\xb4\x1aW\
+o\xed\xc7\x7f<:\x8e\xcf=9\x87\xf1j\x84\x1bw\
+\xf5\xe1\xc7/[\xed@3\xd6zc_C \x80\xa1\
+\xae\x22^}N\x11\xd7\xed\x18\xc2D\xa5\x8dvD\x08\
+\x03\x81r^\xa2\x14\x02y)c\xad\xcd\x18\xc5\xda$\
+!oX1 \x15\x01\xeb\xfaK\xf8\xbd\xd7l\x8bc\
+\x04\x84\xb0\x97\x9a\xc2\xf0i3\x17=G!\x04V\xf5\
+\x94\xf0\xba\x0b\xca\xb8~\xd7\x10\xbesh\x06\xff|\xf7\
+\x19\xdc\x7f\xa2\x0e\x11\xb8\xf7\xf5q\x5c\xe9\xa4P\xebz\
+\x0a\x84U]\x01\x86\xbb\xf3\x8eo\x93\x0b\x9d\x99J\x13\
+'\x17\xac0\xf0\xafz\xeb\xd4\x0f\xef\x8c\xb8\xca\xeaW\
+\xd6Z%t\xfc\x83{+\xb6I\x18Dd\xe4@z\
+/\xc2\x85w\xfa\xc8\x84e\x0e~\x8a}\x82\xc4J\x98\
+\x02+\x92\x15X2\xbb\xca\xbd9\x85\xdbP\x0c\xb2\xe9\
+9:\xb6\x99\xf3S\xc2\xfd\x9a\x91\xc0\xc1\xe9&^N\
+*s\xfb#\x17Jl\x1d*B\x1c\xac\xbbQvv\
+\xad\xc0\xd31ih\x0b\x014\x94\xc0\x87\xee\x1a\xc7\xd6\
+\xc1\x12.\xda\xd0\x97\xc4\xdb3#\xcd06\xe60\xd2\
+\xd2\xc1\x09\x10\xd1\xf6g\x12\xac\xc24\x02b\xea\x8dH\
+\x9e\xbb\x96\xb9\xcb\x04\xe2\xf1\x0a\xac\xea-\xe0\xbf\xbft\
+\x03\xde\xb0g\x18\xd3\x95\x16\xb6\x8dt\xa3\x98\x0b<g\
+\xb6+\xcd\xb4\x94\xcc\x05\x12\xebz\xf3\xde\x15]\xdc\x14\
+\xe7j\xa7\x00O\xa0\xa0\xe3\xd6\x89a\xbadL\xec\xe4\
+\xf4\x02zK\x05\xf4\x95\x8b\xd96\xb0\x9e;\xc5\x81b\
+\xc5\x5c\x88\x97\xef\x1e\xc1E\xeb{\xf1\x91{N\xe2_\
+\x1f\x98F]\xa7J7\x8c\xc8Yx\xc7\x87b\x88H\
+\x00\xa4\x80\x8d\xfd\x01\xfaJyo^zM\x80\xd3\xb3\
+u\xcc\xd7\xda\x86\xd9[\x82\x17\x96\xb8\x19\xc7q\xd2\xc4\
+y\x8a\x1d\xb3=\xd2x\x9ba\xc6:X\xce\x88\x9a\xfb\
+R\x9d\xdf\xd3J\x07\x18\x16\x99\xd6t5)\xf4\xbf\xe5\
+\x9b\x00+\xe0\x04T\x88\x84\x8e\xb4\xb3\xb30\xca\xb3\x13\
+@\xe1\xbb`-\xb8\x1c\xfb\x878\xcc5P\x05\x0eO\
+7\x98\x99\xc6&\x9f\xec\xb7\xef\x18* '\x22\xab\x8c\
+\xc0\x8d\xd0\xd6\x0b\x1d\x11\x10\xb5\x22\x08\xd5NR+\x11\
+N,*\xfc\xd1-'p|\xba\x0a)\xe3\xe3\xbbq\
+\xd2\xa08\x0f\xbcN/\x1dQ\xec\x15\x8f\x92\xd3v\x87\
+\xa7\x16\xb1\xd00Y'\x13\xfc\x126?d\xf2=\xbe\
+\xb2\xcaC.\xffof\x8e\xb7\xf8\xb8\xeb\xda\xfe.\x9c\
+\xbf\xae\x1f\xa5|\x10\xe7\x224\x12\xdc\x85\x81Sbm\
+\x11Jq\x97\x92\x0e\xa6\xd2\xec\x86\x07\xe7X\x16b\xd6\
+OX\xf8\x9b\xf7\x05P\x08C\xdc\xf1\xc4)\xcc,\xd6\
+Y\xd7l\x0c\xc6\xcc\xb3\x14\xa0\x140\xd0U\xc0\xaf\xbd\
+r3~\xed\xba\xd5\xc8\xe9PeM\x18\x89\xc4t\xf6\
+\xcf\x1d\xcfzL\xfc\x82\x08\xbbVw\xa3\xe0\xa4\x03\x16\
+\xce\xf8\x0fN6Pk{\x02G\xe3\x9b\xb3\xd3\xc0\x96\
+\x81{\x8b9\x81;\x9a\x11wnw\xba\xc4Ck\xea\
+\x89\xc0`\xb2\xc4tCv(<\x0e\xc8\xd1\x08\xf4\xff\
+=\xbe\x14\xbf\x1f_#\xb7\xdc\xb22IA\x15y\x9c\
+\xd8J\x11-\xf98\x99[\xfa%\xdb\x06\xe0el\x81\
+\xe3[\x90R\xe0\xc8T\x1d\xb5\x16\xa1\x94\x03\x1c;:\
+\x11\x0d[\x87K\xe8\xce\x87\x98o\xda\x04\xa4\x0eY\x08\
+ \x22\x81\xfe\x02\xf0\xba]\xfd\xb8|c7\x16\x9b\x11\
+n}v\x16\xf7\x1ek\xe0\xa1\xb1\x16~\xf7\xab\xc7\xf0\
+\x93\x97\x0e\x22\x17\x10\xe6\x9b\xc0\xa9\xb9&N/61\
+\xbd\xd8D\xa3\x95(_\xc9Y\xfe\xf9&\xe1\xe0L\x0b\
+\xbft\xd5\x08\xde~\xe9\x1a\xd8\x8c\x05\x19NH\x00\x1e\
+:\xda\x85\xd7'\xeet-\xcd<$PkE\x18\x9b\
+k\xe2\xd4t\x15\x95f\x04%\x08\xe5\x5c\x80\xd1\xbe\x12\
+V\xf5\x16\xd1W\x88\xd5y\xa2%\x14B\xedPM\xbe\
+\x18\x09\xa4U]\xb6\x14>!\xb9\xb6\xad^.\x81\xd5\
+}el\x1e\xed\xc5\xbf\xdd{\x14?\xfe\x92M\x18\xec\
+.:\xb2PG\xbc\x09\xf6\xba\x14\xc0|\xbd\x85\xbd\xa7\
+\xe61\xd0\x05\xac\xed\x1582GI\xfe\xd4\xac\xf1\xb3\
+U\xd6R\x5c\x08\x84R\xe1\xbc\xd5\xc54\x80\x93\x8f\xa4\
+\x08{\xc7+h\x13\x90\xd3zA\xa6\xf4\xb6@p\xe5\
+\xac\xbd\xbe^\x08s!\x19,\xcb$\x8e\xb66\xdb\x98\
+\xfe\xcbF\x94\x15.\xe4{\x97\xdc\xc8\xc44\xae\x98|\
+\x0d\xcc\x89\xed\xf1\x8a\xef\xbb\xac\xc0Y\x00@\xe9\x89s\
+\xd3\x99,\x1b\xd0\x13r,\x1a\xcf9\xa0\xb3\xd1\xf0\xa9\
+s\x87\x92\x14\x02\xc7\x17\x14\xa6*m\xac\x1f\x08\x0d\xbb\
+\xb4q\xd5\x84U}e\x0c\x96$\xe6\x1a*^$\xcf\
+\xa6R$\xb0\xaa,\xf0\xbeW\xaf\xc3\xf5;\x06\x92t\
+\xd2\x0a\xaf?o\x18\x9fx\xe8\x0c\xfe\xfa\x9eI\xdcy\
+\xbc\x8e{O\x9c\x80 B\x04\x01%\x92\x84\x9dZV\
+j\xdb\x97\x11\xd1g\x1f\x9f\xc1\xab\xcf\x19B_)o\
+\x96O\xa4\xe6\xe0\xae\xaak;s\x1d7>\x0a<_\
+k\xe1\xceg\xa7\xf1\x85\xa7f\xf0\xc4X\x03\xf3\xd5\x16\
+\x84\x00\xc2@\xa0\x98\x13(\xe5\x04\x86J\x12\xe7\xac.\
+\xe3\xaam}x\xd1\xc6^\xac\xea\x89\xe3\xe2yvf\
+?\xee\xdc\x0e\x85\xd8\x1d\x87\xf1\xd9yk\x96\x08\xeb'\
+I\xa1m\xdc\x86\x22\xe0\xa2M\x8381\xdb\xc2\x87n\
+=\x82_}\xd5\x16\x0cv\xe5\x8dP\xb2\xc8m\x99\xc9\
+w\x0eL\xe3\x1f\xee>\x8dGN\xd6\xd0\x8c\x22\x90\x88\
+\xafd\xe3jt\x96\xeb\x95\xff&\x88\xd0S\x08\xb0u\
+\xa4\x0c\xd7=g\xc9\xa7\xdeV80Q\xf3t\x1b\x16\
+\xa8\xc3\x81\xc1\xe2Il\x8eG\x9e\xae\x8c\xbc\xadF\x97\
+\xf8\x9d\xcf\xe4\x13>\xff\xec\x5c_\xe3r\x8f\xacYh\
+\xfa\xe1}\x1bF\x11\x9bM+\xb0\x09\xb0\x12\xf7\x02\xc4\
+\x0c@\xa7T\xf6W/\x85B\x09\x92\xc7\x7f\x5c;\xd8\
+\xe5\x9d\xd6\x01\xa8'=[m\xe3\xe4t\x05\x1b\x06\x8a\
+\xec\xa9mw\xb0$\xb1e \xc0\x81\x99\xc8\xee\xed\x1b\
+\xfb\x1d(\x08\x85_}\xc9(^\xb5k\xd0\x5c\xdd\x05\
+\x12(\xe5C\xbc\xf3\x8a5\x98\xac\xb4\xf0\xaf\x0f\xcf\xc4\
+\x99~(\x8e!\x0f\x11\x01$\x10I\x81\x00\xc4\xb2\x95\
+iUE\xe0\x893M\xdcu`\x16o\xb8pU\xe2\
+?\xe0sp\xf9:\x91\xa7\xba\xb3e\xd7Z\xcb\x03G\
+g\xf1\xf7\xdf\x1e\xc7=G+(\x87\x12\x97m(\xe2\
+\x8aMC\xd8:\x98G_1@)\x17\xa2\x19)L\
+,\xb6\xb0o\xbc\x8a/>>\x81\x9b\x1f\x9a\xc0\xe5\x1b\
+\xcb\xb8\xe1\xbcU\xd86\x5c\x86H\xb6\xc7\x9c\x0b>5\
+Z\x92H\x8d\xcbu\xc2\xeaTT\xae\x97\x9a'\xa5\xd4\
+\xce\xbe\x1b/X\x8dc3u\xfc\xd9\xd7\x0f\xe1\xb7_\
+\xb3\x0d\xfd\xa5X\xe6r\xc2\x8f\x08\xf8\xcc\x83\xa7\xf0\x97\
+\xb7\x9f\xc2d#\xde\x05\x10\x224\xbfg\xcbG\xa4\x9e\
+\x02q\x8c\xc3\xfa\xde\x00\xa3\xbd\xa5\x0cI\x1e\xe3\xe3\xd4\
+b\x13GfU\x9c\xe3 \xe1\xd4\x22\xab\xed\x0e\x1eD\
+\xbfw.\xa1\x1d\xb9e\xf8\xac{am\xaa\x05\x97\xb2\
+\x1d\x9c\xf4\x8b\xe3L\x14lh\xccWa|\x19X>\
+\x07X\xbe\x09 \x14\x04\xa2\xe4`\x82N0\xc4y\xb6\
+\x06b\x82\x88\xc2\x07\xa3K\xf8\xda\xee7\xe1\xa7\x0c\xd8\
+\xd56a\xdfd\x0dWn#\xf7\xdd\x04\xa0\xf9@\xe2\
+\x9c\xd1n\xdcrh\x12BH[\x83\x08m\x02^\xbc\
+\xb1\x88\xd7^0l\xed.\xf6z %~\xe1\x9au\
+\xb8vk7\xceT\x22\xd4Z@! \x94B\x81j\
+\x1b\xf8\xfa\xbey\xdcy\xb8\xea\xea\xcb\xc9\xe7fD\xf8\
+\xeccSx\xf9\xae\x01t\xe7s6\x0c\x96\x9b\x9fF\
+\x22\xfb\x98\x11\xff\x95B`\xba\xda\xc4'\x1e\x1c\xc3\xff\
+y`\x1a\xb3u\xe05;{\xf13W\x8c\xe0\xbc5\
+](\xe6\xe2\xf3\x16\xa4\x13N&\xed\xbc\xfa\xbc81\
+\xc9\xb1\xa9*\xee>8\x8b\xbf\xbb\xe3\x18\xb6\x0c\x95\xf0\
+#{\x86\xb1u\xa8\x0bN\xf4\x1a\x1f:\x93tK\x22\
+\xa3p\x89\xd9%\xa2\xd8O\xf23/Y\x8f\xdf\xff\xd2\
+A|\xf0\x9b\x87\xf0;7nC1\x17\x9a\xb5lE\
+\x0a\xff\xe7;'\xf1\xd7w\x8d\xa3\x11\x09\xe4XL\x03\
+We9\xab\xc9f\x01\xf13\xa5\x08\xbbF\x8a\xe8)\
+1G\xa8;$\x1c\x9b\xaab\xba\xd2J\x9cd\x94\x12\
+\x95\x5c]7\xaf?O}:\x95a\x1d\x19\x8c#C\
+\x00f\xa6\x5c3L\xd7\xfb1\xcb\xe9\xa8[3\xce\xd5\
+\x0e@\xfa\x1e\xcb\xf2\x93\x82\x22Y2G\xdd\xe6\xd6\x14\
+\x07\x9cUk\xdc=XK-&\x854\xf4\xe91\xdb\
+nD\x02O\x8fU\x10)w'\xc0dc\x91\x12\x17\
+\x8e\x16Q\x0c\xc89\x19\x08!\x10P\x84\xd7\x9d\xd3\x87\
+\xeeB\x88vD\xb8}\xdf4\x9e\x18[\xc4\x1b/\x18\
+\xc6\xb6U]P\x0a\xe8\xce\xe7\xf0\xe2m\xc3\x99\xf3\xbc\
+~\xd7\x00~\xf7+G\xf0\x95g\xab\x08\x1c\xe1\x19\x9f\
+Ex\xe0d\x03\xdf94\x8bW\x9d\xb3\xca\xf3{\xe8\
+!\xa4\x89\xcc\x0a \xc2CG\xe6\xf0\xa1\xbbN\xe1\xde\
+\x135\x04B\xe2\xdd\x97\x0f\xe0\xe7\xaf\x1eM\xcc\x0aa\
+\xa5\xb9\x86\xaba\x8e\x02\x85 \xc0\xce\xd1\x1e\xec\x1a\xed\
+\xc6L\xa5\x89{\x0e\xce\xe2\xe3\xf7\x9e\xc4\xf6\x912^\
+}\xdej\xac\xea\xcdAKl\xbeD~\x02\x0d\xffD\
+\x9dY\x0f\xb6\xd6\x8e\x7f \x99C9\x1f\xe2W_\xb1\
+\x09\xbf\xfc\xe9}\xf8\x97o\x9d\xc0/\xbe|\x13\xa4\x94\
+hE\x11>r\xcfI\xfc\xf5]g\xd0&i\x12\x9f\
+d\xe2Q\x07\xad\xd1\x17\xbbR\x10.\x5c\xdf\x83@J\
+D|\x0b\x9a\xbd\xfd\xf4\xe9\x1a\xea\xed8\x9b\x93\xd3(\
+\x97\xf2\x9d\xfas\xf05\xa3\x0e\xb9x\xad\xe1J\x868\
+\xbd.}\x86\xcf}-\x1d\xe0\xe1\xef\xaa\xd8\xf5\xb6\xde\
+B\xa1\x22\x88\x15\xb8\x17`\x05r\x02\xbe\x1dJ\x86}\
+\x85\xae\x9ew\xe5\xa4\xecK\x1d\xb6\xe0\x90t\x02\x86\xd8\
+\xe4\x180\xfdw\xb9\x06@\x09\xd9\xbf\xf6\xdc~\x14\x12\
+\x89h\x5c\xd0B+\x18\x84\xaf>=\x87\xc5V\xfc\x19\
+\x89\x0d?X\x0e\xf0\x8bW\x8d`\xb0\xab\x80;\x9f\x9d\
+\xc6o|\xe5\x04\xee<\xda\xc0\x93c\x0bx\xf1\xa6.\
+\xf4\x97s,v 9\x9eD1\x91Pb&l\x1f\
+*\xe0\xce\xfd\xb3\xc6\xc9\x08\xb3(\x84f\x04\xd4\x9a-\
+\xbcbW?B\x13\xe9\x921_\xe2\xf3\x8b\x1d}w\
+>;\x8d\xf7|\xe9\x08\x1e\x1boAJ\x09)%\xe6\
+k-<td\x0eG\xa6\xeb\xc8I\xc2Pw!N\
+$\xca\xbc\xc2\xba\x0d\x0dH=\xce]\xa3\xdd\xb8tS\
+\x1f&\x16\x9a\xf8\xda\x13ch\xb6\xdaX;PL\xc6\
+%:\x90\xa0\x1e\x90`\x8d\x0a\xf6\x7f\xbe\x9e\xees\x02\
+\xd0[\x0a\xb1i\xb0\x80\xbf\xb9\xfd\x18\x86\xbas\xd82\
+\x5c\xc0\x87\xef:\x8e\xbf\xbf{\x02mfr\xf8\xfb\x0d\
+\xe9U\xe7\xfa\x00\xbb\x16$y\xbf+'\xf1\xf3W\xad\
+\xc2h_9\x93r#E\xf8\xbf\xdf\x1d\xc33\x13\xad\
+\xec\x9b\x91\xb4\x83\xd5\xc0N\xfb@:\x01\xc5\x1dOj\
+\xf4\xb4\xf4[\xa6\x8aH\x07\xc7\xf9\xf0H\xe3J\xa2\x09\
+\xf3\xee\x05 @\xaa_\xd6o&\xe0\xc0\xb1\xbb>\x85\
+\xe5\x94e3\x80\xe2\x8b\xde\x0a\x05\xd1W,\xf7\xbc+\
+\xd0IA\x13$\xe2\xe3\xf6\xcd \xcfq\xeb\x16\x8d,\
+\x9e\xb9 \x04\xa1\xd6&\xbcjg\x0fV\x99\x88@\xbe\
+GB(\x86\x02w\x1f\x9c\xc1\xd1\xf9\xc8L.\x22`\
+\xf7P\x88\x9fx\xd1*\xb4\x95\xc2\x1f\xdfr\x1c{\xa7\
+\xda(\x04\x02'\xe6\xdb\xa84Z\xb8v[_r=\
+\xb7ET}2L#\xc7`W\x0e'g\xabx\xe8\
+d\x1dA\xf2\x5c;\x8e\xa4\x00\xc6\x16\xda\xb8x]\x11\
+[\x86\xca\xd6b\xa6\xf4\xd4\x5c\xdf\x06P\xceKl\x1f\
+.`M\xb7D1Ph+\xe0\xf8L\x13OO\xb6\
+q\xdf\xd1*\xbe\xb1w\x16\x13\xf3u\xecY\xdbmn\
+Ab;y)\x9a%\x00\xf90\xc0\xce\xd1.\x9c\xb3\
+\xa6\x07{O\xce\xe3\xfeCS\xe8/\xe70\xd8]\xf0\
+`\x1fc\x95\xdeq\xb1\xc4\xe1@\xc2\x9b\x00\xe0S\x0c\
+\x01X\xdf_\x82R\x0a\xffp\xcf\x19<z|\x01\x9f\
+|l\x16-b\xbb\x0e\x0c\x17\xac\xc6\xd1\xc9G\xceG\
+\x17\x7f\x8e\x08\xd81\x98\xc3\xbb^\xb2\xd6\x98\x19\x167\
+\xe2~\xa6\x17\xeb\xf8\xa7{\xce`\xa6\x1e\xa5\xc8\xd5\xbd\
+\x1b\xc4\x8b\xe4\xf4\xecBW\x87u\xc9\xd9\xf2\x0d\x91\x22\
+\xe4,\x9cvw\x05\xac\xd6\x22\x96\xa0\x81\xd4\xdd\x89\xae\
+\xd6\xa9\xfad\xf5fE\xb4l\x06\xb0\xec8\x00I\x84\
+ \xf1\xc8\xdb\x13M6\xcd4\xf7j\xba\xc4\xca>\xfa\
+':\xd8\x81\x11\xadYi{u\xb1\x11\xe1\xe935\
+\x03Lc\x0c%\x7fJ\xb9\x00\x17\xae\xedN\x00lU\
+\xa6\xd5\xdd\x01\xca\xf9\x10G&kx\xfct\x03\xa1\x8c\
+\x897\x94\x02_\xdb\xb7\x80\x07\x8f\xce\xba7\xd4\x00\xd0\
+\xf7\x04$\xb3\x83\x14\x12\xaf\xd8\xd9\x8b\xae\x9c=\x91\xa6\
+\x17R\x08\xa0\xd2\x02>\xfb\xe8\x14\x1a\xed\x08\xd6YF\
+\xbe@M\xf9\xa1V\xf7\x94\xf0\xda\xf3W\xe1\xf7n\xd8\
+\x82\x8f\xbec\x17>\xf1\xe3\xdb\xf0Oo\xda\x80\x9f\xbe\
+\xa4\x17\xe5\xbc\xc0B\x0b\xf8\xd8C\xd3\xf8\x93[\x8f\xa1\
+\xdaj'\x19{\x08\x8dV\x1bs\xb5\x06\xa6*u\xcc\
+T\x9b\xa8\xb6\xda\x88\xa2\x08\x02\xf1N\x82 `\xb8\xbb\
+\x887_\xb1\x09\xd7\x9f\xb7\x1a\xf7\xed\x9f\xc0\xedO\x9c\
+B\xb5\xd1d[\x900c5f\x86v\x04fIE\
+\x22\x87(\xe1M\xedG/[\x83\xf3W\x17\xf1\xe5g\
+\x16\xa0\x10G&\xa6\x966a\xdc\xfc`\x9d[\xb8\x11\
+lM\x0eE\x84\x0b\xd7\x16\xd1W\xca\xa5\xd5\xe4\x84\xa1\
+\x1c\x9d\xaa\xe2\xe4|\xd3l\xaa8\xbexfrq\xfc\
+\x82\xc6A\x86S\x9a=;&\x063\xc1L\x9f\xf0\xe6\
+\xb7\x14\xb10\x8d03E\x01\xfb\xec\xc6fXaa\
+K:\x0c\xfb\xfb)+\x12\x09\xc84|h\xa7\x0b\xf9\
+^U\xa1=\xc8\xfc\xa90\xfe\x80\xa5\x0a?\xca\xd9\x82\
+\xc0\xa3'\x17\xf0\xe6\x0bG`\xf9\x97kf\x5c\xb2\xb6\
+\x84B0\x05\x85\x00:\x10i\xa4+\x87@\x02\xc7f\
+jXhR\xec$L\xda]h\x02_xr\x06\x97\
+o\xeeG \x033\xbc\x94\xf5K\x84\xed#]X\xd7\
+\x9b\xc3\x81\xa9\xb6cc\x12\x80P\x0a\xdcu\xb8\x8a\xc7\
+N.\xe0\xf2M\x03\xf1.\x83'\x5c\x9cs\xeb\xda\x89\
+Ddr\xf4\x97r!6\x0dJl\x1a*a\xa8\xb7\
+\x80[\xf6W\xd0\xa8)H)\xf1\xf9\xa7\xe6\xa0\xd4a\
+\xec\x1c)\xe1\xf8L\x15Gg\x9a\x98\xab\x0b4\xa3\x98\
+\xe0\xe3\xadA`\xebp\x09\xe7\x8f\x96p\xee\xba>\xac\
+\xeb/\xa0\x10JlY\xd5\x8b\xb5\x83e<zx\x1a\
+\xdf|\xfc8.\xdb\xb6\x0ak\x07z:\xadh\xa6\x87\
+\x9d\xaf\x87e\xda\xccw\x03\xa0\xa7\x90\xc3o\xbej\x13\
+N\xcd\x1f\xc0\x13gZ\x09\xa3\xed\x8c<\xfe\x910\xa3\
+\xfa\x13y\x12R '\x14.\xdb\xd8\x0b)\xa5\x1b\xad\
+i\x86\xa1\xf0\xd8\xa9\x0a*M\x85 \xb0\xf7E\x1a\xd1\
+\xe3\xdf\xaf\xa05H\xbd\x0e\xc9x\x0c\x97\xf2C(\xfd\
+\xef\xa9\xb6|\xbceZ\x87\x87\xe7\xa9]@\xa6\x9d\xa4\
+\x1a\xf6\x9c\x8dVS{\x010\x80HEP\x8c\x12\x9c\
+\x14\x7f\xbe\xa3\xd3\xf3\xd88_}6\xeaIK\x1b$\
+$\xf0\xc4\xe9:\xe6\x1b\x11z\x8b\xd2\xb6k\xe0$\xb0\
+k\xb4\x1b\xab\xca!NU\xc8\x1c\x9b-\x86q\xa5\xa9\
+J\x1b*\x22\x04\xa1}Q\x0a\xe0\xbb\xc7\xab8\xb3P\
+\xc7\xda\xfe.\x13\xdbm\x1c5\xcc\xe9\xdfW\xcac\xcb\
+@\x1e\xcfN\xb5\x0d\xfb1\xeb#\x08su\xc2g\x1e\
+\x99\xc4%\xeb{\xe3=\xee\x94\xc78c\x8f\x9d)F\
+B\x10*\x8d\x08\xb7\xee\x9b\xc6?\xdc}\x06S\xd5\xf8\
+V\xa4\xd8\x1f\x22\xf0\xb9\xa7\x16\x00,\x98y[9@\
+\xc6o!\x0e\xd6\x91\x13S\x18\xea:\x83=k\x0bx\
+\xe5\xae>\xbcxK?F\xfb\x8a\xb8r\xc7\x08&\x16\
+zpxl\x1a\x81\x04V\xf7\xfbL\xa0\xd3\x09F=\
+\xd6\x04\xa0\x1c\xf0\xac(\x02\xb6\x8ct\xe1\xfd\xaf\xdd\x8c\
+_\xf9\xdc!\x1c\x99\x8b\xe0_\xdeLH\xb2\xf8eE\
+\xe7p&\xc9p#R\xc0pW\x88\x0b\xd7\xf7&\x8f\
+\xd2\xc7vZ\x11\xf0\xf0\xb1\xc5x\x0b\xd7x\xd9\x85\x09\
+2\x12\x89V\xe8:6\xb5?GS\xa0\xa7\x9e\x19\xfc\
+e\x0eX\x1fe\x09\xa9\xf1\xfa \xd3\xf3\xb2\xf7Z0\
+'w\xca\xd1\x9a\xd9\x0c3\x1f\x08X\xa1\xcbA\x97\x9f\
+S\x88\x08\xf1]\xe5\x96\xdb:\xa3\xb5\xfat\x06\xf3\xd4\
+\xca5Y\xa4\xe21\x92\x86\xf6\xec\x8b\x81\x00\x8eN\xb7\
+qt\xbaj\x0f\xb3x\x0d\xaf\xee-\xe0\xbc\xd5yD\
+\x91b\x87o\xe2\x7f\xf5\xb6\x82\xbfbR\x08\x9c^l\
+c\xffD\xc5[\x10\xdf\xa1\x19\xc7\xd7\xaf\xed\xcfC$\
+\xc7i5\x8f\xd0\xd9\x8b\x02)p\xeb\xb3\xf3x\xec\xf8\
+\x9c\xd5\x10\xcc\x01\x09K0\xc6\x97\x96h\x02R\x08T\
+\x9am|\xfd\xa9I\xfc\xc2\xa7\x0f\xe0=_>\x85\x03\
+\xd3\x91\x19\x87J@\x12\x88X\xd3\x08\x93t\xe6\x81\xb0\
+q\xe1\x81\x00r\x12\x08\x02\x81H\x84\x18\xaf(|m\
+_\x15\xef\xf9\xf2)\xfc\xe4\xc7\xf7\xe3\xafn=\x8ag\
+O/b\xb0\xab\x88K\xb6\xadEo\xa9hL\xac\x8c\
+\x85\xed\xbc\xdeK\xd6!D\x0a\xb8hc?\xfe\xe0\xc6\
+\x0d\x18.\x09\x9b\xc8\x85\x14\xfa\x0a\x02\xbd9\x91\xe4_\
+\xb4\xac\xcb\xb21\x0bk\xf3\x9db\xe7\xde\xee\x91\x1c\xd6\
+\x0d\xc4g\x0f\xc8\xd3\xa1\x05\x80\xc9\xc5&\x9e>\xd3L\
+\x02\xbc\x98\x91\x22\xb8<!\x7f\xb8\xeev\x1e\x19\x8c\xb4\
+\xe8\xedL\x99:*\xacN\xb0\x11\xf1\xf6Y.\x01\xae\
+y\x18\xc6\xe8\xcd\x85:\xb2_\xacl\x14\xc0Jd\x04\
+\x02\xcb\x8f\xe7\xab\x8d\x8c\x1bp;\x9eK\xfe,Rs\
+}{\xae\xa1(@XhFx\xf8x%\xae\xe9y\
+z\x89b\x07\xd8\x95\x9bz\x11h\xc5Z\xd8m\xc1\xae\
+B\x90J\x00\x22@hD\x0a\xfb'\x1bv$\xa9\xec\
+7\xc2\xa8r\xf1\xfd\x04\xacC\x860\x12\x84\x99\x06\xf0\
+\xc9G&\xd1\x8c\x22\xebWb\x98\xcd\xf9\x9c@|\xba\
+\xed\xbeC\xd3\xf8\x85O?\x8b_\xfe\xfcq\xdcv\xb8\
+\x86Z+\x0ed\xe9/\x0a\x8cvI\xac\xee\x96\x18.\
+\x01\xfd9\x82T\xf1}w\x8a\xd2H\xa2\x1dl\xa08\
+\x1a2\x94\x80\x10\x12\x87f\xdb\xf8\xfb{\xa7\xf0S\xff\
+~\x10\x7f\xfc\x8dC8<YA\xb9\x10\xc6\xfcGt\
+B'f\xe3{\xb6<\xdf0\x90\x02\xc9\xf9\x09\xe0\xd1\
+c3\xf8\x9b[\x0fa\xae\xda\xc4u\xbb\x86\xf1?\xae\
+\x1d\x85\x84\xc0`I\xe2\xb7\xae\x1f\xc5'\x7fz\x07>\
+\xf1\xd3\xdb\xf1\xeb\xd7\xad\xc2`!\xde\xd7\xf7U\x5c3\
+\x11\xc7\x04\x88p\xe5\x96n\x94\xf2\x89\xd6\x97\xe1]=\
+pz\x0e\xa7\xe7\x9a\xf1\x8dI\xe0\x92Z\xb8\xedzS\
+L+\x9f\x19\xca\xb5\x96\xe0\xbe\xf1\x9e\x1a\xb6G\xfd\x8e\
+\xd4\xd7\xc2\xa5\xf3\xf5^\x06]\xbc\xdf\xfc1\xd2\x0aq\
+\x80\x15\xb9\x19(\x9d\x98\x80,\x22r;\x8f\x99\x04\x16\
+\xd8lR\x99\xea\x03\x9c\xcf\x02\xf1\xc5\x1d\xdf=2\x87\
+\x1f{\xd1j\xe4\x82 \x93S\xbehC\x19\xbd\xa5\x10\
+\x0b\x8d\x98\x09\x8c/4\x00EX\xdb\x1d\x22\x94\xb0q\
+\x02\xc6\x09&1\xbe\xd8\xb2\xaam\x06\x9bw\x1dB\x19\
+\xc4G\x00D|\xcb\xce\xad\xfb+x\xeb\xf1\x05\x5c\xb1\
+y\x80\x1d\x86\x82\xbb\xa8B\xa0\xd2h\xe2c\xf7\x8f\xe1\
+\xa3\xdf\x9d\xc2T-\x02 \xb0\xb97\xc0\xb5\xdb\xbbq\
+\xf5\xd6^l\x1d*\xa2\x94\x8b\x0f\xb5\xb6\x15\xa1\xd9V\
+86\xd3\xc4w\x8f.\xe0\xf6}s8<\x1b!\x08\
+\xec\xa5 ~,\xba\x1eXw^ \x0f\x81\xb1\x856\
+\xfe\xe9\xbb3\xf8\xfa\xd3\xf3x\xc7\xc5\xfd\xf8\xb1+\xd6\
+c\xa0\x9cOKF6X!\x80\xe3S\x15\x84\x81\xc0\
+\x9a\xfe2\x88\x80f[a\xbe\xa9Po\xc6)\xe1j\
+\x8d&\x1e=\xb9\x88\xff\xf3\xddq<}\xa6\x81ZK\
+\xe17^\xb5\x05?r\xe10\xbe\xf4\xd8$^\xb7g\
+\x04?}\xe5(\x80\xd8,:o]/\xfaJ!\xfe\
+\xf0\x1b\xa7\x92Tbd\x98\xae\xafZ+\x00\xbd\xc5\x00\
+/\xde\xdc\x07\x9b\x02\xdc/\x0a\xf7\x1d]D%\x12\xc8\
+\x05,]\x5c\xd6\x9e\xfa\x92\xf8\xdc\x01\x0c\xc22\x92L\
+k\x952Y\xb1\xf9\xdd\xee~\x80I~-\xe0\x84\xe3\
+#\xf76\xb6\x9c\xfavw\xc9\xbb\x94\xf7\xfb,\xcb\x8f\
+\x04\x94\x12\xe4$\xd2HO\xc4\xa1\x16f_\xb3HM\
+oM-\x88u\xe80\x00s\xbb\x8c\x14\xc0\x93g\x9a\
+83_\xc7\xfa\x81.\x0fj\xb1d\xdc4\xd4\x85\x1d\
+\x83!\x1e8\xd5\x04\x10\xa7\x87Zh\xb4\xb1i\xb8\x0b\
+\x03\xa5\x10\xe3U\x15\xab\xe8zh\x89\x96@\x8eW\x86\
+\x0f\x8c\x0c\xd7\x9d\xaf\xb7\x1c\xce\xc54\xbaD\xf2\x0a\xcc\
+\xd4#|\xea\xd1\x09\x5c\xbc\xa1\x07\xa1\xb4\xb7\xd7\xe8\x00\
+()\x80\xf1\x85\x1a>x\xebQ\xfc\xe7S\xf15\xe1\
+\x85P\xe0-\xe7\xf5\xe1]/^\x8b\xad\xc3%\xc8\xc4\
+\x86\xe0I'\x84\x00v\x8f\x02\xaf\xd8=\x8c\x9f\xbe\xac\
+\x86\x7f\xbd\xef\x14>\xf9\xe8,\x1a*;\xc6\x02\x14_\
+\xabv\xf1\xfa\x02~\xe5ek\xf1\xdd\xc3\xf3\xb8\xf7h\
+\x05\x87\xa6\x9a\xf8\xe7\xfb&ql\xa6\x89\xf7\xde\xb8\x05\
+\xdd\xc5\xbck\xa7\xf2\xd5\x10\xc0\xe3'\x16\xf0\x95\xa7&\
+\xf1\xa7o\xda\x85\xbeR\x0e\xb7>5\x81\xbf\xbac\x0c\
+\xd5vl\x9f\xb7\xdb\x11\xe6\x92\x8b8sa\x80\x8f=\
+4\x83\xddk\xcax\xf3%\xa3x\xeb\xc5\x83\xb8ts\
+7\x88\xa4Iz*!\xf0\x8a\xf3V\xe1\x7f\xdf7\x8e\
+C3\xed8j\xcfL\xd3\xbd5\x8a\x88\xb0k\xa4\x80\
+\x1d\xa3=&\x17>\xb7\xe5\x05\x80\xf9j\x0b\xdf=<\
+\x9f\x5cl\xa2\xd7/\x8b\x89kg49^\xf9\xa5\x18\
+\x03?\x08\xa4#(5\xb37\xa6\xad\xd3\x80\xa9\xcdW\
+\xc2E+\xb8\x97\xac\xf0\x13\x81\x1a\x06\x19\xf9\xce,\x13\
+\x12\xcb\xb7\xde\x81\x15\xba\x19\x88\x92\x1br\x0dW#\x97\
+\xff\x11c\x81\x9c\xf3\x99\x8cw\x9a\xd0\xfc\xc0\x19\xfd\xdc\
+\x5c\x02\x12/\xa0\xb6\xd9\x9f8\xb5\x88\x0d\x83\xdd\xd6\x87\
+\xa0UY\x22\xf4\x14C\xbcxs7\xee?9\x85P\
+\x0a\x1c\x9bi\xe3\xe8T\x0d\xbbG{\xb0g\xb4\x88\xaf\
+\x1f\xac\x9a<\x06\x00@\x8a\x907\x92\xd4O a\xd7\
+\xa1\xde\x8apl\xb2\xea1-\x02?K\x0f\xc4v\xfa\
+-{\xe7\xf1\xf2\xadSx\xdd\x85\xab\x92y&>\x07\
+)pt\xaa\x82\xdf\xfb\xca\x11|\xebH\x15BJ\x14\
+\x03\xe0W_:\x8cw^\xb1\x16\xf9\x5c\x0e\x94\xdcS\
+\xe0\xef\x86\xd9\xf0W\x89\x8dC]\xf8\xad\x1b\xb6b\xfb\
+\xf0\x18\xfe\xf4\xf6\xd3Xl\xc5!\xc5<\xca\x14\x10\x90\
+\x82p`\xb2\x8e\xc1\xee<~\xfee\x9b\xf1\xd3\x8d6\
+\xa6+\x0d\xcc\xd7#,\xd6Z\xd6E!c\xc24\xeb\
+f\xec]\x81\x81\xae\x10\xb7\xed\xaf\xe0S\x0f\x9e\xc6\x7f\
+\xbbf\x03v\x8f\xf6\xa0\x11\x8d\xe1\xd4\x5c+\xb9W0\
+vT\xeaL5\x8d\x08\xf8\xc4C\xe3x\xd5y\xabq\
+\xfd\xee!\x14Xx\xb0\x06].\x10\xc8\x87\xeey\x05\
+\xe7f M\x15*\xc2\xd5[\xbb\xd1]\x0c3O\xc0\
+\x0a\x01\x1c\x9a\xa8`\xdfD3\xd1\x0f\x8c\xc78CY\
+\xa0\x04\xd5\xd2>\x04\x8br\xc9iR\xb2q\x08\xce\xb1\
+]\xd3\x94e@\xc4\x18t\x86\xa7\xc1\xbe\x98\xe9\xd9#\
+\xd3\xbec\xb6\x18%\x86\x19&\xc6\x07\xfb\x02\xc9\x0a\xac\
+=\xad\xdc\xa8!\xfe\x9b\x031\xeb\x07\xb0\x8b\xe1b\xb7\
+\x93\x0d\x97C\xcc\xf8\x06\xe3w\x9a\x8ap\xef\xe1\x05{\
+TR/\x1c`\x18\xc1K6\xf7\xa27\x1f\xaf\xcc\x5c\
+#\xc2\xddG\x16\x10\x86\x12\xaf;\x7f\x00y\xe9:x\
+$\x08\xa3\xdd!\x1cj\xe3\xeb\x94\xb0\xe9\xd3su\xec\
+\x9fn9G\x95\xdd\xe3,\x16)*-\x81?\xfc\xe6\
+I|\xf0\xd6#x\xfc\xc4,\xe6juT\x9bM<\
+|l\x16\xbf\xf6\xf9#\xf8\xd6\x91\x1aB\x19\x1f:\xfa\
+\xb9\xcb\x87\xf1\xae\x17\xafG>\xcc\xc5\xe3Il\xea\x8e\
+\xea*\xc5\x99\x83\x02)\xf1\xa3\x97\xad\xc5\xaf\x5c\xbb\x1a\
+9\xc1r/X?*\x84\x108]Qx\xe4\xf8\x02\
+\x00\xa0\x94\x0f\xb1~\xa0\x0b\xe7\xae\xed\xc3\xe5\xdb\x86\xd1\
+S\xca\xa3\xdej\xe3\xc1\xc3\xd3\xf8?\xf7\x9e\xc4\x87\xef\
+:\x8eo>u\x06\xd3\x95:\x84 \x1c\x9f\xaa\xe0\xb3\
+\x8fN\xa1\xae\x04>v\xff\x04\x0eO,b\xdbp\x09\
+\xaf\xde\xdd\x17\xf3f\xe1\x06\xce\x10\x80@\x08LU\x09\
+\x8b\x0d\x85\xc1\xee\x12J\x85\x9c\xeb\xe1\x16\x02'\xa6\xaa\
+8=\x1f_\xe7\xa6\x17\xc3\xd9\xfaK\x9eu\xe7%\xae\
+\xde6\x00\x9e\xc7\xc0\xddE!\xdcwd\x1e\xf3u\xe5\
+Qrg\xf7\xa6cm\xb2\xbfz{\xcd\x9c\xb9H\xe1\
+q\xdamg\xddD\xa2C'\xae\x947\xefS\xfa;\
+\x81\xff\xd3}1)@\x94D\xb8\x8a\x17\xc6\xdd\x80\x92\
+\x11e\x1a$\x1c \xcf\x93[q5\x22\xa56\x08\xc3\
+1%\x04\x1e:^\xc1d\xa5\x89\xe1\xae\xbccbk\
+\x0dd\xe7\xeanl\x1d\xcc\xe1\xb1\xd3-@H|c\
+\xdf\x1c\xde~\xe9(\xae\xdd\xd1\x8f\x17o\x9c\xc2\x1d\x87\
+j\xc8\x07\xb1\xc4\xec)\x08\x9c?Z\x02x\x16Y'\
+SC\x8c\xda\xdf=\xba\x803\x8b\xca\x1cc\xe5\x11m\
+\xee\xd8\x93\x93i5\xc2\xdf\xdf3\x81\x7f{h\x0a\x1b\
+zs(\x86\x02\x87g\xda\x98\xae\xa9\xd8\x17\x11\x11.\
+]_\xc4\xbb^<\x8a\x5c \xd1\x8e\x14\xf6\x9d^\xc0\
+\x81\x89\x0a\x86\xca!.\xd80\x80\xbeb\xe8\xe4\xeas\
+\xd4\x82D\x9a\xbd\xe3E\xa3\xd8;V\xc1\xa7\x9f\x9c\x8f\
+s\x1b\x92\x9b\x05'\x22\x81o\xee\x9d\xc1\x0d\xe7\x8d\xa0\
+\x94\xcf\xc5\xaa\xb4R\x90R\xe0\xe4l\x0d\x7fy\xeb1\
+|c\xdf<\xe6\x9b\xb1fV\x08\x80=k\x8a\xb8t\
+]\x17\xee80\x87\x03\xd3m\x84Rb\xa6\xa60S\
+i`\xcbH\x17V\xf5\xe4\x93e\xe2\xfa\xab\xd5\x1ez\
+\xf2\x84b\x8ePi\xb616W\xc3\xb6U=F\xcb\
+k\xb6\xdb\xb8\xf9\x81\xd3\x98Mb\x1c\x8c\xce\xe8\x09\xee\
+H\x11\xce\x1d-b\xd7\x9a\x9e\x18\x06\x19xTm\xb4\
+q\xcf\xc19DBB\x12l\xb2\xac\x8c\xba<\x0b\xb5\
+\x96\xab\xee\xb9\x9c\xecC\xc6\xc21Q\xf4*\xf0\x0dX\
+\xbb6\x9d.U\xb5me\xa0=\x93\xa1\xc6\x04H\xe6\
+@\x89ve\x03\x0bD\x92\x8b\xf3\xf9\x91\xd4Ree\
+\x0c\x09\xed\x964\x5c\xcfq\xed\xb9\x9e\x7f\xcb\xc8\xcc\x04\
+\x1d\xb6\xa7\xff\x18\xf5\xdf\xedH\x7f\x95B\xe0\xd8l\x84\
+\xbd\xa7\xe6!x\x22\x82D\x1b'\x02\x06J!\xae\xd9\
+\xd2\x0d\x8a\x14\x02!\xf1\xe4\x99\x16n\xdf7\x85\x9eb\
+\x0e\xbf~\xddZ\xec\xec\x97h\xb4\x224\xda\x0aWm\
+\xea\xc2\xb9kzX\x80\x86#J \x00\xccV[\xf8\
+\x8f\xc7\xa7\x8cy\xe3+z\xdeP\xcd\xa2\xe7d\x80\xc5\
+&\xe1\xc9\xf1&\x1e<\xd5\xc4L]A&j\x9f\x14\
+\x84\xb7]4\x88\xc1\xae\x02Zm\x85\x8f\xdc}\x1c?\
+\xf1o\xfb\xf1+\x9f?\x8ew\x7f\xea0~\xf1\xd3\xfb\
+\xf0\xc4\xc9\xb9\xf4\xa1\x12O\xda\x94\xf29\xbc\xfb\xea\xf5\
+X\xdf\x1b\x18fa\xbd\xe5\x84@\x02\xb7\x1f\xa8\xe2\x8f\
+\xbf~\x18\x87&\xe7\xa1HA\x08`\xa1\xd6\xc2\xfb\xbe\
+z\x04\x9fy|\x16-\x05\x5c\xbe\xbe\x88+\xd6\x17\x11\
+\x0a\xe0\xa1\x93u\xfc\xf3w\xa7pp\xa6\x1d\x9fC\x10\
+\x84r^\xa0\xbf\x9c\x07@\xa86\xdaL\x15u\x05\x80\
+\x02aUw\x0e=\xf9\x10G&*x\xdfW\x8eb\
+\xef\xd8<\x94\x8a0]\xa9\xe3\xef\xee8\x8a\xcf=>\
+\x8b@\xa6\x11\xd9\xb2\xfe\xf8\xff\xd7m\xefEO1\xcc\
+$h)\x80\x83\x13\x15<1\xd60\xb7\x1bwT\x8d\
+\xc9\x95\xdc\x96\xd0\x5c\x01\x96\x16e\x02VSus\x0c\
+\xe8hB\xad\x96\xbbZ\x0c\xd7\x16\xbc-rf&\x93\
+\xff=\xd5?S\xf7\x93>T\xa4\xa0\xa2\x08\xcb-\xcb\
+?\x0d(4\xf7\xe2\xf6*\xfb\xdc\xc1&\xb2*\x90{\
+j\xce1\x93\xfc\x97\x98O@\x00\xa8\xb4\x09w\xee\x9f\
+\xc3\xd5;\x06\xe1thL\x01\x89\x97\xed\xe8\xc7\xc7\x1e\
+\x9cA%qV}\xe4\xbb\x93\xb8bS\x1f.X\xdf\
+\x87\xbfy\xcb6|\xe2\xc13\x08$\xf0\xb3/^\x83\
+R\x92r\xdc\xb9\x85\x160\x81;\x9fx\xf04\x1e9\
+\x99\x84\x11\xf30R\x22w\x0e\x1a\xd1\xd8\xde\xaf\x80@\
+(\x99}\x9bd\x01^\xd3\x17\xe2\xca-\xbd\x00\x08_\
+}r\x1c\x1f\xfa\xf68\x9aJ \x08\x024\x89\xf0\xed\
+CU\x8c\xcf\x1f\xc6_\xbfe\x1b\xce\x19\xed\xb1\x9a\x80\
+vb%\xc3P\x04l_U\xc6\xeb\xce\xed\xc7?\xde\
+;\x89P\xb2(I\x8a\xfbo\x91\xc0\xff}h\x06\xb7\
+\xef\x9f\xc3/\xbft-\xdev\xd9Z\xdc\xb9\x7f\x1a\xb7\
+<\xbb\x80bN\xe0\x7f^\xb7\x0a?q\xc5Z\x08\x10\
+>q\xff\x18\xfe\xfc\x8e\xf1d\xaf\x9e\xa0\xf7\xbf\x87\xcb\
+!\xfa\xcby(%pb\xa6\x96v\x192\xbbu\xeb\
+p\x17\xc2@b\xdfx\x0dw\x1dZ\xc4\x91O\xee\xc7\
+\xee\x91\x22N\xcd\xb5\xf0\xccD\x13H\xa4\x18'X\xee\
+\xf2 \x22\x0c\x15\x03\x5c\xbbc\x00\x1d\xbd\xff\x82p\xf7\
+\xfe\x19\xcc\xd4\xdaq\x14'\xd7H\x0c\xa8\xb2\x19\x02\xb1\
+\xf1j\xc9\xed\xe2\xa1\xce\x05\xe4\x99\xadli-~x\
+Hl~\xc82\x1a\x5cJ00XJIv\xaca\
+=\xae\xe5\x97\xe5\x9f\x05H2\xd8\xd8\xfdm.\xc6\x99\
+\x9d\xediE\xe9\x80\x0c\x17Ln\x1d\x8e \x8e\xa7\x04\
+\xf7\x1e]\xc4T\xa5\x99\xe2\xba\x1a\x81v\x8dv\xe3\x82\
+5\x05DJ!\x10\xc0\xd3\x13M|\xe8\xce\x93Xl\
+\xb4q\xde\xda^\xbc\xefu\xdb\xf0\xfb7n\xc5\xc6\xc1\
+\xb2\x91\x98\x94x\xfc\xe3\xf4_\xf1E\x9e\x9f~\xf84\
+\xfe\xf1\xde\x89x\xef\xdd\xdc\xc5\xe7:\x84\x98\xc0u\xd5\
+D\xed\xd3`Z\x81\x00\x10\x01\xd81\x10buO\x01\
+\xb3\xd5&>v\xff8\xeam\x98\xe3\xc6\x02\x02A \
+\xb1o\xaa\x85?\xbb\xe5(fk\x0d6O\xe1\xf4\x13\
+K\x1e\x89\xd7\x9c;\x88\x81\x82H\xbc\xe5\xbe\x8f%V\
+\xb7\x8f\xcfE89\xd7\x02\xa0p\xcf\xa1yT#\xe0\
+\xc5\x1b\xcb\xf8\xc9+\xd6\xa2+\x9fC9\x9f\xc7\xdb/\
+[\x8b\x8bG\xf3h\xc7\x09\x05\x01\xc4\xbb$\x1bz%\
+z\x8a!*\xcd6\x0eN6\x92\xac\xbb\xae\x0aG\x04\
+\xe4\x04p\xe1\xda\xf8\x02\x95g'\x1aP\x22\xc0\xf1y\
+\x85o\xec\xaf\xe2\xa9q\xedC!\xcb\xacS+\x1do\
+\xd5^\xb2\xbe\x84m\xab{2o\xc2\x8d5\x986\xee\
+\xd8?\x0f\x12l\xf3\xdf\xd14-^e\x92\xa0\xf1\x17\
+r\xbca\xda\x81\xb6j2\xc6\xc7\xdfgH\x9b\xc2i\
+\xbf\xa4\xabq\x93Yx\x15\x92g\x9a\xf8\x93\x8f\x92\x1d\
+R[NY\x81H\xc0x\x80K\xa9\xce\xf6\x1bsd\
+\xb0\xef\x82\xa9\xb4\x5c\xa5\xd4\xf6Y\x16\xb1\x81\xe2\xcb=\
+\x0eM\xb7\xf0\xe8\xf1yd]\x06B\x14\xa7\x0b\x7f\xe5\
+\xae\xbe8\x9b\x0fb\xe2\xfa\xcf'\xe7\xf1'\xdf8\x8a\
+\x89\x85:\x02\x19\xdf\xce\xa39\xb1I\x06\x0a\x85J+\
+\xc2c\xc7\xe7\xf0\xfe\xaf\x1d\xc6\xfbo9\x85\x85\xa6\xe7\
+\xdb0L.\x99+9\x98\x97Ta\xf6\xa8a0\xd6\
+L\xd9<TD!\x17\xe0\xc0\xf8\x22\xf6\x8e7\x112\
+i\xa0[\x08\x03\x89\xbb\x0e\xd5\xf0\xc5\xc7'<F\xe7\
+\x13\x1ea\xc7H\x17\xce_]p}\x06\xc4\x06\x8b8\
+Zp\xfbH\x1e\x8a\x80\x99j\x9c\xd0t\xc7\xaa\x12\xba\
+\x0aa\x02Z\x81\xae|\x88mC\x05\xa3\x01h\x86\xba\
+}U\x17ra\x80\xa9\xc5&\xc6\x16\x22\x13j\x8d\xe4\
+=BL\xb8\xc3]!\xce_\xd7\x83f;\xc2\xfe\xd3\
+\x8b13E|A\xab\xec\x80u\xd6L\x8c\xd9d(\
+\x08\xaf:g N\x86\x92%\xfc\x85\xc03\xa7\xe6\xf1\
+\xf4\xe9:\xbb\xfc\x83c\x0a!\xeb\xa9\x0b\x17 \xcd\x81\
+\x96`\x1aik'[Q5-\xf8\xdc\xc1\xc7\x11\x8e\
+\xdc\xc9\x07}Y\x89\x86E*\xe8\x09\xc9\x8e\xcb\x0b\xc0\
+\x09H*\x82\x824\xde}\xd7\x0e&'\x80\xc2lu\
+p\xdf\x9e\xb0\xaa\x96\x93\x18\x9b\xe0\x1c(\xb2\x01\x13V\
+\xad\x06\x04j\x91\xc2\xad\xfbf\xf1\xb2]#\x10\x5c\x04\
+0\x0ez\xdd\xb6~\xfcK\xcf\x04N-\xc4Z\x80\x12\
+\x84O>6\x8b\xbd\x135\xbc\xed\xa2\x01\x5c\xb2\xbe\x07\
+\xa5|\x88V\xa40Si\xe1\xf8L\x1dO\x9e\xae\xe3\
+\xf1S\x8b\xd87\xde\xc4L3f\x1c\x81nZ\xb0E\
+\xc9\x92\x0eY\x88\xe5\xc3%)\xa3}\x05\x00\xc0\x81\x89\
+:j-\x05\xc9\x82z\xf4\x1f\x02AA\xe0\xb3\x8fM\
+\xe3u\x17\xac\xc2@)\x9fh\xbal\x1f:i\xb6\x5c\
+\x08\xb1g}7\xbe}\xb4\x0e\x9b\xbe\x92\x8f)\xde*\
+\xec\xca\x87\x90B`UO\x0e\x00\xe1\xf0d\x1d\xb5f\
+\x1b\xa5|\xbc\x0b1\xbd\xd8\xc0\xbe\x89\xba\xd1\xee@@\
+NF\xd8\xb5\xba\x0c@\xe0\xe4L\x0d\xb35\x1b\xe9\xa8\
+\x10;\xec\x08\x84b\x08\xbc\xe3\xa2!l\x1a,\xe3\xe8\
+T\x15\xcf\x8c7\x98Vc\xf1]\xaf\xb3\xb6c\xf8\xce\
+\xb8R\x84M\x03!^\xb2c\xb0\xf3\xf9\x1bR\xb8u\
+\xef\x0c\xe6\x1b\xc9\xe1\x1f\xaeE2d4\x1f\xc9}\xce\
+\x91\xd2\xef\xc3\xb1b\x85\xfd\xee'\x0a\xb1_\xb3\xf0\xd3\
+\xe2\xb6\xf5\x8d%4A\xfcBS\x06\x14\x1fu\x84\xf7\
+=\xd1j\x14\x08\xcb\xf7\x00\xacHV`\xbd]\x03\xc7\
+\xf3,\x1cZt\xa1\xcbO=\x09\x86\x00\x1c\x94\xee\x07\
+\xbd\xb6\x1e\xb5\x09B\x10\x04\xb8\xe7H\x05'g\xaa\xd8\
+8\xd8\x95R\x15\x15\x09l\x18,\xe1\xe5\xdb\xba\xf0\xf1\
+\x87f\x11\x84\x81\xb1&\x1f<\xd9\xc4#\xa7\xc6\xd0_\
+\x18G)'\xd1V\x84JS\xa1\xdaTq\xa4`\x12\
+\xd5\x17\xfa\xa7\xc0\xb2\x10\x0b\x16\xbf\xecJ1\xd5\xcd\x99\
+o\xfc9\x80\xc2HW\x9c\xadgl\xae\x89\x88\x84w\
+\xc0H\x1b\xd41\xf3\xd9\x7f\xa6\x81'\x8e\xcf\xe1\xda\xdd\
+#\xc6\x0cI\x15!\xb0{U\x11!\x22\x10\x85I[\
+\xae\x8a\xa9T\x84j\xa3\x0d\x00\xb8jK\x1f>\xf9\xd0\
+4\xee9R\xc1\xdf\xddq\x0c7\xedY\x85f;\xc2\
+\xc7\xee\x1b\xc3#'\x1b\x08\xa40\x92\xbd\xb7\x10`\xeb\
+p\xac\xd6\x1f\x98\xa8\xa3\xd2T\x90\x02(\xc8\xf8f\xa6\
+\xad\x839\x9c\xbf\xb6\x8ck\xb6\xf7\xe1\xf2-\x03\x90R\
+\xe0\x8eg\xa71\xb6\xd8\xb6[\x85,\x90\xc7\xfat\xe2\
+\xb1qbR\x8a\xf0\xb2\x1d\xfdX\xd7_\xec0O`\
+b\xa1\x89;\xf6\xcfC\x06\x01gu\x09jd\x9b\x0c\
+i\xd4b\xfe\x1e3\x00W% \xa6\x05\xb1\xa4\x90\xa6\
+\x9e5\x1f\xc8\xa1\x5c\x87\xff'\xea\x8d\xd1j5\xces\
+\x9b\xd0gB\x1a_\xe0\xa0\x92\xa5\x87\x15p\x02,\xff\
+4 \x04\x22\xb8\xc1>|O3UH\xdb\xf1L\xcd\
+\xd5\xdc\x96\xbd\x9f\xc5\xac\xfd\x22 \x10\x0085\x1f\xe1\
+\x9eC\xb3\xd88\xd4\x95\xa1\x8f\xc5\xf7\xee\xbd\xf6\xbc!\
+\xfc\xc7\x13s\xa8EvW\x22L\xa8q\xb6\xae0S\
+\xd7\x89D\x05 \x05r\xe0\xfe\x8c\xce\xb6\x9c;\x9e\x8c\
+Q;\x0e.\xbe]\x16'\x19\xed\xc9\xc5\x91-\xb5V\
+,\xe5S\xdbH\x86\xdb\x08T\xdb\x84\x87\x8f/\xe2\xda\
+\xdd#\xa9\x9ey\x9f#\xddy\x14B\x09\xbb-\xeen\
+\xc7\xb6I`\xefD\x1d\xaf\x03p\xcd\x8e\x01\xdc\xb0{\
+\x0a\x9f\x7fj\x1e\xffx\xef\x14n~d\x16\x91R\xf1\
+\xf6\x1cO&J\x02#]!F\xfb\xcb\x00\x11f*\
+M\xbcts\x01\x97n\xec\xc5\x05\xeb\xca\xd8>\xd2\x85\
+\xd5}%\x94\xf3\xd2D\xa9\xed\x1f_\xc4\xbf\xdd?\x09\
+\x82\x88\xb7\x8b\x19\xa5\xa5\x1ds\xd6\x91\xaa\x00\xf4\x14%\
+^s\xdeP\x92\xdc4\x0dm!\x80\x07\x0eM\xe3\xc8\
+t\x13\xd2\xb3d}\xc5+\xd3A\xb7\xe4\x82\xfa*\x9c\
+\xcf!\x5c&\xe0h\x17\xbcSG\xd5\x85q\x8e\x9a\x9f\
+;!R\xd6<\xc8\xe5M+\x15\x08\xb4\x02w\x03\x22\
+IP\xc1\x07\xec\x1f\xd6LC\x9a2\xb8\x1d\x97\xa4Y\
+p\xc941\x00\xb4!\xf0\xb5gf\xf1\xfa\x0bW\xa1\
+\x94\xcf\xa7\xb6\x82\x94\x02\xf6\xac\xeb\xc1\xe5\xeb\x8b\xb8\xed\
+p\x039\xef\x8c\xbaIr\xc3\xc4\xb5\xe6\xe6\x96\xd3\x12\
+\x93Z\x19\xf3\x81\x1b\x0c\xc3+\x1aNn\xb7>\x00\x8a\
+\x1d0\xa1V\xf1\x1cdI\x89\xa4\xe4\x06\x1d\x81\x03\xe3\
+\x15D\xed\x08B\xdadN\xae\x82\x22\xd0]\x0c\x91\x0b\
+$j\x91e\x1eV\xdd\x8e\xeb|\xfb\xe0\x1c~\xf6%\
+M\x0ct\x15\xf0\xdb\xaf\xde\x8cP\x1e\xc17\xf7\xcec\
+\xaa\x1a%w\x02r\xa7\x1a\xa1\xad\x08;G\xf2\x18,\
+KDD\xf8\xc9+\xd7\xe0\xbf\xbdtCrQ\x89\x1e\
+k<\x90Z3\xf6\x9d\xfc\xc5\xad\xc7pp\xba\x95\xdc\
+\xa3\x90\xc1\xd4\xd2\xd8\x14\xfb\x10\x14\xe1\xd2\xf5%\x5c\xb0\
+\xbe7\x8e\x86\xf4`-\x84@;R\xf8\xda\x93\x93\xa8\
++\xbb\xbb\xa2A\x9fiy\x91\xf6\xe5k3!\x0bG\
+\x85\xf3[\xe6\xaa2\x18:3\xc9\x92\xe0\x0e\x95\xbb0\
+\xc8\x1a\xa3\x93B\xbeS\xd1[\x8d/\x14\x0d@$#\
+\xb1W_\xb9\xdb&Yc\xec8n\xe2y\xfeY\xe5\
+\x8cE\xe5\xdfC\x01<r\xb2\x81\xa7\xc7\x16p\xd9\xe6\
+!\xcf\xab\x1a\x7f.\x15rx\xc3\x05\xc3\xf8\xf6\xd1\x13\
+\xc8\x8e\xdcc\xd2Y?'a\x1d\x94\xe4\x0e\xc82\xfc\
+,veUB\xc3X\x92(=\x8d;\xb1]Oh\
+$jO_)\x88s\xd8\xb1\xad#a\x18\x82\xd5<\
+\xe7j-\xb4\x89\x90\xe3\xfdx\xc4\x15\x11\xb9\xa6\x90\xde\
+\xa6L`\x1bH\x81'O7\xf0\xe9\x87\xc6\xf0sW\
+o\xc4\xda\x81\x12\xfe\xf8\x8d;\xf0\xd6\xa33x\xfcT\
+\x15g\xe6\x9b\xb8\xe7\xd0\x22\x0eO7\xd0h'\xb7\x1c\
+\x11p\xe5\x96~\x84A\x00R\x84\xa1\x9e\x12\xb4#\xab\
+\xd1R\x98Xh\xe0\xf0D\x0d\x8f\x9e\x5c\xc4\xfdG\x17\
+\xf0\xd8\xc9\x1a\xe6\x1b\xf1\xf1h\xdf|\xe2\xda?_\x8a\
+\x186\xf15\xe8\xaf=\x7f\x08\xe5|h\x18\x80\xf6\x1d\
+)E\x98\xa96q\xcf\x81i\xdc}\xa4\x8a\x90\xa9\xd5\
+i\x89\xc9\xf0\xc0c\xde\xfcp\x1a\x87S\x0a?Y@\
+\x1aQ\xaa\x83\xe7VS\xb3\xecY>\xe1NjrZ\
+\x8fI\x18Sr\x07\xa4\x0c\xa0^\x08\x0c\xc0\x1e\x8a\xb0\
+>\x00\xfd\xdcdA1\x11|.\xccR\xf3\x17\xc2\xa9\
+\xce\x02\xdf\xd3k\xc5\xc8X@`\xae\x11\xe1KON\
+\xe3\xd2M\x030\x0b\xce\xe0N\x04\x5c\xbd}\x10\xbb\x87\
+\xcf\xe0\xc9\xf1V\x92`\x13\xc6\xee f\x9c;\xce3\
+c#fI\x7ff\xc6h\xcc\xb6\x8f\x0d\xd3\x17^R\
+\x91\xe4'D$1\xb1\x18\x9f\x00\xdc6\x94C>9\
+\xc8$\x80t\x1a\xe9\xe4\x99\xbe\x94\xd3y\xeeI\xb3\x85\
+Z\x0b\xcdV\x94,/\xd3D\xd8\x8b\x11\x04\xfe\xe6[\
+g0\xbd\xd8\xc2\xdb.\x1d\xc5\xa6\xe1.\x5c\xb5c\x04\
+W\xed\x88\xeb\x8d\xcf\xd7\xf0\xd8\x89y<z\xa2\x82\x03\
+\xe3\x15\xac\xe9-\xe2\xb5\x17\x8c\x00\x88\xf3\x16\x8c\xcd\xd6\
+pp|\x11O\x9e\xaa\xe1\xc9S\x8b80\xd5\xc2\xc4\
+b\x1b\xf56@In\x02i\xbc\xb9.\xdb\xccT\x99\
+\x935UJ`\xeb`\x88kv\xf4\x03\x88we\x22\
+\xa501W\xc7\xe3'\xe6q\xf7\x81y<p\xb4\x82\
+\x83\xd3\x0d\xd4\xa2\xb8\x1f\xee\x8fu\x93\xfe\x88\xcc\xb9w\
+,\x1c!\x99Bf\xb0O0db(\xe0\xe7.\xe8\
+\xd4d\xaa\xf8uyC)E\x80\x99cH.\xe3Y\
+\x81m\xc0\x15p\x02\x8a\xf8\x80\x06\xc5\x80q/\xc4d\
+s\xf1\x1d0\xfa\xf0\x90\xe0\x5c!\x01\xb7#\xc1\xf5K\
+n\xdbq;\xf1g!\xe2\x98\xf8;\x0e\xcc\xe3]\xd3\
+Ul6\xce@k\x98\x10\x01\xc3\xddy\xdct\xc1 \
+\x9e\xba\xf5t,\xdd\xf5\x05%\x06\x89\xb8\xf4\xef\xb0J\
+\xacg=D\xc7\xce&\xf3\xd8\xf1\xceg\xb5\xd1&\xe0\
+\xc4L\x1d\x00\xb0k\xb4\x1b#]\x01N/\xaa\x8e)\
+\xc4\x95\x00\x8a\xa1t\xb7\x7fD\x1a\xb9\xc7\x16Zh*\
+`\xa9\x03c\x92\x80jK\xe0\x1f\xef\x9d\xc2\x17\x9e\x98\
+\xc35\xdbzp\xfd\xae~\xec\xd9\xd0\x8bU=\x05\xac\
+\xee+\xe3U}e\xbc\xea\xbc\xd8!'\x84@\xbd\x15\
+\xe1\xb3\x0f\x9e\xc4\xa7\x1e\x9e\xc0\xa1\xe9\x16f+m\xb4\
+\x94&x\x01)\xe2d$Y\xa1\xb0\xde\xd4;\x14\x01\
+\x05\xc2\x0d\xe7\x0e`uO\x1e'\xa6\xabx\xec\xf8\x02\
+\xee:0\x8b\xfb\x8f.\xe2\xf8l\x1b\x8d(\xde\xc5\x08\
+\x92\xa4(v}\x19\xa9\x0a\xfb]ki\xc2#\xa0\x94\
+)\xaf\xd7\xd2s\xdaZf\xeeqpom:I\xb5\
+\x94\xc9\xea{\x22=\xb7\x82\x15\xa2Zb2_\x02\x1f\
+\xd3\x0b\xe58\xb0\x80`'\xc8\x90\xcd\x06=\x04\xd5\xe9\
+\xad\x5c\xe8\xe9\xd7\xfd\x9bb\xc8\xa1\xcb\xb4\xaam\xb5\x86\
+\x13s\x11\xbe\xf1\xd4\x14\xfe\xfbK\xbb\x5c\x00'\xfd\x10\
+\x80\xd7\x9c7\x84O<<\x89\x83\xd3Q|O=7\
+\xbb\xfd\xc5\x7f>%mmd\xce\xc2\x87\x07!&\x98\
+\xa7OWQk\xb6\xb0~\xa0\x84+7u\xe1sO\
+.\xa4Rh\x99\xa2\x805\xfd%\xe4\x02\xd1\x91?\x11\
+\x08O\x8d\xd5\xd0&\x89\xdcs\xccD\x0a@\x04\x01N\
+U\x14>\xf9\xc8\x0c>\xf7\xc4,6\xf6\x85\xb8l}\
+\x19Wn\xed\xc5\xee\xd5]\xe8.\x17\x11\xa9\x08\x07O\
+/\xe0?\x1e\x9d\xc4m\x07*\xa8E\xb1\xd9%\x84D\
+\x18h[\xd7.\x92\xe3\x93\xe0\xdbX\xda\x95m8\xa3\
+\xbb\xc7E\xa4P\x0c\x80v\xab\x8d_\xff\xf4^<p\
+\xa2\x8e\xd3\xf3m4\x14\x92,\xcc\x22\x9e{\x0a\x1f<\
+\x93\x8e\x5c\xcav\xe8R\x0b\xf3D*9\x9e{\xcf\xd1\
+\xd6q\xad\x97\xfa-SK\xec\xe0\x98\x10\xee_k\x22\
+2_\x85>\xf6\xec\xe0Dlz\xad\x80\x0fp%\xf2\
+\x01\x00\x94\xe4\xab\xcfX\x8a\x0e\xce\x0e8\x04\xc3M\x87\
+\x14\xf1g\xc0\xd9\xbdOA;\xc9b>\xff\xa5'g\
+\xf0\xe6\x8bWa\xc8\x5cV)X?\xc0\xda\xfe\x22\xde\
+|\xe1 \xfe\xfc\xceq\x18\xf1\x9d\xc2\x10\xd62\xd3N\
+\x9c(D\xd3\xb4\xdbG<\x07\xcd\xb9\xfd\xd1s\x8e\x1e\
+\x1fZy\xfaL\x03\x87'\xab8wm?n\xda3\
+\x82o\xee\x9dG\xcd9\xdbo'\x9b\x13\x0a\x17\xad\xef\
+\x86\x90\xb2\xe3\xb1\xd8\xd9J\x03\x0f\x1d[\x88#\xc5`\
+\xb5\x03\xe2cc\x0b!@1\x12\x04\xf1\x01\xa2#3\
+-\x1c\x9c\x9e\xc7\xe7\x9e\x98CO^\xa2\x90\x0b\xa0H\
+a\xbe\xdaB]\xc5\x17\x91\xc61\xf7\xe4hj\x9c\xae\
+\x8d\xdee\xa42\xabG\xfe\xac\xc0\x88R\xa0\x1d\x01\x1f\
+\xfd\xee4\x9a*V\xff\x03\xa1o\x13\xca\xc0\x04\xe3/\
+\xb1Q\x98\xcc\xc8\xb0Kk\xb6\xe0\xfc~\x89)\xa0l\
+\x9c\xdf\x93\xd6\x82\xce\x95I\x18\x0f\xb3v\xf0\xf1\x94^\
+>\x82\xd8M\x17\xf7\xa2\xd8\xd4n\x82^\xd7\x15p\x02\
+,?%Xr\xaa\xccQ\x8b\xf5\xf3\x8e,J\xff\xa6\
+\x81\xf1\x1c*#\x07R\x1an\xe6=)\x80\xbd\x13\x0d\
+\xdc\xbeo\xda\x01\xa6\xdf\xc2\xeb/\x1c\xc1\xd6\xc1\x9c\x03\
+?\x1b2\xea\xefg\xd8\x1d\x02\xd2\x8e \xc6\xed]B\
+\xe5s\xf2\x1e\x11\x7f!~ \x040Um\xe3\x1bO\
+O\x01 \x5c\xb1m\x107\x9c\xdb\x87v\x94\x06\x82\x02\
+\xb0\xb67\xc4\xe5\x9b\xfb;rV!\x04\x1e>6\x87\
+\xfdI\xe0\x0d\x8f\xced\xc6\x10:a\xb8H\xea\x86\x12\
+\x80\x90\x98o\x12\xc6\x17\xdb\x98\xac*\xb4D\x80 \x10\
+f\xc7\x87\xff_\xe3'w\x8a\x12\xfbda\xe8\x9a+\
+\xbeOM?PHr\x1b\x9aJ\xda\x5c\xb4\xd3\x8e\x14\
+\xd0\x8a\x08Q\xa4P\x08\x08\xc3\xe5\x00\x1b\xfbB\xec\x18\
+\xcca\xfbP\x0e\xeb{C\x0c\x95\x03\x94r1 \xda\
+\x11!R\x9e\x93\xcf\xf1\xd98\x1c\xdc\xdc3\xb0\xd4\x85\
+!\x94\xfa\x94\x9e\x0b_\x1b\x8d_\x82\xe3\x03\xa7\x1bM\
+\x16B_'/\x8ci\xed\x0c\x0e\xb09\x1c\x96YV\
+\xc0\x07\x10!\xedU\xcf\xb0a\x93\xff\xa5N~\x99`\
+\x17o\x0b\xc4S!-\x0c<I\xcc\xeb\x22N\x17\xf6\
+\xd9G\xa7p\xc3y#\xe8)\xe6R{\xc8\x8a\x04\xd6\
+\x0f\x94\xf1\xd6=\x83\xf8\xe0\x1d\xa7\xe1\x1f2\xb1\xc9\xa4\
+\x84\xe1\xc4i\x7f,\x1b\x87~\xc2\xb4\x08\xca\xf0\xe0\xf9\
+\x0e*]\x84\x90\xf8\xc2\x133x\xf3\xc5\x15l\x1c\xea\
+\xc2/]\xb7\x11\xfb\xc7\x9f\xc5\xa3cM\x84\x810\x1e\
+n(\xc2\xdb/\x19\xc2\x86\xa1r\xe6\xd1`!\x80Z\
+\xb3\x8dO=0\x81\xaa\x12\xc9\xf6\xa2\x8b8\xae\xf4I\
+3F=\x0f\x9e\xc2Z\xdaS\xcf\x96\xf9\x1a\xe6\xe2\xeb\
+k\xbe\xca\xcd#\xeca\x18\x8c\x85\x1du\xc0\x96,$\
+\x88\x1d\x84\x91R(\x84\x02;\x86rx\xd1\x862\xf6\
+l\xe8\xc5\x96\xe1\x12\x86\xbb\xf3(\xe6b\x93D@\xa2\
+\x15)4\xdb\x0aS\x95\x16\x8eM\xd5\xf1\xc4\xc9E<\
+pt\x1e\xfb'\x1aXh\x02\xb9 0q\x1f&\xc3\
+\x8f\x99\xd2sh\x03\xd0\xef9(\x9a^\xef\x8c\x1f\xf8\
+\xd9\x04\x83:>b\x18O8G*\xa7\xe5\xe7`N\
+\xcf\xbf,\x9f\x01$w\xa83\xb6\x1a\xff\xdf\xdbv\xd1\
+\xea\x97s\xe3\x89\x01\xbf&8g\x8eq]\xcf\x9e\xb3\
+)\x9d\xe01\x82\x18H\xa1\x04\x1e\x1d\xab\xe3\xae\xfdS\
+x\xdd\x85\xa3\x1d\x95\x907\xee\x19\xc6\xe7\x1f\x9f\xc4\xbe\
+)\x15\xdb\x97\x9am'\x88N\xa9\x13 >\xaa2o\
+\xb6S\x0fi\xa4Yb\x7fW@\xe0\xf0T\x0b\xffz\
+\xef)\xfc\xf6\x8d[\xb1y\xb8\x84?\xbfi\x1b\xfe\xe4\
+\x1bGq\xdf\xd1\x0a\xda\x11P\x0e\x817]2\x80\x9f\
+z\xf1Z\xe8[\x7f\x13 \x83\x13\xed\xd7\x9f\x9c\xc0\xb7\
+\x0e.\xb2\xb8x\xdd=\xb1\xfeR\xbc\xd5\x85o\x16\xbe\
+\x99\xf7\xc8\x0da\xe5\xa0y\xce\xa2\xd9\x8e\x85c*\xf9\
+&\xb11p<@\x9c\xf2{\xb0H\xb8f[/~\
+d\xcf\x10.\xdd\xd4\x8f\xc1\xae\xbc\xb9.-\xb5E\x97\
+\xe0\xc6\xe6\x11\xe0\xd2\xcd\xc0\x1b.V\x98\xab\xb5\xf0\xf4\
+\xc9y|\xe5\x89)\xdc\xb6o\x0ec\x8b\xca\xee\x06\xa5\
+A\xd1\xa1\xd8\xb6Iq\x981g\x1d\xcfl\xe5\x1d\x1b\
+L\x0b\x0d&h\x04cF\xae\xa3#\xf5[\x9c\x14d\
+\xf9&\xc0\xf2\xaf\x06\xbb\xe4&(\x19\xf4\x15\xbb\xfb\xde\
+\x15\x06A\x9f\xe3\xe9dF\x97\x9b\x83\x8d\xdd\xf9\xe6\xb9\
+M\xb9-\xe9\xc3<\xfe\xddW@\xe3\x0a\x1c\x5c\xad\x08\
+X\xac5\xf1\xcas\x07P\x08\x03\xd6\xb2\x95}\xbd\xa5\
+\x1cH\xb5\xf1\xad\x83\x8b\xf18\x18\xd1\xa4\xe4\x18\xcf\x9a\
+\xeb\x10_F\xc9Tu\xd2\x1a\x0b1N\x0e!\xb0\xef\
+L\x0d\x1b\xfaC\xecZ\xd3\x8d\xe1\xee\x02\xae\xdf=\x80\
+\x17\xad\x8f\x1d\x83?u\xc5*\xbc\xe5\xd2\xb5(\x17r\
+\x99\xc8)%\xf0\xd8\xb1Y\xfc\xee\x97\x8f`\xaaN6\
+\xa2\xd1\xeb\xd7\x81\x1d\xb1\x9f\xc9%L\xa7\x82\x03\xb5\xb4\
+\x89\xd4\xa9h\xb3\xc9\xf1\x85\xa45Y\xb7%G\xbb\x88\
+?\xab\x88\x90\x93\x84\xd7\x9e\xd3\x8d?x\xed\x16\xfc\xf4\
+U\xeb\xb1k\xb4\x17\xa5|\x08\x9d\xb9\xc71\xe58~\
+%\x9a\x8b\xd6V\x8a\xf9\x10\x9b\x86\xbbp\xdd\xeeA\xbc\
+tG?\x02j\xe1\xf0d\x0d\x95\x16\x10\x04\xf2\xf9L\
+\xcb\x19|g\xa6\xee\x89\x0ba\x85\x9c\xbe\x87\xc0g\xc2\
+\xfc\x1d\x91\xdd\x1bXs\xaa_\xd6nVD\x07\x8e\x7f\
+\xfb3\xcfw\xd0\x99e\xf9\x97\x83^\xf2f@\x04}\
+\x85\xae\xde\x98\x01x\xd3\xb1\x17l\xa4\x89\xdf\xca\x7f\xb6\
+z\xde\xec;\xd1\x91\xe53\xbam\x0b&)\x05\xc6\xe6\
+\x9b\xd8\xbd\xaa\x88\x9d\xab\xbb\x13\xfb\x91\x13C\x0c\xe6\x8d\
+\x03E<xt\x16'\x92\xb4T\xbet\xd2\x1c\xba\x93\
+\xb2\x9a\xb9\xfe\x1a\xb1=\x86\xc2\x84\x83\xb51Y\x8d\x96\
+\x02\x1e9>\x8f-\x03\x05l\x19\xeeB!\x17`\xcb\
+H\x17\xce_\xd7\x83\xf5\x83\xe58\xd7}\xca\xae\x04\xa4\
+$<q|\x0e\xbf\xf5\xc5\xc3xv\x22\x8eop\x92\
+\xadf\x15r\xc1\xe1\xb2\xdf\x14\xfd\xb3_\xbd\xf8\x08\xc3\
+\x0e\x18\xf4;\x09%\x0f\xb3\xb9\x94\xf7\x12/\x99f\x14\
+\x11\xb6\x0f\xe5\xf0;7\xac\xc7/\xbc|36\x0dw\
+A@\xa6\x04\x84\xc8\xf8\xdci\xeeZs\x1c\xe9)\xe0\
+\x9a\x9d\x83\xb8h]\x09\xc7'\x17pr\xae\x0d\x91\x01\
+\xe3,\xcd\xcfu\x22\xa6\xefU\xe4c\xb1\x92\xdd\xce;\
+}r\xd6\xab\xef\xfd\xe3\xa3\x88\xff*\xd5/k7\x13\
+\xe1\xc0\xb1o\x7f\x1a\xcb)\xcbf\x00\xa5K\xde\x0c\x12\
+\xf1\xed\xc0\xa1\xbe\x1c\x14\xd6\xe7j\xc8\xc9\xa8\x96\x19\x98\
+eyD\xa6\xd9`\xbex\x85o\xe58\xd2M\x08\xb4\
+T\x9c\xc1\xe7\x95\xbb\xb5\x16\x90n\xa0\x5c\x08\xd0[\x00\
+n\xdf;\x8dv\x92\xae\xdaKJg\xc7\xd7\xa1d\x86\
+o\xf2\xf4M\xd0,/\x03\xe35\xa4D\x8cV\x95&\
+\xe1\xdb\x07f\x11\x8a6v\xac.'7 K\xebx\
+\x14\x9a\xe8\x01!\x08\xf3\xf5\x16\xbe\xf0\xc8\x19\xfc\xc1W\
+\x8fc\xffd\x0b\x01\xdf?\xf4\xac#\xa3\xc0\x00Y\x94\
+\x0f\x17\xfd<8@\xaf\x9d\x85\xaf\x13\xd6\xaa\xbb]J\
+#\xf5m\x0fJ?\xb6\xeb\x07\x10)\xbcl[7>\
+\xf8\xe6\xed\xb8z\xe70\x02!\xb3\xcd\xb9\xe7a\x08w\
+\xb4\xd1\xa5\xc0\xa6\xe1.\x5c\xbb\xb3\x1f\xf3\x8bu<}\
+\xba\x06\xf2\x12\xd3v\xba~\xcb^]\xe6\xc2B\xa3\x90\
+\xd6\x1a}\x02\xd6\xe31J\x1a\x1fa\x07\xd7\x96'J\
+\x00\x22\xd5+j7G\x8a\x0e\x1c\xbf\xfb\x87\xcc\x00\x8a\
+\x17\xdd\x04\x05\x11k\x00a\xac\x01P\x8a\xc6\xb9\xe3\xc7\
+\x9b\x9d\xae\xe1\xc21]<\x04\x12\xec\x19G@\x8d\x0f\
+R\x08\x9c\x9eoa\xdbP\x0e\xe7\xac\xe9\xc9DP\x22\
+`\xfd@\x01\x07\xc6\x17\xf0\xccD\xd3\xa4\xe1\xce\xec^\
+tz\x9e\xe5\x22dK\xc65\x02\x91!X\x85\xbeW\
+!q\xe4\xb5\x81\xbb\x0f/\xe0\x91\xa3shG-\x14\
+\x02\x09\xc8\xf8\xae\xc5F\xa40[m\xe3\xc8\xf8\x02\xbe\
+\xf2\xc4\x19\xfc\xe5-\xc7\xf0\xef\x0fOc\xba\x16\xa7\xfc\
+\xd2 \x11\x9eI\x93\xf2#e\x16\xae\xe2s\x15\x1ei\
+\x9e\xd0\x11\x16\x9d`\xb2\xf4\xb2\xba\xd9\xaf\xe3,\xd3o\
+\xd9\xd3\x8b\xf7\xbdq;6\x0cuA)\x91\xfd\xe2\x0a\
+\x14\x22\xa0\xa7\x94\xc3U\xdb\xfb\xd0n\xb7\xf0\xd8\x89*\
+\x14\x09\xc7\x8a\x8dC\xb2\xd3\xd2I$\x0b\xcc\x19\xa3\x97\
+\x0e\xa3\xe3\x9c]\x80>w]\xab\x0d\x08HAj@\
+Vo&E\x07\x8e\xdd\xbd<\x13`\xf9i\xc1\xa1\xa0\
+\xcc\xbe\x86\xb5k}\xaen\xd4\xfe\x0e\x80\xe1^\xfe\xcc\
+\xd5\xcd\xd8i1\xedR\xc6\x0f\x00\x1a\x11\xf0\xf1\xfb\xc7\
+\xf1\xd2\x9d\x83\x18,\xeb\xb8\x00=\xa8\x98\xe3\x94r9\
+\xbc\xfb\xea\x0d\xb8\xef\xd8\xb3\x98\xac&\xb7\xea\x22\x1dh\
+C\x1d\xfa\xe7\xe3\xcfZO\xc1\x1b2Way\xd2\x99\
+\x15}\xfe\xfe\x9e\xa3u\xdc\x7f\xec8\x06Kc\x18\xec\
+\x96\xe8\xce\xc7;\x18\xb3u`f\xb1\x85\xb9\x86\x02!\
+\x8e\x88\xe3\xc4o\x9a$~\x90\xc5\x12\xf7R\xfb\x1av\
+\x9c\x1e\xbe3\xff\xd6R\x92\xdeT\x7f\x8e\x08\x15\xafi\
+\xc7\x97\xa5\x94\xc2[\xf6\x0c\xe0\xf7~d;zKy\
+v\x09\xe8\xd2\xf8\xf0\x5c\xc5\xbf\x13\xd0i\x8a\x80\xaeb\
+\x01\xbf\xfa\xaa\xad\x90\x02\xf8\xf0=\x13\x80\x08\x8cs.\
+=x+\xad\x9c\x90/\xe2\x11\x0f\xdeD\xbd\xe7\xc6\x99\
+\x07\x17\x1f\xb2\x82\x05a\xfcg\xbe=\xbc|.\xb8\xfc\
+\x94`\xa6\x11ay\x80\x1e\xb9\xf6\xa8k\xa4\x02S\x8f\
+RcO/NG\x81\xc3\x8eT\xfa\xbf\xf3VB)\
+\xf1\xc8\xa9:\xbe\xf4\xd88K\x1c\x0a\xa62\xc4\x0e\xa4\
+\x0b\xd6\xf7\xe2'.\x19\x82 \xb2\xc4O\x84\xe7\xc5\xc5\
+S>A\x8e\x1c\xd9\xde\xf44\xf9y\x88FI\xf0\x8b\
+\x080UW\xd87\x11\xe1\xc1\x13m<|\xb2\x85\xc3\
+\xd3-\xcc5\x91\x1c\x08\xc9\x96\x8c\xda.u\xdbuO\
+\xccs\xc7^\x86\xb1\x9f\xa9--\xa9\xa0u<)\xf9\
+\x1c\xf0c]E*\xc2+w\xf6\xe2\xb7_\xbb\x0d}\
+\xa5\xfc\xf7\x14\xe9\xd6\xb9\xaaH\x9cp\x9d\x1d\x07:\xa6\
+\xa6\x10\x06\xf8\xa5\xeb7\xe3\x1d\x97\x0c@E\x11w\xbb\
+\x01\x82S&9}j\xb3*\xe5\xc4\xeb\xc4\xb7:<\
+w\xcc3\xfe\x91\xc1V\xc0\x17\x96\xcb+\xcbO\x09&\
+C@\x04\x09Q\x0b\x17\xe9\xf5`\xb9\x04!\x98\x94W\
+\x19&\x10\xdb\xb7w=\xfb\xae\x1d\x04\x83\xc0\xeesr\
+?\x12\x01\x90\xf8\xf8\xfd\x9386Ue\xebGN}\
+\x01\x89\x1f\xbfb-.^[@[\xf1p\xcc\xe7S\
+|\x15\xc1\xf5\x9e\x0b\x87\xd4\xfc\x05\xb3\x94&Rm\x92\
+\x99_ \xc8\x5c\x08\xaa\x0f\xd9tT\xb3\x19\x18\x5c\x22\
+g\xfe\x18\x8f\x19\xc0\xfbf\xde}.\x8f\x1a\xdb\xa2z\
+\xbe)*\xf5\x8c\xedI\xc9\xb8\x9d\xb6\x22\x9c\xbb\xba\x88\
+\xdfy\xedV\x0cu\x15\x9e\x7f\x90[\x22\x08\x03\xc9\xd2\
+\xb9\xb1\x7ff\x8b\xceo/\xf5=\xdeb+\xe5s\xf8\
+\xd5Wm\xc1\x8b7\x95\xd1R\xaef\xeb\x1en\xf1\xc0\
+C\xdf\x03\xca C\x10\x90m\x87\x0fQ$cK\xaf\
+\xa3\x04h\xd9\x16\xfc\xf2\x19@\xa4b\xee\xa9\xefx\xe4\
+\xden'\x02\x8d:#y*d4\xc3\x13\xeb)W\
+\xb0A'653Gy\x9d\xeeY\x0a\xe0\xe0T\x0b\
+\xff\xfe\xddS&\x15\xb6\xef\xd8!\x22\x8c\xf4\x16\xf1\x8b\
+\xd7\xaeEO>\xf6>\x7fo\xe2G;\x224\x10|\
+\x9b\xc4\x9dq\xa7\xdf\xb2\xdb^\xa2F\x86\xc6\xe5k\x13\
+\xc2\xf8\xe8\x99\x93T\x8f\x99\xbd\x97i\x14\x90W\x97\xb7\
++t\xeb`\xf0\xef48\xdb\x0e\x0f\xcc\xd2kG\x10\
+\xe8\xc9\x03\xbf\xfe\x8a\xf5\xd82\xd2\x85\xe7{\xc4E\xe7\
+\xa2\xa84#\xec?]\xc1mO\x8e\xe1\xe6\xfb\x8e\xe3\
+\xff\xde{\x02_~\xf4\x14\x1e=:\x83\xa9j\x13\x10\
+\xdaa\xf7\x1ck*\x12\x5c\xe8)\xe2\xd7_\xb5\x11#\
+eav\x0d\xdc\x13\x80l\xdf\x83s\x01\xca\x9c53\
+\xc9\xb2\x97P\xfbA\xb2\xc4C\xdc\x87pO\x0a\xea\x0f\
+\xe2\x05p\x18\x08h\xc7)\x93\x18\xd1\xd8\xa0\x9e\x0e\x92\
+\x05\xae\xfcMM\xdag\x8d\xc8\xf8\x9e\xb9\x96\xe4t\xa4\
+?\xca\x00\xf8\xccc\xd3x\xd5\xb9\x83\xb8t\xf3\x10\xb2\
+\xccJE\xc05;\x87\xf1\xb6\x8b\xe7\xf1\x91\xefL\x22\
+\x0c\x02t$:\xb3\x16\x89\xcf#\xe1\xca\xc4\x99@F\
+Y\xca](\xfc\x07\x9d*\xfaq\x16^\x07B3\x01\
+\xc6\x10\xdd\xe0\x1en\xb3\x90\xe3yN%\xc90\x0aJ\
+g\x9fL\x07\xab:c.V\xc4\x09\xd68!\xb6\xfb\
+\xdf\xbcg\x10\xd7\xed\x1az\xde\x92_H`r\xbe\x86\
+\xaf=q\x06_}r\x06\x07&Z\x98\xad\xb7\xd1V\
+\x0a\x04\x09)\x08\xdd\xf9\x10\xeb\xfa\x03\x5c\xbb\xbd\x17o\
+\xbax5v\xac\xe9uTh\xeb\x17\xe0\x00\x12P\x0a\
+\xb8t\xf3\x00\xdeq\xe90\xfe\xee\xdb\x136\xbd\x9d3\
+ab\xbc^0\xdc\xcf^w\x13\x15\x99\xf8W<\xbe\
+a\xeb\x0a\xad\x1d\x89\xd4r\xf3\x17\x84N\x0a\xb2\xcc\xb2\
+l\x0d@\xc3\x86KV\xca\xf8g\xc1\x06\x17\xc9|w\
+\xa1\xefY#\xdeK\x06\xb4<\xc08%1\x03$\x80\
+\xc9\xaa\xc2\x87\xbf}\x0a\x95F\x8b)\xc0\xae\xb7%\x94\
+\x12?w\xd5Z\x5c\xb4\xb6h\xe2\xc6M-\xef\x15\xdf\
+\x8c\xb1g\x1f\xb2\xf5\xc0N\xda\xa1\x93F\xbd\x13\x87p\
+\x10\xc03^\x93\xbf\x9a\xe8\xdb\x14\xdf\x22\x1c\xc7\xc9G\
+PJ\xa1\x1d)\xb4\xa3\xf8\x92P\xc5\xee\x95\xf6\x99\xb1\
+\x99\x03-I\xdd\x99?\xb9\xb6\xaf\xef\xa0\xe2\xedi\xbf\
+zB\xfc\x10\xd8\xd0\x17\xe2\xa7^\xb2.f\xba\xb4t\
+\xbfH\x08\xe4\xd6\xa7\xc7\xf1\xb3\x1f\x7f\x06\xbf\xfb\x95\x93\
+\xb8\xe7h\x03\x935\x85\x08\x12B\x86\x90RB\x88\x00\
+\x8bM\x85g\xce4\xf1\xff}{\x02?\xfd\xb1\xbd\xf8\
+\xdfw\x1dC\xb5\xd16\x04M\xccl\xf3wM\x84\x10\
+x\xcb\x8bF\xb1\xb1/\xb4W\x98g\xa3\x0d\xac\xbe\xb9\
+\x04\x8c\xb2\xcc)\xce'\xbd\xd4q\xc6T\x86]\x12'\
+\xd5N\x963\xe9\xfb(\xcb\xd7\x00D\xec\x03\xb0n\xa5\
+NX\xccm\x04x\x08O)>`m*{\x1c2\
+\xc5\x04\x96:w\xce8'%\xc4}\xc7\xc1\x0a\xbe\xf2\
+\xd8\x19\xbc\xed\xf2\xb5\xb1\xd6\xe2\xed\xf3\xc7\xa7\x05\xcb\xf8\
+\xb5\xeb\xd7\xe3\x97>s\x08\xf3\xcd\xc4+\xef\x8c1~\
+\xcf\xf7I\x18\xdcp\xdc\xbcl8\x1e+\xb7\xc9\x7f\x84\
+Q\xdd\xe31\x0b\x176\x0c|\x8e\x16\xa0;#B\xa4\
+\x04\x88\x22\xf4\x16%\x19\x17\xacL\x00\x00Y\x83ID\
+AT6\x0d\xe4\xb0c\xa8\x805\x03%\xf4\x14C\x84\
+R\xa2\xdeV\x98\x5ch\xe2\xe0d\x0d\x07'\x1b\x98\xac\
+\xb4\x11A2\x8dA7'\x9e\xdb\xf2\x11\xe9\xdd\x97\x94\
+\x80\xf2\x9d;|Qu^\x07\xfdD)\xbc\xfe\x82!\
+l[\xd5\x9dl\xbfu\xf0\xd6'\x1aK\xa4\x14>~\
+\xcfq|\xe8\x8e\xb1$\xe3P\x80@\xc3W\x9b$l\
+>R\x08HI\x18[T\xf8\xc07Nb\xffx\x15\
+\xbfu\xe36\xf4\x95\xf3\x9e\x18\x22\xe6\xa0\x88\xefU\xd8\
+<\xdc\x85\x1b\xce\xed\xc3\x87\xef\x99\x84\x0c\xd8\x99\x113\
+o\xd7\x1c\xcd\x00U&Njb\xe6\xd9\x9f\x1cl\xe2\
+\x11Q\x82m\x9f\x93\x85\xffJm\x83\xae\xc8Y\x00\xb0\
+Kh\x84\xde\x0a!\xed\x1cb\x10\xd3\x93K\xa9Si\
+@\xa5\x80A\x88\x13x\x88%\xde\xd3\x80av1O\
+V\xdaR\xc0?\xde=\x86\xcb\xb6\xf4c\xcbH7\xcb\
+7g)A)\xe0\x9a\x1dC\xf8\x99+\xe6\xf17w\
+\x9d\x01Aj\x87\x86=\xc7\x90%\xfe\x94\xee\xa7\x032\
+\x98\xacI\xf6\x1d'L<YY\x87OX\x8f\x99\x05\
+\x88^}\x11\xfb_BA\xd8\xb36\x8fW\x9f\xbb\x0a\
+Wo\xeb\xc7\xa6\xe1\x12z\x0a\xf98\xb4\xd5\xbc\x14k\
+\x07\xadH\xe1\xf0\xc4\x22\xfe\xf1\x8e\xa3\xf8\xe23\xf1~\
+7\x08I\x82\x11\xd6\x11[\x9f\x14;wL\x09\x9f\x0d\
+f-\xa4\x11\xb7pb\xe4\x931\x0du\x05x\xdd\x85\
+#\x96\xf90\x95\xdc_j\x22\xe0\xff\xdes\x1c\x7fv\
+\xcb\x094#\x89P\xba\x04h\x8d\x0aa\x18\xae\xbe\xbb\
+0\x101.|\xf2\xe1i\x04\x02x\xef\x8f\xec@1\
+\x1fz\xb0u\xe1 \x84\xc4\x0d\xe7\x0f\xe1\x93\x0fN\xa3\
+\xd2\xf6\x98>\xc7\x07\x0f\xed\xb2\xd5QX\xb3TsI\
+\xc6\xdc\xcd\xa1/\x86\x0fv\xf7\x8c\xf7\x13W\x92\xd6\xa8\
+XVY\x81\x8bA\xda\x80\x8a\xa0\xf7R\xb8\xc3\x928\
+\x02\x80}\xec\xac){m\xa7\x11\xe0\xf9\xbc\xe3|d\
+\xe3\x91B\xe0\xe0t\x84\x0f\x7f\xeb8\x1a\xad\xb6\xb7_\
+c\xd5V!\x04\xde\xf9\x92\xf5\xb8vk\x17\xda\xca_\
+\xca\x14K3D\xeb+\xbd\xdc_\xa3\xdf\xe2\xdb\x85K\
+\xf2A\xca~@\x14\xf3\x9av\xa4\xb0{$\x87?~\
+\xdd\x06\xfc\x9fw\x9e\x8f_x\xd9f\x5c\xb8q\x10}\
+\xc5\x82\xb9\x22\xdc\x92\x85@\xbd\xd5\xc6\xdd\xfb\xa7\xf0\xc1\
+o\x9e\xc0\xd7\xf6\xd6\xd0n\x13\x86\xcb!\xca9\xa0\x1d\
+\x91\xa3Tp\xb3\xce\xce\xc5=\x92\x9b\xca\xb0\xf3|\x16\
+D\xb7E\xb1\xf3\xafM\xc0\xe5\x1bJ\xd8\xbe\xba;\xd9\
+\xefO\xe9S\xd0P\x95\x82p\xd7\xdeq|\xe8\x8e1\
+4T\x00!\xb5\xaf\x83\x18\xbe\x99\x0e\x92q\xa6]\xa2\
+2\x08p\xf3#\xb3\xf8\xd4\xfd'\x00\xdf\xdd\x98\xa1\xb5\
+\xed\x1c\xed\xc1\xae\x91\x1c\x22\x05\xb6\xc0\xae\xc7.m\xec\
+t\x80\x88\xe7\x5c\x16\xd0J\xa8\xcdL\xe5r$\x8e)\
+V@\xc4\xeb!\xf1=m;t(+\xa0\x01\x08\x90\
+L\xdc`\x8e\xd3H\xab\xfc\x8e\x8e\x09#V\xe8\xf9\xf1\
+\x81T\x9a\x11\xcfd\xb6\xbc6\xad\x02\xa6\xdb\x02\x82\x00\
+\xf8\xfcS\xb3\xb8j\xdb\x19\xbc\xfe\xe2\xb5\xee]{\xe6\
+\xa3\xc0@W\x01\xff\xebU\x9bq\xf8\xe6gqt.\
+JN\x0c\xea92\xe9D\xd9\xeb`d\x89\xd9!\xe0\
+2-%\xfe]\xc6\xa9%\xafgD\x92\x885\x94b\
+\x08\xbc\xe3\xb2a\xbc\xfb\xa5\xeb\xb0\xae\xbfl\xe0#\x10\
+_\xdf\xd5\x88\x14\x16\xeb-\xcc\xd7\x9a\x18\x9f\xabal\
+\xae\x85\xaf>9\x8do\x1d\xae\xa0\xd1&\x9c\xb7\xba\x80\
+7^8\x88W\x9c3\x88\xf1\x85&>y\xff8n\
+\xdd\xbf\x80j\x0bFR\x8a\x8c\x19i\xf5\xdc\x0a\xcbN\
+\xbe\x1cxk\x0e6!{\xce= \xc2\xd5\xdb\xfbQ\
+\xc8\x85\x86\x018M\x082\xf0\x9d\x5c\xa8\xe3oo?\
+\x81\xb9\x06\xb1T`~\xfc\x04g\x1cl\x1b\x99q7\
+\x81\xf8J\xb6\x8f\xde;\x8ekv\x0eb\xdb\xaa^s\
+\x06?\xcd\x00\x80\xeeb\x0e/\xda\xdc\x8b\x07NN$\
+'!\xed\xe4\x96\xc2\xdd\x94\xe5\xc6\xccXOIu\xda\
+\xe20\xcel\x94}Y\xbe\xfc_\x89\x94`q\xa4j\
+r\xc7{\xf2\xbf\xb4\xab\xdfB\x94\xbf\xeb@\x82\xd8\x03\
+.]R\x9bv\xe0\xa0w\xf9igij$0\x80\
+z[\xe0\xef\xef<\x85\x0b\xd7\xf7b\xf3H\x8f\x97z\
+:nG)\xc2\xb9k{\xf1\xeb\xd7\xaf\xc3o~\xe1\
+\x08j\x91Lm\x079\xb6X\x86\x83\xc8\xd8\xf4z&\
+\xcc\xc6\xe6\xe3\xd1\x1e\xfb\xb4J\xe7X\xb4P$0T\
+\x16\xf8\xcdW\xae\xc3M\x97\xacF.\x88\xf7\x81\xa7\x16\
+\xeax\xe8\xd8,\x9e8U\xc3\x89\xe9\x1aN\xcd\xd61\
+Y!\xcc\xd6\x22T\x9b-4\x22\x816I\x5c\xb4\xae\
+\x88\x1f{\xd1\x08\xae\xdf=\x8c\x91\xde\x22\x00\x81\xed\xa3\
+\xc0\xa5\x9b\x07q\xc73\x93\xf8\xab\xdb\x8ec\xef\x84=\
+S\x90\xbe\x8c\xc2S\xaf\x98MJ\xbe\xfd\xe2\x1c\xa7N\
+3\x0a\x12@_A\xe2\xa2\xf5=\xce<\x1d\x06\x9e\xac\
+\x9b\x14\xc0\xd7\x1e;\x83GN\xd5\x11$W\x9f;\x82\
+\xc5i\x9d\xa9\xcb\x94\xdcW\xa1\xfd+I\xdb\x01\x04\x8e\
+\xce\xb6\xf0\x85G\xc7\xf1k\xaf\xea\xb1c\xcf(R\x08\
+\xecY\xd7\x85\xbc\x18\x87\xeatAi\xc6\xd2\xfb\xbel\
+'\xc0L\xe3\x04c\xa2\x06\xd3\x9fK\xcdM\xaaD$\
+\xb2C\xa4\xbf\xc7\xb2\x02i\xc1\x85\xe1\xee|\xe1\x9e\xbb\
+h\x03\xdd\x07\x19G$}\xb2\xcdg\x03\xe9\xef>?\
+v\xe9\xd2\xad\x1fJ\x89\xbdSm\xfc\xed\x1d\xc7\xf1\x81\
+7\xeeD1\x17x\xc2#\xfe\xa2\x08\xb8\xf1\x82U\xd8\
+{\xba\x82\x7f\xbcg\xd2Ka\xc7z\xe8\xa8\xca\xd89\
+\xda\xadQ\xe1\xb4\xe12\x86N\xfa\x8b\x80\x020\x5c\x02\
+>\xf0\x86\x8dx\xf5\xb9\xab\x00\x00Q\x14{\xc3\xff\xfe\
+\xae\xd3x\xfaL\x1d\xad6\xc5.\x19\x01\x938T@\
+BA`\xcfh\x88\x7f\xfa\xb1\x9dX\xd3\xdf\x05\x93\xc4\
+)!\xd2\x5c\x10\xe0\x86\x0bWc\xc7\xea2\xde\xff\xe5\
+\xc3\xb8\xe3`\xc5\x9c*tgj\xb5\xacd\xf1\xd9s\
+\xfb\xdd]\xc74\xd3'\x8a\xfd\x17C\xdd\x12#\x03]\
+\xd9\xbe\x5c\xa3,\x12\x16jm|\xf1\xc9)(\x08\x93\
+\xe7\xb83\xa4,\xbc\xad\x06!\xcc\xeeA\xbc$1n\
+\xdd\xbaw\x0e\xef\xbc\xaa\x85\xc1r>q\xe1d\xb7\xba\
+i\xb8\x8c\xaeb\x88\xf9\xba\xca\xf4a\xfb\xcb\xef\x1c\x14\
+\xe2`\xf1\x05\xa0\x01\x08\x03W\x16\x1a9&B\xdaD\
+[NY~J0;\xeb4\xf0\xc4Ro\xb9R<\
+\x0e%H\xda\xf0\xb7\xf7<Ih(Q\x0b\x01\xedP\
+ac!\x1dt\xe2%V\x88\x7f&\x84R\xe2\xcbO\
+\xcd\xe3?\x1e\x1as\x9cH\xfe\x14\x02\x19\xe0\xbf\xbft\
+\x13n\xd8\xd9\xe3l\x0df:\xcd\xbc\xd7\x053\xa8\xc9\
+\x7f\xc7\x01\x07w0\x09\xf6\xcf\xbeU\x0a\x80\xdfz\xf5\
+z\xbc\xfa\xdc\xd5 \x08D\x8a\xf0o\xdf9\x89_\xfb\
+\x8f#xl\xac\x0e\x02\x10\x06\x02\xf9P \x94\x22\xb9\
+\xb5\x99\x92\xcb;\x09\xf9@\xa0\xb7\x94\x07\x91\x97T3\
+\xf9\xac\x14\xb0mu\x0f\xfe\xec-;q\xc3\xaen'\
+}V:\x08\xcb[w\xbdl\xce3\x8d\xd5\xc2\x9f\xaa\
+\xf9;\xda\x1d\xa0\xaf\x18,\xa9\xeeJ\x01\x1c\x1a\x9f\xc7\
+\xde3M\x04\xda\xf1f\x04eg\x0a\xf0\x83\x93\xcc~\
+\x7f\xf2r \x05\x8eM\xb7pd|\x1eBf\x05\x0a\
+Y\xa7\xedPO\x01\xfd\xde8S\xceQg\xda\xf1\xfa\
+\xc5\x0c\x87i\x8c\xdc\x11\xeck\x8e\xdc\x17\xe0\xf4c\x05\
+\x86\x0d`M2n\xbf0r\x02F R\x0e\x92d\
+\xd0\x5c\xc6w\xa6\x0b\x9bL0\xccah\xda\xd7\x90\x15\
+\xd9me\xed*8\x0c\x84\xb7\xe92\x96\x16\x09\xfc\xed\
+\xb7N\xe1\xb1\xa3\xb3\x90\x92\xd9w\xfc,?\x01}\xa5\
+\x1c~\xeb5\x9b\x93\xf8\x00w\x0c\xfe\x94\xe2{C\xbd\
+\x1f\x8c\x1b\xc0\x12\xb6\x9fU\xc7\xbf\x0a\x9d8[R\x0a\
+\xef\xbar\x187]<jf\xf1\xf9G\xce\xe0On\
+9\x89\xc5\x16\x90\xe3w+\xfavl\xa2\xa3\xcf\xd6\x81\
+j32\xed\x9b\xe826W\xa5\x80\xd5}E\xfc\xde\
+\xeb\xb7\xe1\xb2\xf5E\xb4\x22\xae\x96/\xb1\x03\x92\xc0\xd9\
+J\xefN6\xa0\xbb|=\xc5\x109\xe7\x08s\xb63\
+e\xef\xe9**\xf5\xb6{\xde\x22\x8dP\x1d\x0b\xdf\xef\
+\xe7\xde\xceJ3\xc2\xa1\x89:|\xa7\x9e\xb3\x0e\x04t\
+\x17C\x0c\x95u\x0c\x85\xc5\x0b'2\x98\x98T&8\
+\xf2P\x0b#~q\xa8\xbd_\xd6\xf5*\xa4v>\x90\
+\x8e10:\xd8\x0bA\x03\x88T\xa2N\xb2E1\xb9\
+\x0c35\x02\xf2g\xe3$L\xe0@\xd1\x84c\x13r\
+\x92Q+\x09\x94\xb6Q;q\x1cv\xbb\x0b\x07\x9c\x10\
+\xc0\xc9E\x85?\xbf\xe5\x18&\x17j\x1dU5E\xc0\
+\xc6\xe1n\xfc\xe1\x8d\x9b\xb1\xb1/@d\x87\xe7j\xb8\
+\xfe\xbap\x0fu\x82\x11\x9c\x88\xac\xbd\xea\xa9\xd2\xcc\x8e\
+m+\xe0\xa2\xf5e\xfc\xccU\xeb!\x85\x84\x10\xc0\x13\
+'f\xf1\xc1[O\xa2\x1a\xc5\xe7\x04,\x0a\xb9\x9a\x83\
+]d\x81JK\xa1\xd6l;\xeb`lR\x06\x10E\
+\xc0\xba\x812~\xeb5\x9b\xb1\xba\x8b]\xfb\x0e\xc6 \
+\xb9\x18\xe7\x8c8\xf9\xe7\xc7<d\x15R\x0a\xc5\x5c\x00\
+sO\xa4\x0fw\xf6\xfa\xb1\x99\x16Z\xa4m\x7f\xd7\x17\
+\x91>\x13!:\xff\xc6\x9b'\x80H`\xaa\x12Yd\
+\xe8PrR\xa0\x14\xca4\x8f\xe8 g\xac\x9e\xa4s\
+\xf7e\xc9t\xb6\x06\x06)|zI\xeb\x85&\xbbP\
+\xda\xba\xfa\xbe\xca\xf2#\x01\x05\xdb\x8e`*\x8a\xf0\xa6\
+\xeaB-q2\xf1Ss:\xb2\x8e\xe1/\xbf>\xd9\
+i)\xb1\xeb\xf4\x0d\xb0\xd9^Sa\x7f#W\x8d\xe5\
+\x19\x8b\xf3\x81\xc4=Gk\xf8\xbb\xdb\x8e\xa2\xd5\x8e:\
+2UE\xc0\xc5\x9b\xfa\xf0\xbb\xaf\xd9\x80\xfe\x22\x10e\
+\x1dE\xf4\x17\x8e\x19m\x22\xebw\x187 x\xbc>\
+o\xb8\x18\x10\xfe\xdbU\xab1\xdc\x13_#^i\xb4\
+\xf0w\xb7\x1f\xc7\xa9\xf9vr\x7f@\xb6\xf3\x93\xeb\x17\
+B\x00\xf5\xa6B\xb5\x11%p\xb3Wi\x99l\xb5\xc6\
+g\x103\x81K6\xf7\xe3\x9dW\xae\x02(>vL\
+\x19cO\xcd\xdfq\xf8w4hM;fW$\x0b\
+\x91\xd9\xb3Z+r\x82\x8b\x9e\x17\xd3G'\xbc\xd0\xad\
+\xc4\x97\xb1\xb6\x95\xa9\xbc\xc4Pc\x93\x8aK\xeb\xa5\xf8\
+\x9b\x93/\xd81O=\xd3\x95\xd1\x82\x7f\x07\xa1\xfd5\
+#o\xa2~\xed\x85\xa0\x01\xc4{\xa9\x1e\xa0\x1d\x15\x9a\
+\x1cb\xe7\x00\xf2\xef\x01\xd4\xca\x8ef\x08\x22!V\x13\
+\xe5eTV\xe6-\xb5\xe26F*cR8 v\
+,jGB\x83\x10\x04\x127?2\x83\xcf=|\xaa\
+3[%\x82\x22\x81W\x9e\xbb\x0a\xefy\xf9\x1a\x14%\
+\xc5\xb7\x22\x93\x87hZ\x1d\xe7\x8c\x8c-8\x93]n\
+\xf3\xce\xb7\xd8{\xddV\x84\x17m,\xe2\x9a\x9d\x83\xa0\
+$I\xc5\xadOO\xe2\xce\xfd\x8b\xc8\x05\x22\x8b\xf6\xcc\
+7?IU\xbd\x15a\xa6\xd2`p\xe6\x92\xd2\xce\xd1\
+\x868K\xbc\xe5\xb2\xb5\xd85\x9c\x8f\x89\x84\xeb\xb4\x0e\
+\x83\xcb\xe2\x00L t(B\x00\xf5V\x9b\xfbEm\
+\x13\x1euI\xce@u$\xe1\xf3\xb0\x02:xl\xcc\
+w!\x14z\xcb\xecD]\x07y\x15\x11\xa1\x19Y6\
+\xe8\x0b#\xae\x04\xd9)\xa4T\x023\x8a,\xf7\x85;\
+\xb64\x8b3\xe37?),9\xf9\xe7YV\xc0\x07\
+\xe0\x22\x81\x95\xe6\xd6\x11D)\xf4\xe6\xdc\xce\xb5[\x89\
+\xb35\x91f\x1a&\xee]O\xdfS\xebxo\xce\x81\
+\xb7\xe4\x85\x14\xa3O\xbe\xd7I\xe0Cw\x8c\xe1\xbb\x87\
+f\xe2\xdbl;\x16\x81\x1f\xbd|=~\xe5\xbaQ\x14\
+$s\x08\x90\xbd\x9c\xc2!~\x90\xc7\xc9=\x03\x11n\
+4\x19\x97\x12!\x80\xd7\x9e?\x82\xeeb\x1e\x000W\
+m\xe1\xdf\xee?\x83\x06I^\x13\xf0\x10\x86\xff\xd3\xd0\
+hG\x0a\x8b\x8d\xc8\xbe\x91\xf6\x9b\xb2\xdfb-`\xb4\
+\xb7\x887^4\x04A\x91u\xb6\xf2~\x98&\xa5\xcd\
+\x09\xe2\x8d-\x95B\x88\x80\x85F\x1b\xadH\xa5\x08\x0a\
+\xe4\xc6\xe6\x0f\x95s.\xa2\x9a(:\xc6p2xQ\
+\x8a\xafx\xdd\x14\x03`\xd3@\x8e\xfd\x92\x1e\xa7\x00\xd0\
+h),\xb6\x04\xb2r\xf89\xdf\x85e\xf6<\xfd7\
+Q\x06\xfba~\x09\x8b\xcd\xae\xde\xeck0\x9c\xaf\xae\
+\x0c\xf9\xaf\x84\x06 \xe2\x94 \x22\xf1\xb0j$v]\
+\x5clB\xce\x9eO\x96\xfaG\xce\xcf\xce\xa3\x8c\x13W\
+i\x0d\xc2\xf1KY&\x91(\x0f\xd6?\xc1\xa6@\x84\
+\x00\x02\xa7+\x84\xf7\x7f\xed(\x8eL.`)\x1e\x10\
+\xc8\x00\xef\xbaz#~\xee\x8a!\xe8h2s\xca\xde\
+D\xe1\xd9\x90hWyLO@\xfb=8\xafW\x00\
+F\xbaB\x5c\xb9\xa5\x1f\xda\x96|\xe0\xf0\x0c\x1e;U\
+\x83Nt\xec\xb1B\xf8\x8d\x13\xd3\x13[$px\xaa\
+\x01\xa2(\xde\x19\xe0c\xcb<\xb7\x10\xab\x9a/\xdb\xdd\
+\x8f\xc1b\xe0\x0e\x96\xbc\xd5\xed$\xcd\x96P\xab\x03)\
+0]#T\x9aK\xa1\xb1\x00 q\xeeh\x19\xf9\xc0\
+5k\x1cFC\x94^\xd4%,4P|\xe4{\xa8\
++\xc4\x96U\xbdi\x11\xee\x0da\xb1\xde\xc6LU\xc1\
+\x0d\xae\xce\xd0(\x01\xc4G\x8f5\xf7I\xa5z\xe98\
+\xcbN8\x9dZUc\x01H\x88\x95H\xe7\xb1\xdc\x06\
+D\xf2?7\xf7\x8c?\x91\x94%\x83N\x1e\x023O\
+G\x9d\xb2\xedYK>\xcd\xb7E\xa7\x86\xf4\xfb\xde)\
+7_V\x86\x02x|\xac\x81\x0f|\xf5(\xa6\xab\xcd\
+\x8e9\xee\x88\x08\xf90\xc0/\xbe|\x0b~\xe2\x92~\
+(\xbd\x0b\x924\x96:\xbe\xe9\xbbD\xfd\x15f\xf6\xad\
+\x1e\x8fR\x84\xed\xc3!\xd6\x0c\x14ADP*\xc2\xad\
+\xcfL\xa3\xdevmJ_Y\xe4}\xe8\xd6\xa2\x88\xd0\
+S\x08\xf0O\xdf\x1e\xc7\xef~\xfe\x00\x9e\x19\x9b\x07%\
+\xb9\x11R\xa6T\x02X)\x04\xe6\xaaM\xdc\xb1o\x16\
+\x0d\xb3y \xdc\xc5\xd09\xf0\x88\xbf\x9e\xb5\xae\x19\x1e\
+\x1a\x01LW\x14\xe6+\xcd\xcc\xe4&\xfap\x0e\x11\xe1\
+\xfc\x0d\xbd\xd8>\xec&\x09\xe9H0\xcfG,\x0a \
+\x8a\x14.\xddX\xc6\x9a\xfe\x82{\x95z\x86\x8b\xe3\xcc\
+|\x1ds\x0d\xed\x1fb7\x1d\x91\x8b\x1b\x86\xa9\x122\
+\x0ct\xd7$s\x8dR\x17\xaf\x91AK\xce\xb7,\xae\
+\xfb}\x96\x95\xd9\x06\x8c\x22f\xe7gx3\x93g\x9e\
+\xa1\xe0L5K\x9d25=M\xc0\xf9\x9a\xa1\xd6\xeb\
+w\xc8\x91\x10\xf6\x1ey.\x96}D\x0a\x03\x81[\x9e\
+\x9d\xc7_\xdfr\x08\xf5V\xbb\xe3\xe94\x22\xa0\x5c\xc8\
+\xe17n\xd8\x86\xb7]\xd8\x8fH)\xeb\x90\xcb\xf0\x7f\
+\xd9\xa5\x17\xcf\xb9v\x02\x00E\x84m\xc3E\x94\xf3\x12\
+\x8dV\x1b\xff\xf6\x9d\x93\xf8\xea\xd33\x90\xf0\xae\x84c\
+0\xf1\x9bU\x14o\x11\xbe\xed\xa2>\xfc\xdb;w\xe2\
+=\xaf\x5c\x87{\x0f\xcd\xe3'>\xfa4\xfe\xe4+\xfb\
+qdr\x1eB(\xf0\xa8:\x81\xf8|\xfe\xbd\xfb'\
+\xf0\x0b\xff\xfe\x0c\xfe\xe4\x9b\xa7p\xde\x9a\x02\xce\x19\x02\
+\x22e=\xfcV\x02\xfb\xbd\xd2\x12\xdf\xdc\xf5\x9d\xad\xb5\
+qx|\xc1\xab\xe5.\xbc\xde\x87\x7f\xcb\xc5C\x10\xa4\
+a\xec\x9b\x94i?[\xba\x7fKZ\x0a@WN\xe2\
+\xa6\x8bW!g\x12*\x8a\xac\x0d\x14\x00\x84\xbdc\x15\
+T\x1a\x91\xe3z\x22\xf2\xb7r5\x8e\x99\xc1\xb3\x9e\x05\
+{F\xa9\x91\xf1\xbeR\xda\x18\xffkNR\x12\x08\x0a\
+\xcfG\xbbx\xae\xb2\x02\xb7\x03\xbb\x12\xcf\xda\xc0\x0c9\
+\x84[\x9fO,\xcb\x97\xe3\xbf\xce\x9d\xc5\x82\xf7\x03\xf7\
+wp\x95\x9f;\xac\x8c/\x82\xbd\xa0\xdb\xf4\xc7I\x00\
+\x84\xc4'\x1e\x9a\xc6\x9a\xbe\xe3x\xf7K7\xc7>\x81\
+\x14\x86\xc5\x8b\xd5S\xc8\xe3\xbd\xaf\xdb\x0e!\x0f\xe1\xd3\
+\x8fLC\xc8 S\xd7\xb1\x8e76\x11\xbe\xba\x1c\x10\
+\x22\xbe\xba|\xa4'\x87\x89\xf9*\xfe\xea\x96\xe3\xf8\xea\
+S\xb3\xf8\xd9\x97\x8c\xa2\x18J\xfc\xf3\xbdg0YQ\
+&\x19\xa8&\x8a\x986\xe3\x9e\x22E\xd8\xdc\x1f\xe0\x7f\
+\xbcl-^w\xd1(\x8a\xb9\x10\x17m\xea\xc7\xd5;\
+\xfa\xf1\xbf\xef>\x89O<0\x81\xaf=5\x83w^\
+\xb9\x1a7]:\x8a\xe1\x9e\x12\x00\xe0\xe4t\x15\x1f\xbb\
+\xf7$>\xf5\xf0\x14\xa6k\xb1O\xe6\xa2\x8d=\x98[\
+\xcc\xe1\xf1\xc9y\x04\xc2\x0f\x87\xcdFB\xea\xf0\x8c\xab\
+\xb2u%\xf0\xe0\xd1\x05\x5c\x7f\xc1\xea\x0e\x98\xa0\xd7Z\
+\xe0\xa6KG\xf1\xcd\xa7gp\xcf\xb1:r\xd2u\xeb\
+z(\x96\x1e\x84!\x9a\xb8Dm\x85W\x9d\xdf\x8b\x97\
+l\x1fd\xc2%c\xc4DhG\x0a\x0f\x1f\x9dG\xa4\
+l\xc2V'\x08\x89`\x18hGa\x81,d\xd5\x9f\
+\xbcygL\xc4Q(M5\x81\xe7\x94$\xcf\xa3\xac\
+@Z\xf07\x82\x92\x9b\x81r\xfa^\x00/\xc0\xc4Y\
++\xe1\xd2u\x0cg2?\x98\xaa\x0eA\xc04\xeb\xc6\
+\xec\xfa\x1f\xf9MC\xdc\xcb\xed\x0d \x05h\xc7\xfd\x16\
+KA\x12x\xe4\xf8\x22VuI\x9c\xbb\xb6\xc7*\xb6\
+\xc2E<\x00(\xe5C\x5c\xb1\xb9\x17\xb3\x8bU<>\
+V\x873\x91\x0e\x9ee\x03\xa6\x8cg\x94|\xe8-\x12\
+n\xbe\xff4\x9e:\xdd\xc0\x1f\xbcn\x13~\xfc\xcau\
+\xb8ts?.\xdb\xd0\x85\xd3\xb3U\x1c\x9dm\x81\x84\
+4V\x86\x00\x12\xb9@x\xf9\xf6\x1e\xfc\xe9\x9b\xb6\xe1\
+\xda\xdd\xab \xa5L\x94\xa08\x1a\xf0\xaa\x1d\x03\xb8h\
+}\x09\x8f\x9d\xa8\xe0S\x8fL\xe3\xc1#\xb3\x18,J\
+<uj\x11\xbf\xfb\xc5C\xf8\xda\xdey4\xa38\xdb\
+pD\xc0\xfa\x1e\x89u\xfd%|\xf7\xe8b\x9cl\x83\
+\x9e\x1f\xea-e\xa2i\xf0D\xed6^s\xc1\x10\x8a\
+\xb90\x03(\xb6\x94\x0b!\xb6\x0f\x17p\xef\x81i\xcc\
+\x98\xdb\x8f\x9e{\x00>\x1a\xb6\x15a\xe7p\x0e\xef\xbf\
+i\x07F\xfbJ\x19t\xef\xbepz\xae\x8a\xbf\xbfs\
+\x0c\xf3Mr\x96^\xa4p.\xdd\x8a\xff\x5cx\xc4\x9f\
+\xd9\xa7_<\x932A)5\x10\xd4o\x06\xe1\xc0\xb1\
+o\x7f\xeay\x00\xa2sY6\x03(\x5c\xf8&\x10\xc2\
+\xbeBw\xef\xbb\x82P\xf6\x09\x818\xcf=\xdf\x05q\
+$\xb9%D\x91\xa2\xf6L(\xda6<)l\xd3'\
+\xb9 O_7\x96F=~\x9b\x0d\x0f\x035\x1bh\
+B\xa0\xa9\x04\x1e:6\x8f-Cyl_\xdd\xe5\x11\
+\xb4e$\x04\xa0\x90\x93\xb8bk?*\xb5:\x1e?\
+YM\x04\xb9p\xfb\xef\xc0\x10\xccc\x01\x9bGQ\x0a\
+\x1c\x98hb\xb4;\x87\xbfx\xcb6\xbct\xd7p\xbc\
+\x15\x08`\xdd`\x09/\xdb5\x80\xeePa\xef\xe9\x0a\
+\x16\x93\xc4%\x0a@I\x02\xef~\xf1\x08~\xe7\xb5[\
+\x93\x9c\xfa\x19`\x15\x02\x9bG\xcax\xd9\xce~\xb4\xa2\
+\x16n{\xb6\x82\xaf>=\x8bo>3\x8b3\x95\xf8\
+\xbe<\xbdf\x11\x04F\xbb\x80\x9d\xab\xbbp\xcf\xa1\xf9\
+%\xefNp\xfaH\x1c\xa1K\xdd\x11 \x050S\x8d\
+\xf0\xa2\x8del\x19\xe9v\xcf\x83e\x945\xfdEl\
+\x1b\xce\xe3\xa1\xc3s\x98\xaaQ\x9c\xf4\xf3y\xb0\x22\x0d\
+\xdfH\x11\xb6\xf4\x07\xf8\xe3\x9b\xb6\xe1\xa2\x8d\x03\x19\xe9\
+\xc7\x5c\xb5LJ\x81[\x9e\x9c\xc0g\x1f\x9d\x82\xce-\
+\xe0\xbaX;\xf7\xed\x1f\xed\xca\x9a\xd6\xf3\x92\xdf\x5c\xe5\
+51\x1bJ\xf5\x07\xf1\xc5 ?\xf4\x9b\x81r\x17\xdd\
+\x04%\x82\xbebw\xef\xbbr\x81\xec3\xfc-\x83\xed\
+g\xf3I\xf6\xd1\x10\xa2H3\x0b\xe8\xf9[\xd5\xc0\x89\
+\x0b0\xc5n\xa7\xb8\xb9\xd4\x85\xd3\x15\x813\x8a\x0e\x9c\
+Z\x00\x95\x16\xf0\xe0\x91Y\xec^U\xc0\xe6\x912l\
+\x82\x90\xf4\x5c\x0a\xb9\x00Wl\xe9\x03T\x0b\x8f\x9c\xa8\
+ R\xee\xb5Q\x0eh|\x8dH\xf0\x99\xc5\xff\xca\x01\
+\xf0\xa7o\xd8\x8c\xcb\xb7\x0fC\xa9$\xbdgrCN\
+1\x1f\xe2\xb2-\xfd\xb8t}\x17NL-\xe2\xf8l\
+\x1b\xc3\xe5\x00\xbf\xfb\x9a\x0dx\xd75\x1bQ\xce\xe7\xb2\
+Mt\xdd\x07\x09\xf4\x14s\xb8z\xc7 \x86\x0b\x84o\
+\x1d\x5c@\x8b\xe2\xe3\xc0f\x14\x14\xfb\x11\xd6\xf7\x87\xd8\
+5\xda\x8d;\x9f\x9d\x8b\xaf\xcf\xf2\xa0\x96\xe9\x09H\x16\
+,ke\xf8\x93fD\x10D\xb8\xfe\x9c!cjY\
+f\xe8\xe2\x09A`\xf3H7.\xd9P\xc6\x89\x89E\
+\x1c\x9fm\x22\x02O\x98I\x8c\xe9\xc6\xff\x8fO\xce\x01\
+D\x0aWo.\xe3\x037m\xc7\x8b\xb6\x0cb\x89\x0d\
+\x0ac\xd7V\x1b-\xfc\xc5-Gph\xaa\x05)\xfc\
+\xfb.8swo\xac\xd4B\xa5\xa3Y\xf2=h\xee\
+\xdcwd\xe3\xcaH\xf5\xc9\xc6\xcd\x11\xe1\xc0\xf1ej\
+\x00\xcb\xbf\x17@\xa7_\xf6u#\xe6\xf3\xd0\x0b\xea\x1e\
+*\xe9\xe4\xc7\xe5\xd2\x92\xd9\xdb\x8e\xc1L\xd6\x16\xe3\xf1\
+\xd5\x86A$NG\xe3\xeb\xb3\xd7oqr\xe4\xb1\x05\
+\xae\xcaf\xc7\x13\x04\x02c\x15\xc2\xef|\xf1\x08\xee?\
+8\x15G\x84u@\x1eE@\xa9\x10\xe2\x7f\xbcb+\
+\xfe\xd7\xf5\xeb\xd0\x15\xc6\xf7\xd7;g\xe8\xfd\xd5e \
+p\x1c\x9e\x88\x0f\xf5t\x17sNE\x9e'\x0e$p\
+\xd9\xd6A\xbc\xef\xf5\xdb0T\x0e\xf0\xd6K\x06\xf1\xb6\
+\xcb\xd7&GfE\x87\x8e\xdc\xf1\xe6\x82\x00\x17m\xea\
+C1`q\x0a\xec5\x01 \x07\x81f\x8b\xe9\xa2\x22\
+\xadSyK\x9ei\xa1\xfa\xc4O\x14\xef6\xdc\xbao\
+\x0e\x0f\x1e\x9e6j\xbde\xcei\x8f\x11\x11p\xf1\xe6\
+A\xfc\xc3O\x9e\x8b\xdf\x7f\xcdz\x5c8Z@A\xc6\
+pn\xabX\xc5\xd79\x11\xdbQ\x84\xbc$\x5c\xb4\xa6\
+\x80\xf7\xbdv\x03\xfe\xfe'\xce\xc5\x9e\x8d\xfdi\xe2\xf7\
+MV\x8a\xb5\x93\xbb\x9f\x9d\xc2w\x8f\xd4\x10H\xe9\xa4\
+\x0bp\x97\x8d\xbb%\xb5\xf8\xa3L_@\xa7\xa5\xe0<\
+\xd7\x08\x07o\xa7\x0a\x9c\xf9h\x19\xb9|\x17\xc0\x0a8\
+\x01#\x05!\x14\xf3\x8aZ^\xe8\xf8W\x84\xfb\xd4f\
+\xaae\x9ez\xfd\x83\xe3\xfa\xe4J\x17\x5c\x06\xc3\xd9)\
+Qr\xcc\x93\xbf\xc3\x16\x81\xc8jQ~\x14L2\x18\
+g1\x9933\x94\x02\x87g\x15~\xf3\x0bG\xf0\x17\
+o\x0ap\xc9&\xae>z}\x91@>\x0c\xf03\xd7\
+l\xc4pw\x88\x0f|\xf3\x04N/\x12rR\x98\xf3\
+\xdfn\xec\x94\x80\x9b4E\xff!D\x0ah4#t\
+,\x22f\x08\xdd\xa5\x10\xc5\x10\xe8\xce'W\x9c\x12W\
+@\x97\xc6\x12B\xec\xe82\xdc\xc7\x97\xba\xa40P\x0e\
+0[k\xa1\xad\xe2\x9bz\x1d\xbd\xc9\xd3mS\x9a@\
+\xc7\x11X\x896\xd7 \xfc\xf3]'q\xfe\xfa\x1et\
+\x17\x0b\xc9P(\x03\xc3\xe3\x8e\x94\x02\x06\xba\x8a\xf8\x99\
+k6\xe1\x8d\x97\x8c\xe2\xe9\x93\xf3x\xf4D\x05G'\
+k\x98\xa9\xb6 \x85\xc4@9\xc4\xc6\xc1\x22.X\xdf\
+\x85\xf3\xd7\xf7b\xb0\xab\x00\x82H\x9bD\x06\x11\x85\xf3\
+hj\xb1\x86\x7f\xb9\xfb\x14\xeaQ|\xe7\x80FE\xc1\
+p\xd6\xbd5\xdag\x03\xbe\xf3\xcf\x99\xb99\xd7\xc0\xe1\
+f\xa2\x86\xb3\xfc_~#:\x17\xff2\xcb\x0a\xa4\x05\
+\xb7\xec\xca\xd1\xda\xbdE\xb3\xd9T4\x87\xf4\xad\x22\xae\
+\xf6\x1b\xee\xe0\xb1\xdb\xb4%\xe5<\xf1>\xb8\xce\xf6x\
+\xf54q\xbb-\x91\xd3\x96^\x0c\xf3+\xc5\x04|`\
+\xaa\x8d\xff\xf5\x1f\x07\xf1\xc1\x9b\xb6\xe1\xa2-\x83I\x22\
+\x11{\x9e\x9f\x9bkR\x08\xbc\xe1\xd2\xb5\x18\xee\xc9\xe3\
+\xf7\xbf|\x14\x07\xa6\xdbqV!\xe1N1\x15:\xcc\
+\x08\xb0\x19\xb5Qi\xb6\xbc\x99j\x1fF\xac\xc6\x9b\xc0\
+\x13\x08T[q=\x87\x05{Yr\xfc\x22\x00\xb4\xa2\
+\x08\x0a\xca5\xc0\xcdq^\xc2\xfa\xa1\x12\xc6\xe7\x1a\xce\
+\xa1\xad\x18j\x94\xdckh\xdb\xe2\x10\x15\xce\x87\x0ex\
+\x91h:w\x1cX\xc4'\xbes\x02\xef\xben\xab}\
+!-\xaa\xed\xda&\xe3\x1b\xe8*\xe0\xea]#\xb8z\
+\xe70\x22\x8a5\x01!\x04\xa4\x0c\x10$'<\x89\xe2\
+LI\x99&\x8b9\x89\x0a\x83\x93\x8a\x08\x1f\xbf\xfb\x14\
+\x1e8\x1eK\x7f\xd3\xbb\x87\xae\xfc\xe0ZV:\x97L\
+\xa8'\x8c-%\xe7\xb2\xde\xd5u\xc8e\x0c:\xd5\xd9\
+Jl\x03.\xff4`\xf2\xcf\xdd\xce\xf0\x83^\xdc-\
+\xb8\x8eW$t\xf2\x92\xa4(\x5c\x98\x7fn$\x5c\xd6\
+\x16L\xd6/\xd9GH\x1c\xf2\xf2\x9a\x8ds\x08\x00\xfb\
+\xa6\xda\xf8\x8d\xcf\x1f\xc4\xc3G\xa6!%\x19)\xecb\
+\xb9\x95\x0a\xd7\xec\x1a\xc1?\xbc}\x07^\xb2\xb1\x18\xe7\
+\xde{.\xff\xaf\xd1\xa3\xe34\xde\x93\xd5\x08\xc8\x98\xa3\
+I\xc1\x06\x89\x5c \x91\x0f\xe2\x0b2,\xa60{\xd8\
+7H\x85\xdbs\xa3\x19\xa1\x159I\xf9\x8c\xf4\xcd\x87\
+\x12\x1b\x07\x8b88Y7IFl3\x19\xa6\x89\xbf\
+\x84\x1e(\xfd\x99\xeb\xe7\x0a\x12\xff\xdf\xdd\x13\xb8k\xdf\
+$\xa4\xec,=\xd3\x1aJ\x9c\x19GAB @\x18\
+\xe4\x10\xc8\x10\x02\xf1sR\x00H:ce\x96:\xb4\
+.\xad\xf1HH\xc2W\x1f;\x83\x8f~g<>\xe8\
+\xc6\xa3O3\xacVmVR\x07\xf2\xf7}\x06\xba\xaf\
+\xb41\x9c\xde\xd8c\xfc\xc5\xf9\x81\x92\xfe\x14\xbd\x00\x18\
+\x00!\x00Af\xf0#n0i\x9b\xc8\xfb\x97\xa5F\
+3\xfd;\xf3\xdc\xb31\x94;x\xf93\xa3\x82\x00t\
+B(\x7fX\xa6Qkj\xd8\xb4^\xb1:\xb8o\xb2\
+\x85_\xfb\xec\x01\xdcw`\x8a\x010\x9b{)E8\
+g]\x1f\xfe\xe6\xed\xbb\xf0\xa3{\xfa!\x88L*J\
+\xab\xf0\xa4\xe3\xe7\x84\x00\x22\x0488\xd1\xe80t\x0b\
+\xbfB \xd1\x95\x17\x98\xa9\xb4\xad\xa4[\xe2(\xac\xdf\
+^\xa3\x1d\x99 \x1f\xa3~'\xaa\xee\xea\x9e\x1c\xcay\
+\xe0\xf0t\x13B\xa6\x89\xc8\x8e\x97\xb9\xc1\xbc\xf6\xb3\xfc\
+\x01~+R\x00\xd3U\xc2\xfb\xbe|\x18O\x1e\x9f\x8b\
+\xfd\x18\x19-dz\xde\x85pU\xb6\xac\xce2\xa3\x0d\
+\xe3\xff\xeb1K\x09\xdc\xbdw\x12\xef\xff\xca\x918%\
+\xbcL\xfb\x06x'\xae\xc5\xd9\xc9\xd4\xb2\xb8\xddA\xec\
+\x99qd\x1amz\xea\xe4?\x12)\x86\xfc\xfd\x94\xe5\
+;\x01U\x04\xa9T|4\xd7\x9c\xfcKC\xcc\x19j\
+\x073\xc1\xd3\xcd\xb2\xb9*7\xbb\x18\xa2:\xed\xa6\x88\
+\x99y&:\x11\x82\xe0?{\xe7\xb1\xb8\x1aM@ \
+%\x0e\xccD\xf8\xb5\xcf\x1d\xc2\xb7\xf6M\x18M\xc0\xf1\
+\xe60W\x98R\xc0\xaa\xbe2\xde\xf7\xc6\xed\xf8\xadW\
+\x8c\xa2/\x9fD\xd51\x9b\x81\x1f\x1e\xd1M\x08\x00O\
+\x9c\x9cG\xb5\xd9\xee\xe0\xf1!\x10)\x84\x81@1G\
+\x98Y\xac\xa3\xad\x94\xab\xab2\xe9\x96:\xb4\x9e|\xac\
+\xb5cs\xd2\xc9\xdf\x09B\xa4\x08/\xdeT\xc2\xb1\xc9\
+&fj\xcaA\x16s$\x80\xbbY\x12X\x11\xf3i\
+\xb8\xea/\xff\xc7\x0c\xb0\xa4\xa10\x00\xf6O\xb7\xf1\x9e\
+\xcf\xed\xc7\x13\xc7\xe7\x10\x08\xb6\xa0\x8e \xf1\xc1\x90\x16\
+\x08B\x87)k\xea\xce\x94\x96\xb6})\x09w\xef\x9b\
+\xc0o\xfe\xe7!\x8cU\xe3-F\x1e:\xae\xc7\xc8\xcd\
+Fs\xe6\x83|\x9ca\xba{\xca\xd0\x5c\xba8pe\
+\xaf\xdb\xe3\x05I\xf6@\xb12Y\x81W\xe04\x810\
+\x1cP\x83\xc8H6\x9f\xc0\x966G\xdd\xb4\xecKH\
+,G\xb9p\x1a\xe8\xf0\x99,a\x1b$\xf2\x15\x05v\
+\xa0$R\x88\xbd\xc8\xbe\xc3\x88\x11i(\x04\x8e\xcf)\
+\xbc\xe7s\x87\xf0\x95\xc7\xce\xa4\xa4\x83?pR\x84R\
+>\xc4\xcf\xbet#\xfe\xfa\xad[\xb0{$\x97\x98\x04\
+\xe9\xa9\xe9\xb7\xa5\x04\x9e:\xd3\xc4\xbe\xd3\xfe\xe1$w\
+\xe6\x81\x14\xe8-\xe40Um\xa3\xd6\xd2\x87\x93\x98-\
+o\xf2\x12j\x87\xb7\xebHmF\x00)\xb7UE@\
+w\x0ex\xe9\xce^\xdc\xb2o.Q\xb1\xd3J\x92\x7f\
+\x06D\x08\xbb\xd7\x92\xad\xa1zz\x22\xcf\x06E\x84\x10\
+\xc0\x93g\x9a\xf8\x95\x9b\xf7\xe1\xdb\xfb&a/a!\
+;\x814\xe6\xb8*2\xcf\xc0\xe3x\xd52^\x13\xf1\
+\xc1\xa0/=:\x8e\xff\xf9\x99C86\x17\xc5{\xe3\
+\x09\x93\xd2\xce:\xeb\xf0\xcbBL\x8f\xf9\x18\x86\x951\
+{'\x89JG\xb0p;%MG\x06\x87_\x00&\
+\x00d\x00\x04\xa1Qc\xb56dh\x99\xdb\xd1|\xb2\
+\x5cb2iA\x0eug\xabm\xc4\xdb\xc8\xf8\x9dW\
+d&1\x83`\xb6\xc3F?{\xe5\x8e.\xfc\xc6\xcb\
+W\xe3\xbam%\xe38t\xd6J\xe7\x11\x90\xc0XE\
+\xe1\xb7?\x7f\x18\x9f\xbc\xef\x18\x22\xa5\xdc\xa8C\x9dv\
+\xcb\xd8\xab1\xc8_~\xcej|\xf8\xc7v\xe1\x8d\xe7\
+\xf6@\x92J2\x0cY\xd6\xcfO5N\xd7\x22|\xfc\
+;c\xa8\xb7\xda\xc8\xc4\x1c!\x90\x0b$\x86z\xf2\x18\
+_T\x98\xad\xb4\xd8\xb1T\xeb\xd5\x00\xa3y=~)\
+\x09\x8b\xf5\x16\x1e9^A\x9b$\x22\xc6\x04\x94\x22\xbc\
+lG\x0f\x16\xea\x11\x1e?UC\x98x\xc2M^\x0c\
+\xee\xfb\xe0\xc7\xbf\x1d\xc4\xb4L\xd5d\xf3\xe1\x08\xe0#\
+\xb0\x88wJ\x02\x01<;\xd5\xc4/\x7f\xfa\x00>v\
+\xcfQ\xd4Z\xcd\x98\x01z\x9a\x83\xb3r\x9d\xb4\xca\xd4\
+g\x8b\x06R\x00\xb3\xd5\x06\xfe\xf6\x9b\x07\xf1[\xffy\
+\x08\xa7+\xb16\xc5w\x05m\x1e\xbf\xa5\x9cnv}\
+\xd3\x07\xb2\xfc)\x8a\xf4C\x8e\xcb\xbe\x10cp\xb3Z\
+b\x82\xc3+\x90\x11d\xf9\x91\x80{\xde\x04B\xd0W\
+(w\xbf+\x0c\x83>\xdf\xb9\xa3\x91\xd1\xdfj\xd5\x93\
+\xb3\xc1\xbbd\xa4\x87\xe7\xf0\x86\xa9%`.R02\
+\xcdc\x14)\x80{0\xb6\xc4\x95vhE\x0a\xb8f\
+K\x11\x7f\xf3\xa3\xbbq\xed\xeea\xbc\xf2\x9c!,V\
+\xeax\xe4d5\xe5\x01\xb7\x0b\x0a\xd4#\xe0\xee\x83s\
+\xa0(\xc2\x85\x1bz\x91\x0f\x03o\x04\xae\xfaM\x04\x0c\
+v\x17p\xed\xce\x01\x0c\x96\x80\xa7O-b\xa1ac\
+\xcd\x99\xc1\x02\x09\x81\xfd\x13\x0dt\xe7\x08\x17m\xec\x89\
+#\xf1\xac?\x09Q\xa4\xf0\xd5\xc7O\xe33\x8fLa\
+l\xa1\x8d3\xb35l\x1a,`U_\x81\xcd\xd1\xf7\
+/\xc4\xf6\xe33\xa7\xe6\xf1{_8\x84\xbb\xf6\xcf\xe1\
+\x9c5\x05\xe4\x02\x89f[\xa1\xd6&\xac\xed\x0b\xf1\xf3\
+/\x1d\xc5\xff\xbe\xfb\x0c\xc6\x16)\x09\x10\x22\x03s#\
+\xedSR9\xed\xf8\xb2\xa6\x85\x8d\xc3p\xf3$X\x18\
+\x09!@B@J\x81j\x1b\xb8\xfb\xc0<\x0e\x9e^\
+\xc0\x86\xfe<V\xf5\x15\xec-F\x19\x84\x941\x94\xcc\
+\x22\xa5@\xb3\x1d\xe1\xeeg'\xf1\x07_:\x8c\xcf<\
+:\x83\x86\x82\xcd\x03\xc1\x08\xcd\xdd\xf2\xb3\xb8\x94\x85C\
+\xfc\xab\x00\xac\xcf\xc41\xee\xbdJ\x94\xfd\xbe\xef\xec\xb4\
+Z\x08\x00\x90\xea\x13\xd5\x9b\x15\xd1\x81\xe3w\xff\x90#\
+\x01\x8b{n\x02\x09\xd1W\xec\xd2\x0c \xad&\xeay\
+\xa7\xb7\x999\x8af8\xfcL[\xc2\x81\x9d\xe3/u\
+\x80\x98u\x8f\x80\xd7,\xb9\x8b\xc9K\xa4\x08o\xda3\
+\x84\x97\x9d3\x0cR\x02\x85|\x88\xf3\xd7u\xe1\xa1C\
+\xd385\xdfN\xd4\xf04\xe3\x10B \x82\xc4\xfdG\
+\x161>[\xc1E\x1b\xbb\xd1]\xccy\x84\x90v\x91\
+\xe6\xc2\x00\x17o\xea\xc3e\x1b\xbbpr\xba\x8a\xa3\xb3\
+M\x00\x12B0\x91\x90\xa8\xa8\x0f\x1e\x9bG_\x8ep\
+\xfe\xfa\xbe\x98\xf0d\x9c\x1e\xec\xefo;\x8a?\xb9\xe5\
+\x14\xa6\xaa\x0aR\x0a<;Q\xc7\xad{g\xb0Pk\
+`\xd3`\x01}\xa5\xbc\xc3}\xa5\x00\xaa\xf5\x16n\xbe\
+\xff\x04~\xe7\x0b\x87 H\xe1On\xda\x82\x9f\xbfn\
+#^\x7f\xc1 ^\xb6\xa3\x07=\x05\xe0\xb5\xe7\xf5\xe3\
+\xa9\x13\x15|m\xef\x02dr\x11\x87\xf6\xe8\x9bk\xcc\
+\x12\xc9k\x99q6\xe4}\x88eId\x9e1\x97g\
+\xde!!\xb1o\xbc\x89[\x9e\x9e\xc6\xf8l\x0d\xc3=\
+!\x06\xbaB\x84\xc9I\xa8T\x862\x9f\xe7%\xc3\x92\
+Ixs\xa5\xde\xc4}\x07\xa7\xf1\xd7\xb7\x1e\xc1\xdf}\
+k\x0c\x07&[I\xa0\x8fKh<\x8c;\xa3I\xcb\
+\xb4\xd0\x91\xcf,\x81\x84HK}\xdfj4\xc2/\xcd\
+\xeb\x04H\xf5\x05\xf5\x9b\x15\xe1\x87\xcf\x00\x0a{n\x02\
+\x09\xd9W\xe8\xea\x89\xcf\x02\xc0_r;S\xe1?K\
+\x11;\x01\x19\x04\xcc\xcd\x0a\xfd\x80k\x05\xfa]\x81$\
+\x97\xbdd-j\x82g\x81F\xda\x99\xe2c\x8f\x22\xe0\
+\xca-\xddx\xc9\xb6\x81\x18\xcc\x14g\x84-\xe7\x80\xdb\
+\xf6\xcd\xc5Ya;0}\x09\x80\x84\xc0\x13\xa7j\xd8\
+{r\x1e\x17\xac-c\xb8\xa7\xe0\x9d]\xca&\x90u\
+\x83%\x5c\xb7\xab\x1f\xc5@a\xdf\xe9j\x1c\xdb/\xed\
+8\xa5\x00ZJ\xe0\xbeC\xf3(\x07\x0a{6\xf6a\
+\xb1\xde\xc2\x1f\x7f\xf9 \xfe\xf5\xbb\x93P\x90\x89d\x14\
+\x08\xa4\xc0b\x93p\xdf\xa1E|{\xdf\x14T\xd4\xc6\
+\xfa\xc1\x22\xba\x8b\x01\x08\x84\xc7\x8f\xcd\xe2\x0f\xbf|\x08\
+\x9fxh\x02\xaf;\x7f\x00\xef{\xe3\x0e\x9c\xbb\xae\x0f\
+\xb9 @o)\x87\x0dC]\xb8v\xe7 \x9e=]\
+\xc5\x87\xee8c\xe6\xacM\x19n\xe2\xb8f\xaap$\
+\xbd\x9d]\xb6v\x96\xc2\xfd\x84\xbb\x08\xc4\x01]<\x9a\
+AJ\x81Z\x1bx\xf8X\x05_\x7fj\x0aO\x1d\x9f\
+E\xad\xde\x88\xb7?s\x01\xf2A\x12\x8d*\xd2\xff\x22\
+\xa50S\x8bp\xe0\xf4\x1c\xbe\xf8\xc88\xfe\xe6\xd6\xe3\
+\xf8\x97\xef\x8c\xe3\xf1\xb1\x06T\x02/\xcb\x1f\x99\xda\xa9\
+\xc7.\x1c}\xd3\x99\x81\xbfq\xe7\xfcN\xfe\x04;\x00\
+\xa1\x83?\x8ckynu\x01\x01R\xfd\xa2~3\xa9\
+\xe5k\x00\xcb\x0e\x04\xb2[GYGn\xecL\xd2R\
+\xc0N\xdc\xa8\xff\x9a\xc0\xd8sS?1\x17b\x0b\x80\
+9\x86\xf8\xc5\x1bn\xc7\x00CJcr\x12c3\x8c\
+\x09\xe88\xc0\x85j;q\xfe\xc4\xcf\x15\xc5\x97\x85\x9e\
+\xbf\xe64\x1e<\xd1\xb0\x00K\x98\x0a\xb1\xf7\x85\x10\x08\
+\x03\x81o\x1f\xa9\xe2\xff\xf9\xf7g\xf0\xde\xd7l\xc4\xb5\
+\xe7\xacJ\xf6\x93\x81\xec\x95\x8e#\xdb\x06\xbb\x8a\xf8\x95\
+Wl\xc5U[\xfb\xf17\xb7\x9f\xc4\xbdG\xaa !\
+\xe3\x0d\xd6\x84\x89\xd5\x94\xc4\x9f\xdf6\x86\x89J\x1b\xa7\
+f\xeb\xf8\xd2\x93\xf3\x10R\xd8\x0bY\x11_\xb7-@\
+\x08B\x89gg\x22\xfc\xc17N\xe13\x8fL\xe25\
+\xe7\x0d\xa0\x1e\x01\xff~\xff8\xcay\x89?{\xc3\x16\
+\xdcpa|\xbb\x90\xe2\xfe\x12\x10\xee\xd8;\x81?\xfb\
+\xe6q\xd4\x15\xd8\x81\x1b\xb6\x16\x19H+\xd8Z\x98h\
+\x07\xc7\xd9\x18\xdb\xf7z\xac\x94~\x1b@\x92e\x1a\x0a\
+\x81\x90\xde1\xecxN\xd3u\xc2\x97\x9e\xa9\xe0kO\
+\xcfc\xb0{\x0c\x9b\x06Bl\x1b.b\xb8\xbb\x103\
+\xeb|\xcc\xfd+\x8d\x083\xd5\x16N\xcc\xd6ph\xb2\
+\x89\xd3sm\xcc\xfd\xff\xda\xfb\xf20K\x8e\xe2\xce_\
+d\xbd\xb3\xef\xe9\xb9\xef\xd1\xccH3\xa3\x13$tp\
+\x0c\xc8\x98\xe1\x90\x8d8\x0cf\xbd+#Y\x0b6\x06\
+\xb3`\xefr\x88\xe5\xf0\xee\x87\x11`\xaf\xb9\x96\xb51\
+\xb6A\x8bX\x0b\x90\x0d\xc8\x80\xc0\x12BH\x02!\x81\
+\xee[\x9a\xd1\xdcg\xcf\xf4\xf4\xdd\xef\xaa\xcc\xfd\xa3*\
+3#\xb3\xb2^\xf7L\xb7\x84\xfc}/\xf4\x8d\xfaU\
+U\x9e\x91\x11\x91\x11\x91\x99\x91u\x09\x05\x81\x82@r\
+\xbd\x98m2\x08zs]\xb2\x02 \xc0c\x1e\xe86\
+\xba~\x05\x7fa/\xe3\x07\x0e8\xf6\x8cY\xd1\xee\xd4\
+Sf\xfeL\x8d\xd7T>\x89\xd4D\x12\xcf\x85\x9b\x81\
+\x5c\xaf\x9bg\xee\xe4f\xe0F\xbefF\xb7<\x13a\
+\xc7\xb3\xbd\xfc\xad?a\xf9\x9c\xad\xc3\x11I\xc1\xa0\x95\
+\xc9\xbb}\xc7\xa7\xd0\x88%\x0az\x07\x98RX\xd0]\
+\xc2\x9b\x9f\xbf\x08\xf7\xef\xdf\x0bPd3\x12+\x84\x95\
+U\x10\x84\xed\xc31\xde{\xfdN\xbck\xeb4.{\
+\xd1*t\x97\x8b\xf9\xdb\x87\xa1U_\x81\x8b6,\xc2\
+\xe6\xe5\xfd\xf8\xd6/\xf7\xe3+w\x1e\xc6\xde1\x95\xa8\
+\xa8*!\xca\xa6\x04\xfe\xf6gG\xd2e;\x01\xe1\x14\
+\xc7\x1cpJ%\xea\x1d\x11\x1e>\xdc\xc0C\x87\x0e\xa1\
+ \x80KN\x1f\xc0{_\xb1\x1a\x1b\x97\xf6B*\xb8\
+\x1a\x8aR\xb8\xf9\x91!|\xf8\xbb;qx\x22No\
+\x07bZ\x96C\xb7\xf6V#\xf3\x91\xb1\x88v\x18Z\
+\xe1\xce\xb8MWI\xc9\xc4!\x15\x00)\xd1W\x118\
+e\xb0\x84\x8d\x8b+x\xf4p\x1d\x8f\x1c\xaa\xa1\x10\xe9\
+\xe3\xc7\x89F&\x80t\xa3P\x84c\xd3\x12C\x93\x0d\
+\xfcro=\xfdfo\xe4\x89\x19\xf9\x08\x22\x08Br\
+c\xb2;\xc9\x03*\xbd\xe0ZI\xbcx]\x17\x06*\
+\x02\x8f\x1en\xe0\xc0h\x03\xd3qr\xab0W\xc1\x1d\
+\x7f?S,s\xa4b\x866\x1c\x0c\xb5\x99\xf9\xddv\
+\xda\xb4v\x11!]n\x9d#\xccY\x00\xe8\xf0\x10\xe6\
+^{\xc7\x96O\x06\xdd\xd5\xb4\xc3\x8e)\x83 e\x9d\
+\x81\xca\x13*\x16/\xdc\x9d\xc7DO:S\xf2\xc0\x18\
+\x14\xdaS\xaexY\xba5\x89\xaa\xbdo4\xc6d\xad\
+\x85\x81\xee\x82\x09\xfc\xa0\x00l;c\x09\xae\xbd\xeb0\
+\x1e>\xd2t\xb6\x87\xba#\xa6\xd2.'+\x04\xa3\x0d\
+\xc2\xa7~|\x10\x0f\x1f\x9c\xc4\x7f}\xd5:\xac[\xa4\
+o\xc1u\xc5$\xb1>H\x05\xf4w\x15\xf1\xb6\x97\xad\
+\xc3KN\x1b\xc4\xdf\xdd\xba\x0f?xt\x14Sq\x12\
+\xad(Q\x03\x05\xd6\xf4\x11\xba\xca\x11\x9e\x1cjB*\
+2\xc1A\x9cV\xa5C\x22\x04\x81\xa4\xc2\xbb_\xb6\x14\
+\xef\xb8x-\xaa%v\x19g\xca \xd3\x8d\x06\xbe\xf9\
+\x8b\x03\xf8\xcc\xad\x071<-\xcd\xd5\xdb\x16Q\xda(\
+UF\xfb1\xa6\x15\xf7\xf0\xaa\x80\xb3Ui1m\x1d\
+\x7f\x0a\xc92k\x11\x12g\xaf\xa8\xe2U[\xfa\xf1\x92\
+S\x07\xb0nq\x0fz+E\xec=6\x85\xbf\xbei\
+\x17\xbe\xff\xe8\x18\x1a2aDW\xc6'&_D\x80\
+\x0dr\xc8|\x1dz,\x8c6b\xfb\xcb\x03z4c\
+\x85E\xdd\x11.\xbfp1\xfe\xe0%+\xd1S.a\
+h\xa2\x81G\xf7\x8d\xe2\xe6G\x8f\xe1\x96'\xc7qh\
+<\x06\x09JW\xbc\xc9!s\xe3\xbf\xf4\xe8\xb4\xcd\xfc\
+\xee\xd12\xef\x173\xfc\x03\xf4\xca\x93J\xe4\xed\xa8=\
+1\x98\x97U\x00\x89\xa8\xbf\xd4\xdd{e\xa1\xa8}\x00\
+\xda&\xf4\x99?\xbb\xecc?)6~)c\x90+\
+\x0e\x096T\xb8>\xddg\x8aR\x0c\x99\xc4\xbc\xcb\x9e\
+\x22`TS\xff9-\xad\x19+\xbc\xe6\x8c\x01,\xee\
+\xab:\xb3cO\xa5\x00\xc8\x18?}j\xcc\xd8\xab\x99\
+%\x8e@\xf7\x14\x11\x1e;R\xc7\xdd\xdb\x8fcY_\
+\x84\xb5\x8b\xbb\xbd\x1d\x5c\x81Sx),\xe9+\xe3\xe2\
+\xcd\x0b\xb0ii\x09\x07\x8eO\xe1\xd0X\x0b2\x15\xa8\
+\xe5\x02\xe1\xb2\x17,\xc4\xd6\x0d=8p\xbc\x86\xe1\xa9\
+V\xb2V\xef8\xb1\x92\xf6\xc5\x0a\xd8\xbc\xb8\x84\x8f]\
+\xba\x1e\xfd\xd5\xb2Q%\xb5\xdd\xfb\xe4\xc1Q|\xfa\xfb\
+;\xf0\xe5;\x870\xd9BF\x98\x18\xfb\xdcY\xca!\
+\xc0sV\xf2e\xaf\xec\xf5\x17\xd6f\x8e\x91\xf0\xec\xb9\
+\xab*x\xdf\xb6Ux\xef+W\xe3\xa5\x9b\x97`\xe9\
+@\x17\xca\x85dIyAW\x09\x17o\x1e\xc4\xba\x05\
+\x05\x1c\x18\x9e\xc4\x91\x89\x16\xa4bw\x1e\xb21\xe41\
+!\x1c\xa5\x91B\x0c\xa6\x8f\x08+\xf4\x14\x81m\x9bz\
+\xf1\xe7\x97\xae\xc3\x1b\xce]\x8eJ\xa9\x08A\x02\xbd\x95\
+\x226,\xed\xc1\xc5\x9b\x17\xe2\xe5\x9b\x07\xd0]T\xd8\
+}l\x1a\xe3\x0d?\xbeA@\xc7wj\xf2\xfcY\xde\
+\xd1u\xeb\xdbb\xf8\xd5\x8d\xce\x95 \x0a\x00\xe4\x82\xa8\
+\x9e\xac\x02\xfc\xba\x03\x82\x14\xce~\x1db\x12\xfd\x95\xee\
+\xbe+\x0b&\x1e\x80\xe7\xd5e\x03\xa0\xb4\xa3\xce3+\
+\x1d\xee\x0d\xa0\xd4\xf7\xc5jAA\xca\xe5=2u\xb3\
+\xf5\x00\xe3`\xe2\x03\xa1\x9d<\x9c\xfd\x08\xf5\x96\xc2\xf9\
+\xab\xbb\xb1yE\xaf\xb7\xe4LX\xb5\xb0\x8a\xbb\x9f\x1e\
+\xc6\xde\xd1\x16;7o\xcbO+\xcf\xb4S\x90\xc0\xe1\
+I\x89[\x9f\x18\xc1\xe4t\x1d\x9b\x97W\xd1])&\
+w\xbb\xb5\x11\xe2J%j\xebi\xcbz\xb1m\xcb \
+\x16V\x80\xdd\xc35\x1c\x9f\x96\x98j\x00\xf7\xee\x9d\xc2\
+\x92\x9e\x08\x97]\xb8\x18\xa7/\xad\xa0\xd9\x8c1^\x8b\
+Qo\xb6\xd0T\x0aR&\x1aE\xbd%q\xc9\x96~\
+\x5c\xfa\xfce\x00\x08B\x00RI\xec<:\x81\xaf\xde\
+\xb1\x07\x9f\xb8q7~\xb1\xaf\x06\x90H\xb7\xfbx\x9e\
+\xb4T\x0d\xcd\xea-|\x16\xe3\x125\xe8\xe7\x07\x11\xa1\
+%\x09K\xba\x04\xdes\xf1r\x5cu\xc9\x06\x9c\xbbn\
+\x01*\xc5\x22\xdc\x0b4\xd2U\x92H\xe0\xf4\x95}\xd8\
+v\xfa\x22\xac\xea\x17\x18\x9bjbx*F-\xbd\x04\
+\xd58\x0a}\x81\x9a\x9a3\xbc,\xa9\x90\xc4gP\x0a\
+\x8b\xba\x05^\xbd\xb9\x17\x1fx\xcd\x1a\xfc\xc1\xd6\xd5X\
+\xb7\xa8\x07\xee\x11M=\xd5\x10\x16\xf5\x96\xf1\xa2\x8d\x83\
+x\xf1\x86^\x8cM\xd5\xb1\xe3h\xdd\x08aMC\xfc\
+B\xd2 8\xf4\x9d5\x19\xb3{\x8c\xb8nj\xf33\
+\xda\x96\x03\x85\xdauj\x1e\x22\x02\xcdY\x87\xe8\xfeO\
+_EL\xc55\x03KW\xde^)\x15\xd687\xe8\
+\x1au\xdc\xed\xb3\xb9d\x8a\xcd\xda\xdc[\xafM\x0a}\
+9\x88\xb5A\xfd\xa3\xa86\x06\x1b\x01\xa9\xf7\xd8\x0e\xbe\
+1_]_\x22[\x15\xf0f1\x054b\x89+/\
+\x1c\xc4\xff|\xfd&\x98CAi\xde\xe4\x9a\xea\x03x\
+\xef\xf5;Q\x97\xc2\x12>w\xf0\xb9\x86\xa1\xd7c@\
+\xc6\x12\x17\xae\xed\xc2\x9f\xbdb\x15.X?\x98\x84\xeb\
+\xd2\x8dm\xa3Dj\x1c\xee\x1c\x1a\xc7\xd7~~\x00\xdf\
+~`\x18C\xd3\x0a\x02\xc0\xb2^\x81\x8b7\xf6\xe3\xfc\
+u=\xa8\x96\x08G'%\x8e\x8c\xd6\xd1\x88%Z\xb1\
+B\xa5 \xf0\xb2M\x0bp\xf6\xda\x01\x1c\x1d\xad\xe1\xf1\
+C\x13\xf8\xc9\xe3#\xf8\xe9\xf61\xec\x1fk\x82D\x84\
+\xc4\xb3\xc1\xdc\xb6|,\x18\xd6\x9d\xd5\x17#\xc8\xc3f\
+\x96\x02\x1f\xabds\xd1\xf9\xab\xab\xf8\xe0\xab\xd7\xe1\xbc\
+S\x16\x18m\xce1\xa3\x1c\x82\x00\x8c\xe6G\x0a\xa3S\
+M\xdc\xbfg\x14\xb7>1\x8c{\xf6L`\xcfp\x0b\
+\xe3\xb5&\x9a2u~f\x950DP\xa8\x14\x05\x16\
+uG\xd8\xb2\xac\x82\x17o\x5c\x80\x17o\xe8\xc7)K\
+z\x12\x07\xa8\xb7\xdb\xd3_\xfb\xd7\xf4%\x040Yk\
+\xe2\x9f~\xb1\x1f\x9f\xbb\xf5 F\xeb0{#<\xaa\
+Dp\xea\xf6x:\xf8}&0\xf4,\x9bk\x0b\xc7\
+_\xd7l\xc9\x1b\x7f\xfe\xc97\xce\x22c\xdb\x22\xe7\x06\
+}\x97]\x83\x98\x8akz\x97\xac\xb8\xbd\x5c.\xac\xf1\
+\x194\xe9\x1c'\x10e\x88\xc3\xa1!\xde \xc6Cf\
+\xb6\xf1\x1cn\x0a\x01Z\xf1\xcai\x87s\xe3\xb7\x80\x9b\
+\xb0%\x15\xce^V\xc4\xd7\xfe\xf3YX\xd0Uf\xf6\
+bRI\xa3\xd9\xc2\x07\xaf\x7f\x02\xd7?4\x9a\x04\xa7\
+\xf4#EX\x15\xc8\xf5\xb0\xa5\x8c\xa2\xd5\xcf\xc1\x0a\xe1\
+\xb2\x0b\x16\xe3\xad/^\x85\xa5}\x95d\xb9M\xe5\x0b\
+\x00\x0d\x82\x08-\x19\xe3\xfe=#\xf8\xf2m\xfbq\xcb\
+S\x13\x98n%\xe9J\x11\xb0\xbc\xb7\x80\xb5\x03\x11V\
+.\xa8`Aw\x09\x11\x80X\xc682\xde\xc0\xbe\x91\
+&\xf6\x8c\xc48:\xd9B#NB^\x09\xb2&\x88\
+S{\x80\x9bT\x86\xc8]E\xdf\xd1\x84\xd88\xe91\
+z\xd5\xa6\x1e|\xec\xb5\x1b\xb0r\xb0\xc7l\xd7u\xd0\
+\xc3\x8a1\xa5\x9ab\x95Q\xb0\xa4Jv0\x1e<^\
+\xc3\x9e\xa3\x13\xd8}\xbc\x81c\x13\x0dL5b\xd4[\
+\x89yX-\x15\xd1[-`E_\x11k\x16\x96\xb1\
+f\xb0\x8a\xc5}U\x94\x0aQ\xb2\x9a\xe4x\x92C\xcc\
+\xab\x9d|\x96B\xf5\xf3M\x8f\x1c\xc1Go\xd8\x85\x03\
+\x132q\x122\xdcp\xffGf\xc6\xf7\xad\x876\xd6\
+\x84\xe3\x1fp\x06FA(\xd9\x5c[\x18y]+\x96\
+7\xdeq\xf5\xdc\x04\xc0<\xc4\x03\x08\xa3\xcf\xcc\x17\x86\
+7\x8c\x8e\x0c\x90\xca\xdc\xc0\xa5\xfb\xc9\x89@)[\x0e\
+\xf7\x8dp\x93\x8e\x9d\xd7\xb0ei'\x15\xf2\x8eij\
+y\xe2\xe9\x9c\x00\x22\x22\xec8\xda\xc4\x13\x07\xc6\xf1\xc2\
+S\xcbF\xb8\xe8\x09\xbaR*\xe0\x1d\x17\xaf\xc6\xaf\xf6\
+L`\xcf\xb8D\xe4\x94\xc1\x07\x9c\xb3\x8bm<\x11P\
+$\x81\xd1\x86\xc2\x17n;\x82;\xb6\x8f\xe2O.^\
+\x85\x97mY\x84b\x14\x05\x0fRq*\x90JA\x90\
+\xc0y\xa7\x0cb\xcb\x8a^\xfc\xf8\x91!|\xf9\xf6\x03\
+x\xf0P\x03-E\xd87\x16c\xcfH\x0b\xd8YK\
+WR\x12!E\x948lI$*k1\x82\xd1\xa0\
+\xbc\x85\x00\xe3H\xcd2y\xf2.\xf9\xee\x93\xba'0\
+X\xa0W%\x15^\xb9\xb9\x07\x1f\x7f\xc3F,\xe9\xad\
+BJ\xe9p9\xf1\xe4\xae|q\xb46+4\x08\xbd\
+\x95\x12\xfaV\x94\xb0iE\x9f\xa1\x1c\xa5\x92`\xae\x04\
+\xbd\xab\xcf\x19\x01@\x02R\x12\xab\x90\xd3\x8c\xffJ\xaf\
+ZhA`/J}\xd5YKQ.\x00\xef\xff\xe7\
+\xa7qh\x22\xb9j<\x1c\x0f\xc0\xab\xc3\xd0\xa3\xc7\xd5\
+*+\x0f\xc8/\x82\xdc\x5c:0\xf8\x5ca\xee1\x01\
+\xcfz=\xa4\xa2\xferO\xdf\x95\x85\x82u\x02\x86\x80\
+\xcbG\xed\xc4\x09)M\xdc\xc6D\x9a\xd6\x99\xb1\x19B\
+\x80,\xe2f\xd2\xb6x\xbaP\xbezKba\x17a\
+\xebi\x0b\xe0\x1e\x97H\x88`q_\x19\xd5H\xe2\xf6\
+'G\x11\xa7V\xb3\x86\x8c[\x03\x086\x88\xd2\xa5\xa9\
+}c1ny\xfc8\xf6\x1f\x9b\xc0\xda\x85%,\xea\
+-gl\xda`gT\xb2\x93p\xf3\x8a^\xbc\xe2\xf4\
+A\x0c\x94$v\x0eMa\xb4\x9e\x04\xf5\x8c\x84H\xff\
+\x11\xa2\x88\xd2\xa50\xe6`bv\xabv\x1a\xba\xe3\xc2\
+\x03\xa7f\xdbn\xf2\x82<\xc2\xd63v\xf2\xbb\xa5\x80\
+sWU\xf1\xa97\x9e\x86\x15\x03]\xe9R(W\xf9\
+\xedo\xae\x91yqe\x8d\xb3\x8c\xfb\x82\xf8m}\xfa\
+\x9c\x85\xdd'\xaf\x99\x96\x5cS\x8e\xf9\x0d\xf8Vf2\
+%\xf2\xf6\xb9~\x0dk\x8a\x02\xa7,\xe9\xc6\xb2\xde\x02\
+n{j\x04\x8d\x98\x02\x1c\xeb\x11\x05\x05~\x07\xaa\xc8\
+\xcb\xa6\xf1\x9a\x9c\xc5P\xb2_\xd4\xae\x93\xf3\xb0\x11h\
+\xce\x02\xa0t\xce\x1b\x01\x8a\xfa\xcb=\xbdF\x00\xcc\x16\
+B\xcc\x9a/\x10f~\xa66e\xe4\xd5o\x7f\xb3\xe0\
+\x92 \x8cM7\xf0\xaa\xd3\x07\xd1S)gr)\x05\
+\x9c\xba\xac\x1b\x07\x87'\xf1\xd0\xc1i\x08\xe1\xe87\xd9\
+~\xb5A\x8a\xa0\x84I\x1e<8\x8d\x9f<>\x8cf\
+\xb3\x81u\x0b\xab\xe8\xa9\x16\xecr\x93\xb2%;a\xa8\
+\x90\x10cw\xb9\x80\x0b\xd6/\xc0K6\x0e\xa0\xd5j\
+`\xfbP-\x09\x96\xe9\x09[\xd3*\x0a\xb7+\xab\xc0\
+\x86\x0c+?}\x08\xaf\xd6k\xb0\xb0\x8b\xf0\xc97\xac\
+\xc7\x19+\x07\xbc}\x10~\x99\x5c\xe5\xe6\xcf\xbc\xe4\x9c\
+\xe90\xef\x84`\x86\xb2\x98\xf8`\x83\xc3DP\xa6M\
+Z0\x99\xfd\x0f).\x15\x08\x1b\x97t\xa3\xdeh\xe0\
+\xae]\xe3 \x08\xb7:-\xc4\xf2f\xa3\xb6\x8c\xa2\xc5\
+\x9a\x15G\xae\xa3[\xc9~\x9a\xbeNJ\xb9}\xef\xcf\
+\xbe\x85\xb9\xc0\xdc\xe3\x01\xe8mU\xcc\x9b\x9e\xbb8\xa2\
+28r\xd2P\xf09\xa4ZQ\xe6\x97_n\xa2\xc1\
+*\xf7\x9bB0\x9f\xfd\xae\x1d>\x84\x1d\xc7\x9a\xf8\xe9\
+\x13\xc7\xd2}\xf9<G\xf2\x5c)\x16\xf0\x9eW\x9e\x82\
+\xe7-O\x22\xfd\xcc$\xa4\xf2@\xd7_\x10\x02\xfb\xc6\
+$>y\xd3A\x5cy\xcd\xc3\xf8\xd6/\xf7c\xa2\x96\
+\x9e\x823\x97\xc1+\xa7\x0dZ\x18h\xb5x\xd3\xb2n\
+\x9c\xbd\xa2\xc7\x0ej\xea\xc5\xb7q\x13\xd2h4\xccA\
+g\xffq\xb6\xe7}e\x8eHG\xcc\xb9^\x03\x1b\x1d\
+\x97\xf5\x5c*\x5c~\xfeb\x5cd\xc2\xa7\x85\x89\xc2\xd4\
+\xa6\xdc\xd2\xf4ro\x90\xaa\x9c\x18\x0d\xde\xfaD\xe0\xe0\
+\x96\x96\x81\xdaIm\xee\xa9T~\x1a\x967}v\xae\
+\xaeGZ\x88J\xee\x88\xbc\xe2%\xabp\xfe\xeaJr\
+\x12\xd4\xeb\x1fS\xb4\x5c\x8fhh\xc6#\xdb\x06?\x91\
+\xd2\xdd\xe5\x02ODPb\xce\xf3\xf7<D\x04\x8a\x95\
+\x09Nh\x9a\xad[\x9cs^\x99\x87\xca\xf6\x07\xca'\
+\xcc\xd0<\xee\x86ep\x93\xf0\x93\xa8\x5c(\x91\x97\xd0\
+')\xff\x9a\xa7\xa6\x22\xfc\xf3\xbdG16\xd5\xe4V\
+\xa4\xee\x01\x14\x80U\x83]\xf8\xc8o\xaf\xc3\x8a\xded\
+7[P\x8d3\xa3\xc7s\x87t\x94\xc4\xa3O$p\
+\xff\xc1&>\xf0\xed]\xf8\xa3k\x1e\xc1\x0f\x1f<\x8c\
+Z#=\x88\xe4\xcc\x90\xfaw2C\xd5\x9b1\xbe|\
+\xeb.|\xe2\x87{1\xd5\xf2\xcd\x0f\xd2\xae\x00\x97A\
+\x1d\x9cP@\x18\xe8Q\xf5\x9fT\xe6\xb77\x22\x88\x15\
+p\xea\xe2\x22~\xf7\xc2\x95Y\x93\x86y\x07\xad\x9eb\
+\xfb\x02$\xbb\xdc\xb8F\x96\x8f\xb7\xf4;;%h|\
+G^W\xd9frS\xb7\xb6\x0e<\x19\xa2\x91mL\
+\x1b\xe3\xdea3\xbaT\x0a\x8bz\xcbx\xfb\xd6\x95\xa8\
+\x16\xb8\xc3\xd0'\x02\xb7\xeb\x99o\xae\xeb\x08!\x9a\xcf\
+\x14%\xf0\xdc\x88\x08\x04%\x83\x0e\x15\xf7\xfc\xaf\xb5\x0d\
+Y/\x9d\x0e\x99\xdf\xde\xac\x9d\xe9\xa2\x9f!E\xa0\xf9\
+\xa9mG\xed\xe81\xb3\x1flBV\xae\x99\x04\x14\xfb\
+\x0d\xa0(\x04\xee\xdb_\xc3\xad\x8f\x1fM.@&\xaf\
+5*\xd9\xc3\x7f\xfe\xfaA|\xe4\x92u\xe8+\xc2\x9e\
+\xeb\x0f\xe0\xc2\x9d\xbf\x03*5s\x82\x15\x04 I\xe0\
+\x8e\xdd5\xbc\xe7\x9b;\xf0'_\x7f\x04\xb7<r\x18\
+\xb5f\x13f\x13b*i\x05)\x1c\x9f\xac\xe1\x13\xdf\
+\xdb\x8eO\xdf|\x08S\xb1\x1b*\xcaX\xc9\x8c\xca}\
+\xb6\x0a\xebm\x96i\x94\xf7l-\xe6\xac\xc0\xe0\xda\xd7\
+\x1b\xcf\x19\xc4\xca\x05\x15H-\xea\xf9A\x22c\x7f{\
+\xbe\x1d\xfd\xcd\xf1\x01\xa5\xedL\xffZq\xc0\xdamv\
+\x90\xba\x98u\x0f\xfa\xc08/\x93MZ94\x06n\
+0\x90\xff\xd2\xc1\xa3T\x84\xad\xa7-\xc2\x85\xeb\xbam\
+\x00\x990:s*S\xb3I\xe4T\x9fhM\x12\x04\
+\x89\xb9\xc2\xdco\x07\x8e\x9b \xd9\x04\x94\x0c\x86k\xb2\
+\x0d\xce\xc7\x87\x93\x8f\xcf\xda\xb0\xcc\x194C\xcd\xac\xa8\
+\xf9\xc12\xbb\xef44\xa6\xb3\xf53Y\x9e\x0ej\xa7\
+\x0a\xb5\x18\xb8\xe6\xce\x03\x18\x9e\xa83\xab\xd6\xed\x89\x02\
+\xe1\x92s\x96\xe1\x03\xdbV\xa2RP\x88\x95m\xbf_\
+f\xae\x9f(\x95\x5cN$/$\x82\xa0!\x097=\
+5\x89w^\xb7\x1d\xef\xbe\xf6\x11\xdc\xfc\xc8aL\xd4\
+\x9b J.\x01{d\xff(\xfe\xf4\xba\xc7\xf1\x95\xbb\
+\x8f\x22V\xc9\xa5\xd1\xfe\xd6k\x13\xa1\x8b\xdc\xb6\xf9\xf7\
+\xd2\x9bY\x18\xae\xc3-\xbb\x0e\xe0\xe6#\xd8\x8b04\
+[.\xe9\x89\xb0\xed\x8cE\xb6\xd7\x8e\xf1M\x19\x05\x91\
+\x98 0\xde~ei\xc3l\xbcI\xedo\xe3\xbc#\
+\xb2y\xd3<\xe4\xdd]f\xd5g2\xc2\xc4\x8fXE\
+\x01\xba\xb2\x83\xd3\xc6\x9b\xa4\x80\xeeJ\x11\xaf;g\x11\
+\x0a\x22\xce|\xcb\xcd\xea\x10`\x86\xac\xa0oG\xf6\xb3\
+$?h\xc6f\xcd\x16\xe6\xbe\x0cX\x10\x00\x09\xc3`\
+\x86\x99s\xd4\x93\x0c\x1f+;\xf0\xc6\x09e6\xf2\x90\
+\x9b!U\xb1\xb8-\xa7m3M\xe0\xa1%yx\xbf\
+\xcd\xa4\xc1\xedBe_\xa6J\x1f\x22\x22\xdc\xb3\xaf\x86\
+\x1b\xee?\x84+^\xb26\xf9\xcc\xd5<S\x09\xe1?\
+\xbcp5\x1aR\xe1S7\xed\xc3T\x8b\x10i\xb5[\
+k(z\x86\xf7\xcc\x15g\x17X\x8a?\xbb\xd1&y\
+Y\x10\x84\x9a$\xfc\xe8\x89)\xdc\xf1\xf4v\x9c\xb9\xbc\
+\x82\xb3Vvc\xa2\xa1p\xc7\xf61\xec\x1f\x8b\xedA\
+\x97Lg-\xfebEPq\x0b\xa5\x08h\xc4\x00\x09\
+aB\x8d\xa5\xf3\xa2\x83\x22\xb3\xf5\xda\xb1\xf5y\x15v\
+\xb7\xa5n\xb7\x02\x10\xc7\x0a\xe7\xad\xaeb\xcd\xa2\xee$\
+r\xad\x1e#E^\x03\xc9Sy\xadva&}G\
+5\xe6m\xf2\xe8\xc8i\xb7W\xaeo\xfa\xe8T\x14\xca\
+\xcb\xebsk\xd1\xa6\xa4\x9d\xff\x95I{\xd1\xc6\x01\xac\
+\xe8/b\xdf\x88\xf4\xc2\xb7\xe9\x81\x0f\x8cK\x9b\xf12\
+\xcb\xaa\x0e\xca\xb4S7\x91\x9e\xb9\x97\x8f\x9c\x00\xccY\
+\x00H\xc5\xd1\xc4m%eT_K\x00\xae\xbd\xa9\xd5\
+0\x87\xec\x94\x191\xc6\x9c\x16-\x89}\xc8\x04\x03\xdc\
+\xdb\x01\xb5\xfa\x19\x0a\xbf\xed\x98h\x9c\xc7\x9c\x17v\xd0\
+\x08@\x0b\x02_\xf9\xf9a\x5c\xbci!\xd6-\xeeq\
+\xc301\xfcG\x82\xf0\xd6\x17\xafB$\x80O\xdft\
+\x00\xe3M@8\x0a\x83\x82s\x5c\x96\x1f\x92R\xfa\x1d\
+\x18\xf3\xb3\xfe\xa58)D\x84zL\xb8{_\x1dw\
+\xee\xa9\xa7ZB\x22 \x8cPcL\xc9;\xaf\x14\xb0\
+\xb8\x0b\xb8\xe2\xc2\xe5\xd8\xbc\xbc\x0b\xbf\xda=\x8e\x7f\xb9\
+\xefX\xba\x8e\xedv\xc8-\xc1\x0f\xf8\xcelxG;\
+\xb6c&H\xe1\x82u}(\x17\xf9N\xbbp\x08\x0d\
+\xbb)\x93\xdb\xdci\x1bx5\x8e\xeb\xc0^\xf5n\xbf\
+\xdb1\xd7AE\x1c\xb3\x8f7;\x87\xf3\x89\xfd\xd6\xc4\
+\xe7\xacD\xb0=\x13\xce\x18)`Y\x7f\x05\xe7\xae\xec\
+\xc2\xae\xe1q\x94\x22m\xf2\xda\x9d\xb0l?\x91\xcd\x0f\
+\x9f\x06}\xb04cq\xa8XT\xac\xb9\x0b\x80\xb9\xaf\
+\x02\xb0N\xe8;\xd2\xd9t\xc6\xf4s\xdf\xa6b\xf69\
+\x9f\x15\xfdNq)\xa9)\xc1IB^Rw\xb6J\
+\xecB\xcf\xd0w~zS\xb2\x07\x11\x01O\x0f7\xf1\
+\xa5[w\xa3n\xe2\xf2e\x15|\xa5\x12\xaf\xf0e/\
+Z\x8d\xbf\xb8t-\x96T)\xb1\x09\x99\x1a\xcb\xfb\xe7\
+F2\xf6D=w>\xc1\xb2\x8e\xf6mD\x04\x94\x0a\
+\x84R\xe4n?\xd1\x04\x9f\x09\xd0\xae\x80J\x04|\xf4\
+\x925x\xf7\xb6\xf5\xd8v\xe6\x0a|\xf0\x92\xd3\xf0\xe5\
+\xdf\xdf\x8c\xdf\xd8\xd0\x05%%b\xc7\x9c\xf4\xfb\x98\xad\
+\xc5W\x91\xf5\xf1m\xa5\x80\xee\x22\xe1\xac\x15=\xee\xd8\
+\xe8>\x99\xd5\x0cO\xff\xce\xe0^\x99\xf1vL\x85t\
+\xfc\xed\xd8)\x0f\x85\xf6\x1d_\xfet\xaeg\xcb\xd0\x9c\
+%U\x1b\xe5\xd7\xd3.\xfc]\x9a^\xfeB\x14\xe1\xec\
+U},\x92\xb1\x1ew\xe5\xd2\xb0\x87\xe2\xf6\xae\x02&\
+1\x18\xeb\x10%\xda\x1bfyQk;\x98\xbb\x00P\
+\x02\xc2\xac\xad\xe8\xd6\xf3\xa0N\x9c\xb4\x99=\xe78\x09\
+\x95\xa3\x1d\x18\x84\xb3Y\xd0\xc3\x8c\x8b\xac\x1cU\xca\x0a\
+\xa4\x80\xac4\x08\xcd\xeafd\x0d\xda\xe4\x8f \x5c\xff\
+\xc0\x08n|\xf0\xb0\x87s\xde\x07};\x90\xc0\xeb\xce\
+]\x81\xcf\xbf\xe5T\x9c\xb9\xb4\x90\x84\xe9\x86\xb6\x94\x1d\
+\xab9\xab\xd9xM\xf4\x8f\xb2:$\xa8\xb2\x8ch\x9d\
+b\xae\xba\x1b+`\xcb\xb22^~\xfa\xa2\xf4\xfc}\
+\x12\xf0\xe4yk\x07\xf1\xf9\xff\xb8\x05\x7f\xfa\xf2eX\
+PE*\x04|\x04\xdbM>\xe45\x82\x0bt\xe3Q\
+W\x0a=\x95\x02\x96.\xa8 \xb88\x1aTwC\xef\
+<5\xde\xf9\xa3\xb5\x0dk?\x99\x8dC\xfad\xa7\x17\
+\x8c\xc4\xfa\xef\x94;lf\xcc\xad\x1f\xc2\x08\x09M\x97\
+\xc4[\xcaU\x05\xdez\x81\x8d\x8b\x92{\x0a\xb3\xf8\xd3\
+\xe9\x03t\x9cM\xee\xbdf/\x14+i\x9eL\x80y\
+X\x05\x88\xa1\x94tgw\xe5.\xb7\xe8Fs'\x8f\
+k\xc30\xa6g\xdd\xd7\x12\xdb\xb0\x87\x9e@<d*\
+G\x94ZW\x14y\xc8\x0fE\xa7\xcbHZ\x7fP(\
+Yn\xa9\xc5\x02\x9f\xfd\xf1~<yp\xcc\xf3\xc4g\
+GO\x81\xf0\xa2\xd3\x16\xe1o/;\x1d\x97\x9e\xd9\x97\
+\x5c\x06\xa2m8gSN\xfa\x8f\xac\x80\xd0\xbe\x0cb\
+e\xb9~\x0dez\xa7\xdf\x9a]x\xe4SUj\x86\
+)\x85\x9e\x12\xa1\xa4\xe3\xe8\xe9+\xb0\xa4B\x7fW\x05\
+\xef~\xc5z|\xf1\xf7N\xc5y+\xcb\x88c_\xed\
+\xd4NA;\xab\x1a+\x9d\xdc~\xeba\x18\xac\x8a\xe4\
+RS\xbe\xbf\x978\x8e\xf5Tf\xc7\xd1\xb9\xc5\xc8)\
+;\x0f\xd7\xbc\xcb\x0c_\x9eVg\xe53\x8b/\xa1f\
+QtF\xf2\xf2\x13\x80\x9czlaK\xfb+\xe8.\
+E>q9\xd4\xa6\x82\x02\xcdA\xf7\x8c\x90\x9c\x9c\x14\
+\x98\x97\xa0\xdes-\xc0aE\x0a\x7fu\x84h\x0e#\
+\xda_\x8e\x11f\x9cnZi\xf0\xcb\xe7:\x06e\xca\
+\xf3Ta\xdf\x14\xf0\x84\x89\xc3\x84z\x80R\xa1S\x10\
+\xc0\x8e\xe1\x16\xae\xfe\xfeN\x1c\x9fH\xaf\xc9R*\x5c\
+\x97J\xaemZ\xbb\xb8\x1b\x9fz\xd3&|\xf85+\
+\xb1\xb4\x87\xd0\xd0aj\x9c\xb0X\xbe\xfaK\xa6\x01\x8e\
+\xea\xcfgZ\xaf>b\x84\xea\xd2]R\x96 `\xcf\
+\xf1&\x86\xc6\xeb\xce9z\x13[\x01\x84\x97\x9c\xb6\x08\
+\x7f\xfb\xfb\xa7\xe3m/\x1aDW1\x0dU\xee,\xe3\
+\xda}\x82\xd6\x0f\xc0G\xdf2WO\x19\xa8\x14\x85q\
+\xe7\xd8\xd9\xcb\xd3c\x95\x1b\xda\xda\x11;J\x9b<\x8e\
+\xa3!Cc\xbaX\xb3\xa9'\x10%\x87\xef\xfa\xd3\x8c\
+l\xee\x0e\x00\xb2\x91u\xb4\x5c\xe6B\xc0T\xc6o\xb9\
+r\x1b\xd2U\xad\xa0X\x8c\xb8\xf7\xc1kH\xc0\xffp\
+\x02v\xbc\xa5\x01\x95\xfe{\x0e,\x03\xc6\x00$yN\
+,\xde\xe3\x80\xea\xc8\xa5\xa0\x9d\xe7\xac\xca\xeb\x97\xa0\x85\
+\x82\xf130tpV\xf2}\x00Y\x14\xbb3\x0b\x8f\
+ZC\xe4\xde\xd9\xe6\xb4/\xed@!\x22\xfcx\xfb\x04\
+>{\xd3N\xd4[\xcd4\xea\x90\x0aJz(@I\
+\xa0\xbb\x5c\xc2\x1fl]\x8b\x7f|\xebf\xbc\xfe\xac>\
+\x14\x84DK\xda}\xf6z\xc6\xe7\x16\xbc\xdf\x0b{\x11\
+\xa4\xcf\xf4Y\xdfB\xb6\xe7\xc9j\xc6\xee\xe3M\xdc\xf8\
+\xd0\x10\xb4@\xf61#%\xb0\xb4\xbf\x8a\x0f\xfd\xd6i\
+\xf8\xdc\xefn\xc4YKKh\xc5\x122\xc3q\x9eG\
+\xc0\x9bqu\x5c\x7f\xe1\xa8\xe0n{\x5c\xa1\x915\x84\
+\x9du\x7f\xe5\xd1\x0a\xb3\xab\xad\x8d\xcd4F\xd3\xae\xac\
+\x8a\xec\x1cN\xf5L2\xde\x1f\xe6\xd5\xb0m\xa4\x99Y\
+U\xf0\xe8\xc2\xba\x1eW\x99\xca\xa8\x1f\x96\xbe\xfdg\x0f\
+G^1\xc9\xfe\x9b\xe7\x80\x00 0\xa1K~c-\
+*\xb5\xdd\x02\x8ep\x82C\xda\xc4r\xc0E\xbf\x87\x08\
+_\x83p\x9f}v\xb1B%\x9b\xdf\xf2\x82\x87p\xee\
+\xe4RV-\x16\x91\xc0\xb5\xbf\x1a\xc6Wn\xdbc\xb7\
+\x7ff\x88\x9c=%S\x0c\xce\x5c=\x80\xbfz\xf3\x16\
+|\xfe\xcd\x1bp\xd1\xda*\x80\xd8\xb9y\xc8%\x01\xcb\
+\x14\x96@\xb9\xca\xe9\x13<k\xbbS=\xd7\x16\x08\xdf\
+\xb8g\x08\x07\x8fOCP\xd8/\xa2\x1d\x99\xdb\xceX\
+\x8a/\xbdu\x0b\xae\xb8`\x10]\x91B\x8bG\x0d\x0d\
+\xd8\xce\xd9\xb9\xce\xd5oC+\xc2d\xfa\xa7\xb7'\xa7\
+\xe2\x9f\xe7q\xba\xc3\x22<k\x1f\x80\xb6\xf7a\xf7\x03\
+\xb8{\x0b(\xd4*\xbb\x09\xc8\x08\x84\xb0\xbf\x89\x1c-\
+\x88\xd3Y\x8e\x01O\x8c\xd6\x98\x06\xd9\x1e(\xf0\x18\x98\
+\x06S^\x09\xb7\xf9\xe4a\xce\x02\xa0(\x22\x14E\x94\
+:\xb5\xec\xb2_\x06i\xe4>\xf3.\xe6\x07\xc5\x0a\xbd\
+t\xc5\x04O\xd2\xee\xd4@\x1e\xae\x5c[6\x5c-\xa7\
+\x0dR\xc9f\x9f\xcf\xdcz\x10\xfft\xe7\xded\x9d;\
+\xe3\x85\xe4\xeanR\xb8\x94@\xa5X\xc4%\xe7,\xc7\
+\xdf_~&\xfe\xea\x0d\xebp\xd1\xda\x0a\x8aB\xa1\x11\
+\xab4@'7\x81\xfc\xf2\xac:\xe2\x18>.z\xcd\
+K\x9f\xe9\x04\x11\x9e\x1aj\xe2\xbb\xf7\x1e\x0a\x1b\xbd\xac\
+\xb7R\x01+\x17t\xe3\xa3\x97n\xc2g\xde|\x0a\xce\
+XRD\xb3%\xd3\x8bG\xb3\x99\x1d\x03,0\xcbe\
+\x9dU\xc4\x92\xbb\x1a\x9d\xb6\x88\x1c\xfaN\xed?\xbb\x94\
+\xec\xdd\xdd\x88lYF4rs\x8b\xa9\xf0.\x86\xc9\
+\xab+}\xe7h \x8aikm\x80\xfc\xd69\x14\x94\
+\x1dWc'\x99j\xbctV\x12\x12#\x0fI\x84x\
+\x86\xa6\xcc\x06\xe6\xee\x03P\xc9\x05\x95|\x0d7\xa4f\
+[5\x8d\xcf\xf7\xcc\xc1\x07.\x10\x5c\x84\xba\x0a[\x1e\
+\x93\xbb\xb7\x0a\x84nr\xb1\xe9\x036_\xc8/\x91Q\
+\xfbl;k-\x81O\xdet\x00\xdf\xfc\xc5^()\
+}\x0eDXuK\x1co}\xd52~\xe7\xfcU\xf8\
+\x87+\xce\xc4\xdf\xfc\xdez\xbc\xe9\xec>\xac\xe8\x8d\x00\
+\xc4h\xc6@\xac\xf4yy\x8f\xd9y\xf4#\x80\xed\x87\
+ \xe7\x9f\x1b\xcb\x83i[D\xf8\xa7{\x8fb\xdf\xb1\
+\x89\xfc\x15$\x16\xca-\x8a\x04^}\xf62\xfc\xfd\x15\
+\xa7\xe3\xf2\x0b\x16\xa2ZH\xb4\x01\xee\x98t\xc7\xd4\xf0\
+jpFu\xcb\xe7\xda A_\xc1\xc6:k\xe9\xc4\
+!!;\xda\xfc\xc6\xe9\xec=\x80:\x8c\xb6\xbbV\x91\
+\x19\xcd\xd0\x811\xe5\xd2,\xcf\xe1m2\xcc|W\x0c\
+\xdf\xf6\x0f\xb1E/O\xb8{\x93\x87\xeb_\xf08B\
+\xfbxRMH`\xee\x12`\xee\xc7\x81\xcfz-$\
+\x89\xferw\xdf\x95Q\xa1\xd0o\x1b\x1c\xf0\xd8\xb0\xee\
+p\x95?\x1f\xc8\xcd\xc13\x917\xac\x9e\xd3*\xbcI\
+\x22\xeb]\xb0\xb2\x88\x9c\xc9\x97f@n\xb22@\xb8\
+s\xe78zJ1\xceZ\xd9g\x03V\xce\x02oJ\
+\x01\xa5b\x84\x0dKz\xf1\x8a\xd3\x17\xe1\x15[\x06\xb1\
+yI\x19\xdd\xc5\x18\xb5\x86\xc4t#F3\x96fk\
+\xb1#\x08\xb5\xaa\xa9\x03\x22\x92\xdb}~\xcb\x8dB\x1a\
+\x0fO%\x7f\x8fN\xb4\xb0\xb4\x0a\x5c\xb0~\x90\xadH\
+p\xb4xL\xa2\x08}\xd5\x12\xb6nZ\x88\xf5\x83E\
+<~p\x1c\xc3\x932\x11 )\xbe8\xae\xa4\x02V\
+\xf6Gx\xfdy\xcbmhu\x8e\x15\xa3\xa1\x90\xe3\x90\
+4X'\xd8%N\xdd\x1e;\xc0v\x09\x99\xf7\xd3-\
+\xc1\xa3*\xf6L\xac\xde\xd4\x97a\xb6\x11\x13\xab/\x87\
+rt\xcc\x84\xe0$$\x08\xa3\xd31\xbe\xf9\xcb\xc3\x98\
+\xac\xc73\xd2\x8f\xf6ie\x0e<q5\xc8\x08\x0cw\
+\xc2\x04\x94\xec\x17\xd3I<\x809\x1e\x07\x9e\xf3N@\
+w=;\xa48\xe7+\xe1\xaaM\xa9n\x0a\xe5f\xca\
+\x18\xde\xe4\xbcs\x97\xc9\x82\xca<\xcb\xa7\x82\xdf|s\
+\xd7\xdf\x12\xabR\xe7\xdadS\xe1\xea\x1f\xee\xc7\xc8D\
+\x8c\xb7_\xbc\x06=\xd5r\x12\xec3T\x8fc\x84&\
+\xcf\x12\x0a\x11\x09\xac_\xd2\x83\x0dKz\xf0\xa6\x0bV\
+\xe2\xd8h\x0dO\x1c\x1e\xc7\xc3\xfb'\xf1\xd8\xc1\x09\xec\
+<\xd6\xc0\x91I\x89\x89z\x0b\xf5\xa6\x84\x92\x0a\x12\x22\
+\xf5\x01\xb3\xf0\xe7i\x05\x11\x08D\xc9E\x97\xd5r\x01\
+}%\x81\xa5}\x11\xd6.\xa8b\xdd\xa2*\xce\xdb\xd0\
+\x87X)\x13\xd2\xdda\x12\x95\x15\xcdJ%\x01:/\
+=w\x05\xb6,\xef\xc1'\x7f\xb8\x0b7?9\x0e\x22\
+}}\x86c\xf3A+\xc1d~\xb14\x0c\xb1v\x15\
+\x98\xa9\xd9\xcaq\x8f\xba\xae\x18\x87:\xcc\xdc\x9a\xf2\x0b\
+\xd70\xd3/\x19\xad\x8c\xd7k\x97\x89\xdd3\xfbi\xbd\
+,\x1e\xa0\xd3l\x0759\x1a\xa9\xe7\x8f\xb0\xa9\xb8i\
+\x18\x16`v{x`\xb2rJ\x98\x07\x07\x00\xe6\xe3\
+f\xa0\xb4\x81f\xd1*\xe3(r\x1dBZ\xb8i\x9e\
+\xf5W\xc02\xf9\x1c\x09\x1e\xc4\xb7Q\xfe\xadA\xa1\xda\
+%\xf6u\xd4\xdc\x9eq\xb9\x96w\x09\x83 B]\x0a\
+|\xfe\xb6C\xd8}\xbc\x8e\xf7\xbf\xe6\x14\xacX\xd0\x9d\
+\x12\xb3S\x80\xb5a\x03\xa1\xc8\xb4\x06[ \x81e\x0b\
+\xba\xb1|\xb0\x1b\x17oN\x82z\x8e7Z\x18\x99l\
+bh\xac\x8ec\x135\x0cO\xc58>\x19c\xaa\xd1\
+BKJ\xb3\x94\x16E@9\x12\xe8\xaf\x16\xb1\xb0;\
+B\x7f5\xc2\xe2\xbe\x0a\x06\xba\x8a\xe8\xef*\xa1Z*\
+ 92@\x9e\x039d\xa3r&\xb4\xe1\xb8N]\
+\xd6\x87\xbf|\xf3&|\xf0\x9f\x9f\xc0\x0f\x1e\x1dO\xe3\
+\x22\xbaCX\x8f\x05Z\xb1J\xa9+4\x06\x5c\xdd'\
+K\x14f;0O\xca\xf7=(\xe6'\xe1\x8941\
+Y\x81\xaei\xcb\xf7QfM\x97T\xb0\xf3\xe5HB\
+V0\x22\xe4\xcbp\xfb\xa4\x97\x85\xfdd\xbe9f\xf6\
+\xb4h)\xc1\x1aI\x01\x1e\x08\xe9\xb3\x12\xe2\xb9q1\
+H\xc4|\xee\x9a\xb7\x82\xdby)\xfb\xdbI\x15\xec8\
+{ry<X\x1e\x17\x1a&\x1e\xa1\xef-\xf2\xb4\x87\
+`\xdc@\xe5\xd5\x13\xf08\xe9#\xa6\x94>(D\xf8\
+\x97\x07G\xf0\xf4\xd1\xc7\xf0\xa1K\xd6\xe1\x82\x0d\x0b!\
+(\xd9u\xa73\xce\xe8\x11\xd6\xb3\x98\x11\x1e\x04\x12@\
+\x7f\xa5\x84\x81\xae\x12\xd6-\xeea3\xae\xafa\xf9\x90\
+\xce\x13\xa9M\xabSK9[\xf3K\x05~%g\xe0\
+\x07{*x\xdb\xd6\x15\xb8c\xfb\xe3\x98j\xb1\x19;\
+m\xf3\xf0\xa4\xc2\xd8t#\xdd\x0c\xa4\x9bCl \xdd\
+ztx\xf6\xb0wG\x19nv\xcf\x93xme\x8a\
+\x1c\xb1\xb2\xec\xf9#\xc7\xbe\x83\x7fK\x9151\xc8\xf0\
+\xa4{\xdf\x80\x8f5\x0f\x83\x04\x0c\x8fMa\xba\x1e\x9b\
+\x1b\x8c\xc3:/?\xcc\xa6\x8c\x09\xe5\x0a\x09N\xc7n\
+>\xd6\xc96c?{\x98\xbb\x13\x90\x04\x12e2Q\
+(U`v\x9b\x05\xb5Y\x07\x07\xcb\x97\xd0\xae\xefX\
+tg\x1c\x87L\x0do\xa8\x90\xff&\xf8\xacO\xabe\
+\x98\x9e\xd5\xe9\xa0\xda<p\x1fDB(B\x08\xdc\xbb\
+\xbf\x8ew|\xfd)|\xe1\xa6\x1d\x18\x9e\x98\xcaq\xb6\
+y\xc6Ef/<\xf1\xafIs%\x12\xd5?\x0dl\
+)\xa5H\xffQ\xce\xbf$\x0c\xb7RYB\x9c\x99l\
+h\x86o\x0a=\xe5\x82sC\x92E\xa1\xc2\xe1\xf1\x06\
+\x9e:4\xe1\xad\x81\x87\x09\xc0\x99\xc4\xf2\x06M\xb5-\
+\x22\x90^9\xbf\xcd\xc6tM\x5cJ\xd9\xb6\xf9+\x16\
+\xee\xd0\xa6~\x94\x90\x99\x98m\xeb={\xc60Vo\
+\xb9\x0e\xcd\x1c\x1cr\xd7d\xa6\x05F\x9e\xd9%t\x07\
+\xc7\x04\x14\xf5\xfd\x86s\x84\xb9\x9f\x05H/qL\xa4\
+\xa5p\xe4\x14\xc2B6\xfbLv\x82P~\xbe\x0c-\
+\xba\xe8\xa2\xf0\xeb\x9c\xbc\xfc\x9b=\xc7\x9e):\xa0\x10\
+p\x9d\x84\xd8[\xdb\xe6\x84\xa8\x8a\x05\xc2\xf1\x9a\xc4_\
+\xdfr\x08\xef\xf8\xdac\xb8\xe5\x91\xc3h\xc6\xb1'\x08\
+\x94+\xc4r){fG\x92\xfb\x93f\x99O\xa3 \
+?]\xd6_\xce\x82t(\xe0\xe6G\x871ZK\xae\
+\xe70\xbb\xf6\xd2\x7f\xd31p\xe3CG\xd1j\xb5\x0c\
+\xae\xc3\x83D\xae\x90\xcfi\x85\xbb\xbad\x1d\xa1y\xe0\
+j\x8c\xe4\xee\x16d\xf5:\xe8\xe3\xbb\x84L\x9b\x88\xf9\
+$\xda\x8f\xcb\xc8d\x037><\x8c\x98\x84\x11@'\
+=?\x13\xa74>\xd1\x90\xd9\x8a]*\x10\x8a\xd1I\
+\xd7``\xce\x02\xa0\xda]E\xb5ZJ.l\xcch\
+y\x14f\xcc\x94k\xfc]S\xe0y}M\x17\x81g\
+\x8d\xa36S\x5c\xc6\x0fd\xca\xf0\xf6\xfd\xb5\xd1\xa8\x5c\
+\x17LN\xd3R\xcd\x03*\xb9c\x90\x88p\xe7\x9e\x1a\
+\xde\xf5\x8d\xedx\xdf\xb7\x1e\xc3\xbd\xbb\x86!Ul\xae\
+\xb1n\x0f9\x92(\xb7\xe3\xe4P\xbd\xeb?b\x12\xd6\
+\xaf\xc5?\x8ba~f\x1c9\x06_B(\xdc\xf6\xc4\
+\x10\xbez\xe7\x11s\xd2\xd2sdC\x90\xc0\x8d\x8f\x8d\
+\xe2\xae\xa7\x87\xbd\x1b~}d\xbbN\xd5|<\xb0~\
+\xe8q\xf3\xfd\x8e\xfa\x17\xf7\xf4\xf3\xbc\xfe-\xd2N\xdc\
+\x0a\xcf\xbb\xcf}7\x8cN|:\xd0 \x84\xc2\x0d\xf7\
+\x1d\xc2}\xfb\xa6Qd\xb7\xb5\xba\xd4\x923\xce\xca{\
+\x06B\x8c\xe4@,i|\xb2\xae\x8eL\xd4b\xcc\x15\
+\xe6\xec\x03X\xbb\xac\x1f\x8dX\xe1h\x03*#\xc9s\
+\x22\x04\x19\x9f\x0dW\xd5\x9c\x1dWp\xe3\x00\xf8\xa6\x04\
+w\x22Z|\xbbx\xe4~\x06\x9f\x9e)\xfb.\xe3\xbc\
+\xf1x\xcb\xb7\xfex\xb1!v!\x02\x0a\x04L\xb7\x08\
+\xdf~`\x04?}r\x0c\xaf9\xbd\x1foz\xc1r\
+\x9c\xb1\xaa\x1f\xd5R\x94x\xf1O\xfaD\x17\xc3[\xee\
+\xc6\x1b\xf6\xcd\xb70\x94\xf3\x83e\xe6\x8eT\x17\x84 \
+\xdc\xbf\xfb8\xfe\xfc\x86\xa714\x15#\xf2\xb7\xbd\xea\
+tP8>\xadp\xf5\x0f\xf7\xe1\xf3\xfd]X\x9f\xde\
+D\xcc\x19+\xd3l\x87\xd7\xb5\xc3\xcf\xe9\xd4L\x980\
+~\x1f\xeev\xd0\x1a\x8aM\xab\xc2e:\xf8Q9\xbc\
+\x97\xc5\x97 \x89\xdb\x1e\x1b\xc2\x17~r \xb9\xf3\x10\
+\xed\xf2Y\xca1\x8eM\xf2\xd3\x8192\xb9`\x22\xe3\
+/\xa8\xb7\xe4\xc4]\xbbG\x87H61W\x98\xf3>\
+\x80\xf5\xdb.Gmr\x22\x1e\x8f\x8b\xbf-\x0a\xc5\xb5\
+\xbc\x1f98\x0b \x87N\xec\x93\x87\xcf\xdc\x09\x95\xa7\
+\x0b\x99\xd8'\xa0a\x07\xb9<\x90\xd4Mf/\xa9\xa8\
+\xc5\xc0\x83\x07j\xb8\xf1\xe1a<\xb8w\x04J\xb60\
+\xd8\x1d\xa1\xbb\x5cH/\xb1\x98E%36\xf2$\x80\
+\xdc\xe5\xb2\x9c\xd5'\x08\x01<yh\x0c\xef\xbb\xfe)\
+<v\xb4\x95\x5c\x86\x91\xaa\xd8^qfm\xfd\xc0X\
+\x13\x0f\xed\x19\xc1\xa9K\xcaX>PM/%\xc9\xce\
+\xfd\x16Sn\xddvm)\xb7\xe9\xed\xdfg\x1c\xcb\xed\
+qE\xc1\xbc\xd9\xf6Q\x8a\x8fF\xab\x85\x7f\xbd\xef \
+>v\xc3.\x1c\x9aL.\x08\xe19\xfc\xd2\xfd05\
+\xdc\xa4rBGe\xd4Vol\x94\x1c\xe9.\xc5_\
+\x19\xe8)\x8d\x8e\xdc=\xb7}\x00s\x16\x00\xd5\xf5\x17\
+!\xda\x7f\xa7\xaa\xf5o|#\x15*\xa7\xda\x1566\
+M\x1b\xec\xe6\x95\x92\x9d\x8e)\xc4\x13\x14\x1e\xdcDk\
+\x0dM\xe99\xd5\x11f!\x98\xbczB\xbe\x82,\xcd\
+:^\x02\xf7[r\x11HC\x02\xdb\x8f6p\xd3c\
+#\xb8\xe5\xb1c\xd834\x09R1z*\x05TK\
+Qr\x957\xac\x93\xfadD\xc2\x89\x81\x8b\x08s\xd8\
+\xd7\xc4(T\x10D8p|\x0a\x1f\xb8~;\xee9\
+\xd0@A\x84\xc3n\x1b\xa7}:\xec\x91 \xec\x1fi\
+\xe2\xd6'\x861:1\x8d\xfe\x8a@\xb5\x1c%\x11\x88\
+\xd8\x16\xdd\xe4\x9f4\xfe\x00\x1d<\xc4*\xe0\xec?%\
+\xd9o?\x0d\xd8{\x95)+P\x9aW\x96\xdeQ\xe8\
+\xe7C\x1aCA!\x96\x12\xa3\xd3\x0d\xdc\xbbk\x18\x9f\
+\xbbi7\xfe\xe6\xf6C\x18\xa9\x01Qj\x8f\xb7[*\
+tE\x88ehE\xf6\xe4'g~'\x0c;3Y\
+T\xb3\xfeP_<\xf2\xf7\xfd}\xdd\x8d\x03w\x5c7\
+\xa7\xd1\x9f\xb3\x09p\xd1\x19+\xf0\xd5'\xde\xd9\x5c\x81\
+\x1f=IP\x97p3\x8a{\xf4\xe1\xff6K\x19`\
+6\x01\xfb\xea3Y\x0e\x03\x06,\xdbl\x06_\x13\xe0\
+\xceG\x84d\x87^\x1bFH6\xb5q9\xa4_\xdd\
+\xf3\xcf\xc6;\x0e\xa4\xa6A\x1a\xe3\xfb\xa9c-<y\
+\xf4(\xbe\xfe\xab\xa3X7X\xc2\xf3Ww\xe3\xfcu\
+}8cE\x0f\x96-\xa8\xa2\xa7\x5cD!\xb2\x8e \
+\x13u'\x88\xcf0\xd8M\x81\xae\xba\x94\x17P\xc2\xac\
+\x8d+\x1bewd\xaa\x8e\x8f\x7fo\x07\xee\xdc=\x89\
+B$\xcc*\x8b\xf6;jy\xcfW\xa6\xf4\xbbBA\
+`h\x0a\xf8\xdf\xb7\x0f\xe1\xeb\xbf<\x86u\x83E,\
+\xe9\x8eP,\x90S\x8fq\x9a)V\xa6\xfe\xa1\xacT\
+q'H\xd7\x8e\xd0^~K;\xe4\x8e_\xc0j\xf2\
+\xe7e\xe7\xc9;\x91$\x01\xd4\x9a\x0a\x07\xc7c\xec\x1e\
+n`\xa2\x89\xe4\xf6\xa5(M\xe68b}\x03\xd1U\
+E\xf9\xde\x03\x97~42m_\xad\x99\x9b\xe8D\x05\
+\xd5\x1c>\xe3\xe8M\xb5\xbd\xea\x853\x13\xc0L\xf41\
+\xe7\x12\x00\xf4\xff\xd9\xedX@\xf5\xabd\xa1\xf8\x09J\
+\x03\x84*\x8fIU\x06\x0f\xae\xc3*\x9f\xa8Uv \
+\xbd\x0e\x84\xb2p\xe1\x10\xf2\xb3\x04\x91\xe11m\xdeL\
+\xef\xfb$\x8c\xcd\xca_\xa7DK\xb9\x22C\x99\xf5j\
+\xa5\x923\x02\xb1\x02\x0a\xa40P-`\xf5@\x01\xa7\
+-.c\xfd\xe2.l\x5cR\xc1\xea\x05]\xe8\xed\xa9\
+\xa0\xab\x5c@W\x91P\x14\x84H\xb8!\xc0\xf9\xec\xa1\
+T\xb2\x0c\xd8\x92\x12\xf5Xa\xaa.Q\xab714\
+6\x89\xbd\xc7\xebh5c\x5cz\xde*\x94K\xc5\xf0\
+\xac\x952\x7f\xbd\xd9\xc2'\xbf\xff\x14\xbez\xd7Q\x10\
+\x09\x87)2\xbe\x116\xbeYM6a\xb58\xd6\xf3\
+\xbd\x16J\x12!\xf5\xd0\x0ew:\x132^\xb4uz\
+\xce2\xe2V\xb3\x8d\x1b\xe8l\xeca!\xeb,Yi\
+A\xc4\x05@\xe28T\xfa\xcc=\xd9\xf6\x000\xea\xbe\
+\x87v\xcf\xb1\xaa\x1b\xcc\xc6;C\xe8!m\x91\xc5\x5c\
+\xf0\x04\x8a\x02\x10\xd7\xa7\xae\xde\xafN\xf9\xd0\xfb\xcf~\
+\x0a\x9f\xbe\xf2\xb70\x17\x98\x97\xcbA{&\x0f\xa0P\
+.<P\x8f\x16\xd6I\xa0\xecH\xaeT\xd0Y\xa1\xa0\
+%\x9fV\x99\xac\xca\x18r\x16g\x0e\xdb\xf9\x9a\x02{\
+63\x92\x8f{\x86sG\x8e\x84\x9c\x80!\x918\x83\
+\xf0\xc9\xc4\xe03\x8d\x87i<\x17\x80d\xdeYk1\
+\x12\x94:\x90\x08#5\x89\xe1\x83\x0d\xdcw\xb0\x01\x81\
+1\x14\x85Do\xb1\x80j\xa5\x88\xbe*0P\x06z\
+\xcb\x05\xf4W\x8b\xe8\xad$\xbb\xfb\xf4Yt\xa5$\xe2\
+8\x09i>6\xd5\xc0\xe8T\x1d\x13\x0d\x89\xe1i\xc2\
+TCa\xaa\xd6\xc0X=\xc6\x9b\x9e7\x887^\xc0\
+\xae`\xf7zAP\x88\x95\xc45?\xdb\x83k\xef\xd6\
+\xcco\x91\xa8\x18\x124\xee<\xc5\xc7Q\x884\xa6\x0a\
+<\x0cq\xd2sK\x0b\xc69\xe6[\xd1\xe4\x0d\x81\x97\
+\xc69/!\xb2\xc4\xa4\xe3\x01Z=\x0c\xd6\x11\xe7v\
+$c\xdc(\xe1\xc9{\xc5\x88E\x8fw*\x1a|\xa7\
+\xa5\x91O\x1eC\xc0\xd2}hF\xf2\x0d2\x1b\xf1\x09\
+\x80\x8cU_A>]\x1f{\x14\x9f\xbe\xf2\xf5\x98+\
+\xcc\x8b\x00\xe8**H%\x9f\x90\x0aC\x02X\x15b\
+f\xc5)F\xff\x22F8\x84\xd4\xf9\xea\xba\xf8\xdd\x19\
+\x94\xe0\x89t>2\x19>\xf55\x11\xf3'\xc0\xcc\x8e\
+`&\xb7\xdc\xcc{\x9e\xc7\xd3\xf8\xcc\xa3\xef\x1f`m\
+\xd1\xc4\xe8w\x82\x9b\x09B\xffH\xd5\xbe\xd1\x86\xc2h\
+\xa3\x89\x03c\x0aR\x11\x14\x9a LAI\x80\x90\x84\
+\xa2N\x84\x8cH\xec\xe4\xf46\x13A\xca\x86\xa9&\x80\
+\x10!*\x10^\xb4q\x00\x85\x820;\x033@\xc0\
+\xf7\xef=\x84/\xfc\xe4 ZJ\x80\x84\x8b\xe4\xdc;\
+\xef\x0cb\xd8nF\x07\x8d\xfe\x05\x9c\x16\xfbZ\x0cp\
+S\xc0\x0a\x1b.A\xed\x1f\xf3\x85XY\x8a\xf3\x1ac\
+T\xf2\x98\x94\xc0D\x00!\x9b\xc5=\xd3\x90\xd5:\xda\
+\xd8\x86)\xa1\x91\xde\x14\x94\x8b/\x0a|dDG\x04\
+RV\x00J\x85\xe3\x85\xc6\xf8}KK\x12G1w\
+\x98\x17\x01p\xda\xea\xc5\x90S#\x87\x1e\x9d\xac?\xa1\
+T\xd7*G^s\x1cy\xbc\xec\x83\xca\xfb\xc0\xcb\x0a\
+\xd8\xe5\xbc\x04\x13T\xc25\x0f3\xf5:\xe6\x81\xa7\xb5\
+9\xcf\x9e\x86\x11\x90c\xcesP\x90\xf0\xfe{M\x22\
+\xe7\xc9/\xcf\xaa}z\xb6\x88\x90D\xdc1y\x05\x90\
+\x1c\xff\xe1\xe1\xd2#\xc34\x99\xc8AJbA5\xc2\
+9\xab\xfb\x10>0\x95\x84\x10\xfb\xf9\x93C\xf8\xf8\x0f\
+vc\xbcI\x08\x1d\xea\xcb\xed\xbf\xd1\xc6}{*;\
+\xbbZ\xfb\x9f\xe5\xe5\xf8\xe6\x13\x02\xe01\xa0\xd3+\xe7\
+\xa8p\x16l\xe3\xb8\xbdO\x8a\xe9\x11\x9c\x0f\xcdo\xf7\
+\xd8\xb3;\x8e\xd9\xa0\xa5*X\xb3&8\x97\x00\xc9\x91\
+\xa0a\xc6\xe0\x07\xedt\x0a\xa1\xe2\xa7\xbb\xba+O\x17\
+Ke\xcc\x07\xcc\xc3fB`\xa1\xdc\x87\x1bG\xce\x98\
+$\x85;\x00@\x91\x1b;\x85`'m\xce_\xfe\xf8\
+\xe8t\xb9\x82\x92\xa3\x82\xab\xfd\x8e\x11\x9a\x82\xf2^\xf1\
+\x81M\xb5\x0eo\x82\xf0\xf1\x9f\x11\x06\xc1\xf4<+k\
+\x93\xd1h\x14\x9c\x99\xdf\xd6k\xe75\xf37Xvh\
+G\x99\x1f\x13^\xb125I+S!'\xe2X\x01\
+\x1b\x17\x15\xb0r\xb0+(\xa4\x84\x00\x9e<8\x86\x8f\
+\xdd\xb0\x13\x87&T\x1a=\x88u\x22\xd3\x12\xab\xe1:\
+\x96\xbc\xd7wkb\xd8\x19\x91_*b7\x82\xb9\xf5\
+\xb8\xc7e\xc3m\xc8\xbb3\x90\xe0\x0b\x1d=\x97k}\
+\x8b\xb5\x98\x0f\x847(\xa10~n3\x09\x01\x0c\xa4\
+}\xcd\xc7\x9d\x8bEo\xb6\x01_\xa3\xd0M! n\
+\xdd~W\xefk\x8f\x97\xc6\x0fa>`^\x04\xc0\xff\
+\xbd\xearl\xa1\xa7\xb00j\xdd.\xa4\x9c\xe4\xfd1\
+D\xcfgn\xf2\x89\xc32F.\xaa\x9c3\x01l\xd0\
+\x142v>\xffa\xfd\x0e,M\x98^\xdcwy\x8e\
+?\xfe\xac\x98\x00b\xcc\xe4\x08:\x82k\xb1\xe84\xbe\
+\xb6\xc1\xbf\xf9\x02c&\xdc\xe4tB\xaf\xd3[\xcd+\
+\x99\xb5\xceX\xde\x8d\xeer\xe4l\x99\x07\x92\x99\xff\xe0\
+\xf1I|\xf4;\xdb\xf1\xd8P\x93]\x18\x92\xdb}\xf7\
+\xe6\x1e\xe5\xf1N\xfa\x8b{\xc7m\xf4Ge\xfa\x87\x00\
+\x93\x82\x13\xbey\xf2U*\xb0A\xa0 \x82\xf2\x86X\
+y\xbf\xf2\xf1\xe8\xdf\x89\xa0\xda\xa4m\xd3\x00\xc7\xfeW\
+\x0e]\xaa\x5c\xda\xb2\x84J\x00\xa4\x8c\xa7\xaa\xaau\xcb\
+\xe2\x9d\xdf\xc5-\xff\xebr\xcc\x07\xcc\x8b\x00\x00\x80\xd2\
+\xe0\x0a\xc4\xa5\xbe{c\xd5z\x90\xab\xfa|V\xd4\xbd\
+\xd5q,\xf4\x07G\x0d\xd6j_\xc8\x9er\x9e\x19\xae\
+\x02\xb2!c{\x04\x85D\x00\xf1\xed\xd2\x04\x99\x95\xab\
+\xd7p\x07\x9c7!O\x95\x0c\xd2\xad\xca\xa4\x0b\xc9#\
+G@\xb4\xa1c\x95\x16\xa2\x00D\xa4\xb0qiO\xe6\
+\x1c\x00\x110Vk\xe0\x13?\xd8\x89;vM\x9b\xb5\
+~\xdd'\x22\x17\xd7v\xb8\xec\x85%\xb9\x08S\x81w\
+\x19d\xf0\xef|fV\x9esNyE\xb9v8\xdf\
+]\x90\xf9\xec\x10\x88\xcaoJP\xf8;\x22-\xd0\x0f\
+\x7f\x06g}`\x9f\xdc\x98\x12\xa9Fb\x9c\xabVm\
+\xe5\xba\x1c@PD\x90\xad\xd6\xa3\xa3S\xf2\xe7Q\xa1\
+\x1b\xf3\x05\xf3&\x00\xba\x8f\xdd\x83'&K\xc7)n\
+~[J\x99\x0e#\xb9\x02\x90\xc8\xfef\xc8\xcd\x12o\
+\xc8\xdb\x86\xcc\x8c\xe5C\xc6\x9eo\xe3U\x08B\xc8\xae\
+\x9d!\xb3\xf2\x08\xd04\x84\xd3\x99\x82{\x97\xa1\xdb-\
+\xa7\xfd\x1cO\xbaL\xaeA9(H\xeb\x09\x05\xe0u\
+\xd8@iA\xa5@J\xa1X\x88`\xbc\xe5iu\xcd\
+8\xc6\x17o\xde\x89\x1b\x1e\x1aA\xa1\xc0\xee\xe6\xf3\xfb\
+\x95\x19\x07\x1b\x07\xd2\xd7rB*q\x18\xd1\x08ef\
+\x08\xc8\x0e\x92\xc3H,\xaf\x13@\xd5\xb3\x1a2j;\
+\xf1\xc3H*\x98\x8e\x9cw\xe4\xd5\x91\xd3^\xde!\xef\
+L\x02\x0f)F\x5c}54cC\xe0\x93}\x05\xa5\
+$\xa2\xb8\xfe\xbd\x83\xf5\x0b\x86\xcf[2\x8c\xf9\x829\
+\xef\x04\xd4\xb0\xf7\xae\x7f\xc5\xb23/F!\xae\x1f\x89\
+\xa3\xae\xdf\x12Qa\x90S\xbb\x9d\xc5\xd8\xff\x1d\x03>\
+\x84\xccY@[&\xb5\x12\x98#\xd3\xc17O\x1a\x12\
+\xea|B\x0a\x8c\xb9\xa3\xbc\xfai\x18\x83\xf2\xae\xb6;\
+\x0c\xa4}C\xa6\xca<\xcd\x81\xf1\x12\x8b\x0c\xe6\xb6K\
+\xbfg\xdb}[\x920X\x15\xf8\x8d-\x83(\xa4K\
+\x87\x8dV\x8c\x7f\xb8m7\xbex\xdb\x11(\x88\xa0\xb3\
+\x92\x17l\xe3\xdbq\x04ha\x9b\xd5,|\xa4r7\
+\x97_\xae\x8f\xd3\xd0p\xf2R\xc8\xab\x7f\xd64\xc4\xeb\
+\xf2h3[\xa1\xca\x9a\x99\xc1pd\xfe/\x87\xd5\xd3\
+\xba\xc8\x9ae3y\x89\x0db\x00\xc8\xf8\xc8\x00M|\
+dq\xd7\xdeC?\xbb\xfa\xcd\xb3\xeb\xe3,`^V\
+\x014l^Z\xc0u+\xae\xdd\xf1\xc2]\xef\xfeQ\
+\x83\x0a\xef\xe4N\x00\xc7\xfbJ\xa9\xd4\xe5\xb1\x99\x03\x0c\
+\xe8\xbe\xf2\x04\x05\xb3\xa1uL\xff p\x9f\xa1?#\
+ @.\xdc|\x81;sg\x0c}\x0f\x14cx\xc5\
+\x85\xbbW\x91\xf3l\x88I\xd9v\xe6k\xa7F#0\
+\x99\x15\xbc\xcbR\xbd\xba\xbc\xceF\x91\xc0\xf7\x1e\x1e\xc1\
+`\xf7vl\xdb\xb2\x10\x13\x8d\x18\xdf\xb9\xf7\x08\xbe\xff\
+\xf0\x08\x9a\x88 \xbc\xcau\xf3\xfcs3\xd9Hj\x94\
+}\x0c:\xcb\xb8^\xc6m\x8b\x1c{\xdf\xf5\x8b\x05q\
+n]{\xba\x1aB{$r\x95,'&5\x1f@\
+\xc7\x1c\xd1\xb4\xa72\x0ck\xfd\x0aY\xad\xc7\x0a\x98,\
+\xd5\xb9\xb1\x01y[l\xcb\xa8U\xfb\xce\x86\xe8\xe8\x83\
+\x87+\xab1\x9fp\x12Sn{\xd8\xf4_\xbe\x85\xae\
+r\xf1\xdc\xa3\xaa\xf7\xdbT,\xaf!\xc7\xfb\x97t'\
+/dg\x18\x82l\x1a\xe8\x09qj\x80C\x5c3a\
+\xc0c\xc2\x8c0\x0a|\x22 3\x9e\x0eM\xf8L\x9e\
+\xc1zJ\xb6yt\x9a\xd3\x86\xdc\xe7\xcc\xfb0\xde\x88\
+\x08\x12\x0a2V\xe8*\x12b\x05\xd4Z\xc9F\xa4\xbc\
+Q\xd1n;\xfd\x148\x808\xcb\xf1\x0a1G\xfb\xb4\
+~l>?O8J\xd0l\xc8:O\xf3\xccoc\
+vBj?\xd8vS\x93\xcdi\x84gH\x03\xf0{\
+\x91\xa6\x89[\xcd\xa1r}\xe4\xb5\xb1\xc2];\xbf\xf0\
+\x86Y\xf4m\xf60o>\x00\x0d\xc3\x07v\xe1\xf8\xdb\
+_wo\xab^\xfb\x8a\x92\x0a\xfa|6G6\xdf\xc5\
+\x95\xf5\xd9\xcd^4\xc0\xc9\xcb\x1cN\xc6p\xca\xa6s\
+\x8fx\xb0\xfc\xceR\x94\x97\xcfqd\xe64U\xb1f\
+\xf8B$h\x0a\xdbB\xb38`\xaai\xc0|\xc9t\
+\xdd\xe9\x07{\xc8h\xa2v\x93i!JN(6e\
+\x12Y\xa6\x9dH\xb6^\xfctF\xf2\xfct.2f\
+#\xacu\xf3\xc8Q\xfdC\xe5\xe427\xd7\xaer}\
+\x0d\x99\x9e\x84\x1b\x92\x8fQ\x96\xcf\x8bU\x981\xb8\xb2\
+\x83\xedh:\x8c\x1e\x15\xf9\x82\xc4\x0c\x0f{\x95\xd0c\
+,%\x10\xd7\xbe~\xc9\xe2\xe3\xbfZ?0\xef\xec:\
+\x7f>\x00\x0dS\x8f\xde\x84Au\x16*h>]\x17\
+\xe5\x97EB,w<\xfe3J>m\xdb\xf9\xd4;\
+KM\xc0\x81\x9cY\xd0\xe74\xc6\x90\x8e\x85\x1a\xf2\xf3\
+\xcch\xa8\xb6i\xebl\xb2:U\xe5\xb0e\x9e\xbf\x02\
+3\xbc\xf3\xf2\x19\xbfAn\x83\xb8\xa3!\xdcGK\xee\
+\xbezk\x7f\xeb-\xbe\xbe\xa5\x1d\x8e\xcdz\xb2Ji\
+\xc8Y3\x1b\x84\xf8\xcdu\xc7\x8e+\x93\xae\xf7\x823\
+\xbcV\x0f\xc3\xf5\x1a\x15?-\xc3^\xaf\xeai3\xec\
+\x87N\x13\xc7\x8d\xc7\x8a\xf5\xe1?\xddQ\xab\x1c\xbb\xe7\
+\xd3o<I\xdc\xe4\xc3\xfc\x8b\x14\x00\xd5\xc6\x18\x0eU\
+W\xed\xe9\xa2\xfa\xe7\xa4\x92\xb5\x8c\x0d7\xc3l\x9fL\
+\xc8\xee\xb2\xcbI\xe8\x05h\xc7)\x8eml\xbe\x04f\
+\x97L\x11*\x93\xcf-\xbe\x0d\x01\xb2\x19\xc0\xd4\xe3'\
+w\xde\xe5\xd8\x07\xed\xb4W\xb4a\xea\x80\xe2\x13\xe4\xed\
+\xd0l\x9e\xc3\xa8&e\xa6RN\xd8.\x91\x1brP\
+\xc1\x82\x03\x15\xce4\xfa!\x81\xcb\x97,\xf2\xca\x0e\xb8\
+\xfb\xb9s)m\xbb\xb9\xd5\x9a\xe7\xf7=\xbe\x19\x9af\
+>\x86L\xd9ni\x19\xe3!\xdd\xa1\x18K9\xadj\
+\xb5O\xedl\x9e\xba\xe3\xa2U\xbdx&`\xde}\x00\
+\x1a.\xfc\x1fw\xa0*\xa7*;\xc6\xd4gP\xaa\xbe\
+C\x87\x86\x0a\xda\x8fl\x16\xb6q\xde\x11\xe6_\x93\x87\
+\xd8V\xce\x13\xe8\xad\xe3\xcc\xf2\x03Nx~\x83\x00v\
+\x1c\x87\x8ds\xc2\xc7\xabf6\xbe\x07\x90\x15v\xe4\xb2\
+\x8cr\xfc\x19\xa1\xbc\x19\xe5%\xec\xf2\x08\xbe\x98\xc9\x8e\
+\x0f\x150\xb3\xbd:\x9b\xf2f\x9d\x0e\x9e30\xd0\x87\
+\xfc\xf6\xf2\x19\xdc\xdfI\x99\xaf\xa9\xcc\xd4\xbe|r\xcc\
+\xf3\x1b0\xc7Q\xc6Q4\x83\xd6\x00\xa0U\x9b\xbe\x06\
+\x13\x13\x7f\x8cj\xef\xf4\x81/l\x9b\x19i'\x01\xcf\
+\x98\x00\x00\x80\x0d\xff\xe5\xbb@\xab\xb9\xaaV\xed\xff\x7f\
+\xa2T\xd9*\x00\xbbs\xec\x84\x9d\x81\x1c5\xf0\x8eV\
+\xe6\x0c\x8e\xf32\xab\xda\x05;\xcf\xe9\xa3\xdd,\xdf\x8e\
+\x8agt\xd0\xe5\x17\xe9\xd3\x8a\x93\x17\x08\xf3#s\xfa\
+\xb5%\xe0\xe0\xb7\xd9\x9bV\x04@\xb5\xc5\x8b\xdb\x16\xaf\
+\x81\xe6\x9dv\xdcY#\xe2D\xc1s\xc72\xe1\x99\xc1\
+YF\xcbhS\x9fA\x90m\x99\xf2\xebj\x83\xaf\xac\
+\x93\x90\x8f\xa9\xcf\xf4\xf9\xe5(\x00\xadz\xfd\x9ebm\
+\xf4-\x13\xf5\xd6\x8ec\xff\xf8\x96\x93\xc0\xd1\xec\xe0\x19\
+1\x014\x0c\xdd|=j\xd5\xbe}]j\xfaC\xb2\
+\xd9\xdc\xa1\xd4\x891|>\x9am\xecv\x8e4\xfek\
+\xa6\xc0\x9b\x9c\xd1(o\x92\xc9m\x84\x0a8\xaf\xdc\xb4\
+\x19K@;\xf3\x1cU\xd1\xc5\x06Q\xa0P\xca\x96\xab\
+\xe9\x87\x14\xd8>\x01\xe6\xa0\xcb\x01\xc5\xf2;a\xc0\x02\
+Xl[H\xdeK\x95et\xbf\x13n\xbd\x94S\x94\
+\xab\x1e\xbb\xae\x18\x95y\x93,7*\xab\x99g\xca\xd2\
+j\xbc\xeb\x83\xc8t(pt\x94\x9fjiOR*\
+C\x83n]\xca\x7f\x11zLR\xc5\xf1P\xb99\xf9\
+\xa1\xddr`\xc7\xd65\xa5\x99\xc7d\x0e0\xefN@\
+\x0e\xf5\xa1\x07QYq\x0e6\x9e\xf7\xc2=cG\x0f\
+\xef!Qx\xb5\x22Q\xe1\xb3x\xf2wVs\xf3\x8c\
+\xdf\xb3v\xa8\x9d\x15O\xde)w\xa2\xceG\x95\xd1N\
+x\xfb\xdcc\xd1Y\xe54\xd7\xe7\xd9\xde\x19\xee>\x84\
+Mq\xfb\x1c\xd4,\x98j\xea\xab\xd0Fr\xe4\xf5\xd9\
+\xad0\xe8SP\xc8Mc]\x85\xe9\x17j\x83\x17\xb7\
+\xd1\xb9\xb8\xb4\xaf\xf2f\xdbYj\x05\xc1\x99\xc0\xd6\x9f\
+\xd5b<\xc7N\xa6i\xbe\xf0bj\x1f\x11\xe2V<\
+\xd6\x85\xfa\x87?\xf9\xcaU\xdf*\x16I}\xeb\x03\xcf\
+\x8c\xea\xaf\xe1\x19\x15\x00\x000\xf5\xd8\xbf\xe1\xc2\x97\xbe\
+\x02oX3\xfa\xd4\x03C\xc5\xd1\xa6\x8a\xb6BDe\
+\x1dnJ\xa3\xc2\x9aC\xd9\xc1pO\xf4\xe5\x88\x8a\x1c\
+\x1b\xa0\xbd\xda\xeb\x12\x81\xa9\x86\xb2\xe5\xcc\x1ehV\xaf\
+\xb8\xf6\xe1\xe2\x81\xddY\x17\xa2\xab@1\x19\xc5\xe1\x04\
+\xb5j\x13\xdc\x93`v\x0dj\xa6\xb4\xeak\x08\x7f\xfe\
+s\xbe\xdao\xc7\xceu\x08\xda\xbf\xf9\xf1\xfe\xc3\xb9\xda\
+ %\xd3\xd6\x10R\xb2\xbaE\x107N:\x95\xc9\x9f\
+=\xf7\x9a\x87#\x9d\xc6\xf3?0\x9c4[r\xac9\
+1v\xd5\xda\xa1\xbb\xfe\xee\x07OM\xc8\x9f|\xe2u\
+x\xa6\xe1\x19\x17\x00\x00\xf0\xc8\xcd\xd7\xe1\xe0\x86\xb7\xa8\
+%\xcd\xdd\xf7N\x8a\xfe\x11\x89h+H\x94\x13Bk\
+3\xc3R\x1e\x22\xd9g\x07\x02is\x0c\xfd\x8c\xb0\xc9\
+\xb5\x19\xda\x10X`7\x18/\xce\x99\x84xq\x8e\x19\
+\xe0\xcdvd\x99\xdf\xf1qP\xa0\xac\x9c:O\x0c\xf2\
+m[b\xac\xd9\x1e'aa\x10\x9a\xe7\xdba\xb5\x1d\
+;g\xd5vr\xf2p\xf3 l\xd2\xe4\xa9V\xa1\xd6\
+p\x15\xdez\xf1\xc9\xabm\xf6\xe8m\xa3\x9a\xa5\xdf\x1b\
+\x8dxlzb\xec\xaa\x89G\xef\xfc\xd2\xe1\xea\xba\xf8\
+\xe0\xd7\xdf>\xfb:\xe6\x00\xcf\x8a\x00\x00\x80#\xbf\xb8\
+\x1e\xeb~\xf3\x8f\xd4\x96\xea\xc4\xbd\xe3\xb2<4\xd5R\
+\xcf\x87\x88\xfafv\xb0d\x07.\xf9\xe5\xa5\x9dQ\xdd\
+sufwFaO\xb32\x0b\xbc\xc4\xed\x92\x84^\
+\xa8P\xfe\x802I^\xb7x\x8b)[\x07\x91]b\
+$\xef/B\xcf\x8eDq\xf1\xac\xb5\x11WU\x0d+\
+\xbb\xa6\xadm%\x14\xb7\xbf\xf3\x1d,Y\xf6\xca\x9b\x00\
+\xecX\xbb\xab\x1fm\xd4q\x84\xc2\x8c\xb7\x1fC\x8d\x09\
+\x0a\xbc\x9b\xb5 \xc8 \x9d=\x0b\x01\xd9\x8a\xc7\x9a\x93\
+\xe3W\x1d\xfb\xe5O\xbfT]\xb66\x9e\xfc\xf6;f\
+W\xee<\xc0\xb3&\x00\x00`\xd7\x1d\xdf\xc0\xa6\x0b^\
+\xab~r\xf3\xef\xdc\xdb\xbb\xf4\x81\x07Q(\x9c\x0f\x11\
+-\x16\x0e;\xce\xa4\x8e\xb9\x9bJ\x12\x088\x86\x02\xb9\
+\xf3A\xb5)\xef\xe4\xa1]\xdc\xfa\xec\xe1\x9d\xb0\xee\x1b\
+\xde,\x13\xeeQ\xfe\x91\x5c\xca\xcdc\xd3\xe8V\xe4\x5c\
+\xab=\xa3\xb0S&o\x88\xad\x13eN\x0b\x11\xab\x1d\
+\x84\xaa\xe2\xe5\x85\xed\xed\xb0\xa6\x92\xe7\x7fp\x19\xb6\xdd\
+\x0a\x85b\xa5\x10+\x8fL\xdd\xc4~\xf3\xfc\x94\xd3\xb2\
+\xf0\x0c\xa0q!\xd0l4v\x96[\xd3\xef;\xadk\
+\xe2\x9a\xae\xd5\xeb\xe3\xfd\xd7\xbc\x15\xcf&<\xa3\xab\x00\
+!\xb8\xfe/\xaf\xc0\x1f^\xf6/\xd8\xff7\xb7\xfc\xb8\
+\xd0<\xfe;\xb2^\xfbN,UK\xa3\xd1?k\xcd\
+\x87B\x997\x1c\xaf\xf9\x0e\x9e<\xb2\x0f\xcf;hG\
+\x8d'\xf3:\xd7#o\x02|(+\x0cx\x5c\xcb\x19\
+\x15M\xa6=\xfa\xbff\xdaY\x97\xbb\xf5*\xe4\x0c\x9f\
+%\xf8\xbb\xe4r\xb7\xde\x90e\xc5t\x91\xcc\xfa\xce\xbd\
+\xcdV\x84\x5c1\x92\xe9[\xc8\xff\xceu\xc5\xb0\xed\xe4\
+k!\xe1\xf5\xd5\xbc\x9d&\x5cdj\xba\xf5\xe2\xf7\xb0\
+\x14\xd9\x99_\x01h6jw\xa8\xda\xf8\xef\xff\xe6\x87\
+_s\xed\xad\xbf\xd8\xddz\xe4\xb3o81\xc4\xcf\x03\
+\xcc}\x9a;I\xf8\xf8_\xfd\x1f|\xec\x81\xe5XW\
+\x9d\x1e\xa8u\xf5\xbf\x87\x0a\xd5wE\x85\xc2\xe2<f\
+\x0d\x13\xd5\xcc7\xc7\xb8a\x98)X\xca\x89\xbd\xf7\x1a\
+\xc7\x9c\xb8\xf9K\x93\xb0jjv\xc2\x81Ue\xd9K\
+\x95;\xf1gL\x820\xcc\x8f\x16\x93\xebW\xf1\xcck\
+\x82\xc55\xa1\xfd~\x81\xb6\xcd\x9f\xb1o\xb3a\xdcY\
+\x14\xe9\xacz\x84\xf3\xdb\xaf\xbe\xd3x&\xbf\x10\x02\xe9\
+l^)\xe5\xb4lN_Sl\x8c\xffEe\xc1\xb2\
+}O~\xe7\x8b\x90\x0f\xcf\xed\x82\x8f\x93\x85_\x9b\x00\
+\xd0\xb0\xf5\xbf}\x03\xd1\xe4P\xb4\xbf\xbcnk\x9d\x8a\
+\xefC\xb1\xba\x0dB\x14\x89\x1d\x93\xe3\xa1\xa2\xf3:\xe1\
+3[\xc2@\xb3\xddl4C\xbavR\xc8G$\xc1\
+\xf1\x0d\xaa\x00\xc3\x87\x082W\xc3\xe633\xc1\x9e\x1e\
+\x0c\xf8\x002{^\xda!*\xe0WP\xc8\x7f\x9e\x09\
+-\xdag`vr\x06\xda\xe2\xde\x1b`\x97K\xc9+\
+tv\xd7\x80\x9f\x08\xe9\xe6\xed\x9e\xca\x1fX\x97\x1e\xc2\
+\x1b\x83\xb24\xa32e\xf0i*\x96J\xa9f\xfd\xfe\
+\x0a5>\xb3\xa6\xbbv\xfdX\xab4\xfd\xab\xab_{\
+\x02\xfd\x98\x7fxV}\x00!\xd8\xf3\xf3\xeb\xf1\x1b/\
+|\x81:<x\xde\xae\xfe\xc6\xd1\xef5Z\xcd]\x8d\
+\x18\xcb\x88\xa2\xa5D$\x92u\xf5Y\x14D\xb3\xf8\xe8\
+Od\x14\xf8>c]'\xb0sn\xd6>\xa2\xc0Z\
+\x08\xd3\x8c\xcd\x8c\xda\xae\x8ev\xc2i\x16\xed\xf0M\x0f\
+\xbe\xf4\xcf\x97\x19}'\xa5cY\x07\xc2\x8c\x85\xeav\
+\x8c\xb8\x5c\xbf\x85M\x9dg\x0c\xcc\xdea\xc8k\x0e\xf9\
+\x8bBN:\xc5\x92\xfa\x8eE\x04\x9eU\xa6\xfa\xe4\xc2\
+\x11\x82TR\xb5\x9a\xcd\xa7\x0b\xcd\xa9\xcf/\xc4\xc4\x07\
+\xa6\x96\xbf\xe8\xf6\xcd\x07\xbe\xdb\xfa\xb7\xcf\xfc\xf1\xcc\x03\
+\xf3\x0c\xc3\xaf]\x03\xe0\xf0\xbb\x7f\xf4~|\xb3\xebS\
+X9\xf6\xb5\xc5\xaa\xba\xe0\xf5\x85R\xf9m(\x94\x9f\
+\x0fAEb\xae^\xaer'\xe0Ks\xcay\x97\xe6\
+\xd7\x84\xabf\x9a\x07r\x90\xc6\xb0\xa60s\xe6\x8c6\
+\x90\xf3m&\x17\x84\xef\x94\xf7_\xe6\xcd\xdam\xfb\xc7\
+\xd4wn7\xab6\xe5\xe5\xe1\xd9\xde\xea\xeb\xce\xee\xfe\
+,\x19\xd6\xb6B#\xa1\xcb\x8598d\xc3wdW\
+M\xbc\xbdF\xae\xa3\xc5{\x1d\x1a\x07\xad\xb5\xb8\xaa?\
+\xcf\xc5\xf1\x9c\x15R*\x1d\x98$\xe6\x02\x00)\xa5l\
+5v6\x1b\xcdkem\xfck\xcf\x9f\xbc\xfd\xe9#\
+b\xb9\xba\xff\xeb\xff\x1d\xcf\x15xN\x09\x00\x0d\xefy\
+\xffU\xf8\xdc\xcb>\x81\x97\xde\xfe\xed\xc5\x07\xa7\xa3\x97\
+N\xa1\xf4\xdbQ\xa9\xb2\x0d\xa0\xa5 *\xe80W*\
+\x87`,x\x03\x98\xe1\x5cw\xbd\xd7}\xe3!J\x13\
+!yD\x14Xj\x0ez\x14\x94\xeb\x93\xf0\x09N\x17\
+\xd5\xee,\x92\x1bp\xc42*R\xd3@\xab\xd6~c\
+\x88\xb53l\x01\xe4\xf6\xda\xb4\xd56\x10\x8ey\xc5\x05\
+1\xd7\x1c\x94\x17\x06\xc9\xb7\xa7\xdb\x1bu~\x1br\x98\
+-kHA\xdf\x8f\x90\x085\xe6\xd5\xb7\x1c\x9a\xe6\xb4\
+L\xcd#TPF\x00\xce\xd6\x10Br\x05\xba\x8c\x95\
+\x94\xf28\xc5\xcd\xfb\x11\xd7\xaf\xef\x8d\xc7~\xd4s\xf4\
+\x81\x9d\xcdR\x9f\xba\xff\xda\x8f\xcc\xaa\xc7\xcf&<'\
+\x05\x00\x87\xd7\x5c\xfdS\xd0\xe4\xe1\xe2\xd1\xb8\xe7\x94\xa1\
+\xc9\xd6\xf3\xa9P~y,\xc4y\x92\x8a\xab\x05\xd4\x02\
+I\xa2\x90\xdc;\xcd\x96\xa0\x94\xca0\x91\xd5\xe6\xc8\x10\
+0\x9f\x8df\x83\x08\xb7\x0c\xc5\x98\x81#\x94\x1b\xfb\xee\
+i\xbf\xb0g,o~\xe6\x06?\x7f\xcd$Qj\x1e\
+\xd9\xa0\x18!\x15\xc3{}\x92\xbe\xc1\xcc\xc6$`\x96\
+\x0c\xac\xeb\xf5\x040{\xad\x1b\xe6\x9b\x10!\x8d'\x1b\
+<\xc4[\x12\x99\xc1_9C#=\xd1\x14\x9e`T\
+\xaaY\x10\x14\xa4\x94\xb1 \x9a\x8e\xa5\xdc+Z\xb5\x07\
+\x15\xd1\xddQs\xf2\xb6j\xab\xf6\xd8\xa3W\xfc\xe5\xe4\
+\x17\xef~\x17\xfe\xe4=\x7fx\xe2\x08\x7f\x96\xe09/\
+\x008\x5c\xf0\xfaw\xe1\xf2\xad\xab\xc5gG^\xda_\
+\x9c\x1a[\xde\xac\x8d\xacU\xe5\x81M#5\xb9`I\
+\x8f8\xad\xd9j\x0eL\xb7\xa0b\x99\x5c\xe7\x9ct\xd0\
+u\xdd\xe8;\xee\x94L\x97k\xf2x\x92;\xf2\xcc4\
+\xc7\x9dAd\xd4=\x13\xc6\xdc\xb7\x89\xa1\xaf\xbfT\x10\
+$R\x8d4!\x1cM\xec\x92\x9b5\xb0u\x98\x90\xd1\
+\x8e\xfa\xc99P\x00J:\xf6\xb7J\xed\x9aDn\xb0\
+\x8bW\x8dJ\xee:\xb3\xf8l\xc7\x89\xdd\x0d\xa9\xa7\x00\
+e\xb7Ts\xbf\x89R\xd2\x06-1\xb8`\xa0\xd5\x01\
+ m+9\x97\xc6\x80\xec-\xc3\xf6\x9e\x04\xbb\xac\xe2\
+\xf7\x5c\x0b\xf7\x04\xf5\xccn\xa7\x80dR\xdaw\xc4\xc2\
+r)\xde$\x17\x9f\x1a\xff\x04\x95.\xd3\x12\xa3\x83\xe4\
+\xb7\x10\x84JA\xa0\xb7RP#\x93\xad'#A\xc7\
+\xa3\xb8\xf1TO!\xde{\x98\x96l\xdf<\xfc\xd3\xa3\
+7\x7f\xe8y\xad\xcf\x5c\xbf\x07\x7fv\xd5;\x9f-\xb6\
+\x98\x13\xfc\xbb\x12\x00!\x18y\xe0\x16\xf4\x9f}:\xee\
+\xbb\xe1\x96\xc2?\xfe\xf8>\xfa\xfe\xa3\xe380\xde@\
+cz\x1cD\x02J\xb2\x9eF\x04DEP\x04\xa8\x18\
+@\xdcB\xb2\x15B\xa5\x0c\x1e\x03\x10\x10\x91\x9dU\x04\
+\x15@$\xd0l\xd4A\xa4R\x86\xa5$\x9fR\xa0H\
+\x19b$\x95\x84C\xd7EBPr\x15\x8f\x1207\
+\xebF\x0a*n%E\xc4*IK\x04\xc4\x04\x08\x01\
+2\x99c\xa8X\x01T\x00$@\x22\x06Dz\xfd\x17\
+\x04\x00\x09\xc4\x12h\x09P\xb1\x00\xa1$$b(\xc4\
+ \x11\xa5w\xce\x17A*\x99\xd3$\xa5\xdfT\x11\x11\
+\x80X\xb6\x00(PT\x81\xa2&\x84(\x80$\xa1\xa5\
+$\xa0$\xd0\x8a\x81\x02@\xa2\x00\xc4\x12J\x00\x14\xc7\
+\x09\x93S)e\xde\x16H*\x90\x00\xd0\x94P\x85\x02\
+\xa8 \x00\xd9\x82\x82\x00\xb5\x00\x19\x09@H\x90L5\
+!\x99\xe0O\x14#(\x15\x03R\x00BA\x08\x01%\
+#(\xd5\x02(\x06T\x04\x15\x09\xa0U\x03H\x80\x84\
+\x00)J\x04\xbb\x8aAQ\x82\x17%%@\x12D\x11\
+ \xa2D\xb0\xab\x16H\xe9\xeb\xd2\xf4@\x02J\x09 \
+*@H\x09\x09\x01Rq\x22\x17\xe2\x16\x04\x04\x0a\x8a\
+\xd0B\x03\xa2\x5cJ\xee\x5c$@6\x12\x1a)\x16+\
+X\xd4\x1b\xe1\xc5[\x16\xe1\xed\x97\x9c\x83\x17lZ\xd1\
+j\xc5R->\xe37\x7f\xdd,\xd0\x81\x0et\xa0\x03\
+\x1d\xe8@\x07:\xd0\x81\x0et\xa0\x03\x1d\xe8@\x07:\
+\xd0\x81\x0et\xa0\x03\x1d\xe8@\x07:\xd0\x81\x0et\xa0\
+\x03\x1d\xe8@\x07:\xd0\x81\x0et\xa0\x03\x1d\xe8@\x07\
+:\xd0\x81\x0et\xa0\x03\x1d\xe8@\x07:\xd0\x81\x0et\
+\xa0\x03\x1d\xe8@\x07:\xd0\x81\x0et\xa0\x03\x1d\xe8@\
+\x07:\xd0\x81\x0et\xa0\x03\x1d\xe8@\x07\xfe\xdd\xc3\xff\
+\x07N\x17\x112\x14\xa4\x84\xa5\x00\x00\x00%tEX\
+tdate:create\x00202\
+5-11-24T01:02:00\
++00:00,\xfe\xff\xd4\x00\x00\x00%tE\
+Xtdate:modify\x0020\
+25-11-24T01:02:0\
+0+00:00]\xa3Gh\x00\x00\x00(t\
+EXtdate:timestam\
+p\x002025-11-24T01:\
+02:00+00:00\x0a\xb6f\xb7\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x07\
+\x08sW\x87\
+\x00a\
+\x00p\x00p\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9a\xb86B8\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,83 @@
+import os
+import re
+import time
+from typing import NamedTuple
+
+SAVE_RE = re.compile(r"([a-f0-9]+)(?:_\d+)?\.save$")
+
+# Directory mtimes have a coarse resolution on some filesystems. While the folder
+# was touched within this window a cached listing may miss a same-tick change.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class SaveFile(NamedTuple):
+    name: str
+    path: str
+    base: str | None
+    mtime: float
+    size: int
+
+
+class SaveIndex:
+    """
+    Cached listing of a DBE_Production folder, grouped by account base name.
+
+    The folder is read with one os.scandir pass; every entry keeps its stat
+    result and base name. The listing is rebuilt only when the directory mtime
+    changes, so repeated queries cost a single stat call.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files = {}
+        self.by_base = {}
+        self._dir_mtime_ns = None
+
+    def refresh(self, force: bool = False) -> "SaveIndex":
+        try:
+            dir_mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            self.files, self.by_base, self._dir_mtime_ns = {}, {}, None
+            return self
+
+        racy = time.time_ns() - dir_mtime_ns < RACY_WINDOW_NS
+        if force or racy or dir_mtime_ns != self._dir_mtime_ns:
+            self._rebuild()
+            self._dir_mtime_ns = dir_mtime_ns
+        return self
+
+    def _rebuild(self):
+        files = {}
+        by_base = {}
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.name.endswith(".save"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                match = SAVE_RE.match(entry.name)
+                base = match.group(1) if match else None
+                save = SaveFile(entry.name, entry.path, base, st.st_mtime, st.st_size)
+                files[entry.name] = save
+                if base:
+                    by_base.setdefault(base, []).append(save)
+        self.files = files
+        self.by_base = by_base
+
+    def bases(self) -> set:
+        return set(self.by_base)
+
+    def files_for(self, base: str) -> list:
+        """All save files of one account base, newest first."""
+        return sorted(self.by_base.get(base, []), key=lambda f: f.mtime, reverse=True)
+
+    def newest(self, saves=None) -> SaveFile | None:
+        saves = self.files.values() if saves is None else saves
+        return max(saves, key=lambda f: f.mtime, default=None)
+
+    def __len__(self):
+        return len(self.files)
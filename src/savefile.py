@@ -0,0 +1,287 @@
+import mmap
+import os
+import struct
+
+# Top level property names are sorted into these sections by keyword.
+SECTIONS = {
+    "keybindings": ("binding", "bind", "input", "controller", "key"),
+    "camera": ("camera", "fov", "stiffness", "swivel"),
+    "video": ("video", "resolution", "graphics", "fps", "vsync", "window", "render"),
+    "audio": ("audio", "volume", "sound", "music", "voice"),
+}
+
+MAX_NAME_LENGTH = 256
+_PROPERTY_MARKER = b"Property\x00"
+_INT32 = struct.Struct("<i")
+
+
+def section_for(name: str) -> str:
+    lower = name.lower()
+    for section, keywords in SECTIONS.items():
+        if any(k in lower for k in keywords):
+            return section
+    return "other"
+
+
+class Property:
+    """
+    One serialized Unreal property tag. Only the header is decoded up front; the
+    value is a memoryview slice into the mapped file and decoded on access.
+    """
+
+    __slots__ = ("save", "name", "type", "struct_name", "offset", "value_start", "value_end", "bool_value")
+
+    def __init__(self, save, name, type_, struct_name, offset, value_start, value_end, bool_value=None):
+        self.save = save
+        self.name = name
+        self.type = type_
+        self.struct_name = struct_name
+        self.offset = offset
+        self.value_start = value_start
+        self.value_end = value_end
+        self.bool_value = bool_value
+
+    @property
+    def raw(self) -> memoryview:
+        return self.save.view[self.value_start:self.value_end]
+
+    @property
+    def value(self):
+        raw = self.raw
+        if self.type == "BoolProperty":
+            return self.bool_value
+        if self.type == "IntProperty" and len(raw) == 4:
+            return struct.unpack_from("<i", raw)[0]
+        if self.type == "FloatProperty" and len(raw) == 4:
+            return round(struct.unpack_from("<f", raw)[0], 6)
+        if self.type in ("StrProperty", "NameProperty") and len(raw) >= 4:
+            text = self.save.read_fstring(self.value_start)
+            return text[0] if text else None
+        if self.type in ("StructProperty", "ArrayProperty"):
+            children = self.children()
+            if children:
+                return {child.name: child.value for child in children}
+        return bytes(raw).hex() if len(raw) <= 16 else f"<{len(raw)} bytes>"
+
+    def children(self) -> list:
+        """Nested properties of struct or array values, if the value is a property stream."""
+        start = self.value_start
+        if self.type == "ArrayProperty":
+            start += 4  # element count
+        return list(self.save.iter_properties(start, self.value_end, probe=True))
+
+
+class SaveFile:
+    """
+    Read-only, memory-mapped view of a Rocket League .save file.
+
+    Top level properties are located lazily by walking the Unreal property tag
+    stream (Name, Type, Size, ArrayIndex, value ...) with memoryview slices, so
+    nothing but the touched headers is read. Files that don't contain such a
+    stream are reported as opaque.
+
+    Saves written by the game are expected to be encrypted, and nothing here decrypts
+    them, so those are opaque: inspect only reports their size, diff compares them
+    block by block and validate_save can't check them. The property decoding
+    applies to unencrypted saves, e.g. ones dumped by save editors.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.view = memoryview(self._mmap) if self._mmap else memoryview(b"")
+        self.size = size
+        self._start = None
+        self._scanned = False
+        self.truncated = False
+
+    def close(self):
+        self.view.release()
+        if self._mmap:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Low level decoding ---
+    def read_fstring(self, pos: int) -> tuple[str, int] | None:
+        """Decodes an Unreal FString at pos. Returns (text, end) or None."""
+        if pos < 0 or pos + 4 > self.size:
+            return None
+        length = _INT32.unpack_from(self.view, pos)[0]
+        if length == 0 or abs(length) > MAX_NAME_LENGTH:
+            return None
+        start = pos + 4
+        if length > 0:
+            end = start + length
+            if end > self.size or self.view[end - 1] != 0:
+                return None
+            try:
+                text = bytes(self.view[start:end - 1]).decode("ascii")
+            except UnicodeDecodeError:
+                return None
+        else:
+            end = start - length * 2
+            if end > self.size:
+                return None
+            try:
+                text = bytes(self.view[start:end - 2]).decode("utf-16-le")
+            except UnicodeDecodeError:
+                return None
+        if not text.isprintable():
+            return None
+        return text, end
+
+    def read_tag(self, pos: int, limit: int) -> tuple[Property | None, int] | None:
+        """Decodes the property tag at pos. Returns (property or None for the 'None' terminator, next position)."""
+        name = self.read_fstring(pos)
+        if name is None:
+            return None
+        if name[0] == "None":
+            return None, name[1]
+        type_ = self.read_fstring(name[1])
+        if type_ is None or not type_[0].endswith("Property"):
+            return None
+        cursor = type_[1]
+        if cursor + 8 > limit:
+            return None
+        size = _INT32.unpack_from(self.view, cursor)[0]
+        cursor += 8  # Size + ArrayIndex
+        struct_name = None
+        bool_value = None
+        if type_[0] == "StructProperty":
+            struct_tag = self.read_fstring(cursor)
+            if struct_tag is None:
+                return None
+            struct_name, cursor = struct_tag
+        elif type_[0] == "BoolProperty":
+            if cursor >= limit:
+                return None
+            bool_value = bool(self.view[cursor])
+            cursor += 1
+        elif type_[0] == "ByteProperty":
+            enum_tag = self.read_fstring(cursor)
+            if enum_tag is not None:
+                cursor = enum_tag[1]
+        if size < 0 or cursor + size > limit:
+            return None
+        prop = Property(self, name[0], type_[0], struct_name, pos, cursor, cursor + size, bool_value)
+        return prop, cursor + size
+
+    def _find_stream_start(self) -> int | None:
+        # The first type name ("...Property") anchors the stream; walk back to its name tag.
+        hit = self._mmap.find(_PROPERTY_MARKER) if self._mmap else -1
+        while hit != -1:
+            type_end = hit + len(_PROPERTY_MARKER)
+            for type_start in range(type_end - 1, max(type_end - MAX_NAME_LENGTH, 4) - 1, -1):
+                if _INT32.unpack_from(self.view, type_start - 4)[0] == type_end - type_start:
+                    for name_start in range(type_start - 5, max(type_start - 4 - MAX_NAME_LENGTH, 4) - 1, -1):
+                        if _INT32.unpack_from(self.view, name_start - 4)[0] == type_start - 4 - name_start:
+                            if self.read_tag(name_start - 4, self.size):
+                                return name_start - 4
+                    break
+            hit = self._mmap.find(_PROPERTY_MARKER, type_end)
+        return None
+
+    # --- Public API ---
+    @property
+    def is_opaque(self) -> bool:
+        if not self._scanned:
+            self._start = self._find_stream_start()
+            self._scanned = True
+        return self._start is None
+
+    def iter_properties(self, start: int | None = None, limit: int | None = None, probe: bool = False):
+        """Lazily yields the properties of the stream starting at start (default: top level)."""
+        if start is None:
+            if self.is_opaque:
+                return
+            start = self._start
+        limit = self.size if limit is None else limit
+        pos = start
+        while pos < limit:
+            tag = self.read_tag(pos, limit)
+            if tag is None:
+                if not probe:
+                    self.truncated = True
+                return
+            prop, pos = tag
+            if prop is None:
+                return
+            yield prop
+
+    def sections(self) -> dict:
+        result = {}
+        for prop in self.iter_properties():
+            result.setdefault(section_for(prop.name), []).append(prop)
+        return result
+
+
+def inspect_save(path: str) -> dict:
+    """Section -> {property name: decoded value} for one save file."""
+    with SaveFile(path) as save:
+        if save.is_opaque:
+            return {"opaque": True, "size": save.size,
+                    "note": "No readable property stream, the file is probably encrypted."}
+        result = {section: {p.name: p.value for p in props} for section, props in save.sections().items()}
+        result["truncated"] = save.truncated
+        return result
+
+
+def _keyed(save: SaveFile) -> dict:
+    # Static arrays repeat the same name, so key by (name, occurrence).
+    seen = {}
+    result = {}
+    for prop in save.iter_properties():
+        index = seen[prop.name] = seen.get(prop.name, -1) + 1
+        result[(prop.name, index)] = prop
+    return result
+
+
+def diff_saves(path_a: str, path_b: str, block_size: int = 4096) -> dict:
+    """
+    Section -> names of properties that differ between two saves. Values are compared
+    as memoryview slices of both mappings, without copying them. Opaque files are
+    compared block by block instead.
+    """
+    with SaveFile(path_a) as a, SaveFile(path_b) as b:
+        if a.is_opaque or b.is_opaque:
+            blocks = max(a.size, b.size) // block_size + 1
+            changed = [i for i in range(blocks)
+                       if a.view[i * block_size:(i + 1) * block_size] != b.view[i * block_size:(i + 1) * block_size]]
+            return {"opaque": True, "changed_blocks": changed, "block_size": block_size}
+
+        props_a, props_b = _keyed(a), _keyed(b)
+        result = {}
+        for key in props_a.keys() | props_b.keys():
+            pa, pb = props_a.get(key), props_b.get(key)
+            if pa is not None and pb is not None and pa.type == pb.type and pa.bool_value == pb.bool_value \
+                    and pa.raw == pb.raw:
+                continue
+            name = key[0]
+            result.setdefault(section_for(name), []).append(name)
+        return {section: sorted(set(names)) for section, names in result.items()}
+
+
+def validate_save(path: str) -> str | None:
+    """
+    Returns an error text if the save is empty or its property stream is cut off,
+    None otherwise. Opaque (encrypted) saves pass unchecked; for backups the
+    checksum manifest is what catches damaged files.
+    """
+    with SaveFile(path) as save:
+        if save.size == 0:
+            return f"{os.path.basename(path)} is empty"
+        if save.is_opaque:
+            return None
+        for _ in save.iter_properties():
+            pass
+        if save.truncated:
+            return f"{os.path.basename(path)} looks truncated or corrupt"
+        return None
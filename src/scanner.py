@@ -0,0 +1,171 @@
+import heapq
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+SLOTS = ("Steam_exe", "Epic_exe", "Steam_folder", "Epic_folder")
+
+EXCLUDED_DIRS = {"onedrive", "$recycle.bin", "system volume information", "$windows.~bt", "$windows.~ws",
+                 "winsxs", "node_modules", ".git"}
+
+# Directory name -> how strongly it points towards the exe or save folders. Bonuses add
+# up along a path, so Documents/My Games/Rocket League is visited long before filler
+# directories of the same depth.
+PRIORITY_HINTS = {
+    "steamapps": 8, "steamlibrary": 8, "steam": 6, "epic games": 8, "epicgames": 8,
+    "rocketleague": 8, "rocket league": 8, "tagame": 8, "savedata": 6, "savedataepic": 6,
+    "my games": 8, "common": 2, "binaries": 2, "win64": 2, "compatdata": 4, "252950": 8, "pfx": 4,
+    "drive_c": 4, "documents": 5, "users": 4, "home": 4, "program files": 3, "program files (x86)": 3,
+    "games": 4, "heroic": 4,
+}
+
+# Trees that practically never hold the targets: visited last and only this many levels deep
+LOW_PRIORITY_DIRS = {"windows", "programdata", "appdata", "$windows.old", "windows.old", "cache", ".cache",
+                     "caches", "temp", "tmp", "packages", "site-packages", "__pycache__", "proc", "sys", "usr"}
+LOW_PRIORITY_PENALTY = 100
+LOW_PRIORITY_DEPTH = 3
+
+SAVE_FOLDER_NAME = "dbe_production"
+EXE_NAME = "rocketleague.exe"
+
+
+def classify_save_folder(parts_lower) -> str | None:
+    if "savedataepic" in parts_lower:
+        return "Epic_folder"
+    if "savedata" in parts_lower:
+        return "Steam_folder"
+    return None
+
+
+def classify_exe(parts_lower) -> str | None:
+    if "steamapps" in parts_lower or "steam" in parts_lower:
+        return "Steam_exe"
+    if "epic games" in parts_lower or "epicgames" in parts_lower:
+        return "Epic_exe"
+    return None
+
+
+def _lower_parts(path: str) -> tuple:
+    return tuple(p.lower() for p in path.split(os.sep) if p)
+
+
+def directory_priority(name_lower: str, hints=PRIORITY_HINTS) -> int:
+    """Bonus of a directory name; 'SteamLibrary2' or 'D:/Games/Steam' style names count too."""
+    bonus = hints.get(name_lower, 0)
+    if not bonus and ("steam" in name_lower or "epic" in name_lower or "rocket" in name_lower):
+        bonus = 3
+    return bonus
+
+
+class DriveScanner:
+    """
+    Single-pass, multi-threaded, best-first search for the Rocket League exe and save folders.
+
+    Every root is walked once with os.scandir, looking for both targets at the
+    same time. Within a root the directory with the lowest cost is entered next:
+    one per level of depth, minus the PRIORITY_HINTS bonuses along its path, plus
+    a penalty inside LOW_PRIORITY_DIRS, which are also cut off after
+    low_priority_depth levels. Excluded directories and anything deeper than
+    max_depth are never entered. Roots are scanned in parallel and all workers
+    stop as soon as every requested slot is filled or cancel_event is set.
+    """
+
+    def __init__(self, roots, slots=SLOTS, excluded=EXCLUDED_DIRS, max_workers: int | None = None,
+                 hints=PRIORITY_HINTS, low_priority=LOW_PRIORITY_DIRS, low_priority_depth: int = LOW_PRIORITY_DEPTH,
+                 max_depth: int | None = None, cancel_event=None):
+        self.roots = list(dict.fromkeys(os.path.normcase(os.path.abspath(r)) for r in roots))
+        self.wanted = set(slots)
+        self.excluded = {e.lower() for e in excluded}
+        self.hints = {h.lower(): bonus for h, bonus in hints.items()}
+        self.low_priority = {d.lower() for d in low_priority}
+        self.low_priority_depth = low_priority_depth
+        self.max_depth = max_depth
+        self.max_workers = max_workers or max(1, min(len(self.roots), 8))
+        self.found = {}
+        self.candidates = defaultdict(list)
+        self.dirs_visited = 0
+        self.skipped_roots = {}  # root -> error of roots that could not be read
+        self.first_result = None  # seconds until the first slot was filled
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.cancel_event = cancel_event
+
+    def scan(self) -> dict:
+        if not self.wanted or not self.roots:
+            return {}
+        self._start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="drive-scan") as pool:
+            for future in [pool.submit(self._scan_root, root) for root in self.roots]:
+                future.result()
+        return dict(self.found)
+
+    def _report(self, slot: str | None, path: str):
+        if slot is None:
+            return
+        with self._lock:
+            if slot not in self.wanted:
+                return
+            self.candidates[slot].append(path)
+            if slot not in self.found:
+                self.found[slot] = path
+                if self.first_result is None:
+                    self.first_result = time.perf_counter() - self._start
+                if self.wanted.issubset(self.found):
+                    self._done.set()
+
+    def _scan_root(self, root: str):
+        # Other roots nested below this one (mount points on Linux/macOS) get their own worker.
+        nested_roots = {r for r in self.roots if r != root and r.startswith(root)}
+        max_depth = self.max_depth if self.max_depth is not None else float("inf")
+        excluded, low_priority, hints = self.excluded, self.low_priority, self.hints
+        push, pop = heapq.heappush, heapq.heappop
+        # (cost, tiebreak, path, depth, levels below a low priority dir or -1)
+        heap = [(0, 0, root, 0, -1)]
+        pushed = 1
+        visited = 0
+
+        cancel = self.cancel_event
+        while heap and not self._done.is_set() and not (cancel is not None and cancel.is_set()):
+            cost, _, current, depth, low_depth = pop(heap)
+            visited += 1
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        name_lower = entry.name.lower()
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+
+                        if is_dir:
+                            if name_lower in excluded:
+                                continue
+                            if nested_roots and os.path.normcase(entry.path) in nested_roots:
+                                continue
+                            if name_lower == SAVE_FOLDER_NAME:
+                                self._report(classify_save_folder(_lower_parts(entry.path)), entry.path)
+                            if depth >= max_depth:
+                                continue
+
+                            child_cost = cost + 1 - (hints.get(name_lower) or directory_priority(name_lower, hints))
+                            child_low = low_depth + 1 if low_depth >= 0 else -1
+                            if child_low < 0 and name_lower in low_priority:
+                                child_low = 0
+                                child_cost += LOW_PRIORITY_PENALTY
+                            elif child_low > self.low_priority_depth:
+                                continue
+                            push(heap, (child_cost, pushed, entry.path, depth + 1, child_low))
+                            pushed += 1
+                        elif name_lower == EXE_NAME:
+                            self._report(classify_exe(_lower_parts(current)), entry.path)
+            except (PermissionError, OSError) as e:
+                if current == root:
+                    with self._lock:
+                        self.skipped_roots[root] = str(e)
+                continue
+
+        with self._lock:
+            self.dirs_visited += visited
@@ -0,0 +1,102 @@
+import os
+import time
+from save_index import SaveIndex
+
+# How long the files of a new base must stay unchanged before they count as complete, in seconds
+SETTLE_WINDOW = 0.75
+SETTLE_POLL_INTERVAL = 0.05
+
+
+def held_open(processes, paths) -> set:
+    """The paths any of the processes currently has open."""
+    wanted = {os.path.normcase(os.path.abspath(p)) for p in paths}
+    held = set()
+    for proc in processes:
+        try:
+            for f in proc.open_files():
+                path = os.path.normcase(os.path.abspath(f.path))
+                if path in wanted:
+                    held.add(path)
+        except Exception:
+            # Gone, access denied or not supported on this platform.
+            continue
+    return held
+
+
+class SettleDetector:
+    """
+    Decides when the game has finished writing the save files of one account base.
+
+    The set of files counts as complete once no file was added, resized or touched
+    for stable_window seconds and none is held open by the game at that point (if
+    one is, the window starts over). File stats are re-read every poll_interval, a
+    folder watcher wakes it up earlier.
+    """
+
+    def __init__(self, index: SaveIndex, base: str, stable_window: float = SETTLE_WINDOW,
+                 poll_interval: float = SETTLE_POLL_INTERVAL, processes=None):
+        self.index = index
+        self.base = base
+        self.stable_window = stable_window
+        self.poll_interval = poll_interval
+        # Callable returning the game's psutil processes, for the open handle check.
+        self.processes = processes
+
+    def signature(self) -> dict:
+        result = {}
+        for save in self.index.refresh().files_for(self.base):
+            try:
+                st = os.stat(save.path)
+            except OSError:
+                continue
+            result[save.path] = (st.st_size, st.st_mtime_ns)
+        return result
+
+    def wait(self, timeout: float, cancel_event=None, watcher=None) -> dict:
+        """
+        Blocks until the files are stable or timeout expired. Returns the files, whether
+        they settled, the time it took and how often the set changed meanwhile.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        last = None
+        stable_since = start
+        changes = 0
+        held = set()
+
+        while True:
+            now = time.monotonic()
+            current = self.signature()
+            if current != last:
+                if last is not None:
+                    changes += 1
+                last = current
+                stable_since = now
+            elif current and now - stable_since >= self.stable_window:
+                # Only asked once the files look finished, walking the processes' handles is expensive.
+                held = held_open(self.processes(), current) if self.processes else set()
+                if not held:
+                    return self._result(current, True, start, changes, held)
+                stable_since = now
+
+            if now >= deadline:
+                return self._result(current, False, start, changes, held)
+            if cancel_event is not None and cancel_event.is_set():
+                return self._result(current, False, start, changes, held, cancelled=True)
+
+            pause = min(self.poll_interval, deadline - now)
+            if watcher is not None:
+                watcher.wait(pause)
+            else:
+                time.sleep(pause)
+
+    @staticmethod
+    def _result(files: dict, settled: bool, start: float, changes: int, held: set, cancelled: bool = False) -> dict:
+        return {
+            "files": sorted(files),
+            "settled": settled,
+            "settle_time": time.monotonic() - start,
+            "changes": changes,
+            "held_open": sorted(held),
+            "cancelled": cancelled,
+        }
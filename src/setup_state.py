@@ -0,0 +1,72 @@
+import os
+from PySide6.QtCore import QObject, QTimer, Signal
+
+# Changes arriving within this time are folded into one refresh.
+DEBOUNCE_MS = 50
+PLATFORMS = ("steam", "epic")
+
+
+class SetupState(QObject):
+    """
+    Observable setup status of both platforms, derived from the config store and
+    checks of the configured paths.
+
+    Config commits and invalidate() calls only schedule a recompute; everything
+    within DEBOUNCE_MS is coalesced. changed(state, keys) is emitted once per
+    recompute and only when something differs, with the top level keys that
+    changed ("steam", "epic", "summary"), so widgets repaint just their part.
+    """
+
+    changed = Signal(dict, set)
+    _invalidated = Signal()
+
+    def __init__(self, rl_manager, debounce_ms: int = DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.rl_manager = rl_manager
+        self.recomputes = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._recompute)
+        # Config listeners may run on worker threads; the signal hops to this object's thread.
+        self._invalidated.connect(self._timer.start)
+        rl_manager.config.subscribe(self._on_config_changed)
+        self.state = self._compute()
+
+    def _on_config_changed(self, changes):
+        self._invalidated.emit()
+
+    def invalidate(self):
+        """Schedules a recompute, e.g. after files in a save folder changed."""
+        self._invalidated.emit()
+
+    def close(self):
+        self.rl_manager.config.unsubscribe(self._on_config_changed)
+
+    def _platform_state(self, platform: str) -> dict:
+        rl_manager = self.rl_manager
+        save = getattr(rl_manager, f"save_path_{platform}")
+        exe = getattr(rl_manager, f"rocket_league_path_{platform}")
+        ready = bool(save and exe)
+        return {
+            "save": save,
+            "exe": exe,
+            "save_exists": bool(save) and os.path.isdir(save),
+            "exe_exists": bool(exe) and os.path.isfile(exe),
+            "ready": ready,
+            "accounts": rl_manager.known_accounts(platform=platform) if ready else [],
+        }
+
+    def _compute(self) -> dict:
+        self.recomputes += 1
+        state = {platform: self._platform_state(platform) for platform in PLATFORMS}
+        state["backup"] = self.rl_manager.backup_path
+        state["summary"] = self.rl_manager.check_all_paths_set()
+        return state
+
+    def _recompute(self):
+        state = self._compute()
+        keys = {key for key in state if state[key] != self.state.get(key)}
+        self.state = state
+        if keys:
+            self.changed.emit(state, keys)
@@ -0,0 +1,323 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import delta
+from integrity import hash_file, copy_with_hash
+from transfer import TransferEngine, link_or_copy, reflink
+
+KEYFRAME_INTERVAL = 8  # longest delta chain is KEYFRAME_INTERVAL - 1, which bounds restore time
+MAX_DELTA_RATIO = 0.5  # keep a full blob if the delta saves less than this
+
+class SnapshotStore:
+    """
+    Content-addressed store for save backups.
+
+    Every file is stored once as a blob named after its sha256. A snapshot is a small
+    JSON manifest mapping file names to blob hashes, so backing up unchanged files
+    costs no extra disk space and a snapshot's id is derived from its content.
+
+    A changed file is stored as a binary delta against the same file of the account's
+    previous snapshot when that is small enough. Every KEYFRAME_INTERVAL versions a
+    full blob is written again, so restoring never applies more than a few deltas.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.blob_dir = os.path.join(root, "blobs")
+        self.manifest_dir = os.path.join(root, "manifests")
+        # Incoming files are staged here, on the same filesystem, never in blob_dir.
+        self.tmp_dir = os.path.join(root, "tmp")
+        self.hash_cache_path = os.path.join(root, "hash_cache.json")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        self._hash_cache = self._load_hash_cache()
+
+    # --- Blobs ---
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def _prefix_dirs(self):
+        for prefix in os.listdir(self.blob_dir):
+            prefix_dir = os.path.join(self.blob_dir, prefix)
+            if os.path.isdir(prefix_dir):
+                yield prefix_dir
+
+    def delta_path(self, digest: str) -> str:
+        return self.blob_path(digest) + ".delta"
+
+    def is_delta(self, digest: str) -> bool:
+        return not os.path.exists(self.blob_path(digest)) and os.path.exists(self.delta_path(digest))
+
+    def has_blob(self, digest: str) -> bool:
+        return os.path.exists(self.blob_path(digest)) or os.path.exists(self.delta_path(digest))
+
+    def stored_path(self, digest: str) -> str:
+        return self.delta_path(digest) if self.is_delta(digest) else self.blob_path(digest)
+
+    def _delta_header(self, digest: str) -> tuple[str, int, int] | None:
+        if not self.is_delta(digest):
+            return None
+        with open(self.delta_path(digest), "rb") as f:
+            return delta.read_header(f.read(delta.HEADER_SIZE))
+
+    def read_blob(self, digest: str) -> bytes:
+        """Returns a blob's content, applying its delta chain if it is stored as a delta."""
+        if not self.is_delta(digest):
+            with open(self.blob_path(digest), "rb") as f:
+                return f.read()
+        with open(self.delta_path(digest), "rb") as f:
+            data = f.read()
+        base, _, _ = delta.read_header(data)
+        return delta.apply(self.read_blob(base), data)
+
+    def _store_delta(self, digest: str, new_path: str, base: str) -> bool:
+        header = self._delta_header(base)
+        depth = header[1] + 1 if header else 1
+        if depth >= KEYFRAME_INTERVAL:
+            return False
+        with open(new_path, "rb") as f:
+            data = f.read()
+        encoded = delta.encode(self.read_blob(base), data, base, depth)
+        if len(encoded) > len(data) * MAX_DELTA_RATIO:
+            return False
+
+        target = self.delta_path(digest)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target + ".tmp", "wb") as f:
+            f.write(encoded)
+        os.replace(target + ".tmp", target)
+        return True
+
+    def _load_hash_cache(self) -> dict:
+        try:
+            with open(self.hash_cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_hash_cache(self):
+        tmp_path = self.hash_cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._hash_cache, f)
+        os.replace(tmp_path, self.hash_cache_path)
+
+    def _cached_hash(self, path: str, st: os.stat_result) -> str | None:
+        # Unchanged files (same size, mtime and inode) are not read again.
+        cached = self._hash_cache.get(os.path.abspath(path))
+        if cached and cached[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]:
+            return cached[3]
+        return None
+
+    def _remember_hash(self, path: str, digest: str):
+        st = os.stat(path)
+        self._hash_cache[os.path.abspath(path)] = [st.st_size, st.st_mtime_ns, st.st_ino, digest]
+
+    def add_blob(self, path: str, base: str | None = None) -> tuple[str, int]:
+        """Stores a file, as a delta against the blob base if given and worthwhile."""
+        st = os.stat(path)
+        digest = self._cached_hash(path, st)
+        if digest and self.has_blob(digest):
+            return digest, st.st_size
+
+        # Clone or copy into the store first and hash while doing so, so the data is read once.
+        tmp_target = os.path.join(self.tmp_dir, f"incoming-{os.getpid()}-{os.path.basename(path)}.tmp")
+        try:
+            if reflink(path, tmp_target):
+                digest = hash_file(tmp_target)
+            else:
+                digest, _ = copy_with_hash(path, tmp_target)
+
+            target = self.blob_path(digest)
+            if self.has_blob(digest):
+                target = self.stored_path(digest)
+            elif base and base != digest and self.has_blob(base) and self._store_delta(digest, tmp_target, base):
+                target = self.delta_path(digest)
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(tmp_target, target)
+        finally:
+            if os.path.exists(tmp_target):
+                os.remove(tmp_target)
+        self._remember_hash(path, digest)
+        self._remember_hash(target, digest)
+        return digest, st.st_size
+
+    # --- Snapshots ---
+    def create(self, paths, account: str | None = None, platform: str | None = None, source: str = "") -> dict:
+        # The account's previous version of each file is the delta base.
+        history = self.list(account) if account else []
+        previous = history[0]["files"] if history else {}
+        files = {}
+        for path in paths:
+            base = previous.get(os.path.basename(path), {}).get("hash")
+            digest, size = self.add_blob(path, base=base)
+            files[os.path.basename(path)] = {"hash": digest, "size": size}
+        self._save_hash_cache()
+
+        content = json.dumps(sorted((name, f["hash"]) for name, f in files.items()))
+        snapshot_id = hashlib.sha256(f"{account}|{content}".encode()).hexdigest()[:16]
+
+        existing = self.get(snapshot_id)
+        if existing:
+            return existing
+
+        manifest = {
+            "id": snapshot_id,
+            "created": time.time(),
+            "account": account,
+            "platform": platform,
+            "source": source,
+            "files": files,
+        }
+        tmp_path = os.path.join(self.manifest_dir, snapshot_id + ".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.manifest_dir, snapshot_id + ".json"))
+        return manifest
+
+    def get(self, snapshot_id: str) -> dict | None:
+        try:
+            with open(os.path.join(self.manifest_dir, snapshot_id + ".json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def list(self, account: str | None = None) -> list:
+        """All snapshots, newest first, optionally only those of one account base."""
+        snapshots = []
+        for name in os.listdir(self.manifest_dir):
+            if not name.endswith(".json"):
+                continue
+            manifest = self.get(name[:-len(".json")])
+            if manifest and (account is None or manifest.get("account") == account):
+                snapshots.append(manifest)
+        snapshots.sort(key=lambda m: m["created"], reverse=True)
+        return snapshots
+
+    def restore(self, snapshot_id: str, target_dir: str, hardlink: bool = False, rename_base: str | None = None) -> list:
+        """
+        Writes the files of a snapshot into target_dir and returns the written paths.
+
+        hardlink shares the blob's inode and must only be used for folders whose files
+        are never modified in place. rename_base swaps the account base in file names.
+        """
+        manifest = self.get(snapshot_id)
+        if manifest is None:
+            raise FileNotFoundError(f"Snapshot {snapshot_id} does not exist")
+
+        os.makedirs(target_dir, exist_ok=True)
+        items = []
+        written = []
+        for name, info in manifest["files"].items():
+            if rename_base and manifest.get("account") and name.startswith(manifest["account"]):
+                name = rename_base + name[len(manifest["account"]):]
+            target = os.path.join(target_dir, name)
+            if self.is_delta(info["hash"]):
+                # Deltas have no file to link or clone, write the rebuilt content.
+                if os.path.lexists(target):
+                    os.remove(target)
+                with open(target, "wb") as f:
+                    f.write(self.read_blob(info["hash"]))
+                written.append(target)
+            else:
+                items.append((self.blob_path(info["hash"]), target, info["hash"]))
+
+        if hardlink:
+            for blob, target, _ in items:
+                if os.path.lexists(target):
+                    os.remove(target)
+                link_or_copy(blob, target)
+        else:
+            TransferEngine().copy(items)
+        return written + [target for _, target, _ in items]
+
+    def verify(self, max_workers: int = 4) -> dict:
+        """
+        Checks that every referenced blob still hashes to its name.
+
+        Blobs whose size, mtime and inode match the hash cache are trusted; only the
+        others are re-read, in parallel.
+        """
+        report = {"ok": 0, "corrupt": [], "missing": [], "rehashed": 0}
+        referenced = {f["hash"] for m in self.list() for f in m["files"].values()}
+        to_hash = []
+        for digest in self._with_delta_bases(referenced):
+            path = self.stored_path(digest)
+            try:
+                st = os.stat(path)
+            except OSError:
+                report["missing"].append(digest)
+                continue
+            if self._cached_hash(path, st) == digest:
+                report["ok"] += 1
+            else:
+                to_hash.append((digest, path))
+
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for (digest, path), actual in zip(to_hash, pool.map(lambda item: self._hash_blob(*item), to_hash)):
+                    if actual == digest:
+                        report["ok"] += 1
+                        self._remember_hash(path, digest)
+                    else:
+                        report["corrupt"].append(digest)
+            report["rehashed"] = len(to_hash)
+            self._save_hash_cache()
+        return report
+
+    def _hash_blob(self, digest: str, path: str) -> str:
+        if path.endswith(".delta"):
+            try:
+                return hashlib.sha256(self.read_blob(digest)).hexdigest()
+            except (OSError, ValueError):
+                return ""
+        return hash_file(path)
+
+    def _with_delta_bases(self, digests) -> set:
+        """The given blobs plus every blob their delta chains depend on."""
+        result = set()
+        pending = list(digests)
+        while pending:
+            digest = pending.pop()
+            if digest in result:
+                continue
+            result.add(digest)
+            try:
+                header = self._delta_header(digest)
+            except (OSError, ValueError):
+                header = None
+            if header:
+                pending.append(header[0])
+        return result
+
+    def usage(self) -> dict:
+        """Number of full and delta blobs and the bytes they take on disk."""
+        report = {"full": 0, "delta": 0, "bytes": 0}
+        for prefix_dir in self._prefix_dirs():
+            for name in os.listdir(prefix_dir):
+                if name.endswith(".tmp"):
+                    continue
+                report["delta" if name.endswith(".delta") else "full"] += 1
+                report["bytes"] += os.path.getsize(os.path.join(prefix_dir, name))
+        return report
+
+    def delete(self, snapshot_id: str):
+        path = os.path.join(self.manifest_dir, snapshot_id + ".json")
+        if os.path.exists(path):
+            os.remove(path)
+
+    def gc(self) -> int:
+        """Removes blobs no snapshot refers to anymore. Returns the number of removed blobs."""
+        referenced = self._with_delta_bases(f["hash"] for m in self.list() for f in m["files"].values())
+        removed = 0
+        for prefix_dir in self._prefix_dirs():
+            for name in os.listdir(prefix_dir):
+                if name.endswith(".tmp"):
+                    continue
+                if name.removesuffix(".delta") not in referenced:
+                    os.remove(os.path.join(prefix_dir, name))
+                    removed += 1
+        return removed
@@ -0,0 +1,65 @@
+import time
+from tracing import tracer
+
+# Time from process start to the first painted frame we aim to stay under.
+STARTUP_BUDGET_MS = 800
+
+
+class StartupTimer:
+    """
+    Collects named startup milestones and reports them once the window painted.
+
+    The report is recorded as a "startup" run of the tracer, so it shows up in the
+    timings panel and as a trace file; a run over budget also leaves a notice.
+    """
+
+    def __init__(self, start: float | None = None, budget_ms: int = STARTUP_BUDGET_MS):
+        self.start = time.perf_counter() if start is None else start
+        self.budget_ms = budget_ms
+        self.marks = []
+
+    def mark(self, name: str) -> float:
+        elapsed_ms = (time.perf_counter() - self.start) * 1000
+        self.marks.append((name, elapsed_ms))
+        return elapsed_ms
+
+    def total_ms(self) -> float:
+        return self.marks[-1][1] if self.marks else 0.0
+
+    def report(self) -> str:
+        steps = ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.marks)
+        total = self.total_ms()
+        text = f"Startup: {steps} (budget {self.budget_ms} ms)"
+        note = f"budget {self.budget_ms} ms"
+        if total > self.budget_ms:
+            text += f" - over budget by {total - self.budget_ms:.0f} ms"
+            note = f"over the {self.budget_ms} ms budget by {total - self.budget_ms:.0f} ms"
+
+        phases = []
+        previous_ms = 0.0
+        for name, ms in self.marks:
+            phases.append((name, self.start + previous_ms / 1000, self.start + ms / 1000))
+            previous_ms = ms
+        if phases:
+            tracer.record_run("startup", phases, total_ms=round(total, 1), budget_ms=self.budget_ms, note=note)
+        if total > self.budget_ms:
+            # Later runs replace last_run, the notice stays visible.
+            tracer.event("startup_over_budget", total_ms=round(total), budget_ms=self.budget_ms)
+        return text
+
+    def watch_first_paint(self, widget):
+        """Marks 'first paint' and records the report on the widget's first paint event."""
+        from PySide6.QtCore import QEvent, QObject
+
+        timer = self
+
+        class _FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint:
+                    obj.removeEventFilter(self)
+                    timer.mark("first paint")
+                    timer.report()
+                return False
+
+        self._paint_filter = _FirstPaintFilter(widget)
+        widget.installEventFilter(self._paint_filter)
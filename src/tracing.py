@@ -0,0 +1,203 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Exported traces kept in the trace folder
+KEEP_TRACES = 20
+# Events recorded outside of a run, shown in the timings panel
+KEEP_NOTICES = 20
+
+
+def _io_counters() -> dict | None:
+    try:
+        import psutil
+        io = psutil.Process().io_counters()
+    except (ImportError, AttributeError, OSError):
+        return None  # not available on macOS
+    return {"read_bytes": io.read_bytes, "write_bytes": io.write_bytes,
+            "read_count": io.read_count, "write_count": io.write_count}
+
+
+def trace_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "traces")
+
+
+class Tracer:
+    """
+    Records timed spans of the phases of a run (a migration, a backup, a scan).
+
+    Spans can be nested and may come from any thread. Each span stores its
+    duration, the process I/O done meanwhile and any values the code adds to the
+    dict it yields. When the outermost run ends, it becomes last_run and is
+    exported as a Chrome trace (chrome://tracing, Perfetto).
+
+    event() records an instant, like a fallback or a skipped drive, in the current
+    run or, outside of one, in notices. The app has no console, so this is where
+    such diagnostics go.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._epoch = time.perf_counter()
+        self._spans = []
+        self._run_name = None
+        self.last_run = None
+        self.notices = deque(maxlen=KEEP_NOTICES)
+
+    @contextmanager
+    def span(self, name: str, **args):
+        stack = self._local.__dict__.setdefault("stack", [])
+        info = dict(args)
+        io_before = _io_counters()
+        start = time.perf_counter()
+        stack.append(name)
+        try:
+            yield info
+        except BaseException as e:
+            info["error"] = type(e).__name__
+            raise
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            io_after = _io_counters()
+            if io_before and io_after:
+                info.update({f"io_{key}": io_after[key] - io_before[key] for key in io_before})
+            with self._lock:
+                if self._run_name is not None:
+                    self._spans.append({
+                        "name": name,
+                        "start_ms": (start - self._epoch) * 1000,
+                        "duration_ms": (end - start) * 1000,
+                        "depth": len(stack),
+                        "thread": threading.get_ident(),
+                        "args": info,
+                    })
+
+    def event(self, name: str, **args):
+        stack = self._local.__dict__.get("stack", [])
+        now = time.perf_counter()
+        with self._lock:
+            if self._run_name is None:
+                self.notices.append({"name": name, "created": time.time(), "args": args})
+                return
+            self._spans.append({
+                "name": name,
+                "start_ms": (now - self._epoch) * 1000,
+                "duration_ms": 0.0,
+                "depth": len(stack),
+                "thread": threading.get_ident(),
+                "args": args,
+                "instant": True,
+            })
+
+    def record_run(self, name: str, phases, **args) -> dict:
+        """
+        Stores phases timed elsewhere, (name, start, end) in perf_counter seconds, as a
+        finished run: one outer span with args, one child span per phase.
+        """
+        thread = threading.get_ident()
+        start, end = min(p[1] for p in phases), max(p[2] for p in phases)
+        spans = [{"name": name, "start_ms": (start - self._epoch) * 1000, "duration_ms": (end - start) * 1000,
+                  "depth": 0, "thread": thread, "args": args}]
+        spans += [{"name": phase, "start_ms": (phase_start - self._epoch) * 1000,
+                   "duration_ms": (phase_end - phase_start) * 1000, "depth": 1, "thread": thread, "args": {}}
+                  for phase, phase_start, phase_end in phases]
+        return self._finish(name, spans)
+
+    def _finish(self, name: str, spans: list) -> dict:
+        self.last_run = {"name": name, "created": time.time(), "spans": spans, "path": None}
+        try:
+            self.last_run["path"] = self.export(self.last_run)
+        except OSError as e:
+            self.last_run["export_error"] = str(e)
+        return self.last_run
+
+    @contextmanager
+    def run(self, name: str, **args):
+        """Outermost span of a run. Nested runs are recorded as ordinary spans."""
+        with self._lock:
+            nested = self._run_name is not None
+            if not nested:
+                self._run_name = name
+                self._spans = []
+        if nested:
+            with self.span(name, **args) as info:
+                yield info
+            return
+
+        try:
+            with self.span(name, **args) as info:
+                yield info
+        finally:
+            with self._lock:
+                spans = sorted(self._spans, key=lambda s: s["start_ms"])
+                self._run_name = None
+                self._spans = []
+            self._finish(name, spans)
+
+    def export(self, run: dict, path: str | None = None) -> str:
+        """Writes a run in the Chrome trace event format and returns the file path."""
+        if path is None:
+            folder = trace_dir()
+            os.makedirs(folder, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(run["created"]))
+            path = os.path.join(folder, f"{stamp}-{run['name'].replace(' ', '_')}.json")
+            self._prune(folder)
+
+        pid = os.getpid()
+        events = []
+        for s in run["spans"]:
+            event = {"name": s["name"], "ph": "X", "ts": round(s["start_ms"] * 1000, 1),
+                     "dur": round(s["duration_ms"] * 1000, 1), "pid": pid, "tid": s["thread"], "args": s["args"]}
+            if s.get("instant"):
+                event["ph"] = "i"
+                event["s"] = "t"
+                del event["dur"]
+            events.append(event)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, indent=1, default=str)
+        return path
+
+    @staticmethod
+    def _prune(folder: str):
+        traces = sorted(f for f in os.listdir(folder) if f.endswith(".json"))
+        for name in traces[:max(0, len(traces) - KEEP_TRACES + 1)]:
+            os.remove(os.path.join(folder, name))
+
+    def breakdown(self) -> str:
+        """Readable phase list of the last run, indented by nesting, and the latest notices."""
+        lines = []
+        if self.last_run:
+            lines.append(f"Last run: {self.last_run['name']} "
+                         f"({time.strftime('%H:%M:%S', time.localtime(self.last_run['created']))})")
+            for s in self.last_run["spans"]:
+                if s.get("instant"):
+                    lines.append(f"{'  ' * s['depth']}! {s['name']}: {_format_args(s['args'])}")
+                    continue
+                io = s["args"].get("io_write_bytes")
+                extra = f"  {io / 1024:.0f} KB written" if io else ""
+                if s["args"].get("note"):
+                    extra += f"  ({s['args']['note']})"
+                lines.append(f"{'  ' * s['depth']}{s['name']}: {s['duration_ms']:.0f} ms{extra}")
+            if self.last_run["path"]:
+                lines.append(f"Trace: {self.last_run['path']}")
+            elif self.last_run.get("export_error"):
+                lines.append(f"Trace not written: {self.last_run['export_error']}")
+        else:
+            lines.append("No run recorded yet.")
+        for notice in self.notices:
+            lines.append(f"{time.strftime('%H:%M:%S', time.localtime(notice['created']))} "
+                         f"! {notice['name']}: {_format_args(notice['args'])}")
+        return "\n".join(lines)
+
+
+def _format_args(args: dict) -> str:
+    return ", ".join(f"{key}={value}" for key, value in args.items())
+
+
+# Shared by RLManager, the jobs and the GUI.
+tracer = Tracer()
@@ -0,0 +1,187 @@
+import mmap
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from integrity import hash_file
+
+FICLONE = 0x40049409  # Linux ioctl for reflink copies (btrfs, xfs, ...)
+COMPARE_CHUNK = 1024 * 1024
+
+
+def reflink(src: str, dst: str) -> bool:
+    """Copy-on-write clone of src to dst. Returns False if the filesystem can't do it."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            if os.path.exists(dst):
+                os.remove(dst)
+            return False
+    if sys.platform == "darwin":
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "clonefile"):
+            return False
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    return False
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        return True
+    except OSError:
+        return False
+
+
+def fast_copy(src: str, dst: str) -> str:
+    """
+    Copies src to dst (data and metadata like shutil.copy2) without moving the data
+    through Python. Returns the method that was used.
+
+    Order: reflink, copy_file_range, then shutil.copyfile, which itself uses
+    sendfile on Linux, fcopyfile on macOS and CopyFile2 on Windows. An existing
+    dst is unlinked first so a hardlinked target never gets overwritten in place.
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    if reflink(src, dst):
+        method = "reflink"
+    elif _copy_file_range(src, dst):
+        method = "copy_file_range"
+    else:
+        shutil.copyfile(src, dst)
+        method = "copyfile"
+    shutil.copystat(src, dst)
+    return method
+
+
+def link_or_copy(src: str, dst: str):
+    """Hardlink when possible; only use for targets that are never modified in place."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        fast_copy(src, dst)
+
+
+def same_bytes(a: str, b: str) -> bool:
+    """Compares two files by size, then memory-mapped chunk by chunk until the first difference."""
+    size = os.path.getsize(a)
+    if size != os.path.getsize(b):
+        return False
+    if size == 0:
+        return True
+    with open(a, "rb") as fa, open(b, "rb") as fb, \
+            mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, \
+            mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mb:
+        for offset in range(0, size, COMPARE_CHUNK):
+            if ma[offset:offset + COMPARE_CHUNK] != mb[offset:offset + COMPARE_CHUNK]:
+                return False
+    return True
+
+
+def _classify(item) -> str:
+    src, dst, _ = item
+    try:
+        dst_size = os.stat(dst).st_size
+    except OSError:
+        return "add"
+    if dst_size != os.stat(src).st_size:
+        return "overwrite"
+    return "unchanged" if same_bytes(src, dst) else "overwrite"
+
+
+def plan_transfer(items, existing=(), max_workers: int = 4) -> dict:
+    """
+    Works out which targets have to be written before anything is touched.
+
+    items: iterable of (src, dst, expected_hash or None), the hash is checked by
+    TransferEngine once the target is written. existing are files already
+    in the target folder; those that no item writes are marked for deletion. Targets
+    with the same size are compared byte by byte with the source, so identical files
+    are left alone without hashing either side.
+    """
+    items = list(items)
+    start = time.perf_counter()
+    plan = {"add": [], "overwrite": [], "unchanged": [], "delete": []}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for item, action in zip(items, pool.map(_classify, items)):
+            plan[action].append(item)
+    targets = {dst for _, dst, _ in items}
+    plan["delete"] = sorted(path for path in existing if path not in targets)
+    plan["bytes_to_write"] = sum(os.stat(src).st_size for src, _, _ in plan["add"] + plan["overwrite"])
+    plan["seconds"] = time.perf_counter() - start
+    return plan
+
+
+def summarize_plan(plan: dict) -> dict:
+    """File names per action, for reports and dry runs."""
+    summary = {action: sorted(os.path.basename(dst) for _, dst, _ in plan[action])
+               for action in ("add", "overwrite", "unchanged")}
+    summary["delete"] = [os.path.basename(path) for path in plan["delete"]]
+    summary["bytes_to_write"] = plan["bytes_to_write"]
+    summary["seconds"] = plan["seconds"]
+    return summary
+
+
+class TransferEngine:
+    """
+    Copies many files concurrently with kernel-side copies.
+
+    Targets that already have the same content as their source are skipped.
+    Written targets with an expected hash are read back and checked against it; a
+    mismatch removes the target and raises OSError. copy() returns a report with
+    the number of copied, verified and skipped files, the bytes written and the
+    throughput.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+
+    def _transfer(self, item) -> tuple[str, int]:
+        src, dst, expected_hash = item
+        method = fast_copy(src, dst)
+        # The target was just written, reading it back mostly hits the page cache.
+        if expected_hash and hash_file(dst) != expected_hash:
+            os.remove(dst)
+            raise OSError(f"{dst} does not match the checksum of {os.path.basename(src)} after copying")
+        return method, os.stat(dst).st_size
+
+    def copy(self, items) -> dict:
+        """items: iterable of (src, dst, expected_hash or None)."""
+        return self.apply(plan_transfer(items, max_workers=self.max_workers))
+
+    def apply(self, plan: dict) -> dict:
+        """Deletes and writes exactly what a plan_transfer() plan lists."""
+        start = time.perf_counter()
+        writes = plan["add"] + plan["overwrite"]
+        report = {"files": len(writes) + len(plan["unchanged"]), "copied": 0, "skipped": len(plan["unchanged"]),
+                  "verified": sum(1 for _, _, expected_hash in writes if expected_hash),
+                  "deleted": 0, "bytes": 0, "methods": {}, "plan": summarize_plan(plan)}
+
+        for path in plan["delete"]:
+            os.remove(path)
+            report["deleted"] += 1
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for method, size in pool.map(self._transfer, writes):
+                report["copied"] += 1
+                report["bytes"] += size
+                report["methods"][method] = report["methods"].get(method, 0) + 1
+
+        report["seconds"] = time.perf_counter() - start
+        report["bytes_per_sec"] = report["bytes"] / report["seconds"] if report["seconds"] > 0 else 0.0
+        return report
@@ -1,46 +1,122 @@
 import time
-import psutil
-import subprocess
 import os
-import glob
-import re
-import shutil
 from PySide6.QtCore import QSettings
 import sys
 from pathlib import Path
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
+from scanner import DriveScanner, SLOTS, EXCLUDED_DIRS
+from location_cache import LocationCache
+from watcher import FolderWatcher
+from save_index import SaveIndex, SAVE_RE
+from snapshots import SnapshotStore
+from integrity import is_manifest, load_manifest, verify_folder, write_manifest
+from transfer import TransferEngine, plan_transfer
+from known_bases import KnownBases
+from savefile import validate_save
+from tracing import tracer
+from settle import SettleDetector
+from launchers import discover_locations
+from config import ConfigStore, ConfigField
+import archive
+
+# Result slot -> config field / RLManager attribute
+SLOT_SETTINGS = {
+    "Steam_exe": "rocket_league_path_steam",
+    "Epic_exe": "rocket_league_path_epic",
+    "Steam_folder": "save_path_steam",
+    "Epic_folder": "save_path_epic",
+}
+
+# How often a cancellable wait checks its cancel event, in seconds
+CANCEL_POLL_INTERVAL = 0.2
+
+class MigrationCancelled(Exception):
+    """Raised when a running migration was cancelled by the user."""
+
+def today_bounds():
+    day_start = datetime.combine(datetime.today().date(), datetime.min.time())
+    return day_start.timestamp(), (day_start + timedelta(days=1)).timestamp()
 
 class RLManager:
+    # Backed by the config store, assigning one commits it (or joins the open transaction).
+    save_path_epic = ConfigField()
+    rocket_league_path_epic = ConfigField()
+    save_path_steam = ConfigField()
+    rocket_league_path_steam = ConfigField()
+    backup_path = ConfigField()
+
     def __init__(self):
         self.settings = QSettings("RLAccountMigrator", "Config")
-        
-        self.save_path_epic = self.settings.value("save_path_epic", "")
-        self.rocket_league_path_epic = self.settings.value("rocket_league_path_epic", "")
-
-        self.save_path_steam = self.settings.value("save_path_steam", "")  
-        self.rocket_league_path_steam = self.settings.value("rocket_league_path_steam", "")
-
-        self.backup_path = self.settings.value("backup_path", "")
+        self.config = ConfigStore(self.settings)
         self.cretate_save_backup_folder()
 
+        self.last_save_detection = None
+        self.last_transfer = None
+        self.last_scan = None
+        # Plain attribute, so a one-off override (CLI --settle) is not persisted.
+        self.settle_window = self.config.get("settle_window")
+        self._save_indexes = {}
+        self.snapshots = SnapshotStore(os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "snapshots"))
+        err = self.check_backup_integrity()
+        if err:
+            tracer.event("backup_integrity", error=err)
+        self.known_bases = KnownBases(os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "known_bases.json"))
+        self.location_cache = LocationCache(os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "location_cache.json"))
+
     def cretate_save_backup_folder(self):
-        self.backup_path = os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "saves_backup")        
-        if not os.path.exists(self.backup_path):
-            os.makedirs(self.backup_path)
-        self.settings.setValue("backup_path", self.backup_path)
+        backup_path = os.path.join(os.path.expanduser("~"), ".RLAccountMigrator", "saves_backup")
+        os.makedirs(backup_path, exist_ok=True)
+        self.backup_path = backup_path
     
-    def get_rocket_league_locations(self):
+    def get_rocket_league_locations(self, progress=None, cancel_event=None):
+        """
+        Finds the exe and save folders and stores them in the config. progress gets a
+        short text per phase; setting cancel_event stops a drive scan and raises
+        MigrationCancelled without storing anything.
+        """
+        report = progress or (lambda text: None)
         results = defaultdict(list)
 
-        found_in_standard = self._check_standard_locations(results)
-
-        if not found_in_standard:
-            print("Standard locations not found. Starting a full drive scan...")
-            self._full_drive_scan(results)
+        # Everything found is committed to the config once, at the end.
+        with tracer.run("locate"), self.config.transaction():
+            report("Checking install locations...")
+            with tracer.span("standard_locations"):
+                found_in_standard = self._check_standard_locations(results)
+
+            if not found_in_standard:
+                with tracer.span("cached_locations"):
+                    found_in_cache = self._check_cached_locations(results)
+                if not found_in_cache:
+                    report("Searching all drives, this can take a while...")
+                    with tracer.span("full_drive_scan") as trace:
+                        self._full_drive_scan(results, cancel_event=cancel_event)
+                        trace.update(self.last_scan)
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise MigrationCancelled()
 
         return dict(results)
 
+    def _apply_location(self, results, slot, path):
+        # One invalid path would fail the commit of everything else that was found.
+        if self.config.validate(SLOT_SETTINGS[slot], path):
+            return
+        results[slot].append(path)
+        setattr(self, SLOT_SETTINGS[slot], path)
+
+    def _check_cached_locations(self, results):
+        missing = [slot for slot in SLOTS if not results[slot]]
+
+        found = self.location_cache.lookup(missing)
+        missing = [slot for slot in missing if slot not in found]
+        if missing:
+            found.update(self.location_cache.rescan_stale(missing, **self.scan_options()))
+
+        for slot, path in found.items():
+            self._apply_location(results, slot, path)
+
+        return all(results[slot] for slot in SLOTS)
+
     def _check_standard_locations(self, results):
         if sys.platform == "win32":
             steam_apps_path = Path(os.getenv("ProgramFiles(x86)")) / "Steam" / "steamapps" / "common" / "rocketleague"
@@ -49,205 +125,309 @@ class RLManager:
 
             steam_exe = steam_apps_path / "Binaries" / "Win64" / "RocketLeague.exe"
             if steam_exe.exists():
-                results["Steam_exe"].append(str(steam_exe))
-                self.settings.setValue("rocket_league_path_steam", str(steam_exe))
-                self.rocket_league_path_steam = str(steam_exe)
+                self._apply_location(results, "Steam_exe", str(steam_exe))
 
             epic_exe = epic_apps_path / "Binaries" / "Win64" / "RocketLeague.exe"
             if epic_exe.exists():
-                results["Epic_exe"].append(str(epic_exe))
-                self.settings.setValue("rocket_league_path_epic", str(epic_exe))
-                self.rocket_league_path_epic = str(epic_exe)
+                self._apply_location(results, "Epic_exe", str(epic_exe))
 
             epic_save_folder = documents_path / "SaveDataEpic" / "DBE_Production"
             if epic_save_folder.exists():
-                results["Epic_folder"].append(str(epic_save_folder))
-                self.settings.setValue("save_path_epic", str(epic_save_folder))
-                self.save_path_epic = str(epic_save_folder)
+                self._apply_location(results, "Epic_folder", str(epic_save_folder))
 
             steam_save_folder = documents_path / "SaveData" / "DBE_Production"
             if steam_save_folder.exists():
-                results["Steam_folder"].append(str(steam_save_folder))
-                self.settings.setValue("save_path_steam", str(steam_save_folder))
-                self.save_path_steam = str(steam_save_folder)
-
-        elif sys.platform.startswith("linux"):
-            pass
+                self._apply_location(results, "Steam_folder", str(steam_save_folder))
 
-        elif sys.platform == "darwin": # macOS 
-            pass
+        # Non-default installs, Linux (Proton, Heroic) and macOS come from the launcher manifests.
+        missing = [slot for slot in SLOTS if not results[slot]]
+        if missing:
+            discovered = discover_locations()
+            for slot in missing:
+                if slot in discovered:
+                    self._apply_location(results, slot, discovered[slot])
 
         all_found = len(results["Epic_exe"]) > 0 and len(results["Steam_exe"]) > 0 and \
                     len(results["Epic_folder"]) > 0 and len(results["Steam_folder"]) > 0
 
         return all_found
 
-    def _full_drive_scan(self, results):
-        for p in psutil.disk_partitions():
-            root_drive = Path(p.mountpoint)
-            if not root_drive.exists():
-                continue
-
-            try:
-                for path in root_drive.rglob("DBE_Production"):
-                    path_parts_lower = [part.lower() for part in path.parts]
-                    if results["Epic_folder"] and results["Steam_folder"]:
-                        break
-                    if "onedrive" in path_parts_lower:
-                        continue
-                    if "savedataepic" in path_parts_lower:
-                        results["Epic_folder"].append(str(path))
-                        self.settings.setValue("save_path_epic", str(path))
-                        self.save_path_epic = str(path)
-                    elif "savedata" in path_parts_lower:
-                        results["Steam_folder"].append(str(path))
-                        self.settings.setValue("save_path_steam", str(path))
-                        self.save_path_steam = str(path)
-
-                for path in root_drive.rglob("RocketLeague.exe"):
-                    path_parts_lower = [part.lower() for part in path.parts]
-                    if results["Steam_exe"] and results["Epic_exe"]:
-                        break
-                    if "onedrive" in path_parts_lower:
-                        continue
-                    if any(l in path_parts_lower for l in ["steamapps", "steam"]):
-                        results["Steam_exe"].append(str(path))
-                        self.settings.setValue("rocket_league_path_steam", str(path))
-                        self.rocket_league_path_steam = str(path)
-                    elif any(l in path_parts_lower for l in ["epic games", "epicgames"]):
-                        results["Epic_exe"].append(str(path))
-                        self.settings.setValue("rocket_league_path_epic", str(path))
-                        self.rocket_league_path_epic = str(path)
-
-            except (PermissionError, OSError) as e:
-                print(f"Skipping {root_drive} due to error: {e}")
-                continue
+    def scan_options(self) -> dict:
+        """DriveScanner settings from the config."""
+        extra_excluded = {name.strip() for name in self.config.get("scan_excluded").split(",") if name.strip()}
+        return {
+            "excluded": EXCLUDED_DIRS | extra_excluded,
+            "max_depth": self.config.get("scan_max_depth") or None,
+            "low_priority_depth": self.config.get("scan_low_priority_depth"),
+        }
+
+    def _full_drive_scan(self, results, roots=None, cancel_event=None):
+        if roots is None:
+            import psutil
+            roots = [p.mountpoint for p in psutil.disk_partitions() if os.path.exists(p.mountpoint)]
+        missing = [slot for slot in SLOTS if not results[slot]]
+
+        scanner = DriveScanner(roots, slots=missing, cancel_event=cancel_event, **self.scan_options())
+        found = scanner.scan()
+        self.location_cache.update(scanner.candidates)
+        self.last_scan = {"dirs_visited": scanner.dirs_visited, "first_result": scanner.first_result,
+                          "found": sorted(found), "skipped_roots": scanner.skipped_roots}
+
+        for slot, path in found.items():
+            self._apply_location(results, slot, path)
             
-    def latest_saves(self, platform: str = "steam" or "epic"):
-    
-        saves = []
+    def save_index(self, platform: str = "steam" or "epic", force: bool = False) -> SaveIndex:
+        save_path = ""
         if platform == "steam":
-            saves = glob.glob(os.path.join(self.save_path_steam, "*.save"))
+            save_path = self.save_path_steam
         elif platform == "epic":
-            saves = glob.glob(os.path.join(self.save_path_epic, "*.save"))
-        if not saves:
+            save_path = self.save_path_epic
+
+        index = self._save_indexes.get(save_path)
+        if index is None:
+            index = self._save_indexes[save_path] = SaveIndex(save_path)
+        return index.refresh(force=force)
+
+    def latest_saves(self, platform: str = "steam" or "epic"):
+        # Files can be rewritten in place without touching the folder mtime, so re-stat here.
+        index = self.save_index(platform, force=True)
+        if not index.files:
             return []
-        
-        today = datetime.today().date()
 
-        saves = [f for f in saves if datetime.fromtimestamp(os.path.getmtime(f)).date() == today]
+        day_start, day_end = today_bounds()
+        saves = [f for f in index.files.values() if day_start <= f.mtime < day_end]
         if not saves:
             return []
-        
-
-
-        newest_file = max(saves, key=os.path.getmtime)
 
-        match = re.match(r"([a-f0-9]+)(?:_\d+)?\.save$", os.path.basename(newest_file))
-        if not match:
+        newest = index.newest(saves)
+        if not newest.base:
             return []
-        newest_base = match.group(1)
-
-        base_files = [f for f in saves if re.match(rf"{newest_base}(?:_\d+)?\.save$", os.path.basename(f))]
-
-        base_files.sort(key=os.path.getmtime, reverse=True)
 
-        return base_files
+        return [f.path for f in index.files_for(newest.base) if day_start <= f.mtime < day_end]
 
     def duplicate_save(self, platform: str = "steam" or "epic"):
-        latest_list = self.latest_saves(platform)
-        if latest_list:
-            existing_files = glob.glob(os.path.join(self.backup_path, "*.save"))
-            if len(existing_files) == 0:
-                for latest in latest_list:
-                    copy_target = os.path.join(self.backup_path, os.path.basename(latest))
-                    shutil.copy2(latest, copy_target)
+        with tracer.run("backup", platform=platform) as trace:
+            with tracer.span("latest_saves"):
+                latest_list = self.latest_saves(platform)
+            if latest_list:
+                trace["files"] = len(latest_list)
+                with tracer.span("snapshot"):
+                    self._archive_backup_folder()
+                    snapshot = self.snapshots.create(latest_list, account=self.get_base_name(latest_list[0]),
+                                                     platform=platform, source="duplicate_save")
+                with tracer.span("use_snapshot"):
+                    self.use_snapshot(snapshot["id"])
+                self.known_bases.record(platform, self.get_base_name(latest_list[0]))
                 return latest_list
-            else:
-                error = "Backup folder is not empty! Please clear it before creating a new backup."
-                return error 
-        return None
+            return None
+
+    def _archive_backup_folder(self):
+        """Keeps the current backup folder content as a snapshot before it gets replaced."""
+        files = [os.path.join(self.backup_path, f) for f in os.listdir(self.backup_path) if f.endswith(".save")]
+        if files:
+            self.snapshots.create(files, account=self.get_base_name(files[0]), source="backup_folder")
+
+    def use_snapshot(self, snapshot_id: str):
+        """Makes a snapshot the active backup that migrations copy from."""
+        for f in os.listdir(self.backup_path):
+            os.remove(os.path.join(self.backup_path, f))
+        # The backup folder is only read from and cleared, so it can share the blobs' inodes.
+        written = self.snapshots.restore(snapshot_id, self.backup_path, hardlink=True)
+        manifest = self.snapshots.get(snapshot_id)
+        write_manifest(self.backup_path, {name: info["hash"] for name, info in manifest["files"].items()})
+        return written
     
-    def wait_for_new_latest_save(self, timeout: int, platform: str = "steam" or "epic"):
+    def export_backup(self, path: str | None = None, snapshot_id: str | None = None) -> dict:
+        """Writes the active backup, or a stored snapshot, into a compressed archive."""
+        if snapshot_id is None:
+            files = [f for f in os.listdir(self.backup_path) if f.endswith(".save")]
+            account = self.get_base_name(files[0]) if files else None
+        else:
+            manifest = self.snapshots.get(snapshot_id)
+            account = manifest.get("account") if manifest else None
+        if path is None:
+            path = os.path.join(archive.archive_dir(), f"{time.strftime('%Y%m%d-%H%M%S')}-{account or 'backup'}.zip")
+
+        with tracer.run("export", snapshot=snapshot_id) as trace:
+            if snapshot_id is None:
+                err = self.check_backup_folder_empty() or self.check_backup_integrity()
+                if err:
+                    raise OSError(err)
+                index = archive.export_folder(self.backup_path, path, {"account": account})
+            else:
+                index = archive.export_snapshot(self.snapshots, snapshot_id, path)
+            trace.update(files=len(index["files"]), archive_size=index["archive_size"])
+        index["path"] = path
+        return index
+
+    def restore_archive(self, path: str, platform: str = "steam" or "epic", base_name: str | None = None,
+                        names=None) -> list:
+        """
+        Streams the save files of an archive straight into the platform's save folder.
+        With base_name they are renamed to that account, otherwise they keep the base
+        they were exported from.
+        """
+        save_path = self.save_path_steam if platform == "steam" else self.save_path_epic
+        if not save_path:
+            raise ValueError(f"The {platform} save folder is not configured.")
+        with tracer.run("restore_archive", platform=platform) as trace:
+            written = archive.extract(path, save_path, names=names, rename_base=base_name)
+            trace["files"] = len(written)
+        base = base_name or archive.read_index(path).get("account")
+        if base:
+            self.known_bases.record(platform, base)
+        return written
+
+    def wait_for_new_latest_save(self, timeout: int, platform: str = "steam" or "epic", cancel_event=None,
+                                 processes=None, require_new_base: bool = False):
+        """
+        Waits for the save files of a new account base and returns them once they stopped
+        changing (see SettleDetector). processes returns the game's processes, so files
+        it still holds open are not taken yet.
+
+        If no new base appears in time the newest existing saves are returned, or with
+        require_new_base a RuntimeError is raised.
+        """
         save_path = ""
         if platform == "steam":
             save_path = self.save_path_steam
         elif platform == "epic":
             save_path = self.save_path_epic
 
-        existing_files = glob.glob(os.path.join(save_path, "*.save"))
-        existing_bases = set()
-        for f in existing_files:
-            match = re.match(r"([a-f0-9]+)(?:_\d+)?\.save$", os.path.basename(f))
-            if match:
-                existing_bases.add(match.group(1))
-
-        start_time = time.time()
-        today = datetime.today().date()
-
-        while time.time() - start_time < timeout:
-            current_files = glob.glob(os.path.join(save_path, "*.save"))
-            new_bases = set()
-            for f in current_files:
-                match = re.match(r"([a-f0-9]+)(?:_\d+)?\.save$", os.path.basename(f))
-                if match:
-                    base = match.group(1)
-                    if base not in existing_bases:
-                        new_bases.add(base)
-
-            if new_bases:
-                newest_file = max(current_files, key=os.path.getmtime)
-                newest_base = re.match(r"([a-f0-9]+)(?:_\d+)?\.save$", os.path.basename(newest_file)).group(1)
-
-                file_date = datetime.fromtimestamp(os.path.getmtime(newest_file)).date()
-                if file_date != today:
-                    time.sleep(2)
-                    continue
-
-                if newest_base in new_bases:
-                    base_files = [
-                        f for f in current_files
-                        if re.match(rf"{newest_base}(?:_\d+)?\.save$", os.path.basename(f))
-                    ]
-                    base_files.sort(key=os.path.getmtime, reverse=True)
-                    return base_files
-
-            time.sleep(2)
-
+        index = SaveIndex(save_path)
+        with FolderWatcher(save_path) as watcher:
+            existing_bases = index.refresh().bases()
+
+            start_time = time.time()
+            day_start, day_end = today_bounds()
+
+            while time.time() - start_time < timeout:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise MigrationCancelled()
+
+                new_bases = index.refresh().bases() - existing_bases
+
+                if new_bases:
+                    newest = index.newest()
+                    if day_start <= newest.mtime < day_end and newest.base in new_bases:
+                        detected_at = time.time()
+                        self.last_save_detection = {
+                            "base": newest.base,
+                            "backend": watcher.backend.name,
+                            "waited": detected_at - start_time,
+                            "latency": max(0.0, detected_at - newest.mtime),
+                        }
+
+                        # The game may still be writing the other files of the base.
+                        settler = SettleDetector(index, newest.base, stable_window=self.settle_window,
+                                                 processes=processes)
+                        settle = settler.wait(max(0.0, timeout - (time.time() - start_time)),
+                                              cancel_event=cancel_event, watcher=watcher)
+                        if settle["cancelled"]:
+                            raise MigrationCancelled()
+                        self.last_save_detection.update(
+                            {key: settle[key] for key in ("settled", "settle_time", "changes")})
+                        return settle["files"]
+
+                remaining = timeout - (time.time() - start_time)
+                if cancel_event is not None:
+                    remaining = min(remaining, CANCEL_POLL_INTERVAL)
+                watcher.wait(remaining)
+
+        if require_new_base:
+            raise RuntimeError(f"No new account appeared within {timeout} seconds. "
+                               "Log in the next account before starting the migration.")
         return self.latest_saves(platform=platform)
 
     def get_base_name(self, filename):
-        match = re.match(r"([a-f0-9]+)(?:_\d+)?\.save$", os.path.basename(filename))
+        match = SAVE_RE.match(os.path.basename(filename))
         return match.group(1) if match else None
 
+    def plan_replace(self, base_name, platform: str = "steam" or "epic") -> dict:
+        """What replacing the account's saves with the backup would add, overwrite, keep and delete."""
+        index = self.save_index(platform)
+        manifest = load_manifest(self.backup_path) or {"files": {}}
+        items = []
+        for f in os.listdir(self.backup_path):
+            if is_manifest(f):
+                continue
+            target = os.path.join(index.path, base_name + f[len(base_name):])
+            items.append((os.path.join(self.backup_path, f), target, manifest["files"].get(f, {}).get("hash")))
+        return plan_transfer(items, existing=[save.path for save in index.by_base.get(base_name, [])])
+
     def replace_save_files_with_backup(self, base_name, platform: str = "steam" or "epic"):
-        save_path = ""
-        if platform == "steam":
-            save_path = self.save_path_steam
-        elif platform == "epic":
-            save_path = self.save_path_epic
-        
-        for f in os.listdir(save_path):
-            if re.match(rf"{base_name}(?:_\d+)?\.save$", f):
-                os.remove(os.path.join(save_path, f))
+        err = self.check_backup_integrity() or self.check_backup_save_files()
+        if err:
+            raise OSError(err)
 
-        for f in os.listdir(self.backup_path):
-            shutil.copy2(os.path.join(self.backup_path, f), os.path.join(save_path, base_name + f[len(base_name):]))
+        plan = self.plan_replace(base_name, platform=platform)
+        self.last_transfer = TransferEngine().apply(plan)
 
     def backup_save_files_for_new_ones(self, base_name, platform: str = "steam" or "epic"):
-        save_path = ""
-        if platform == "steam":
-            save_path = self.save_path_steam
-        elif platform == "epic":
-            save_path = self.save_path_epic
-
-        for f in os.listdir(self.backup_path):
-            os.remove(os.path.join(self.backup_path, f))
-        for f in os.listdir(save_path):
-            if re.match(rf"{base_name}(?:_\d+)?\.save$", f):
-                shutil.copy2(os.path.join(save_path, base_name + f[len(base_name):]), os.path.join(self.backup_path, f))
+        index = self.save_index(platform)
+        files = [save.path for save in index.by_base.get(base_name, [])]
+
+        self._archive_backup_folder()
+        if not files:
+            for f in os.listdir(self.backup_path):
+                os.remove(os.path.join(self.backup_path, f))
+            return
+
+        snapshot = self.snapshots.create(files, account=base_name, platform=platform, source="get_backup")
+        self.use_snapshot(snapshot["id"])
+
+    def known_accounts(self, platform: str = "steam" or "epic") -> list:
+        """Known account bases that still have save files, most recently used first."""
+        present = self.save_index(platform).bases()
+        return [base for base in self.known_bases.bases(platform) if base in present]
+
+    def _apply_save_mode(self, mode: str, base_name: str, platform: str, report):
+        report("Copying save files...")
+        with tracer.span("copy", mode=mode) as trace:
+            if mode == "replace_existing":
+                self.replace_save_files_with_backup(base_name, platform=platform)
+                trace.update({key: self.last_transfer[key] for key in ("copied", "skipped", "deleted", "bytes")})
+            elif mode == "get_backup":
+                self.backup_save_files_for_new_ones(base_name, platform=platform)
+        self.known_bases.record(platform, base_name)
+
+    def generate_new_save_files(self, mode: str = "get_backup" or "replace_existing", platform: str = "steam" or "epic",
+                                progress=None, cancel_event=None, base_name: str | None = None,
+                                require_new_base: bool = False):
+        """
+        Launches Rocket League, waits for the save files of the logged in account and
+        either replaces them with the backup or backs them up.
+
+        progress is called with a short text for every phase. Setting cancel_event
+        aborts the wait, closes the game and raises MigrationCancelled.
+
+        With base_name the target account is given directly. If it already has save
+        files the game is not launched at all and only the file operations run.
+
+        require_new_base fails the launch before any file is copied if the game created
+        no new account saves, instead of falling back to the newest existing ones.
+        """
+        with tracer.run("migration", mode=mode, platform=platform) as trace:
+            trace["result"] = self._generate_new_save_files(mode, platform, progress, cancel_event, base_name,
+                                                            require_new_base)
+            return trace["result"]
+
+    def _generate_new_save_files(self, mode, platform, progress, cancel_event, base_name, require_new_base):
+        report = progress or (lambda text: None)
+
+        from process import GameProcess, find_running_game
+
+        # Also without a launch: a running game would overwrite the replaced saves on exit.
+        if find_running_game():
+            raise RuntimeError("Rocket League is already running. Please close it before starting a migration.")
+
+        if base_name:
+            if base_name not in self.save_index(platform).bases():
+                raise ValueError(f"No save files of account {base_name} found in the {platform} save folder.")
+            report("Account already has save files, skipping game launch...")
+            self._apply_save_mode(mode, base_name, platform, report)
+            return True
 
-    def generate_new_save_files(self, mode: str = "get_backup" or "replace_existing", platform: str = "steam" or "epic"):
         rocket_league_path = ""
         if platform == "steam":
             rocket_league_path = self.rocket_league_path_steam
@@ -258,40 +438,39 @@ class RLManager:
         if not (rocket_league_path and os.path.exists(rocket_league_path)):
             return False
 
-        subprocess.Popen([rocket_league_path])
+        report("Starting Rocket League...")
+        game = GameProcess(rocket_league_path)
+        with tracer.span("launch"):
+            game.launch()
 
         try:
-            latest_files = self.wait_for_new_latest_save(timeout=60, platform=platform)
+            report("Waiting for new save files...")
+            with tracer.span("wait_for_save") as trace:
+                latest_files = self.wait_for_new_latest_save(timeout=60, platform=platform, cancel_event=cancel_event,
+                                                             processes=game.refresh,
+                                                             require_new_base=require_new_base)
+                trace["files"] = len(latest_files)
+                trace.update(self.last_save_detection or {})
             if not latest_files:
                 return False
+            if self.last_save_detection and not self.last_save_detection.get("settled", True):
+                report("Save files were still changing when the wait timed out, copying them anyway...")
 
             base_name = self.get_base_name(latest_files[0])
             if not base_name:
                 return False
 
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'] and 'RocketLeague' in proc.info['name']:
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=10)
-                    except (psutil.NoSuchProcess, psutil.TimeoutExpired):
-                        proc.kill()
+            report("Closing Rocket League...")
+            with tracer.span("shutdown") as trace:
+                trace.update(game.shutdown())
 
-            if mode == "replace_existing":
-                self.replace_save_files_with_backup(base_name, platform=platform)
-            elif mode == "get_backup":
-                self.backup_save_files_for_new_ones(base_name, platform=platform)
+            self._apply_save_mode(mode, base_name, platform, report)
             return True
 
-        except TimeoutError:
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'] and 'RocketLeague' in proc.info['name']:
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=10)
-                    except (psutil.NoSuchProcess, psutil.TimeoutExpired):
-                        proc.kill()
-            raise
+        finally:
+            # No-op after a regular shutdown, closes the game on failure, timeout or cancel.
+            if game.refresh(adopt=True):
+                game.shutdown()
 
     # --- Check-Funktion ---
     def check_folder_paths_set(self, platform: str = "steam" or "epic"):
@@ -307,10 +486,26 @@ class RLManager:
     def check_backup_folder_empty(self):
         file_count = []
         for f in os.listdir(self.backup_path):
-            file_count.append(f)
+            if not is_manifest(f):
+                file_count.append(f)
         if len(file_count) == 0:
             return "No saves backed up to copy"
 
+    def check_backup_integrity(self):
+        report = verify_folder(self.backup_path)
+        if report["corrupt"] or report["missing"]:
+            broken = ", ".join(report["corrupt"] + report["missing"])
+            return f"Backup files are corrupt or missing: {broken}\nRestore a snapshot or create a new backup."
+
+    def check_backup_save_files(self):
+        errors = [err for f in os.listdir(self.backup_path) if not is_manifest(f)
+                  if (err := validate_save(os.path.join(self.backup_path, f)))]
+        if errors:
+            return "Backup save files are damaged: " + ", ".join(errors)
+
+    def verify_backups(self):
+        return {"backup_folder": verify_folder(self.backup_path), "snapshots": self.snapshots.verify()}
+
     def check_folders_identical(self, platform: str = "steam" or "epic"):
         save_path = ""
         if platform == "steam":
@@ -322,19 +517,12 @@ class RLManager:
             return "Save folder and backup folder cant be the same folder!"
         
     def check_path_contains_save_files(self, platform: str = "steam" or "epic"):
-        save_path = ""
-        if platform == "steam":
-            save_path = self.save_path_steam
-        elif platform == "epic":
-            save_path = self.save_path_epic
-        
-        try:
-            save_files = [f for f in os.listdir(save_path) if f.endswith(".save")]
-            if not save_files:
-                return "No .save file found in the save folder!"
-            return None
-        except FileNotFoundError:
+        index = self.save_index(platform)
+        if not os.path.isdir(index.path):
             return None
+        if not index.files:
+            return "No .save file found in the save folder!"
+        return None
         
     def check_all_paths_set(self):
         if self.backup_path and self.save_path_epic and self.save_path_steam and self.rocket_league_path_epic and self.rocket_league_path_steam:
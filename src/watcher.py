@@ -0,0 +1,152 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from tracing import tracer
+
+POLL_INTERVAL = 0.25
+
+
+class InotifyBackend:
+    """Blocks on an inotify descriptor watching one directory (Linux only)."""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    def __init__(self, path: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_CREATE | self.IN_MOVED_TO | self.IN_CLOSE_WRITE | self.IN_MODIFY
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {path}")
+
+    def wait(self, timeout: float) -> bool:
+        ready, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+class QtBackend:
+    """Uses QFileSystemWatcher, i.e. the native change notifications of Windows and macOS."""
+
+    name = "qt"
+
+    def __init__(self, path: str):
+        from PySide6.QtCore import QCoreApplication, QFileSystemWatcher
+
+        if QCoreApplication.instance() is None:
+            raise RuntimeError("QFileSystemWatcher needs a running QCoreApplication")
+        self.watcher = QFileSystemWatcher([path])
+        if path not in self.watcher.directories():
+            raise OSError(f"QFileSystemWatcher could not watch {path}")
+        self.changed = False
+        self.watcher.directoryChanged.connect(self._on_changed)
+
+    def _on_changed(self, _path):
+        self.changed = True
+
+    def wait(self, timeout: float) -> bool:
+        from PySide6.QtCore import QEventLoop, QTimer
+
+        if not self.changed:
+            loop = QEventLoop()
+            self.watcher.directoryChanged.connect(loop.quit)
+            QTimer.singleShot(int(max(0.0, timeout) * 1000), loop.quit)
+            loop.exec()
+            self.watcher.directoryChanged.disconnect(loop.quit)
+        changed, self.changed = self.changed, False
+        return changed
+
+    def close(self):
+        self.watcher.deleteLater()
+
+
+class PollingBackend:
+    """Fallback: a single stat of the directory per interval, the mtime moves on every create/rename."""
+
+    name = "polling"
+
+    def __init__(self, path: str, interval: float = POLL_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.last_mtime = self._mtime()
+
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            mtime = self._mtime()
+            if mtime != self.last_mtime:
+                self.last_mtime = mtime
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+class FolderWatcher:
+    """
+    Waits for changes in a single directory with the best backend available.
+
+    Linux uses inotify, other platforms QFileSystemWatcher when a Qt application
+    is running, and everything falls back to cheap directory mtime polling.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.backend = self._create_backend(path)
+
+    @staticmethod
+    def _create_backend(path: str):
+        backends = [QtBackend, PollingBackend]
+        if sys.platform.startswith("linux"):
+            backends.insert(0, InotifyBackend)
+        for backend in backends:
+            try:
+                return backend(path)
+            except (OSError, RuntimeError, AttributeError, ImportError) as e:
+                tracer.event("watcher_fallback", backend=backend.name, error=str(e))
+        return PollingBackend(path)
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks until the folder changed or the timeout expired. Returns True on change."""
+        return self.backend.wait(timeout)
+
+    def close(self):
+        self.backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
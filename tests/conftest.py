@@ -0,0 +1,39 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+class DictSettings:
+    """Stands in for QSettings: value / setValue / sync on a dict."""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.syncs = 0
+
+    def value(self, name, default=None):
+        return self.values.get(name, default)
+
+    def setValue(self, name, value):
+        self.values[name] = value
+
+    def sync(self):
+        self.syncs += 1
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """RLManager on a dict config with empty backup and steam save folders, no QSettings or home dir."""
+    from config import ConfigStore
+    from util import RLManager
+    manager = RLManager.__new__(RLManager)
+    manager.config = ConfigStore(DictSettings())
+    manager._save_indexes = {}
+    manager.last_save_detection = None
+    manager.settle_window = manager.config.get("settle_window")
+    (tmp_path / "backup").mkdir()
+    (tmp_path / "saves").mkdir()
+    manager.backup_path = str(tmp_path / "backup")
+    manager.save_path_steam = str(tmp_path / "saves")
+    return manager
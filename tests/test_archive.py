@@ -0,0 +1,65 @@
+import json
+import os
+import zipfile
+import pytest
+import archive
+
+ACCOUNT = "aaaa1111"
+
+
+def _archive(tmp_path, files: dict) -> str:
+    path = str(tmp_path / "backup.zip")
+    archive.create_archive(path, files, {"account": ACCOUNT, "platform": "steam"})
+    return path
+
+
+def test_round_trip_with_rename(tmp_path):
+    path = _archive(tmp_path, {f"{ACCOUNT}.save": b"main", f"{ACCOUNT}_1.save": b"slot one"})
+    written = archive.extract(path, str(tmp_path / "out"), rename_base="bbbb2222")
+    assert sorted(os.path.basename(p) for p in written) == ["bbbb2222.save", "bbbb2222_1.save"]
+    assert (tmp_path / "out" / "bbbb2222_1.save").read_bytes() == b"slot one"
+
+
+@pytest.mark.parametrize("name", [
+    "../x.save",
+    "../../x.save",
+    "sub/x.save",
+    "..\\x.save",
+    "/tmp/x.save",
+    "x.txt",
+], ids=["parent", "grandparent", "subfolder", "backslash", "absolute", "not_a_save"])
+def test_unsafe_names_write_nothing(tmp_path, name):
+    path = _archive(tmp_path, {f"{ACCOUNT}.save": b"main", name: b"evil"})
+    assert name in zipfile.ZipFile(path).namelist()
+    target = tmp_path / "work" / "out"
+    target.parent.mkdir()
+
+    with pytest.raises(ValueError):
+        archive.extract(path, str(target))
+    assert not target.exists()
+    assert os.listdir(target.parent) == []
+    assert not os.path.exists(tmp_path / "x.save")
+
+
+def test_name_invalid_after_rename_writes_nothing(tmp_path):
+    path = _archive(tmp_path, {f"{ACCOUNT}.save": b"main", f"{ACCOUNT}_1.save": b"slot one"})
+    target = tmp_path / "out"
+    for rename_base in ("../bbbb2222", "not-hex", "sub/bbbb2222"):
+        with pytest.raises(ValueError):
+            archive.extract(path, str(target), rename_base=rename_base)
+        assert not target.exists()
+    assert sorted(os.listdir(tmp_path)) == ["backup.zip"]
+
+
+def test_corrupt_member_leaves_no_file(tmp_path):
+    path = _archive(tmp_path, {f"{ACCOUNT}.save": b"main"})
+    index = archive.read_index(path)
+    index["files"][f"{ACCOUNT}.save"]["hash"] = "0" * 64
+    broken = str(tmp_path / "broken.zip")
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(broken, "w") as dst:
+        dst.writestr(f"{ACCOUNT}.save", src.read(f"{ACCOUNT}.save"))
+        dst.writestr(archive.INDEX_NAME, json.dumps(index))
+
+    with pytest.raises(OSError, match="corrupt"):
+        archive.extract(broken, str(tmp_path / "out"))
+    assert os.listdir(tmp_path / "out") == []
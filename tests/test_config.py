@@ -0,0 +1,60 @@
+import pytest
+from conftest import DictSettings
+from config import ConfigStore
+
+
+@pytest.fixture
+def settings():
+    return DictSettings({"scan_max_depth": 4})
+
+
+def test_transaction_writes_once_and_notifies(settings):
+    config = ConfigStore(settings)
+    changes = []
+    config.subscribe(changes.append)
+    with config.transaction():
+        config.set("scan_max_depth", 8)
+        config.set("scan_excluded", "Games")
+        assert config.get("scan_max_depth") == 8
+        assert settings.values["scan_max_depth"] == 4
+    assert settings.values == {"scan_max_depth": 8, "scan_excluded": "Games"}
+    assert settings.syncs == config.writes == 1
+    assert changes == [{"scan_max_depth": (4, 8), "scan_excluded": ("", "Games")}]
+
+
+def test_transaction_rolls_back_on_exception(settings):
+    config = ConfigStore(settings)
+    changes = []
+    config.subscribe(changes.append)
+    with pytest.raises(RuntimeError):
+        with config.transaction():
+            config.set("scan_max_depth", 8)
+            with config.transaction():
+                config.set("scan_excluded", "Games")
+            raise RuntimeError("cancelled")
+    assert config.get("scan_max_depth") == 4
+    assert config.get("scan_excluded") == ""
+    assert settings.values == {"scan_max_depth": 4}
+    assert settings.syncs == config.writes == 0
+    assert changes == []
+
+
+def test_transaction_rolls_back_on_validation_error(settings):
+    config = ConfigStore(settings)
+    with pytest.raises(ValueError, match="scan_low_priority_depth"):
+        with config.transaction():
+            config.set("scan_max_depth", 8)
+            config.set("scan_low_priority_depth", 100)
+    assert config.get("scan_max_depth") == 4
+    assert settings.values == {"scan_max_depth": 4}
+    assert settings.syncs == 0
+
+    # Nothing of the failed transaction is left pending.
+    config.set("scan_excluded", "Games")
+    assert settings.values == {"scan_max_depth": 4, "scan_excluded": "Games"}
+
+
+def test_invalid_stored_values_fall_back_to_default():
+    config = ConfigStore(DictSettings({"scan_max_depth": 999, "settle_window": "not a number"}))
+    assert config.get("scan_max_depth") == 0
+    assert config.get("settle_window") == ConfigStore(DictSettings()).get("settle_window")
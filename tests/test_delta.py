@@ -0,0 +1,46 @@
+import random
+import pytest
+import delta
+
+DIGEST = "ab" * 32
+
+
+def _data(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+BASE = _data(64 * 1024)
+
+
+@pytest.mark.parametrize("target", [
+    BASE,
+    BASE[:1000] + b"inserted bytes" + BASE[1000:],
+    BASE[:5000] + BASE[9000:],
+    b"xyz" + BASE,
+    BASE[7:],
+    BASE[:30000] + _data(3000, seed=1) + BASE[30000:60000],
+    BASE[32768:] + BASE[:32768],
+    b"",
+    _data(1000, seed=2),
+], ids=["same", "insert", "delete", "shift", "cut_front", "mixed", "swapped_halves", "empty", "unrelated"])
+def test_round_trip(target):
+    data = delta.encode(BASE, target, DIGEST, 3)
+    assert delta.apply(BASE, data) == target
+    assert delta.read_header(data) == (DIGEST, 3, len(target))
+
+
+def test_round_trip_from_empty_base():
+    target = _data(4000, seed=3)
+    assert delta.apply(b"", delta.encode(b"", target, DIGEST, 1)) == target
+
+
+def test_small_edit_gives_small_delta():
+    target = bytearray(BASE)
+    target[20000:20004] = b"edit"
+    data = delta.encode(BASE, bytes(target), DIGEST, 1)
+    assert len(data) < len(BASE) // 20
+
+
+def test_read_header_rejects_other_data():
+    with pytest.raises(ValueError):
+        delta.read_header(b"not a delta at all" * 10)
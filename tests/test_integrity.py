@@ -0,0 +1,51 @@
+import os
+from integrity import MANIFEST_NAME, hash_file, load_manifest, verify_folder, write_manifest
+
+
+def _write(path, content: bytes):
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _folder(tmp_path):
+    for name, content in {"a.save": b"aaaa", "b.save": b"bbbb", "c.save": b"cccc"}.items():
+        _write(tmp_path / name, content)
+    write_manifest(str(tmp_path), {f: hash_file(str(tmp_path / f)) for f in os.listdir(tmp_path)})
+
+
+def test_verify_folder_without_manifest(tmp_path):
+    _write(tmp_path / "a.save", b"aaaa")
+    report = verify_folder(str(tmp_path))
+    assert not report["has_manifest"]
+    assert report["ok"] == report["corrupt"] == report["missing"] == []
+
+
+def test_verify_folder_trusts_unchanged_files(tmp_path):
+    _folder(tmp_path)
+    report = verify_folder(str(tmp_path))
+    assert report["has_manifest"]
+    assert sorted(report["ok"]) == ["a.save", "b.save", "c.save"]
+    assert report["corrupt"] == report["missing"] == report["untracked"] == []
+    assert report["rehashed"] == 0
+
+
+def test_verify_folder_reports_corrupt_missing_and_untracked(tmp_path):
+    _folder(tmp_path)
+    _write(tmp_path / "a.save", b"AAAA")
+    os.remove(tmp_path / "b.save")
+    _write(tmp_path / "d.save", b"new")
+    # Rewritten with the same content, only the mtime moved.
+    st = os.stat(tmp_path / "c.save")
+    os.utime(tmp_path / "c.save", ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    report = verify_folder(str(tmp_path))
+    assert report["corrupt"] == ["a.save"]
+    assert report["missing"] == ["b.save"]
+    assert report["ok"] == ["c.save"]
+    assert report["untracked"] == ["d.save"]
+    assert report["rehashed"] == 2
+    assert MANIFEST_NAME not in report["untracked"]
+
+    # The intact file's new mtime was stored, it isn't read again.
+    assert load_manifest(str(tmp_path))["files"]["c.save"]["mtime_ns"] == os.stat(tmp_path / "c.save").st_mtime_ns
+    assert verify_folder(str(tmp_path))["rehashed"] == 1
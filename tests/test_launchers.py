@@ -0,0 +1,137 @@
+import json
+import os
+import sys
+import pytest
+import launchers
+from launchers import discover_locations, find_epic, find_steam, parse_vdf
+
+LIBRARYFOLDERS = r'''
+"libraryfolders"
+{
+	"0"
+	{
+		"path"		"{steam_root}"
+		"label"		""
+		"apps"
+		{
+			"228980"		"1016856064"
+		}
+	}
+	// second drive
+	"1"
+	{
+		"path"		"{library}"
+		"apps"
+		{
+			"252950"		"21764395418"
+		}
+	}
+}
+'''
+
+APPMANIFEST = r'''
+"AppState"
+{
+	"appid"		"252950"
+	"name"		"Rocket League"
+	"installdir"		"rocketleague"
+	"UserConfig"
+	{
+		"language"		"english"
+	}
+}
+'''
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(sys, "platform", "linux")
+    return home
+
+
+def make(path, content: str | None = None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if content is None:
+        path.mkdir(exist_ok=True)
+    else:
+        path.write_text(content)
+    return path
+
+
+def save_folder(prefix, platform_dir: str):
+    return make(prefix / "drive_c" / "users" / "steamuser" / "Documents" / "My Games" / "Rocket League" / "TAGame"
+                / platform_dir / "DBE_Production")
+
+
+def test_parse_vdf():
+    data = parse_vdf(LIBRARYFOLDERS.replace("{steam_root}", "C:\\\\Program Files (x86)\\\\Steam")
+                     .replace("{library}", 'D:\\\\Steam \\"Library\\"'))
+    folders = data["libraryfolders"]
+    assert folders["0"]["path"] == "C:\\Program Files (x86)\\Steam"
+    assert folders["1"]["path"] == 'D:\\Steam "Library"'
+    assert folders["1"]["apps"] == {"252950": "21764395418"}
+
+    manifest = parse_vdf(APPMANIFEST)["appstate"]
+    assert manifest["installdir"] == "rocketleague"
+    assert manifest["userconfig"] == {"language": "english"}
+    # Old libraryfolders format: index -> path
+    assert parse_vdf('"LibraryFolders" { "TimeNextStatsReport" "1" "1" "/mnt/games" }') == \
+        {"libraryfolders": {"timenextstatsreport": "1", "1": "/mnt/games"}}
+
+
+def test_steam_library_manifest_and_proton_prefix(home, tmp_path):
+    steam_root = make(home / ".local" / "share" / "Steam")
+    library = tmp_path / "SteamLibrary"
+    make(steam_root / "steamapps" / "libraryfolders.vdf",
+         LIBRARYFOLDERS.replace("{steam_root}", str(steam_root)).replace("{library}", str(library)))
+    make(library / "steamapps" / "appmanifest_252950.acf", APPMANIFEST)
+    exe = make(library / "steamapps" / "common" / "rocketleague" / "Binaries" / "Win64" / "RocketLeague.exe", "")
+    saves = save_folder(library / "steamapps" / "compatdata" / "252950" / "pfx", "SaveData")
+
+    assert launchers.steam_libraries(steam_root.resolve()) == [steam_root.resolve(), library.resolve()]
+    assert find_steam() == {"Steam_exe": str(exe.resolve()), "Steam_folder": str(saves.resolve())}
+
+
+def test_steam_without_manifest_finds_nothing(home, tmp_path):
+    steam_root = make(home / ".steam" / "steam")
+    make(steam_root / "steamapps" / "common" / "rocketleague" / "Binaries" / "Win64" / "RocketLeague.exe", "")
+    assert find_steam() == {}
+
+
+def test_heroic_install_and_prefix(home, tmp_path):
+    install = tmp_path / "Games" / "Heroic" / "RocketLeague"
+    exe = make(install / "Binaries" / "Win64" / "RocketLeague.exe", "")
+    prefix = tmp_path / "prefixes" / "RocketLeague"
+    saves = save_folder(prefix, "SaveDataEpic")
+    config = home / ".config" / "heroic"
+    make(config / "legendaryConfig" / "legendary" / "installed.json", json.dumps({
+        "Fortnite": {"title": "Fortnite", "install_path": str(tmp_path / "Fortnite")},
+        "Sugar": {"title": "Rocket League®", "install_path": str(install),
+                  "executable": os.path.join("Binaries", "Win64", "RocketLeague.exe")},
+    }))
+    make(config / "GamesConfig" / "Sugar.json", json.dumps({"Sugar": {"winePrefix": str(prefix)}}))
+
+    assert find_epic() == {"Epic_exe": str(exe), "Epic_folder": str(saves)}
+    assert discover_locations() == {"Epic_exe": str(exe), "Epic_folder": str(saves)}
+
+
+def test_epic_launcher_manifest(home, tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "darwin")
+    manifests = home / "Library" / "Application Support" / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
+    install = tmp_path / "Epic Games" / "rocketleague"
+    exe = make(install / "Binaries" / "Win64" / "RocketLeague.exe", "")
+    make(manifests / "0A1B.item", json.dumps({"AppName": "Fortnite", "DisplayName": "Fortnite",
+                                               "InstallLocation": str(tmp_path / "Fortnite")}))
+    make(manifests / "2C3D.item", json.dumps({"AppName": "Sugar", "DisplayName": "Rocket League",
+                                               "InstallLocation": str(install),
+                                               "LaunchExecutable": "Binaries/Win64/RocketLeague.exe"}))
+    make(manifests / "broken.item", "{not json")
+
+    assert find_epic() == {"Epic_exe": str(exe)}
+
+
+def test_nothing_installed(home):
+    assert discover_locations() == {}
@@ -0,0 +1,70 @@
+import pytest
+from migration_queue import DONE, FAILED, PENDING, MigrationQueue
+
+OLD_BASE = "aaaa1111"
+
+
+def test_wait_requiring_new_base_does_not_fall_back(manager, tmp_path):
+    old = tmp_path / "saves" / f"{OLD_BASE}.save"
+    old.write_bytes(b"already migrated")
+    with pytest.raises(RuntimeError, match="No new account"):
+        manager.wait_for_new_latest_save(timeout=0.3, platform="steam", require_new_base=True)
+    assert manager.last_save_detection is None
+    # Without the flag the newest existing saves are returned.
+    assert manager.wait_for_new_latest_save(timeout=0.3, platform="steam") == [str(old)]
+
+
+class FakeManager:
+    """Only what MigrationQueue._run_item calls, generate_new_save_files is scripted."""
+
+    def __init__(self, tmp_path, generate):
+        self.backup_path = str(tmp_path)
+        self.last_save_detection = None
+        self.generate = generate
+        self.calls = []
+
+    def check_folder_paths_set(self, platform):
+        return None
+
+    def check_backup_folder_empty(self):
+        return None
+
+    def check_backup_integrity(self):
+        return None
+
+    def generate_new_save_files(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.generate(self, kwargs)
+
+
+def test_logged_in_entry_requires_a_new_account(tmp_path):
+    def no_new_account(manager, kwargs):
+        raise RuntimeError("No new account appeared within 60 seconds.")
+
+    queue = MigrationQueue(str(tmp_path / "queue.json"))
+    queue.add("steam")
+    manager = FakeManager(tmp_path, no_new_account)
+    stats = queue.run(manager)
+
+    assert manager.calls[0]["require_new_base"] is True
+    assert manager.calls[0]["base_name"] is None
+    item = queue.items()[0]
+    assert item["status"] == FAILED
+    assert "No new account" in item["error"]
+    assert item["base"] is None
+    assert stats[FAILED] == 1 and stats[PENDING] == 0
+
+
+def test_detected_base_is_stored_for_reruns(tmp_path):
+    def detects(manager, kwargs):
+        manager.last_save_detection = {"base": "bbbb2222"}
+        kwargs["progress"]("Copying save files...")
+        return True
+
+    queue = MigrationQueue(str(tmp_path / "queue.json"))
+    queue.add("steam")
+    queue.run(FakeManager(tmp_path, detects))
+
+    item = MigrationQueue(str(tmp_path / "queue.json")).items()[0]
+    assert item["status"] == DONE
+    assert item["base"] == "bbbb2222"
@@ -0,0 +1,99 @@
+import random
+import struct
+import pytest
+from savefile import diff_saves, inspect_save, validate_save
+
+
+def fstring(text: str) -> bytes:
+    data = text.encode("ascii") + b"\x00"
+    return struct.pack("<i", len(data)) + data
+
+
+def tag(name: str, type_: str, value: bytes, extra: bytes = b"") -> bytes:
+    return fstring(name) + fstring(type_) + struct.pack("<ii", len(value), 0) + extra + value
+
+
+def int_prop(name, value):
+    return tag(name, "IntProperty", struct.pack("<i", value))
+
+
+def float_prop(name, value):
+    return tag(name, "FloatProperty", struct.pack("<f", value))
+
+
+def bool_prop(name, value):
+    return tag(name, "BoolProperty", b"", extra=bytes([value]))
+
+
+def str_prop(name, value):
+    return tag(name, "StrProperty", fstring(value))
+
+
+def struct_prop(name, struct_name, *props):
+    return tag(name, "StructProperty", b"".join(props) + fstring("None"), extra=fstring(struct_name))
+
+
+def save_bytes(fov=110.0, swivel=True, truncate=0) -> bytes:
+    """Layout of an unencrypted save: a versioned header, then the top level property stream."""
+    header = struct.pack("<iii", 0x1C0, 0x2A, 0) + fstring("TAGame.SaveData_TA") + struct.pack("<i", 0)
+    stream = b"".join([
+        struct_prop("CameraSettings", "ProfileCameraSettings",
+                    float_prop("FOV", fov), float_prop("Stiffness", 0.45), bool_prop("bSwivel", swivel)),
+        int_prop("VideoResolutionX", 1920),
+        float_prop("MusicVolume", 0.2),
+        tag("KeyBindings", "ArrayProperty", struct.pack("<i", 1) + str_prop("Action", "Jump") + fstring("None")),
+        str_prop("PlayerName", "someone"),
+        fstring("None"),
+    ])
+    data = header + stream
+    return data[:len(data) - truncate] if truncate else data
+
+
+def encrypted_bytes(size: int = 4096, seed: int = 0) -> bytes:
+    """Stands in for a save as the game writes it: a short header and an encrypted body."""
+    body = random.Random(seed).randbytes(size)
+    return struct.pack("<ii", len(body), 0x5EED) + body
+
+
+def _write(path, data: bytes) -> str:
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_inspect_groups_properties_into_sections(tmp_path):
+    result = inspect_save(_write(tmp_path / "a.save", save_bytes()))
+    assert result["truncated"] is False
+    assert result["camera"]["CameraSettings"] == {"FOV": 110.0, "Stiffness": 0.45, "bSwivel": True}
+    assert result["video"] == {"VideoResolutionX": 1920}
+    assert result["audio"] == {"MusicVolume": pytest.approx(0.2)}
+    assert result["keybindings"]["KeyBindings"] == {"Action": "Jump"}
+    assert result["other"] == {"PlayerName": "someone"}
+
+
+def test_diff_reports_changed_sections(tmp_path):
+    a = _write(tmp_path / "a.save", save_bytes())
+    b = _write(tmp_path / "b.save", save_bytes(fov=100.0))
+    assert diff_saves(a, b) == {"camera": ["CameraSettings"]}
+    assert diff_saves(a, a) == {}
+
+
+def test_validate_rejects_cut_off_and_empty_saves(tmp_path):
+    assert validate_save(_write(tmp_path / "ok.save", save_bytes())) is None
+    assert "truncated" in validate_save(_write(tmp_path / "cut.save", save_bytes(truncate=40)))
+    assert "empty" in validate_save(_write(tmp_path / "empty.save", b""))
+
+
+def test_encrypted_saves_are_opaque(tmp_path):
+    # Documented limitation: without decryption nothing inside these can be checked.
+    a = _write(tmp_path / "a.save", encrypted_bytes())
+    result = inspect_save(a)
+    assert result["opaque"] is True and result["size"] == 4104
+    assert validate_save(a) is None
+    assert validate_save(_write(tmp_path / "cut.save", encrypted_bytes()[:1000])) is None
+
+    changed = bytearray(encrypted_bytes())
+    changed[3000] ^= 0xFF
+    b = _write(tmp_path / "b.save", bytes(changed))
+    diff = diff_saves(a, b)
+    assert diff["opaque"] is True
+    assert diff["changed_blocks"] == [3000 // diff["block_size"]]
@@ -0,0 +1,144 @@
+import os
+import threading
+import pytest
+from scanner import EXCLUDED_DIRS, LOW_PRIORITY_DEPTH, SLOTS, DriveScanner
+
+STEAM_EXE = ("Steam", "steamapps", "common", "rocketleague", "Binaries", "Win64", "RocketLeague.exe")
+EPIC_EXE = ("Epic Games", "rocketleague", "Binaries", "Win64", "RocketLeague.exe")
+STEAM_SAVES = ("Documents", "My Games", "Rocket League", "TAGame", "SaveData", "DBE_Production")
+EPIC_SAVES = ("Documents", "My Games", "Rocket League", "TAGame", "SaveDataEpic", "DBE_Production")
+
+
+def make(root, *parts) -> str:
+    """Creates a file (name with a dot) or directory below root and returns its path."""
+    path = os.path.join(str(root), *parts)
+    if "." in parts[-1]:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+    else:
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def filler(root, count: int, width: int = 4):
+    """count directories spread over a few levels, none of them hinting at the targets."""
+    level, created = [str(root)], 0
+    while created < count:
+        next_level = []
+        for parent in level:
+            for _ in range(width):
+                path = os.path.join(parent, f"d{created:05d}")
+                os.makedirs(path)
+                next_level.append(path)
+                created += 1
+        level = next_level
+
+
+def test_finds_all_slots_in_one_pass(tmp_path):
+    expected = {
+        "Steam_exe": make(tmp_path, "Games", *STEAM_EXE),
+        "Epic_exe": make(tmp_path, "Games", *EPIC_EXE),
+        "Steam_folder": make(tmp_path, "Users", "me", *STEAM_SAVES),
+        "Epic_folder": make(tmp_path, "Users", "me", *EPIC_SAVES),
+    }
+    scanner = DriveScanner([tmp_path])
+    assert scanner.scan() == expected
+    assert scanner.first_result is not None
+    assert {slot: paths for slot, paths in scanner.candidates.items()} == {s: [p] for s, p in expected.items()}
+
+
+def test_excluded_directories_are_not_entered(tmp_path):
+    make(tmp_path, "node_modules", *STEAM_EXE)
+    make(tmp_path, "OneDrive", *STEAM_SAVES)
+    make(tmp_path, "Backups", *EPIC_EXE)
+
+    assert DriveScanner([tmp_path]).scan() == {"Epic_exe": os.path.join(str(tmp_path), "Backups", *EPIC_EXE)}
+    assert DriveScanner([tmp_path], excluded={"backups"}).scan() == {
+        "Steam_exe": os.path.join(str(tmp_path), "node_modules", *STEAM_EXE),
+        "Steam_folder": os.path.join(str(tmp_path), "OneDrive", *STEAM_SAVES[:-1], "DBE_Production"),
+    }
+
+
+def test_nested_roots_are_scanned_once(tmp_path):
+    mount = make(tmp_path, "mnt", "games")
+    exe = make(mount, *STEAM_EXE)
+    filler(tmp_path / "other", 40)
+
+    scanner = DriveScanner([tmp_path, mount], slots=SLOTS)
+    assert scanner.scan() == {"Steam_exe": exe}
+    assert scanner.candidates["Steam_exe"] == [exe]
+    total_dirs = sum(len(dirs) for _, dirs, _ in os.walk(tmp_path)) + 1
+    assert scanner.dirs_visited == total_dirs
+
+
+def test_stops_once_every_requested_slot_is_filled(tmp_path):
+    make(tmp_path, "a", *STEAM_SAVES)
+    filler(tmp_path / "zzz", 300)
+    total_dirs = sum(len(dirs) for _, dirs, _ in os.walk(tmp_path)) + 1
+
+    scanner = DriveScanner([tmp_path], slots=["Steam_folder"])
+    assert list(scanner.scan()) == ["Steam_folder"]
+    assert scanner.dirs_visited < total_dirs // 10
+
+    # Slots that are not asked for are not reported.
+    make(tmp_path, "b", *EPIC_EXE)
+    assert "Epic_exe" not in DriveScanner([tmp_path], slots=["Steam_folder"]).scan()
+
+
+def test_unreadable_root_is_recorded(tmp_path):
+    scanner = DriveScanner([tmp_path / "missing"])
+    assert scanner.scan() == {}
+    assert list(scanner.skipped_roots) == [os.path.normcase(str(tmp_path / "missing"))]
+
+
+def test_cancel_event_stops_the_scan(tmp_path):
+    make(tmp_path, *STEAM_EXE)
+    cancel = threading.Event()
+    cancel.set()
+    scanner = DriveScanner([tmp_path], cancel_event=cancel)
+    assert scanner.scan() == {}
+    assert scanner.dirs_visited == 0
+
+
+
+@pytest.mark.parametrize("max_depth, found", [(None, True), (7, True), (6, False)])
+def test_max_depth(tmp_path, max_depth, found):
+    # Win64 is the 7th directory level below the root, max_depth is the deepest one entered.
+    make(tmp_path, "x", *STEAM_EXE)
+    assert bool(DriveScanner([tmp_path], max_depth=max_depth).scan()) == found
+
+
+def test_hinted_paths_are_visited_first(tmp_path):
+    filler(tmp_path, 400, width=20)
+    saves = make(tmp_path, "Users", "me", *STEAM_SAVES)
+    scanner = DriveScanner([tmp_path], slots=["Steam_folder"])
+    assert scanner.scan() == {"Steam_folder": saves}
+    # A breadth-first walk would list the 400 filler directories first.
+    assert scanner.dirs_visited < 20
+
+
+def test_low_priority_trees_come_last_and_are_cut_off(tmp_path):
+    windows_exe = make(tmp_path, "Windows", *STEAM_EXE)
+    games_exe = make(tmp_path, "zz", "Games", *STEAM_EXE)
+
+    # Win64 is 6 levels below Windows, deeper than the default cutoff.
+    assert LOW_PRIORITY_DEPTH < 6
+    scanner = DriveScanner([tmp_path], slots=["Steam_exe"])
+    assert scanner.scan() == {"Steam_exe": games_exe}
+
+    os.remove(games_exe)
+    assert DriveScanner([tmp_path], slots=["Steam_exe"]).scan() == {}
+    assert DriveScanner([tmp_path], slots=["Steam_exe"], low_priority_depth=6).scan() == {"Steam_exe": windows_exe}
+
+
+def test_scan_options_come_from_the_config(manager):
+    manager.config.set("scan_excluded", " Backups, ,Old Stuff ")
+    manager.config.set("scan_max_depth", 12)
+    manager.config.set("scan_low_priority_depth", 5)
+    options = manager.scan_options()
+    assert options["excluded"] == EXCLUDED_DIRS | {"Backups", "Old Stuff"}
+    assert options["max_depth"] == 12
+    assert options["low_priority_depth"] == 5
+
+    manager.config.set("scan_max_depth", 0)
+    assert manager.scan_options()["max_depth"] is None
@@ -0,0 +1,85 @@
+import json
+import os
+import random
+import pytest
+from snapshots import KEYFRAME_INTERVAL, SnapshotStore
+
+ACCOUNT = "abc123"
+NAME = ACCOUNT + ".save"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / "store"))
+
+
+def _versions(count: int) -> list:
+    """count versions of a save file, each one a small edit of the previous."""
+    rng = random.Random(0)
+    data = bytearray(rng.randbytes(32 * 1024))
+    versions = []
+    for i in range(count):
+        data[i * 100:i * 100 + 8] = rng.randbytes(8)
+        versions.append(bytes(data))
+    return versions
+
+
+def _snapshot(store, folder, content: bytes) -> dict:
+    path = os.path.join(folder, NAME)
+    with open(path, "wb") as f:
+        f.write(content)
+    snapshot = store.create([path], account=ACCOUNT, platform="steam")
+    # list() sorts by creation time, keep it strictly increasing.
+    snapshot["created"] = max((m["created"] for m in store.list(ACCOUNT)), default=0) + 1
+    with open(os.path.join(store.manifest_dir, snapshot["id"] + ".json"), "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+    return snapshot
+
+
+def test_delta_chain_starts_over_at_keyframe_interval(store, tmp_path):
+    versions = _versions(KEYFRAME_INTERVAL + 2)
+    digests = [_snapshot(store, str(tmp_path), v)["files"][NAME]["hash"] for v in versions]
+
+    depths = [(store._delta_header(d) or (None, 0, 0))[1] for d in digests]
+    # A full blob, KEYFRAME_INTERVAL - 1 deltas, then a full blob again.
+    assert depths == list(range(KEYFRAME_INTERVAL)) + [0, 1]
+    assert not store.is_delta(digests[KEYFRAME_INTERVAL])
+    for digest, content in zip(digests, versions):
+        assert store.read_blob(digest) == content
+
+
+def test_restore_rebuilds_deltas(store, tmp_path):
+    versions = _versions(3)
+    snapshots = [_snapshot(store, str(tmp_path), v) for v in versions]
+    assert store.is_delta(snapshots[-1]["files"][NAME]["hash"])
+
+    written = store.restore(snapshots[-1]["id"], str(tmp_path / "out"), rename_base="fff999")
+    assert [os.path.basename(p) for p in written] == ["fff999.save"]
+    with open(written[0], "rb") as f:
+        assert f.read() == versions[-1]
+
+
+def test_gc_keeps_bases_of_referenced_deltas(store, tmp_path):
+    versions = _versions(3)
+    snapshots = [_snapshot(store, str(tmp_path), v) for v in versions]
+    digests = [s["files"][NAME]["hash"] for s in snapshots]
+
+    # The newest snapshot is a delta on the middle one, which is a delta on the oldest.
+    for snapshot in snapshots[:-1]:
+        store.delete(snapshot["id"])
+    assert store.gc() == 0
+    assert all(store.has_blob(d) for d in digests)
+    assert store.read_blob(digests[-1]) == versions[-1]
+
+    store.delete(snapshots[-1]["id"])
+    assert store.gc() == 3
+    assert not any(store.has_blob(d) for d in digests)
+
+
+def test_gc_ignores_staged_files(store, tmp_path):
+    _snapshot(store, str(tmp_path), _versions(1)[0])
+    os.makedirs(store.tmp_dir, exist_ok=True)
+    with open(os.path.join(store.tmp_dir, "incoming-1-x.save.tmp"), "wb") as f:
+        f.write(b"partial")
+    assert store.gc() == 0
+    assert store.usage()
@@ -0,0 +1,65 @@
+import json
+import os
+import pytest
+import tracing
+from tracing import Tracer
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, "trace_dir", lambda: str(tmp_path / "traces"))
+    return Tracer()
+
+
+def test_events_inside_a_run_are_exported_as_instants(tracer):
+    with tracer.run("locate"):
+        with tracer.span("full_drive_scan") as trace:
+            tracer.event("watcher_fallback", backend="inotify", error="no inotify")
+            trace["dirs_visited"] = 3
+    assert not tracer.notices
+
+    with open(tracer.last_run["path"], encoding="utf-8") as f:
+        events = {e["name"]: e for e in json.load(f)["traceEvents"]}
+    assert events["watcher_fallback"]["ph"] == "i"
+    assert events["watcher_fallback"]["args"] == {"backend": "inotify", "error": "no inotify"}
+    assert events["full_drive_scan"]["ph"] == "X"
+    assert events["full_drive_scan"]["args"]["dirs_visited"] == 3
+    assert "! watcher_fallback: backend=inotify, error=no inotify" in tracer.breakdown()
+
+
+def test_events_outside_a_run_become_notices(tracer):
+    tracer.event("backup_integrity", error="1 corrupt file")
+    assert tracer.last_run is None
+    breakdown = tracer.breakdown()
+    assert "No run recorded yet." in breakdown
+    assert "! backup_integrity: error=1 corrupt file" in breakdown
+
+
+def test_failed_export_is_shown_instead_of_printed(tracer, tmp_path, monkeypatch):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a folder")
+    monkeypatch.setattr(tracing, "trace_dir", lambda: str(blocker / "traces"))
+    with tracer.run("migration"):
+        pass
+    assert tracer.last_run["path"] is None
+    assert "Trace not written:" in tracer.breakdown()
+    assert not os.path.exists(blocker / "traces")
+
+
+def test_startup_report_is_recorded_as_a_run(tracer, monkeypatch):
+    import startup
+    monkeypatch.setattr(startup, "tracer", tracer)
+    timer = startup.StartupTimer(start=0.0, budget_ms=100)
+    timer.marks = [("imports", 80.0), ("window", 120.0), ("first paint", 150.0)]
+
+    text = timer.report()
+    assert "over budget by 50 ms" in text
+    spans = tracer.last_run["spans"]
+    assert tracer.last_run["name"] == "startup"
+    assert [s["name"] for s in spans] == ["startup", "imports", "window", "first paint"]
+    assert [round(s["duration_ms"]) for s in spans] == [150, 80, 40, 30]
+    assert spans[0]["args"]["budget_ms"] == 100
+    assert os.path.exists(tracer.last_run["path"])
+    breakdown = tracer.breakdown()
+    assert "startup: 150 ms  (over the 100 ms budget by 50 ms)" in breakdown
+    assert "! startup_over_budget" in breakdown
@@ -0,0 +1,88 @@
+import hashlib
+import os
+import pytest
+from integrity import MANIFEST_NAME, hash_file, write_manifest
+from transfer import TransferEngine, plan_transfer, summarize_plan
+
+BACKUP_BASE = "aaaa1111"
+TARGET_BASE = "bbbb2222"
+
+
+def _write(path, content: bytes) -> str:
+    with open(path, "wb") as f:
+        f.write(content)
+    return str(path)
+
+
+def _read(path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_plan_transfer_classifies_and_apply_writes_only_changes(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+    items = [
+        (_write(src / "new.save", b"new"), str(dst / "new.save"), None),
+        (_write(src / "same.save", b"same"), _write(dst / "same.save", b"same"), None),
+        (_write(src / "resized.save", b"longer content"), _write(dst / "resized.save", b"short"), None),
+        (_write(src / "edited.save", b"abcd"), _write(dst / "edited.save", b"abce"), None),
+    ]
+    stale = _write(dst / "stale.save", b"old")
+
+    plan = plan_transfer(items, existing=[stale, str(dst / "same.save")])
+    summary = summarize_plan(plan)
+    assert summary["add"] == ["new.save"]
+    assert summary["overwrite"] == ["edited.save", "resized.save"]
+    assert summary["unchanged"] == ["same.save"]
+    assert summary["delete"] == ["stale.save"]
+    assert plan["bytes_to_write"] == len(b"new") + len(b"longer content") + len(b"abcd")
+    # Planning doesn't touch the target folder.
+    assert os.path.exists(stale) and _read(dst / "edited.save") == b"abce"
+
+    report = TransferEngine().apply(plan)
+    assert (report["copied"], report["skipped"], report["deleted"]) == (3, 1, 1)
+    assert sorted(os.listdir(dst)) == ["edited.save", "new.save", "resized.save", "same.save"]
+    for _, target, _ in items:
+        assert _read(target) == _read(src / os.path.basename(target))
+
+
+def test_plan_replace_deletes_stale_files_and_skips_manifest(manager, tmp_path):
+    backup, saves = tmp_path / "backup", tmp_path / "saves"
+    _write(backup / f"{BACKUP_BASE}.save", b"main")
+    _write(backup / f"{BACKUP_BASE}_1.save", b"slot one")
+    write_manifest(str(backup), {f: hash_file(str(backup / f)) for f in os.listdir(backup)})
+    _write(saves / f"{TARGET_BASE}.save", b"main")
+    _write(saves / f"{TARGET_BASE}_1.save", b"slot 1!!")
+    _write(saves / f"{TARGET_BASE}_7.save", b"only in the target")
+    other = _write(saves / "cccc3333.save", b"another account")
+
+    plan = manager.plan_replace(TARGET_BASE, platform="steam")
+    summary = summarize_plan(plan)
+    assert summary["unchanged"] == [f"{TARGET_BASE}.save"]
+    assert summary["overwrite"] == [f"{TARGET_BASE}_1.save"]
+    assert summary["add"] == []
+    assert summary["delete"] == [f"{TARGET_BASE}_7.save"]
+    assert not any(os.path.basename(src) == MANIFEST_NAME
+                   for src, _, _ in plan["add"] + plan["overwrite"] + plan["unchanged"])
+
+    report = TransferEngine().apply(plan)
+    # The backup's manifest hashes are checked on the written files.
+    assert report["verified"] == report["copied"] == 1
+    assert sorted(os.listdir(saves)) == sorted(["cccc3333.save", f"{TARGET_BASE}.save", f"{TARGET_BASE}_1.save"])
+    assert _read(saves / f"{TARGET_BASE}_1.save") == b"slot one"
+    assert _read(other) == b"another account"
+
+
+def test_apply_rejects_copies_that_do_not_match_the_expected_hash(tmp_path):
+    src = _write(tmp_path / "a.save", b"content")
+    good = hashlib.sha256(b"content").hexdigest()
+    bad = hashlib.sha256(b"other content").hexdigest()
+
+    report = TransferEngine().copy([(src, str(tmp_path / "ok.save"), good)])
+    assert report["verified"] == 1 and _read(tmp_path / "ok.save") == b"content"
+
+    with pytest.raises(OSError, match="checksum"):
+        TransferEngine().copy([(src, str(tmp_path / "bad.save"), bad)])
+    assert not os.path.exists(tmp_path / "bad.save")